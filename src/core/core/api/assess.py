@@ -183,6 +183,9 @@ class Stories(MethodView):
                 "timeto",
                 "no_count",
                 "exclude_attr",
+                "cursor",
+                "projection",
+                "counts",
             ]
             filter_args: dict[str, str | int | list] = {k: v for k, v in request.args.items() if k in filter_keys}
             filter_list_keys = ["source", "group", "story_ids", "language"]
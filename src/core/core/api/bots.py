@@ -119,6 +119,25 @@ class StoryAttributes(MethodView):
         return {"error": "Story not found"}, 404
 
 
+class BulkAttributes(MethodView):
+    @api_key_required
+    def patch(self):
+        payload = request.json
+        if not isinstance(payload, dict):
+            return {"error": "Expected a dict with news_items and stories"}, 400
+        news_items = payload.get("news_items") or {}
+        stories = payload.get("stories") or {}
+        if not isinstance(news_items, dict) or not isinstance(stories, dict):
+            return {"error": "news_items and stories must map ids to updates"}, 400
+        if not news_items and not stories:
+            return {"error": "No data provided"}, 400
+        response, status = StoryService.bulk_update_attributes(news_items, stories, actor=_bot_actor())
+        if status in (200, 207):
+            sse_manager.news_items_updated()
+        invalidate_frontend_cache_on_success(status, scopes=(SCOPE_ASSESS_VIEWS, SCOPE_STORY_REPORT_VIEWS))
+        return response, status
+
+
 class UpdateStory(MethodView):
     @api_key_required
     def get(self, story_id: str):
@@ -165,6 +184,10 @@ def initialize(app: Flask):
         "/news-item/<string:news_item_id>/attributes",
         view_func=UpdateNewsItemAttributes.as_view("update_news_item_attributes"),
     )
+    bots_bp.add_url_rule(
+        "/attributes",
+        view_func=BulkAttributes.as_view("bulk_attributes"),
+    )
     bots_bp.add_url_rule(
         "/story/<string:story_id>",
         view_func=UpdateStory.as_view("update_story"),
@@ -77,7 +77,8 @@ class ProductsRender(MethodView):
 
     @auth_required("PUBLISH_ACCESS")
     def get(self, product_id: str):
-        return ProductService.get_render(product_id)
+        inline = request.args.get("inline", default="", type=str).lower() == "true"
+        return ProductService.get_render(product_id, as_attachment=not inline)
 
 
 class AutoRenderProducts(MethodView):
@@ -1,12 +1,13 @@
 from datetime import timedelta
 
-from flask import Blueprint, Flask, Response, jsonify, make_response, request, send_file
+from flask import Blueprint, Flask, jsonify, make_response, request, send_file
 from flask.views import MethodView
 from werkzeug.datastructures import FileStorage
 
 from core.config import Config
 from core.log import logger
 from core.managers import queue_manager
+from core.managers.artifact_store import ArtifactNotFoundError, EmptyArtifactError, get_artifact_store
 from core.managers.auth_manager import api_key_required
 from core.managers.decorators import extract_args
 from core.managers.sse_manager import sse_manager
@@ -48,10 +49,25 @@ class AddNewsItems(MethodView):
         result, status = Story.add_news_items(json_data)
         if 200 <= status < 300:
             sse_manager.news_items_updated()
-        invalidate_frontend_cache_on_success(status, scopes=(SCOPE_ASSESS_VIEWS, SCOPE_STORY_REPORT_VIEWS))
+        if news_item_ids := result.get("news_item_ids"):
+            invalidate_frontend_cache_on_success(
+                status,
+                models=("story", "news_item", "filter_lists", "report_item"),
+                object_ids={"story": result.get("story_ids") or [], "news_item": news_item_ids},
+            )
         return result, status
 
 
+class KnownNewsItems(MethodView):
+    @api_key_required
+    def post(self):
+        payload = request.json or {}
+        hashes = payload.get("hashes", [])
+        if not isinstance(hashes, list) or not all(isinstance(item_hash, str) for item_hash in hashes):
+            return {"error": "Expected hashes list"}, 400
+        return {"hashes": sorted(NewsItem.get_known_hashes(hashes))}, 200
+
+
 class Products(MethodView):
     @api_key_required
     def get(self, product_id: str):
@@ -62,10 +78,33 @@ class ProductsRender(MethodView):
     @api_key_required
     def get(self, product_id: str):
         if product_data := Product.get_render(product_id):
-            return Response(product_data["blob"], headers={"Content-Type": product_data["mime_type"]}, status=200)
+            return ProductService.send_render(product_data, as_attachment=False)
         return {"error": "Product not found"}, 404
 
 
+class Artifacts(MethodView):
+    @api_key_required
+    def post(self):
+        try:
+            artifact = get_artifact_store().put(request.stream)
+        except EmptyArtifactError:
+            return {"error": "No artifact content provided"}, 400
+        logger.debug(f"Stored artifact {artifact.digest} with {artifact.size} bytes")
+        return {"digest": artifact.digest, "size": artifact.size}, 201
+
+
+class Artifact(MethodView):
+    @api_key_required
+    def get(self, digest: str):
+        store = get_artifact_store()
+        try:
+            # Workers skip uploading artifacts they find here, so a lookup keeps the artifact from being pruned.
+            store.touch(digest)
+            return store.send(digest, mimetype="application/octet-stream")
+        except ArtifactNotFoundError:
+            return {"error": "Artifact not found"}, 404
+
+
 class ProductsPublish(MethodView):
     @api_key_required
     def post(self, product_id: str):
@@ -172,9 +211,10 @@ class Stories(MethodView):
             "story_id",
             "story_ids",
             "cybersecurity",
+            "cursor",
         ]
         filter_args: dict[str, str | int | list] = {k: v for k, v in request.args.items() if k in filter_keys}
-        filter_list_keys = ["source", "group", "story_ids"]
+        filter_list_keys = ["source", "group", "story_ids", "fields"]
         for key in filter_list_keys:
             filter_args[key] = request.args.getlist(key)
 
@@ -185,8 +225,15 @@ class Stories(MethodView):
             if default_lookback_days > 0:
                 filter_args["timefrom"] = (Story.utcnow() - timedelta(days=default_lookback_days)).isoformat()
 
-        if story := Story.get_for_worker(filter_args):
-            return jsonify(story), 200
+        try:
+            if "cursor" in filter_args:
+                return jsonify(Story.get_page_for_worker(filter_args)), 200
+            stories = Story.get_for_worker(filter_args)
+        except ValueError as exc:
+            return {"error": str(exc)}, 400
+
+        if stories:
+            return jsonify(stories), 200
         return {"error": "No stories found"}, 404
 
     @api_key_required
@@ -194,6 +241,7 @@ class Stories(MethodView):
         configured_story_ids = _configured_misp_story_ids()
         response, status = Story.add_or_update(request.json)
         _cancel_deleted_misp_story_jobs(configured_story_ids)
+        invalidate_frontend_cache_on_success(status, scopes=(SCOPE_ASSESS_VIEWS, SCOPE_STORY_REPORT_VIEWS))
         return make_response(jsonify(response), status)
 
 
@@ -208,6 +256,7 @@ class MISPStories(MethodView):
         result, status = Story.add_or_update_for_misp(data)
         _cancel_deleted_misp_story_jobs(configured_story_ids)
         sse_manager.news_items_updated()
+        invalidate_frontend_cache_on_success(status, scopes=(SCOPE_ASSESS_VIEWS, SCOPE_STORY_REPORT_VIEWS))
         return make_response(jsonify(result), status)
 
     @api_key_required
@@ -360,10 +409,13 @@ def initialize(app: Flask):
     worker_bp.add_url_rule("/products/<string:product_id>", view_func=Products.as_view("products_worker"))
     worker_bp.add_url_rule("/products/<string:product_id>/render", view_func=ProductsRender.as_view("products_render_worker"))
     worker_bp.add_url_rule("/products/<string:product_id>/publish", view_func=ProductsPublish.as_view("products_publish_worker"))
+    worker_bp.add_url_rule("/artifacts", view_func=Artifacts.as_view("artifacts_worker"))
+    worker_bp.add_url_rule("/artifacts/<string:digest>", view_func=Artifact.as_view("artifact_worker"))
     worker_bp.add_url_rule("/presenters/<string:presenter>", view_func=Presenters.as_view("presenters_worker"))
     worker_bp.add_url_rule("/publishers/<string:publisher>", view_func=Publishers.as_view("publishers_worker"))
     worker_bp.add_url_rule("/connectors/<string:connector_id>", view_func=Connectors.as_view("connectors_worker"))
     worker_bp.add_url_rule("/news-items", view_func=AddNewsItems.as_view("news_items_worker"))
+    worker_bp.add_url_rule("/news-items/known", view_func=KnownNewsItems.as_view("known_news_items_worker"))
     worker_bp.add_url_rule("/bots", view_func=BotInfo.as_view("bots_worker"))
     worker_bp.add_url_rule("/tags", view_func=Tags.as_view("tags_worker"))
     worker_bp.add_url_rule("/iocs", view_func=IOCs.as_view("iocs_worker"))
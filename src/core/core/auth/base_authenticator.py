@@ -2,7 +2,7 @@ from flask import Response, jsonify, make_response
 from flask_jwt_extended import create_access_token, set_access_cookies
 
 from core.log import logger
-from core.model.token_blacklist import TokenBlacklist
+from core.managers.auth_cache_manager import auth_cache_manager
 from core.model.user import User
 
 
@@ -18,7 +18,7 @@ class BaseAuthenticator:
 
     @staticmethod
     def logout(jti):
-        TokenBlacklist.add(jti)
+        auth_cache_manager.revoke(jti)
 
     @staticmethod
     def generate_error() -> Response:
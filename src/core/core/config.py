@@ -44,6 +44,8 @@ class Settings(BaseSettings):
     JWT_DECODE_LEEWAY: int = 5
     JWT_TOKEN_LOCATION: list = ["headers", "cookies"]
     JWT_COOKIE_SUFFIX: Annotated[str, Field(pattern=r"^[A-Za-z0-9_-]*$")] = ""
+    JWT_REVOCATION_CACHE: bool = True
+    JWT_IDENTITY_CACHE_SECONDS: int = 30
 
     @property
     def JWT_ACCESS_COOKIE_NAME(self) -> str:
@@ -74,10 +76,14 @@ class Settings(BaseSettings):
     SQLALCHEMY_POOL_SIZE: int = 20
     SQLALCHEMY_POOL_TIMEOUT: Annotated[int | None, Field(gt=0)] = None
     SQLALCHEMY_POOL_RECYCLE: Annotated[int | None, Field(ge=-1)] = None
+    FTS_MAINTENANCE: Literal["deferred", "immediate"] = "deferred"
     COLORED_LOGS: bool = True
     BUILD_DATE: datetime = datetime.now(UTC)
     GIT_INFO: dict[str, str] | None = None
     DATA_FOLDER: str = "./taranis_data"  # When started with Docker, the path is /app/data
+    ARTIFACT_STORE: Literal["filesystem"] = "filesystem"
+    ARTIFACT_FOLDER: str = ""  # Defaults to the artifacts folder in DATA_FOLDER
+    ARTIFACT_GRACE_MINUTES: Annotated[int, Field(ge=0)] = 60
     SSE_URL: str = "http://sse:8088/publish"
     DISABLE_SSE: bool = False
     DISABLE_SCHEDULER: bool = False
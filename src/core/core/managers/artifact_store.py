@@ -0,0 +1,204 @@
+"""Content-addressed storage for rendered products.
+
+Artifacts are stored once per SHA-256 digest of their content. Products keep only the digest, so
+rendered reports never pass through the database, Redis or JSON payloads as base64 and are streamed
+to presenters, publishers and downloads instead. ARTIFACT_STORE selects the backend; "filesystem"
+keeps artifacts below ARTIFACT_FOLDER, which defaults to the artifacts folder in DATA_FOLDER.
+"""
+
+import hashlib
+import io
+import os
+import re
+import tempfile
+from collections.abc import Container
+from datetime import datetime
+from pathlib import Path
+from typing import IO, NamedTuple, Protocol
+
+from flask import Response, current_app, has_app_context, request, send_file
+
+from core.config import Config
+
+
+ARTIFACTS_FOLDER = "artifacts"
+CHUNK_SIZE = 1024 * 1024
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class Artifact(NamedTuple):
+    digest: str
+    size: int
+
+
+class ArtifactNotFoundError(LookupError):
+    def __init__(self, digest: str) -> None:
+        super().__init__(f"Artifact {digest} not found")
+
+
+class EmptyArtifactError(ValueError):
+    def __init__(self) -> None:
+        super().__init__("Artifact has no content")
+
+
+def is_digest(value: object) -> bool:
+    return isinstance(value, str) and DIGEST_PATTERN.fullmatch(value) is not None
+
+
+class ArtifactBackend(Protocol):
+    def put(self, source: IO[bytes]) -> Artifact: ...
+
+    def exists(self, digest: str) -> bool: ...
+
+    def size(self, digest: str) -> int: ...
+
+    def open(self, digest: str) -> IO[bytes]: ...
+
+    def delete(self, digest: str) -> None: ...
+
+    def touch(self, digest: str) -> None: ...
+
+    def prune(self, keep: Container[str], modified_before: datetime) -> int: ...
+
+
+class FileSystemArtifactBackend:
+    """Artifacts as files named by their digest, fanned out into folders by the first two characters.
+
+    The modification time of a file is refreshed whenever its content is stored or looked up again,
+    so prune only removes artifacts nobody has used for a while.
+    """
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, source: IO[bytes]) -> Artifact:
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=self.root, prefix=".incoming-", delete=False) as temporary_file:
+            temporary_path = Path(temporary_file.name)
+            while chunk := source.read(CHUNK_SIZE):
+                digest.update(chunk)
+                temporary_file.write(chunk)
+                size += len(chunk)
+        artifact = Artifact(digest.hexdigest(), size)
+        try:
+            if not size:
+                raise EmptyArtifactError()
+            target = self.path(artifact.digest)
+            if target.is_file():
+                target.touch()
+            else:
+                target.parent.mkdir(exist_ok=True)
+                os.replace(temporary_path, target)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+        return artifact
+
+    def exists(self, digest: str) -> bool:
+        return self.path(digest).is_file()
+
+    def size(self, digest: str) -> int:
+        try:
+            return self.path(digest).stat().st_size
+        except FileNotFoundError as e:
+            raise ArtifactNotFoundError(digest) from e
+
+    def open(self, digest: str) -> IO[bytes]:
+        try:
+            return self.path(digest).open("rb")
+        except FileNotFoundError as e:
+            raise ArtifactNotFoundError(digest) from e
+
+    def delete(self, digest: str) -> None:
+        self.path(digest).unlink(missing_ok=True)
+
+    def touch(self, digest: str) -> None:
+        try:
+            self.path(digest).touch(exist_ok=True)
+        except FileNotFoundError as e:
+            raise ArtifactNotFoundError(digest) from e
+
+    def prune(self, keep: Container[str], modified_before: datetime) -> int:
+        cutoff = modified_before.timestamp()
+        deleted = 0
+        for path in self.root.glob("??/*"):
+            if not is_digest(path.name) or path.name in keep:
+                continue
+            try:
+                # Checked right before unlinking, so an artifact reused during the scan is kept.
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+
+class ArtifactStore:
+    def __init__(self, backend: ArtifactBackend):
+        self.backend = backend
+
+    def put(self, source: IO[bytes]) -> Artifact:
+        """Store the content of source; raises EmptyArtifactError without storing anything if it is empty."""
+        return self.backend.put(source)
+
+    def put_bytes(self, data: bytes) -> Artifact:
+        return self.put(io.BytesIO(data))
+
+    def exists(self, digest: str | None) -> bool:
+        return is_digest(digest) and self.backend.exists(digest)  # type: ignore[arg-type]
+
+    def open(self, digest: str) -> IO[bytes]:
+        if not is_digest(digest):
+            raise ArtifactNotFoundError(digest)
+        return self.backend.open(digest)
+
+    def delete(self, digest: str) -> None:
+        if is_digest(digest):
+            self.backend.delete(digest)
+
+    def touch(self, digest: str) -> None:
+        """Mark an artifact as in use, so that prune keeps it for another grace period."""
+        if not is_digest(digest):
+            raise ArtifactNotFoundError(digest)
+        self.backend.touch(digest)
+
+    def prune(self, keep: Container[str], modified_before: datetime) -> int:
+        """Delete artifacts not in keep and unused since modified_before; returns how many were deleted."""
+        return self.backend.prune(keep, modified_before)
+
+    def send(self, digest: str, mimetype: str, download_name: str | None = None, as_attachment: bool = False) -> Response:
+        """Stream an artifact with its digest as strong ETag, answering conditional and range requests."""
+        if not is_digest(digest):
+            raise ArtifactNotFoundError(digest)
+        size = self.backend.size(digest)
+        response = send_file(
+            self.backend.open(digest),
+            mimetype=mimetype,
+            as_attachment=as_attachment,
+            download_name=download_name,
+            etag=digest,
+            conditional=False,
+        )
+        response.content_length = size
+        return response.make_conditional(request, accept_ranges=True, complete_length=size)
+
+
+def _setting(name: str):
+    return current_app.config.get(name, getattr(Config, name)) if has_app_context() else getattr(Config, name)
+
+
+def build_backend() -> ArtifactBackend:
+    if (backend := _setting("ARTIFACT_STORE")) == "filesystem":
+        root = _setting("ARTIFACT_FOLDER") or Path(_setting("DATA_FOLDER")) / ARTIFACTS_FOLDER
+        return FileSystemArtifactBackend(Path(root).resolve())
+    raise ValueError(f"Unsupported artifact store {backend}")
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Store for the configured backend, resolved per call so that it follows the application config."""
+    return ArtifactStore(build_backend())
@@ -0,0 +1,309 @@
+"""Per-process caches for JWT authentication and access control.
+
+Revoked token ids mirror the token_blacklist table in memory, resolved users are kept
+for a few seconds per token id, and compiled access contexts are kept per role set, so
+an authenticated request needs no database round trip for auth and ACL checks.
+Processes keep each other in sync over a Redis pub/sub channel: logouts, blocklist cleanups
+and committed changes to users, roles, organizations, ACLs and source groups are broadcast
+on it. While the subscription is down the caches are bypassed and every check goes to the database.
+An event that cannot be published is recorded as an AuthCacheResync request instead, which makes
+every process drop its caches and reload the blocklist from the database.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from itertools import chain
+from typing import Any, TypeVar
+
+from flask import Flask
+from models.cache_contract import get_secret_value
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.orm.base import PASSIVE_NO_INITIALIZE
+
+from core.config import Config
+from core.log import logger
+from core.managers.db_manager import db
+from core.model.auth_cache_resync import AuthCacheResync
+from core.model.organization import Organization
+from core.model.role import Role
+from core.model.token_blacklist import TokenBlacklist
+from core.model.user import User
+
+
+AUTH_EVENTS_CHANNEL = "taranis:auth:events"
+RECONNECT_DELAY_SECONDS = 5
+RESYNC_CHECK_SECONDS = 1
+MAX_CACHED_IDENTITIES = 10_000
+ALL_USERS = "*"
+PENDING_USERNAMES_KEY = "auth_cache_usernames"
+PENDING_ACCESS_KEY = "auth_cache_access"
+ACCESS_TABLES = frozenset({"role", "role_based_access", "rbac_role", "osint_source_group", "osint_source_group_osint_source"})
+
+AccessContextT = TypeVar("AccessContextT")
+
+
+class AuthCacheManager:
+    def __init__(self):
+        self.revoked: dict[str, datetime] = {}
+        self.identities: dict[str, tuple[float, str, User]] = {}
+        self.access_contexts: dict[tuple[str, ...], Any] = {}
+        self.generation = 0
+        self.access_generation = 0
+        self._app: Flask | None = None
+        self._redis: Redis | None = None
+        self._listener_pid: int | None = None
+        self._resync_id = 0
+        self._synced = threading.Event()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        self._app = app
+        if not Config.JWT_REVOCATION_CACHE:
+            return
+        try:
+            self._redis = Redis.from_url(
+                Config.REDIS_URL, password=get_secret_value(Config.REDIS_PASSWORD), decode_responses=True, socket_keepalive=True
+            )
+        except (RedisError, ValueError):
+            logger.exception("Failed to initialize auth cache Redis client; checking tokens against the database")
+            self._redis = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the caches mirror the database; starts the listener of this process on first use."""
+        if self._redis is None:
+            return False
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        return self._synced.is_set()
+
+    def is_revoked(self, jti: str) -> bool:
+        if self.active:
+            return jti in self.revoked
+        return TokenBlacklist.invalid(jti)
+
+    def revoke(self, jti: str) -> None:
+        entry = TokenBlacklist.add(jti)
+        self._apply_event({"event": "revoked", "jti": jti, "created": entry.created.isoformat()})
+        self._publish({"event": "revoked", "jti": jti, "created": entry.created.isoformat()})
+
+    def prune(self, check_time: datetime) -> None:
+        """Delete blocklist entries created before check_time, in the database and in every process."""
+        TokenBlacklist.delete_older(check_time)
+        self._apply_event({"event": "pruned", "before": check_time.isoformat()})
+        self._publish({"event": "pruned", "before": check_time.isoformat()})
+
+    def reload(self) -> None:
+        """Re-read the blocklist in every process after it was changed outside revoke and prune."""
+        self.revoked = TokenBlacklist.get_revoked()
+        self._publish({"event": "reload"})
+
+    def load_user(self, jti: str, username: str) -> User | None:
+        """Resolve the user of a token, attached to the request session."""
+        ttl = Config.JWT_IDENTITY_CACHE_SECONDS
+        if ttl <= 0 or not self.active:
+            return User.find_by_name(username)
+
+        now = time.monotonic()
+        entry = self.identities.get(jti)
+        if entry is None or entry[0] <= now or entry[1] != username:
+            generation = self.generation
+            if (user := User.load_detached(username)) is None:
+                return None
+            entry = (now + ttl, username, user)
+            with self._lock:
+                # Skip caching if users changed while loading; the loaded state may predate the change.
+                if generation == self.generation:
+                    if len(self.identities) >= MAX_CACHED_IDENTITIES:
+                        self.identities = {key: value for key, value in self.identities.items() if value[0] > now}
+                    self.identities[jti] = entry
+        return db.session.merge(entry[2], load=False)
+
+    def invalidate_identities(self, usernames: Iterable[str] | None = None) -> None:
+        """Drop cached users by name, or all of them, in every process."""
+        names = None if usernames is None else sorted(set(usernames))
+        self._apply_event({"event": "identities", "usernames": names})
+        self._publish({"event": "identities", "usernames": names})
+
+    def get_access_context(self, role_ids: tuple[str, ...], compile_context: Callable[[], AccessContextT]) -> AccessContextT:
+        """Return the cached access context of a role set, compiling it on a miss."""
+        if not self.active:
+            return compile_context()
+        if (context := self.access_contexts.get(role_ids)) is None:
+            generation = self.access_generation
+            context = compile_context()
+            with self._lock:
+                if generation == self.access_generation:
+                    self.access_contexts[role_ids] = context
+        return context
+
+    def invalidate_access_contexts(self, publish: bool = True) -> None:
+        self._apply_event({"event": "access"})
+        if publish:
+            self._publish({"event": "access"})
+
+    def collect_changes(self, session: Session) -> None:
+        """Record the users and access contexts the pending flush makes stale.
+
+        Access contexts are dropped in this process right away, since a context compiled
+        inside the same transaction already sees the flushed state.
+        """
+        usernames: set[str] = set()
+        access_changed = False
+        for instance in chain(session.dirty, session.deleted):
+            if isinstance(instance, User):
+                history = attributes.get_history(instance, "username", passive=PASSIVE_NO_INITIALIZE)
+                usernames.update(name for name in chain(history.unchanged or [], history.deleted or [], history.added or []) if name)
+            elif isinstance(instance, Role | Organization):
+                usernames.add(ALL_USERS)
+        for instance in chain(session.new, session.dirty, session.deleted):
+            access_changed = access_changed or self._changes_access(session, instance)
+        if usernames:
+            session.info.setdefault(PENDING_USERNAMES_KEY, set()).update(usernames)
+        if access_changed:
+            session.info[PENDING_ACCESS_KEY] = True
+            self.invalidate_access_contexts(publish=False)
+
+    def publish_changes(self, session: Session) -> None:
+        if usernames := session.info.pop(PENDING_USERNAMES_KEY, None):
+            self.invalidate_identities(None if ALL_USERS in usernames else usernames)
+        if session.info.pop(PENDING_ACCESS_KEY, False):
+            self.invalidate_access_contexts()
+
+    def discard_changes(self, session: Session) -> None:
+        session.info.pop(PENDING_USERNAMES_KEY, None)
+        if session.info.pop(PENDING_ACCESS_KEY, False):
+            self.invalidate_access_contexts(publish=False)
+
+    @staticmethod
+    def _changes_access(session: Session, instance: object) -> bool:
+        table_name = getattr(instance, "__tablename__", None)
+        if table_name in ACCESS_TABLES:
+            return True
+        if table_name != "osint_source":
+            return False
+        if instance in session.new or instance in session.deleted:
+            return True
+        return attributes.get_history(instance, "groups", passive=PASSIVE_NO_INITIALIZE).has_changes()
+
+    def _start_listener(self) -> None:
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            self._synced.clear()
+            threading.Thread(target=self._listen, name="auth-cache-listener", daemon=True).start()
+
+    def _listen(self) -> None:
+        while self._redis is not None and self._listener_pid == os.getpid():
+            pubsub = self._redis.pubsub()
+            try:
+                pubsub.subscribe(AUTH_EVENTS_CHANNEL)
+                confirmation = pubsub.get_message(timeout=RECONNECT_DELAY_SECONDS)
+                if not confirmation or confirmation["type"] != "subscribe":
+                    raise RedisError("auth cache subscription was not confirmed")
+                # Subscribed before loading, so no revocation can fall between the two.
+                self._resync_id = self._latest_resync_id()
+                self._reload_revoked()
+                self._synced.set()
+                while self._redis is not None and self._listener_pid == os.getpid():
+                    message = pubsub.get_message(ignore_subscribe_messages=True, timeout=RESYNC_CHECK_SECONDS)
+                    if message and message["type"] == "message":
+                        self._apply_event(json.loads(message["data"]))
+                    self._resync_if_requested()
+            except (RedisError, SQLAlchemyError, ValueError):
+                logger.exception("Auth cache listener failed; checking tokens against the database until it reconnects")
+            finally:
+                self._synced.clear()
+                self.identities = {}
+                self.access_contexts = {}
+                pubsub.close()
+            time.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _latest_resync_id(self) -> int:
+        if self._app is None:
+            return 0
+        with self._app.app_context():
+            return AuthCacheResync.latest()
+
+    def _resync_if_requested(self) -> None:
+        """Reload from the database after another process failed to publish an event."""
+        if (resync_id := self._latest_resync_id()) == self._resync_id:
+            return
+        logger.warning("Auth cache event was not broadcast; reloading auth caches from the database")
+        self._synced.clear()
+        try:
+            self._reload_revoked()
+            self._apply_event({"event": "identities", "usernames": None})
+            self._apply_event({"event": "access"})
+        finally:
+            self._resync_id = resync_id
+            self._synced.set()
+
+    def _reload_revoked(self) -> None:
+        if self._app is None:
+            return
+        with self._app.app_context():
+            self.revoked = TokenBlacklist.get_revoked()
+
+    def _apply_event(self, payload: dict[str, Any]) -> None:
+        match payload.get("event"):
+            case "revoked":
+                self.revoked[payload["jti"]] = datetime.fromisoformat(payload["created"])
+                self.identities.pop(payload["jti"], None)
+            case "pruned":
+                cutoff = datetime.fromisoformat(payload["before"])
+                self.revoked = {jti: created for jti, created in self.revoked.items() if created >= cutoff}
+            case "reload":
+                self._reload_revoked()
+            case "identities":
+                usernames = payload.get("usernames")
+                with self._lock:
+                    self.generation += 1
+                    if usernames is None:
+                        self.identities = {}
+                    else:
+                        self.identities = {jti: entry for jti, entry in self.identities.items() if entry[1] not in usernames}
+            case "access":
+                with self._lock:
+                    self.access_generation += 1
+                    self.access_contexts = {}
+
+    def _publish(self, payload: dict[str, Any]) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.publish(AUTH_EVENTS_CHANNEL, json.dumps(payload))
+        except RedisError:
+            logger.exception("Failed to publish auth cache event; requesting a reload in every process")
+            try:
+                AuthCacheResync.request()
+            except SQLAlchemyError:
+                logger.exception("Failed to request an auth cache reload")
+
+
+auth_cache_manager = AuthCacheManager()
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_identity_changes(session: Session, flush_context, instances) -> None:
+    auth_cache_manager.collect_changes(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_identity_changes(session: Session) -> None:
+    auth_cache_manager.publish_changes(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_identity_changes(session: Session, previous_transaction) -> None:
+    if not session.in_transaction():
+        auth_cache_manager.discard_changes(session)
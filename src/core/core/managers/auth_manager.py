@@ -13,6 +13,7 @@ from core.auth.external_authenticator import ExternalAuthenticator
 from core.auth.openid_authenticator import OpenIDAuthenticator
 from core.config import Config
 from core.log import logger
+from core.managers.auth_cache_manager import auth_cache_manager
 from core.model.token_blacklist import TokenBlacklist
 from core.model.user import User
 
@@ -24,13 +25,14 @@ AUTH_ERROR = ({"error": "not authorized"}, 401)
 
 def cleanup_token_blacklist(app):
     with app.app_context():
-        TokenBlacklist.delete_older(TokenBlacklist.utcnow() - timedelta(days=1))
+        auth_cache_manager.prune(TokenBlacklist.utcnow() - timedelta(days=1))
 
 
 def initialize(app: Flask):
     global current_authenticator
 
     jwt.init_app(app)
+    auth_cache_manager.init_app(app)
 
     authenticator = app.config.get("TARANIS_AUTHENTICATOR", None)
     if authenticator == "openid":
@@ -171,7 +173,7 @@ def api_key_or_auth_required(permissions: list | str | None = None):
 @jwt.user_lookup_loader
 def user_lookup_callback(_jwt_header, jwt_data):
     identity = jwt_data[Config.JWT_IDENTITY_CLAIM]
-    return User.find_by_name(identity) if identity else None
+    return auth_cache_manager.load_user(jwt_data["jti"], identity) if identity else None
 
 
 @jwt.user_identity_loader
@@ -182,4 +184,4 @@ def user_identity_lookup(user: "User") -> str:
 @jwt.token_in_blocklist_loader
 def check_if_token_is_revoked(jwt_header, jwt_payload: dict):
     jti = jwt_payload["jti"]
-    return TokenBlacklist.invalid(jti)
+    return auth_cache_manager.is_revoked(jti)
@@ -7,6 +7,7 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import event, text
 from sqlalchemy.engine import Engine, reflection
 
+from core.config import Config
 from core.log import logger
 from core.managers.db_migration_manager import perform_migration
 from core.managers.db_seed_manager import pre_seed, pre_seed_update, sync_enums
@@ -42,11 +43,13 @@ def initialize(app: Flask, initial_setup: bool = True):
     logger.debug(f"DB Engine created with {db.engine.pool.status()}")
 
 
-def setup_fts(engine: Engine):
-    if db.engine.dialect.name != "postgresql":
+def setup_fts(engine: Engine, maintenance: str | None = None):
+    if engine.dialect.name != "postgresql":
         return
+    maintenance = maintenance or Config.FTS_MAINTENANCE
     with engine.begin() as conn:
         conn.execute(text(Path("core/sql/fulltext_search.sql").read_text(encoding="utf-8")))
+        conn.execute(text(Path(f"core/sql/fts_maintenance_{maintenance}.sql").read_text(encoding="utf-8")))
 
 
 def is_db_empty(engine: Engine) -> bool:
@@ -82,6 +82,7 @@ def pre_seed_update(db_engine: Engine):
     migrate_use_feed_content()
     migrate_user_profiles()
     cleanup_empty_stories()
+    rebuild_story_counters()
     migrate_missing_initial_revisions()
     cleanup_intelowl_email_enrichment_parameter()
     if db_engine.dialect.name == "postgresql":
@@ -172,6 +173,13 @@ def rebuild_story_search_vectors():
     logger.info(f"Rebuilt search vectors for {count} stories")
 
 
+def rebuild_story_counters():
+    from core.model.story_counter import StoryCounter
+
+    if StoryCounter.rebuild_if_empty():
+        logger.info("Rebuilt story counters")
+
+
 def cleanup_empty_stories():
     from core.service.story import StoryService
 
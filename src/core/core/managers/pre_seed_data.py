@@ -20,6 +20,9 @@ workers = [
                 "rules": "digest_splitting_limit",
             },
             {"parameter": "BROWSER_MODE", "type": "switch"},
+            {"parameter": "MAX_CONCURRENT_REQUESTS", "type": "number"},
+            {"parameter": "MAX_REQUESTS_PER_HOST", "type": "number"},
+            {"parameter": "HOST_REQUEST_INTERVAL", "type": "number"},
         ],
         "type": "RSS_COLLECTOR",
     },
@@ -42,6 +45,9 @@ workers = [
                 "rules": "digest_splitting_limit",
             },
             {"parameter": "BROWSER_MODE", "type": "switch"},
+            {"parameter": "MAX_CONCURRENT_REQUESTS", "type": "number"},
+            {"parameter": "MAX_REQUESTS_PER_HOST", "type": "number"},
+            {"parameter": "HOST_REQUEST_INTERVAL", "type": "number"},
         ],
         "type": "SIMPLE_WEB_COLLECTOR",
     },
@@ -132,8 +138,11 @@ workers = [
         "parameters": [
             {"parameter": "ITEM_FILTER"},
             {"parameter": "REQUESTS_TIMEOUT", "type": "text", "rules": "positive_int"},
+            {"parameter": "BATCH_SIZE", "type": "text", "rules": "positive_int"},
+            {"parameter": "MAX_PARALLEL_REQUESTS", "type": "text", "rules": "positive_int"},
             {"parameter": "BOT_API_KEY"},
             {"parameter": "BOT_ENDPOINT", "value": "http://llm-bot:8000/ner"},
+            {"parameter": "MODEL_VERSION"},
             {"parameter": "RUN_AFTER_COLLECTOR", "type": "switch"},
             {"parameter": "RUN_AFTER_BOTS"},
             {"parameter": "REFRESH_INTERVAL", "type": "cron_interval"},
@@ -199,6 +208,8 @@ workers = [
         "parameters": [
             {"parameter": "ITEM_FILTER"},
             {"parameter": "REQUESTS_TIMEOUT", "type": "text", "rules": "positive_int"},
+            {"parameter": "BATCH_SIZE", "type": "text", "rules": "positive_int"},
+            {"parameter": "MAX_PARALLEL_REQUESTS", "type": "text", "rules": "positive_int"},
             {"parameter": "BOT_API_KEY"},
             {"parameter": "SUMMARY_ENDPOINT", "value": "http://llm-bot:8000/summarize"},
             {"parameter": "TITLE_ENDPOINT", "value": "http://llm-bot:8000/title"},
@@ -226,8 +237,11 @@ workers = [
         "parameters": [
             {"parameter": "ITEM_FILTER"},
             {"parameter": "REQUESTS_TIMEOUT", "type": "text", "rules": "positive_int"},
+            {"parameter": "BATCH_SIZE", "type": "text", "rules": "positive_int"},
+            {"parameter": "MAX_PARALLEL_REQUESTS", "type": "text", "rules": "positive_int"},
             {"parameter": "BOT_API_KEY"},
             {"parameter": "BOT_ENDPOINT", "value": "http://llm-bot:8000/sentiment"},
+            {"parameter": "MODEL_VERSION"},
             {"parameter": "RUN_AFTER_COLLECTOR", "type": "switch", "value": "true"},
             {"parameter": "RUN_AFTER_BOTS"},
             {"parameter": "REFRESH_INTERVAL", "type": "cron_interval"},
@@ -240,8 +254,11 @@ workers = [
         "parameters": [
             {"parameter": "ITEM_FILTER"},
             {"parameter": "REQUESTS_TIMEOUT", "type": "text", "rules": "positive_int"},
+            {"parameter": "BATCH_SIZE", "type": "text", "rules": "positive_int"},
+            {"parameter": "MAX_PARALLEL_REQUESTS", "type": "text", "rules": "positive_int"},
             {"parameter": "BOT_API_KEY"},
             {"parameter": "BOT_ENDPOINT", "value": "http://llm-bot:8000/cybersec-classification"},
+            {"parameter": "MODEL_VERSION"},
             {"parameter": "CLASSIFICATION_THRESHOLD", "value": "0.65"},
             {"parameter": "RUN_AFTER_COLLECTOR", "type": "switch"},
             {"parameter": "RUN_AFTER_BOTS"},
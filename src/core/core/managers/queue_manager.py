@@ -11,8 +11,8 @@ Architecture:
 
 2. Cron Scheduler (separate worker process):
    - Runs as `taranis-cron`
-   - Polls Redis for cron definitions (`rq:cron:def`)
-   - Tracks next run timestamps in `rq:cron:next`
+   - Caches cron definitions (`rq:cron:def`) in memory and follows changes via `rq:cron:events`
+   - Tracks next run timestamps in `rq:cron:next` and sleeps until the earliest one is due
    - Uses leader lock `rq:cron:leader` for single active scheduler
 
 3. RQ Workers:
@@ -25,7 +25,7 @@ Schedule Updates:
 When a source/bot schedule is updated:
 1. Changes are saved to the database
 2. Core upserts/deletes the job definition in `rq:cron:def`
-3. The scheduler process picks up changes on its next poll cycle
+3. Core appends the change to the `rq:cron:events` stream, which wakes the scheduler
 """
 
 import contextlib
@@ -58,6 +58,7 @@ from core.service.simple_web_collector import get_simple_web_collector_url
 
 CRON_DEFS_KEY = "rq:cron:def"
 CRON_EVENTS_KEY = "rq:cron:events"
+CRON_EVENTS_MAXLEN = 10000
 CRON_NEXT_KEY = "rq:cron:next"
 TOKEN_CLEANUP_JOB_ID = "cleanup_token_blacklist"
 TOKEN_CLEANUP_CRON = "0 2 * * *"
@@ -1393,7 +1394,7 @@ class QueueManager:
                 p.hset(CRON_DEFS_KEY, spec.job_id, payload)
                 if next_ts is not None:
                     p.zadd(CRON_NEXT_KEY, {spec.job_id: next_ts})
-                p.xadd(CRON_EVENTS_KEY, {"op": "upsert", "job_id": spec.job_id})
+                p.xadd(CRON_EVENTS_KEY, {"op": "upsert", "job_id": spec.job_id}, maxlen=CRON_EVENTS_MAXLEN, approximate=True)
                 p.execute()
                 return True
         except Exception as e:
@@ -1410,7 +1411,7 @@ class QueueManager:
             with self._redis.pipeline() as p:
                 p.hdel(CRON_DEFS_KEY, job_id)
                 p.zrem(CRON_NEXT_KEY, job_id)
-                p.xadd(CRON_EVENTS_KEY, {"op": "delete", "job_id": job_id})
+                p.xadd(CRON_EVENTS_KEY, {"op": "delete", "job_id": job_id}, maxlen=CRON_EVENTS_MAXLEN, approximate=True)
                 p.execute()
                 return True
         except Exception as e:
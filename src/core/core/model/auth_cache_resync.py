@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import Connection
+from sqlalchemy.orm import Mapped
+
+from core.managers.db_manager import db
+from core.model.base_model import BaseModel
+
+
+class AuthCacheResync(BaseModel):
+    """Requests to reload the per-process auth caches, written when an auth cache event could not be broadcast."""
+
+    __tablename__ = "auth_cache_resync"
+
+    id: Mapped[int] = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    created: Mapped[datetime] = db.Column(db.DateTime, default=BaseModel.utcnow)
+
+    @classmethod
+    def request(cls) -> None:
+        """Record a request outside of the current session, which may be committing or already committed."""
+        with db.engine.begin() as connection:
+            latest = cls.latest(connection)
+            connection.execute(db.insert(cls).values(created=cls.utcnow()))
+            connection.execute(db.delete(cls).where(cls.id <= latest))
+
+    @classmethod
+    def latest(cls, connection: Connection | None = None) -> int:
+        query = db.select(db.func.coalesce(db.func.max(cls.id), 0))
+        return (connection or db.session).execute(query).scalar_one()
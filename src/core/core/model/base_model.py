@@ -67,17 +67,19 @@ class BaseModel(db.Model):
     def serialize_datetime(cls, value: datetime) -> str:
         return cls.as_utc_aware(value).isoformat()
 
+    @classmethod
+    def serialize_value(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return cls.serialize_datetime(value)
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
     def to_dict(self) -> dict[str, Any]:
         table = getattr(self, "__table__", None)
         if table is None:
             return {}
-        data = {c.name: getattr(self, c.name) for c in table.columns}
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = self.serialize_datetime(value)
-            elif isinstance(value, Enum):
-                data[key] = value.value
-        return data
+        return {c.name: self.serialize_value(getattr(self, c.name)) for c in table.columns}
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
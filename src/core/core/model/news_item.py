@@ -1,5 +1,5 @@
 import hashlib
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -9,7 +9,7 @@ from models.assess import validate_bcp47
 from pydantic import ValidationError
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, query_expression, relationship
 from sqlalchemy.sql import Select
 
 from core.log import logger
@@ -19,7 +19,7 @@ from core.model.news_item_attribute import NewsItemAttribute
 from core.model.news_item_tag import NewsItemTag
 from core.model.osint_source import OSINTSource
 from core.model.role import TLPLevel
-from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.role_based_access import ItemType
 from core.model.settings import Settings
 from core.model.user import User
 from core.service.role_based_access import RBACQuery, RoleBasedAccessService
@@ -67,6 +67,8 @@ class NewsItem(BaseModel):
     story_id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), db.ForeignKey("story.id", ondelete="SET NULL"), nullable=True, index=True)
     story: Mapped["Story | None"] = relationship("Story", back_populates="news_items")
 
+    content_teaser: Mapped[str | None] = query_expression()
+
     def __init__(
         self,
         title: str = "",
@@ -162,6 +164,12 @@ class NewsItem(BaseModel):
     def identical(cls, hash) -> bool:
         return db.session.execute(db.select(db.exists().where(cls.hash == hash))).scalar_one()
 
+    @classmethod
+    def get_known_hashes(cls, hashes: Iterable[str]) -> set[str]:
+        if not (hashes := list(set(hashes))):
+            return set()
+        return set(db.session.execute(db.select(cls.hash).where(cls.hash.in_(hashes))).scalars())
+
     @classmethod
     def find_by_hash(cls, hash):
         return cls.get_filtered(db.select(cls).where(cls.hash == hash))
@@ -206,12 +214,44 @@ class NewsItem(BaseModel):
         data["tags"] = [tag.to_dict() for tag in self.tags]
         return data
 
+    def to_worker_dict(self, fields: set[str] | None = None) -> dict[str, Any]:
+        if fields is None:
+            return self.to_dict()
+        data = {name: self.serialize_value(getattr(self, name)) for name in fields if name != "tags"}
+        if "tags" in fields:
+            data["tags"] = [tag.to_dict() for tag in self.tags]
+        return data
+
+    def to_summary_dict(self, content_length: int) -> dict[str, Any]:
+        content = self.content_teaser if self.content_teaser is not None else (self.content or "")[:content_length]
+        return {
+            "id": self.id,
+            "title": self.title,
+            "source": self.source,
+            "link": self.link,
+            "language": self.language,
+            "osint_source_id": self.osint_source_id,
+            "story_id": self.story_id,
+            "published": self.serialize_datetime(self.published) if self.published else None,
+            "collected": self.serialize_datetime(self.collected) if self.collected else None,
+            "content": content,
+            "tags": [tag.to_dict() for tag in self.tags],
+        }
+
     def get_sentiment(self) -> str:
-        return next((attr.value for attr in self.attributes if attr.key == "sentiment_category"), "")
+        return self.sentiment_from_attributes(self.attributes)
 
     def get_cybersecurity_status(self) -> str:
-        return next((attr.value for attr in self.attributes if attr.key == "cybersecurity_human"), None) or next(
-            (attr.value for attr in self.attributes if attr.key == "cybersecurity_bot"), "none"
+        return self.cybersecurity_status_from_attributes(self.attributes)
+
+    @staticmethod
+    def sentiment_from_attributes(attributes: Sequence[NewsItemAttribute]) -> str:
+        return next((attr.value for attr in attributes if attr.key == "sentiment_category"), "")
+
+    @staticmethod
+    def cybersecurity_status_from_attributes(attributes: Sequence[NewsItemAttribute]) -> str:
+        return next((attr.value for attr in attributes if attr.key == "cybersecurity_human"), None) or next(
+            (attr.value for attr in attributes if attr.key == "cybersecurity_bot"), "none"
         )
 
     def upsert(self):
@@ -243,10 +283,12 @@ class NewsItem(BaseModel):
     @classmethod
     def delete_all(cls) -> tuple[dict[str, Any], int]:
         from core.model.news_item_tag import NewsItemTag, NewsItemTagCluster
+        from core.model.story_counter import StoryCounter
 
         db.session.execute(db.delete(NewsItemTagCluster))
         db.session.execute(db.delete(NewsItemTag))
         db.session.execute(db.delete(cls))
+        StoryCounter.mark_rebuild()
         db.session.commit()
         logger.debug(f"All {cls.__name__} deleted")
         return {"message": f"All {cls.__name__} deleted"}, 200
@@ -507,9 +549,6 @@ class NewsItem(BaseModel):
         return query.offset(offset).limit(limit)
 
     def allowed_with_acl(self, user: User, require_write_access: bool) -> bool:
-        if not RoleBasedAccess.is_enabled():
-            return True
-
         query = RBACQuery(
             user=user,
             resource_id=self.osint_source_id,
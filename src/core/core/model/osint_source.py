@@ -21,7 +21,7 @@ from core.managers.db_manager import db
 from core.model.base_model import DB_INTEGER_MAX, UUID_STR_LENGTH, BaseModel
 from core.model.parameter_value import ParameterValue
 from core.model.role import TLPLevel
-from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.role_based_access import ItemType
 from core.model.settings import Settings
 from core.model.task import Task as TaskModel
 from core.model.word_list import WordList
@@ -573,6 +573,7 @@ class OSINTSource(BaseModel):
     def delete(cls, source_id: str, force: bool = False) -> tuple[dict, int]:
         from core.managers import queue_manager
         from core.model.story import Story
+        from core.model.story_counter import StoryCounter
         from core.service.misp_auto_update import refresh_misp_auto_update_jobs
         from core.service.story import StoryService
 
@@ -598,6 +599,7 @@ class OSINTSource(BaseModel):
                         .scalars()
                         .all()
                     )
+                    StoryCounter.mark_stories(affected_story_ids)
                     db.session.execute(news_item_table.delete().where(news_item_table.c.osint_source_id == source_id))
                 StoryService.delete_stories_with_no_items()
             db.session.delete(source)
@@ -985,7 +987,7 @@ class OSINTSourceGroup(BaseModel):
         }
 
     def allowed_with_acl(self, user: "User | None", require_write_access) -> bool:
-        if not RoleBasedAccess.is_enabled() or not user:
+        if not user:
             return True
 
         query = RBACQuery(
@@ -1,14 +1,14 @@
-import binascii
 import mimetypes
-from base64 import b64decode
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy.orm import Mapped, deferred, relationship
+from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.sql import Select
 
+from core.config import Config
 from core.log import logger
 from core.managers import queue_manager
+from core.managers.artifact_store import get_artifact_store
 from core.managers.db_manager import db
 from core.model.base_model import UUID_STR_LENGTH, BaseModel
 from core.model.product_type import ProductType
@@ -35,7 +35,7 @@ class Product(BaseModel):
     default_publisher: Mapped[str | None] = db.Column(db.String(UUID_STR_LENGTH), db.ForeignKey("publisher_preset.id"), nullable=True)
     last_rendered: Mapped[datetime] = db.Column(db.DateTime)
     last_published_url: Mapped[str | None] = db.Column(db.Text, nullable=True)
-    render_result = deferred(db.Column(db.Text))
+    render_digest: Mapped[str | None] = db.Column(db.String(64), nullable=True, index=True)
 
     def __init__(
         self,
@@ -110,13 +110,11 @@ class Product(BaseModel):
         data = super().to_dict()
         data["type"] = self.product_type.type
         data["report_items"] = [report_item.id for report_item in self.report_items if report_item]
-        data.pop("render_result", None)
         return data
 
     def to_detail_dict(self) -> dict[str, Any]:
         data = self.to_dict()
         data["supported_reports"] = [r.to_supported_products_dict() for r in self.get_supported_reports()]
-        data["render_result"] = self.render_result
         data["mime_type"] = self.product_type.get_mimetype() if self.product_type else None
         return data
 
@@ -130,39 +128,39 @@ class Product(BaseModel):
             "mime_type": self.product_type.get_mimetype(),
             "report_items": [report_item.to_product_dict() for report_item in self.report_items if report_item],
             "parameters": {param.parameter: param.value for param in self.product_type.parameters},
+            "render_digest": self.render_digest,
         }
 
-    @classmethod
-    def test_if_valid_render_result(cls, render_result: str) -> bool:
-        """
-        Test if render_result is a valid base64 string
-        :return: True if valid, False otherwise
-        """
-        try:
-            b64decode(render_result)
-            return True
-        except (binascii.Error, TypeError, ValueError):
-            logger.exception()
+    def update_render(self, render_digest: str) -> bool:
+        if not get_artifact_store().exists(render_digest):
+            logger.error(f"Render artifact {render_digest} of Product {self.id} not found")
             return False
 
-    def update_render(self, render_result: str) -> bool:
-        if self.test_if_valid_render_result(render_result):
-            self.last_rendered = self.utcnow()
-            self.render_result = render_result
-            db.session.commit()
-            return True
-
-        return False
+        self.last_rendered = self.utcnow()
+        self.render_digest = render_digest
+        db.session.commit()
+        return True
 
     @classmethod
-    def update_render_for_id(cls, product_id: str, render_result: str):
+    def update_render_for_id(cls, product_id: str, render_digest: str):
         if not (product := cls.get(product_id)):
             return {"error": "Product not found"}, 404
-        if product.update_render(render_result):
+        if product.update_render(render_digest):
             logger.debug(f"Render result for Product {product_id} updated")
             return {"message": "Product updated"}, 200
         return {"error": "Product not updated"}, 500
 
+    @classmethod
+    def prune_renders(cls) -> int:
+        """Delete render artifacts no product references and nobody stored or looked up within the grace period.
+
+        Artifacts are not deleted when a product drops them: a worker may have found the same content in the
+        store and be about to reference it, so only artifacts unused for ARTIFACT_GRACE_MINUTES are removed.
+        """
+        referenced = set(db.session.execute(db.select(cls.render_digest).where(cls.render_digest.is_not(None))).scalars())
+        modified_before = datetime.now(UTC) - timedelta(minutes=Config.ARTIFACT_GRACE_MINUTES)
+        return get_artifact_store().prune(referenced, modified_before)
+
     def get_file_name(self) -> str:
         product_title = self.title
         mime_type = self.product_type.get_mimetype()
@@ -174,8 +172,8 @@ class Product(BaseModel):
 
     @classmethod
     def get_render(cls, product_id: str):
-        if (product := cls.get(product_id)) and product.render_result:
-            return {"mime_type": product.product_type.get_mimetype(), "blob": product.render_result, "filename": product.get_file_name()}
+        if (product := cls.get(product_id)) and product.render_digest:
+            return {"mime_type": product.product_type.get_mimetype(), "digest": product.render_digest, "filename": product.get_file_name()}
         return None
 
     @classmethod
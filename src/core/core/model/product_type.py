@@ -16,7 +16,7 @@ from core.managers.db_manager import db
 from core.model.base_model import UUID_STR_LENGTH, BaseModel
 from core.model.parameter_value import ParameterValue
 from core.model.report_item_type import ReportItemType
-from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.role_based_access import ItemType
 from core.model.worker import Worker
 from core.service.role_based_access import RBACQuery, RoleBasedAccessService
 
@@ -44,7 +44,7 @@ class ProductType(BaseModel):
             self.report_types = ReportItemType.get_bulk(report_types)
 
     def allowed_with_acl(self, user, require_write_access) -> bool:
-        if not RoleBasedAccess.is_enabled() or not user:
+        if not user:
             return True
 
         query = RBACQuery(user=user, resource_id=str(self.id), resource_type=ItemType.PRODUCT_TYPE, require_write_access=require_write_access)
@@ -15,7 +15,7 @@ from core.model.attribute import AttributeEnum, AttributeType
 from core.model.base_model import UUID_STR_LENGTH, BaseModel
 from core.model.report_item_type import AttributeGroup, AttributeGroupItem, ReportItemType
 from core.model.revision import ReportRevision
-from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.role_based_access import ItemType
 from core.model.story import Story
 from core.model.user import User
 from core.service.report_story_sync import ReportStorySyncService
@@ -392,7 +392,7 @@ class ReportItem(BaseModel):
         return True
 
     def _allowed_with_acl(self, user, require_write_access) -> bool:
-        if not RoleBasedAccess.is_enabled() or not user:
+        if not user:
             return True
 
         query = RBACQuery(
@@ -9,7 +9,7 @@ from core.log import logger
 from core.managers.db_manager import db
 from core.model.attribute import Attribute
 from core.model.base_model import UUID_STR_LENGTH, BaseModel
-from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.role_based_access import ItemType
 from core.service.role_based_access import RBACQuery, RoleBasedAccessService
 
 
@@ -181,7 +181,7 @@ class ReportItemType(BaseModel):
         return query
 
     def allowed_with_acl(self, user, require_write_access) -> bool:
-        if not RoleBasedAccess.is_enabled() or not user:
+        if not user:
             return True
 
         query = RBACQuery(
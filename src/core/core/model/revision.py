@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Any, cast
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from sqlalchemy import UniqueConstraint, func
+from sqlalchemy import UniqueConstraint, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm.attributes import set_committed_value
 
 from core.managers.db_manager import db
+from core.model import revision_codec
 from core.model.base_model import UUID_STR_LENGTH, BaseModel
 
 
+UNUSED_GRACE_PERIOD = timedelta(hours=1)
+# The digests of all news item references in the stored data of a revision table, keyframes and deltas alike.
+NEWS_ITEM_REFERENCES_SQL = {
+    "postgresql": """SELECT jsonb_path_query(CAST(data AS jsonb), '$.**."{key}"') #>> '{{}}' FROM {table}""",
+    "sqlite": "SELECT tree.value FROM {table}, json_tree({table}.data) AS tree WHERE tree.key = '{key}'",
+}
+
 if TYPE_CHECKING:
     from core.model.report_item import ReportItem
     from core.model.story import Story
@@ -30,8 +42,148 @@ def _increment_parent_revision(item: Story | ReportItem) -> int:
     return next_revision
 
 
-class StoryRevision(BaseModel):
+def _increment_parent_revisions(items: Sequence[Story]) -> None:
+    db.session.flush()
+
+    table = getattr(items[0], "__table__")  # noqa: B009
+    next_revisions = dict(
+        db.session.execute(
+            table.update()
+            .where(table.c.id.in_([item.id for item in items]))
+            .values(revision=func.coalesce(table.c.revision, 0) + 1)
+            .returning(table.c.id, table.c.revision)
+        )
+        .tuples()
+        .all()
+    )
+    for item in items:
+        set_committed_value(item, "revision", next_revisions[item.id])
+
+
+class RevisionNewsItem(BaseModel):
+    """News items referenced from compacted revision snapshots, stored once per distinct content.
+
+    last_used is refreshed whenever a revision stores or reuses a news item, so delete_unreferenced
+    never removes an item that a revision still being written is about to reference.
+    """
+
+    __tablename__ = "revision_news_item"
+
+    digest: Mapped[str] = db.Column(db.String(64), primary_key=True)
+    data: Mapped[dict[str, Any]] = db.Column(db.JSON, nullable=False)
+    last_used: Mapped[datetime] = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
+
+    @classmethod
+    def store(cls, news_items: dict[str, dict[str, Any]]) -> None:
+        if not news_items:
+            return
+        now = cls.utcnow()
+        # Refreshing known items locks them against a concurrent delete_unreferenced until this transaction ends.
+        known = set(
+            db.session.execute(
+                db.update(cls).where(cls.digest.in_(list(news_items))).values(last_used=now).returning(cls.digest),
+                execution_options={"synchronize_session": False},
+            ).scalars()
+        )
+        if rows := [
+            {"digest": digest, "data": news_item, "last_used": now} for digest, news_item in news_items.items() if digest not in known
+        ]:
+            insert = pg_insert if db.engine.dialect.name == "postgresql" else sqlite_insert
+            db.session.execute(insert(cls).on_conflict_do_nothing(), rows)
+
+    @classmethod
+    def load(cls, digests: Iterable[str]) -> dict[str, dict[str, Any]]:
+        if not (digests := list(digests)):
+            return {}
+        return dict(db.session.execute(db.select(cls.digest, cls.data).where(cls.digest.in_(digests))).tuples().all())
+
+    @classmethod
+    def delete_unreferenced(cls) -> int:
+        """Delete the news items no story or report revision references that were not used within UNUSED_GRACE_PERIOD."""
+        references = NEWS_ITEM_REFERENCES_SQL["postgresql" if db.engine.dialect.name == "postgresql" else "sqlite"]
+        referenced = " UNION ".join(
+            references.format(table=revision_cls.__tablename__, key=revision_codec.NEWS_ITEM_REF_KEY)
+            for revision_cls in (StoryRevision, ReportRevision)
+        )
+        statement = db.text(
+            f"WITH referenced (digest) AS ({referenced}) "
+            f"DELETE FROM {cls.__tablename__} WHERE last_used < :cutoff "
+            f"AND NOT EXISTS (SELECT 1 FROM referenced WHERE referenced.digest = {cls.__tablename__}.digest)"
+        ).bindparams(db.bindparam("cutoff", type_=db.DateTime))
+        deleted = db.session.execute(statement, {"cutoff": cls.utcnow() - UNUSED_GRACE_PERIOD}).rowcount
+        db.session.commit()
+        return deleted
+
+
+class DeltaEncodedRevision:
+    """Revision rows holding either a compacted keyframe or a delta against the latest keyframe of their parent.
+
+    See core.model.revision_codec for the encoding; ``data`` reconstructs the full snapshot on demand.
+    """
+
+    parent_key: ClassVar[str]
+    revision: Mapped[int]
+    keyframe_revision: Mapped[int | None]
+    stored_data: Mapped[Any]
+
+    @classmethod
+    def _parent_column(cls):
+        return getattr(cls, cls.parent_key)
+
+    @classmethod
+    def _latest_keyframes(cls, parent_ids: Iterable[str]) -> dict[str, tuple[int, dict[str, Any]]]:
+        parent = cls._parent_column()
+        latest = (
+            db.select(parent, func.max(cls.revision)).where(parent.in_(list(parent_ids)), cls.keyframe_revision.is_(None)).group_by(parent)
+        )
+        rows = db.session.execute(db.select(parent, cls.revision, cls.stored_data).where(tuple_(parent, cls.revision).in_(latest)))
+        return {parent_id: (revision, data) for parent_id, revision, data in rows.tuples()}
+
+    @classmethod
+    def encode_snapshots(cls, snapshots: Sequence[tuple[str, int, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Encode (parent id, revision, snapshot) entries into row values and store the news items they reference."""
+        if not snapshots:
+            return []
+        keyframes = cls._latest_keyframes({parent_id for parent_id, _, _ in snapshots})
+        # News items referenced by a stored keyframe are stored already; most revisions reference nothing else.
+        stored_digests = revision_codec.news_item_references([data for _, data in keyframes.values()])
+        news_items: dict[str, dict[str, Any]] = {}
+        rows = []
+        for parent_id, revision, snapshot in snapshots:
+            stored, keyframe_revision, referenced = revision_codec.encode(snapshot, revision, keyframes.get(parent_id))
+            news_items.update(referenced)
+            if keyframe_revision is None:
+                keyframes[parent_id] = (revision, stored)
+            rows.append({cls.parent_key: parent_id, "revision": revision, "stored_data": stored, "keyframe_revision": keyframe_revision})
+        RevisionNewsItem.store({digest: news_item for digest, news_item in news_items.items() if digest not in stored_digests})
+        return rows
+
+    @classmethod
+    def insert_snapshots(
+        cls, snapshots: Sequence[tuple[str, int, dict[str, Any]]], created_by_id: str | None = None, note: str | None = None
+    ) -> None:
+        if rows := cls.encode_snapshots(snapshots):
+            db.session.execute(
+                db.insert(cls), [{"id": BaseModel.uuid7_str(), "created_by_id": created_by_id, "note": note, **row} for row in rows]
+            )
+
+    @property
+    def data(self) -> dict[str, Any]:
+        keyframe_data = None
+        if self.keyframe_revision is not None:
+            cls = type(self)
+            keyframe_data = db.session.execute(
+                db.select(cls.stored_data).where(
+                    cls._parent_column() == getattr(self, cls.parent_key), cls.revision == self.keyframe_revision
+                )
+            ).scalar_one()
+        snapshot = revision_codec.decode(self.stored_data, keyframe_data)
+        return revision_codec.expand_snapshot(snapshot, RevisionNewsItem.load(revision_codec.news_item_references(snapshot)))
+
+
+class StoryRevision(DeltaEncodedRevision, BaseModel):
     __tablename__ = "story_revision"
+    parent_key = "story_id"
 
     id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True, default=BaseModel.uuid7_str)
     story_id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), db.ForeignKey("story.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -40,7 +192,8 @@ class StoryRevision(BaseModel):
     created_by_id: Mapped[str | None] = db.Column(db.String(UUID_STR_LENGTH), db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     created_by: Mapped[User | None] = relationship("User")
     note: Mapped[str | None] = db.Column(db.Text)
-    data: Mapped[dict[str, Any]] = db.Column(db.JSON, nullable=False)
+    stored_data: Mapped[Any] = db.Column("data", db.JSON, nullable=False)
+    keyframe_revision: Mapped[int | None] = db.Column(db.Integer, nullable=True)
 
     __table_args__ = (UniqueConstraint("story_id", "revision", name="uq_story_revision_story_rev"),)
 
@@ -51,18 +204,35 @@ class StoryRevision(BaseModel):
     @classmethod
     def create_from_story(cls, story: Story, created_by_id: str | None = None, note: str | None = None) -> StoryRevision:
         next_revision = _increment_parent_revision(story)
-        revision = cls()
-        revision.story_id = story.id
-        revision.revision = next_revision
+        (row,) = cls.encode_snapshots([(story.id, next_revision, cls.snapshot_story(story))])
+        revision = cls(**row)
         revision.created_by_id = created_by_id
         revision.note = note
-        revision.data = cls.snapshot_story(story)
         db.session.add(revision)
         return revision
 
+    @classmethod
+    def create_for_stories(
+        cls,
+        stories: Sequence[Story],
+        in_reports_counts: dict[str, int],
+        created_by_id: str | None = None,
+        note: str | None = None,
+    ) -> None:
+        """Record one revision per story with a single revision bump and one bulk insert."""
+        if not stories:
+            return
+        _increment_parent_revisions(stories)
+        cls.insert_snapshots(
+            [(story.id, story.revision, story.to_detail_dict(in_reports_count=in_reports_counts.get(story.id, 0))) for story in stories],
+            created_by_id=created_by_id,
+            note=note,
+        )
+
 
-class ReportRevision(BaseModel):
+class ReportRevision(DeltaEncodedRevision, BaseModel):
     __tablename__ = "report_revision"
+    parent_key = "report_item_id"
 
     id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True, default=BaseModel.uuid7_str)
     report_item_id: Mapped[str] = db.Column(
@@ -73,7 +243,8 @@ class ReportRevision(BaseModel):
     created_by_id: Mapped[str | None] = db.Column(db.String(UUID_STR_LENGTH), db.ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
     created_by: Mapped[User | None] = relationship("User")
     note: Mapped[str | None] = db.Column(db.Text)
-    data: Mapped[dict[str, Any]] = db.Column(db.JSON, nullable=False)
+    stored_data: Mapped[Any] = db.Column("data", db.JSON, nullable=False)
+    keyframe_revision: Mapped[int | None] = db.Column(db.Integer, nullable=True)
 
     __table_args__ = (UniqueConstraint("report_item_id", "revision", name="uq_report_revision_report_rev"),)
 
@@ -84,11 +255,9 @@ class ReportRevision(BaseModel):
     @classmethod
     def create_from_report(cls, report: ReportItem, created_by_id: str | None = None, note: str | None = None) -> ReportRevision:
         next_revision = _increment_parent_revision(report)
-        revision = cls()
-        revision.report_item_id = report.id
-        revision.revision = next_revision
+        (row,) = cls.encode_snapshots([(report.id, next_revision, cls.snapshot_report(report))])
+        revision = cls(**row)
         revision.created_by_id = created_by_id
         revision.note = note
-        revision.data = cls.snapshot_report(report)
         db.session.add(revision)
         return revision
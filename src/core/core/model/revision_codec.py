@@ -0,0 +1,135 @@
+"""Delta encoding for story and report revision snapshots.
+
+Snapshots are stored compacted: news items nested in them are replaced by content-addressed
+references, and most revisions hold a JSON-patch style delta against the latest keyframe of
+their story or report instead of the whole snapshot. Everything here works on plain JSON
+values, so the history-compaction migration can use it without a Flask app.
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any
+
+
+NEWS_ITEM_REF_KEY = "$news_item"
+# A full snapshot is written at least every KEYFRAME_INTERVAL revisions, which bounds how far a delta can drift.
+KEYFRAME_INTERVAL = 20
+# Deltas larger than this share of their compacted snapshot are not worth the reconstruction and become keyframes.
+MAX_DELTA_RATIO = 0.5
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def news_item_digest(news_item: dict[str, Any]) -> str:
+    return hashlib.sha256(_dumps(news_item).encode()).hexdigest()
+
+
+def compact_snapshot(snapshot: dict[str, Any]) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Replace nested news items by references; return the compacted snapshot and the news items by digest."""
+    news_items: dict[str, dict[str, Any]] = {}
+
+    def compact(value: Any, key: str | None = None) -> Any:
+        if isinstance(value, dict):
+            return {child_key: compact(child, child_key) for child_key, child in value.items()}
+        if isinstance(value, list):
+            if key != "news_items":
+                return [compact(child) for child in value]
+            references = []
+            for news_item in value:
+                if not isinstance(news_item, dict) or NEWS_ITEM_REF_KEY in news_item:
+                    references.append(news_item)
+                    continue
+                digest = news_item_digest(news_item)
+                news_items[digest] = news_item
+                references.append({"id": news_item.get("id"), NEWS_ITEM_REF_KEY: digest})
+            return references
+        return value
+
+    return compact(snapshot), news_items
+
+
+def news_item_references(snapshot: Any) -> set[str]:
+    if isinstance(snapshot, dict):
+        if digest := snapshot.get(NEWS_ITEM_REF_KEY):
+            return {digest}
+        return set().union(*(news_item_references(value) for value in snapshot.values()))
+    if isinstance(snapshot, list):
+        return set().union(*(news_item_references(value) for value in snapshot))
+    return set()
+
+
+def expand_snapshot(snapshot: Any, news_items: dict[str, dict[str, Any]]) -> Any:
+    """Inverse of compact_snapshot; references without a stored news item are kept as they are."""
+    if isinstance(snapshot, dict):
+        if (digest := snapshot.get(NEWS_ITEM_REF_KEY)) and digest in news_items:
+            return copy.deepcopy(news_items[digest])
+        return {key: expand_snapshot(value, news_items) for key, value in snapshot.items()}
+    if isinstance(snapshot, list):
+        return [expand_snapshot(value, news_items) for value in snapshot]
+    return snapshot
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(base: dict[str, Any], target: dict[str, Any], path: str = "") -> list[dict[str, Any]]:
+    """RFC 6902 operations turning base into target; objects are diffed per key, other values are replaced whole."""
+    operations: list[dict[str, Any]] = []
+    for key in base.keys() - target.keys():
+        operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in target.items():
+        key_path = f"{path}/{_escape(key)}"
+        if key not in base:
+            operations.append({"op": "add", "path": key_path, "value": value})
+        elif isinstance(value, dict) and isinstance(base[key], dict):
+            operations.extend(diff(base[key], value, key_path))
+        elif _dumps(value) != _dumps(base[key]):
+            operations.append({"op": "replace", "path": key_path, "value": value})
+    return operations
+
+
+def apply_patch(base: dict[str, Any], operations: list[dict[str, Any]]) -> dict[str, Any]:
+    document = copy.deepcopy(base)
+    for operation in operations:
+        *parents, key = [_unescape(token) for token in operation["path"].split("/")[1:]]
+        target = document
+        for parent in parents:
+            target = target[parent]
+        if operation["op"] == "remove":
+            target.pop(key, None)
+        else:
+            target[key] = copy.deepcopy(operation["value"])
+    return document
+
+
+def encode(
+    snapshot: dict[str, Any], revision: int, keyframe: tuple[int, dict[str, Any]] | None
+) -> tuple[Any, int | None, dict[str, dict[str, Any]]]:
+    """Encode a snapshot against the latest keyframe (revision, stored data), if any.
+
+    Returns the data to store, the keyframe revision it is a delta against (None for a new
+    keyframe) and the news items the stored data references.
+    """
+    compacted, news_items = compact_snapshot(snapshot)
+    if keyframe is not None:
+        keyframe_revision, keyframe_data = keyframe
+        if revision - keyframe_revision < KEYFRAME_INTERVAL:
+            operations = diff(keyframe_data, compacted)
+            if len(_dumps(operations)) <= MAX_DELTA_RATIO * len(_dumps(compacted)):
+                return operations, keyframe_revision, news_items
+    return compacted, None, news_items
+
+
+def decode(stored: Any, keyframe_data: dict[str, Any] | None) -> dict[str, Any]:
+    """Compacted snapshot of a stored revision; keyframe_data is required for deltas."""
+    if keyframe_data is None:
+        return stored
+    return apply_patch(keyframe_data, stored)
@@ -1,3 +1,6 @@
+import base64
+import binascii
+import json
 import re
 from collections import Counter
 from collections.abc import Sequence
@@ -7,11 +10,11 @@ from typing import Any
 from models.assess import NewsItem as AssessNewsItem
 from models.assess import Story as StoryPayload
 from pydantic import ValidationError
-from sqlalchemy import func, inspect, or_
+from sqlalchemy import func, inspect, or_, tuple_
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import Mapped, aliased, relationship
+from sqlalchemy.orm import Mapped, aliased, load_only, relationship, selectinload, with_expression
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.expression import false, null, true
 
@@ -27,18 +30,52 @@ from core.model.revision import StoryRevision
 from core.model.role import TLPLevel
 from core.model.role_based_access import ItemType
 from core.model.story_conflict import StoryConflict
+from core.model.story_counter import StoryCounter
 from core.model.user import User
 from core.service.role_based_access import RBACQuery, RoleBasedAccessService
 from core.service.story_operations import StoryOperationsService
 
 
+STORY_SORT_KEYS: dict[str, tuple[tuple[str, bool], ...]] = {
+    "date_desc": (("created", True), ("title", True), ("id", True)),
+    "date_asc": (("created", False), ("title", False), ("id", False)),
+    "relevance": (("relevance", True), ("created", True), ("id", True)),
+    "updated_desc": (("updated", True), ("title", True), ("id", True)),
+    "updated_asc": (("updated", False), ("title", False), ("id", False)),
+}
+
+STORY_SUMMARY_CONTENT_LENGTH = 500
+
+# Story attributes mirrored into indexed story columns, so filters and TLP checks need no attribute joins.
+STATUS_ATTRIBUTE_COLUMNS = {"TLP": "tlp", "cybersecurity": "cybersecurity", "sentiment": "sentiment"}
+
+# Story relations workers can request next to plain story columns; news item fields are requested as "news_items.<field>".
+WORKER_STORY_RELATIONS = ("news_items", "tags", "attributes", "misp_auto_update")
+
+# Filters the story_counter table cannot answer; any of them forces exact counting.
+STORY_COUNTER_UNSUPPORTED_FILTERS = (
+    "story_id",
+    "story_ids",
+    "language",
+    "search",
+    "exclude_attr",
+    "include_attr",
+    "cybersecurity",
+    "relevant",
+    "tags",
+    "changed_by",
+    "timefrom",
+    "timeto",
+)
+
+
 class Story(BaseModel):
     __tablename__ = "story"
 
     id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True, default=BaseModel.uuid7_str)
     title: Mapped[str] = db.Column(db.String())
     description: Mapped[str] = db.Column(db.String())
-    created: Mapped[datetime] = db.Column(db.DateTime)
+    created: Mapped[datetime] = db.Column(db.DateTime, index=True)
     updated: Mapped[datetime] = db.Column(db.DateTime, default=BaseModel.utcnow)
 
     read: Mapped[bool] = db.Column(db.Boolean, default=False)
@@ -54,6 +91,9 @@ class Story(BaseModel):
     revision: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
     news_items: Mapped[list["NewsItem"]] = relationship("NewsItem")
     last_change: Mapped[str] = db.Column(db.String())
+    tlp: Mapped[str | None] = db.Column(db.String(), index=True)
+    cybersecurity: Mapped[str | None] = db.Column(db.String(), index=True)
+    sentiment: Mapped[str | None] = db.Column(db.String(), index=True)
     attributes: Mapped[list["NewsItemAttribute"]] = relationship(
         "NewsItemAttribute", secondary="story_news_item_attribute", cascade="all, delete"
     )
@@ -98,6 +138,8 @@ class Story(BaseModel):
         self.relevance_override = relevance if relevance_override is None else relevance_override
         if attributes:
             self.attributes = NewsItemAttribute.load_multiple(attributes)
+            for attribute in self.attributes:
+                self._sync_status_column(attribute.key, attribute.value)
         self.created, self.updated = self.get_story_dates(created, updated)
         self.recompute_relevance(in_reports_count=0)
 
@@ -337,6 +379,91 @@ class Story(BaseModel):
 
         return db.session.execute(count_query).one()
 
+    @classmethod
+    def get_counts(cls, filter_args: dict[str, Any], filter_query: Select, unrestricted: bool) -> dict[str, Any]:
+        """Return list counts from story_counter where possible, else from the filter query.
+
+        With counts=estimated, multi source/group counters and planner estimates are accepted as well.
+        """
+        estimated = filter_args.get("counts") == "estimated"
+        if unrestricted and (counts := cls._get_counter_counts(filter_args, estimated)) is not None:
+            return counts
+        if estimated and (counts := cls._estimate_additional_counts(filter_query)) is not None:
+            return counts
+
+        additional_counts = cls.get_additional_counts(filter_query)
+        return {
+            "total_count": additional_counts.total_count,
+            "read_count": additional_counts.read_count,
+            "important_count": additional_counts.important_count,
+            "in_reports_count": additional_counts.in_reports_count,
+        }
+
+    @staticmethod
+    def _bool_filter(filter_args: dict[str, Any], key: str) -> bool | None:
+        value = str(filter_args.get(key, "")).lower()
+        return {"true": True, "false": False}.get(value)
+
+    @classmethod
+    def _get_counter_counts(cls, filter_args: dict[str, Any], estimated: bool) -> dict[str, Any] | None:
+        if any(filter_args.get(key) for key in STORY_COUNTER_UNSUPPORTED_FILTERS):
+            return None
+
+        source_ids = set(filter_args.get("source") or [])
+        if groups := filter_args.get("group"):
+            if not estimated:
+                return None
+            source_ids.update(
+                db.session.execute(
+                    db.select(OSINTSourceGroupOSINTSource.osint_source_id).where(
+                        OSINTSourceGroupOSINTSource.osint_source_group_id.in_(groups)
+                    )
+                ).scalars()
+            )
+            if not source_ids:
+                return {"total_count": 0, "read_count": 0, "important_count": 0, "in_reports_count": 0}
+        if len(source_ids) > 1 and not estimated:
+            return None
+
+        filter_range = filter_args.get("range", "").lower()
+        counts: dict[str, Any] = StoryCounter.get_counts(
+            source_ids=sorted(source_ids),
+            since=cls._range_date_limit(filter_range).date() if filter_range else None,
+            read=cls._bool_filter(filter_args, "read"),
+            important=cls._bool_filter(filter_args, "important"),
+            in_report=cls._bool_filter(filter_args, "in_report"),
+        )
+        if len(source_ids) > 1:
+            counts["estimated"] = True
+        return counts
+
+    @classmethod
+    def _estimate_row_count(cls, query: Select) -> int:
+        compiled = query.compile(dialect=db.engine.dialect, compile_kwargs={"render_postcompile": True})
+        plan = db.session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @classmethod
+    def _estimate_additional_counts(cls, filter_query: Select) -> dict[str, Any] | None:
+        if db.engine.dialect.name != "postgresql":
+            return None
+        subquery = filter_query.subquery()
+        try:
+            return {
+                "total_count": cls._estimate_row_count(db.select(subquery.c.id)),
+                "read_count": cls._estimate_row_count(db.select(subquery.c.id).where(subquery.c.read == true())),
+                "important_count": cls._estimate_row_count(db.select(subquery.c.id).where(subquery.c.important == true())),
+                "in_reports_count": cls._estimate_row_count(
+                    db.select(subquery.c.id).join(ReportItemStory, ReportItemStory.story_id == subquery.c.id).distinct()
+                ),
+                "estimated": True,
+            }
+        except (SQLAlchemyError, KeyError, IndexError, TypeError, ValueError):
+            logger.exception("Failed to estimate story counts")
+            return None
+
     @classmethod
     def get_filter_query(cls, filter_args: dict) -> Select:
         query = db.select(cls).group_by(cls.id).join(NewsItem, NewsItem.story_id == cls.id)
@@ -372,7 +499,7 @@ class Story(BaseModel):
                 query = query.filter(false())
 
         if search := filter_args.get("search"):
-            sort: bool = "relevance" in filter_args.get("sort", "").lower()
+            sort: bool = "relevance" in filter_args.get("sort", "").lower() and "cursor" not in filter_args
             query = cls._add_search_to_query(search, query, sort=sort)
 
         if exclude_attr := filter_args.get("exclude_attr"):
@@ -394,7 +521,7 @@ class Story(BaseModel):
             query = query.filter(Story.important == false())
 
         if cybersecurity_status := filter_args.get("cybersecurity", "").lower():
-            query = cls._add_key_value_filter_to_query(query, "cybersecurity", cybersecurity_status)
+            query = query.filter(Story.cybersecurity == cybersecurity_status)
 
         relevant = filter_args.get("relevant", "").lower()
         if relevant == "true":
@@ -433,25 +560,7 @@ class Story(BaseModel):
                 query = query.filter(cls.last_change == changed_by)
 
         if filter_range := filter_args.get("range", "").lower():
-            date_limit = cls.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            if filter_range in ["day", "week", "month", "24h"]:
-                if filter_range == "day":
-                    date_limit -= timedelta(days=1)
-
-                elif filter_range == "24h":
-                    date_limit -= timedelta(hours=24)
-
-                elif filter_range == "week":
-                    date_limit -= timedelta(days=date_limit.weekday())
-
-                elif filter_range == "month":
-                    date_limit = date_limit.replace(day=1)
-
-            elif filter_range.startswith("last") and filter_range[4:].isdigit():
-                days = int(filter_range[4:])
-                date_limit -= timedelta(days=days)
-
-            query = query.filter(cls.created >= date_limit)
+            query = query.filter(cls.created >= cls._range_date_limit(filter_range))
 
         if timefrom := filter_args.get("timefrom"):
             normalized_timefrom = StoryPayload.model_validate({"created": timefrom}).created
@@ -463,6 +572,28 @@ class Story(BaseModel):
 
         return query
 
+    @classmethod
+    def _range_date_limit(cls, filter_range: str) -> datetime:
+        date_limit = cls.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        if filter_range in ["day", "week", "month", "24h"]:
+            if filter_range == "day":
+                date_limit -= timedelta(days=1)
+
+            elif filter_range == "24h":
+                date_limit -= timedelta(hours=24)
+
+            elif filter_range == "week":
+                date_limit -= timedelta(days=date_limit.weekday())
+
+            elif filter_range == "month":
+                date_limit = date_limit.replace(day=1)
+
+        elif filter_range.startswith("last") and filter_range[4:].isdigit():
+            days = int(filter_range[4:])
+            date_limit -= timedelta(days=days)
+
+        return date_limit
+
     @classmethod
     def _add_search_to_query(cls, search: str, query: Select, sort: bool = False) -> Select:
         if db.engine.dialect.name == "postgresql":
@@ -504,61 +635,178 @@ class Story(BaseModel):
         )
 
     @classmethod
-    def _add_sorting_to_query(cls, filter_args: dict[str, str], query: Select) -> Select:
-        if sort := filter_args.get("sort", "date_desc").lower():
-            if sort == "date_desc":
-                query = query.order_by(db.desc(cls.created), db.desc(cls.title))
-
-            elif sort == "date_asc":
-                query = query.order_by(db.asc(cls.created), db.asc(cls.title))
+    def _get_sort_keys(cls, filter_args: dict[str, Any]) -> tuple[str, tuple[tuple[str, bool], ...]]:
+        sort = (filter_args.get("sort") or "date_desc").lower()
+        if sort not in STORY_SORT_KEYS:
+            sort = "date_desc"
+        return sort, STORY_SORT_KEYS[sort]
 
-            elif sort == "relevance":
-                query = query.order_by(db.desc(cls.relevance), db.desc(cls.created))
-
-            elif sort == "updated_desc":
-                query = query.order_by(db.desc(cls.updated), db.desc(cls.title))
+    @classmethod
+    def _sort_column(cls, name: str):
+        if name == "title":
+            return func.coalesce(cls.title, "")
+        return getattr(cls, name)
 
-            elif sort == "updated_asc":
-                query = query.order_by(db.asc(cls.updated), db.asc(cls.title))
+    @classmethod
+    def _add_sorting_to_query(cls, filter_args: dict[str, str], query: Select) -> Select:
+        _, sort_keys = cls._get_sort_keys(filter_args)
+        return query.order_by(
+            *(db.desc(cls._sort_column(name)) if descending else db.asc(cls._sort_column(name)) for name, descending in sort_keys)
+        )
 
-        return query
+    @classmethod
+    def encode_cursor(cls, story: "Story", filter_args: dict[str, Any]) -> str:
+        sort, sort_keys = cls._get_sort_keys(filter_args)
+        values = []
+        for name, _ in sort_keys:
+            value = getattr(story, name)
+            if name == "title":
+                value = value or ""
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        return base64.urlsafe_b64encode(json.dumps({"sort": sort, "key": values}).encode()).decode()
 
     @classmethod
-    def _add_key_value_filter_to_query(cls, query: Select, filter_key: str, filter_value: str) -> Select:
-        nia1 = aliased(NewsItemAttribute)
-        snia1 = aliased(StoryNewsItemAttribute)
+    def decode_cursor(cls, cursor: str, filter_args: dict[str, Any]) -> list[Any]:
+        sort, sort_keys = cls._get_sort_keys(filter_args)
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            values = data["key"]
+            if data["sort"] != sort or len(values) != len(sort_keys):
+                raise ValueError
+            return [datetime.fromisoformat(value) if name in ("created", "updated") else value for (name, _), value in zip(sort_keys, values)]
+        except (binascii.Error, KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
 
-        subquery = (
-            db.select(snia1.story_id)
-            .join(nia1, nia1.id == snia1.news_item_attribute_id)
-            .filter((nia1.key == filter_key) & (nia1.value == filter_value))
-            .distinct()
-        )
-        return query.filter(Story.id.in_(subquery))
+    @classmethod
+    def _add_cursor_to_query(cls, filter_args: dict[str, Any], query: Select) -> Select:
+        _, sort_keys = cls._get_sort_keys(filter_args)
+        values = cls.decode_cursor(filter_args["cursor"], filter_args)
+        columns = tuple_(*(cls._sort_column(name) for name, _ in sort_keys))
+        # every sort mode orders all of its keys in one direction, so a row-value comparison is an exact keyset boundary
+        if sort_keys[0][1]:
+            return query.filter(columns < tuple_(*values))
+        return query.filter(columns > tuple_(*values))
 
     @classmethod
     def _add_attribute_filter_to_query(cls, query: Select, filter_key: str, exclude: bool = False) -> Select:
+        if column := STATUS_ATTRIBUTE_COLUMNS.get(filter_key):
+            status_column = getattr(Story, column)
+            return query.filter(status_column.is_(None) if exclude else status_column.is_not(None))
+
         nia2 = aliased(NewsItemAttribute)
         snia2 = aliased(StoryNewsItemAttribute)
 
         subquery = db.select(snia2.story_id).join(nia2, nia2.id == snia2.news_item_attribute_id).filter(nia2.key == filter_key).distinct()
 
-        query = query.outerjoin(StoryNewsItemAttribute, StoryNewsItemAttribute.story_id == Story.id).outerjoin(
-            NewsItemAttribute, NewsItemAttribute.id == StoryNewsItemAttribute.news_item_attribute_id
-        )
-
         if exclude:
             return query.filter(Story.id.notin_(subquery))
         return query.filter(Story.id.in_(subquery))
 
     @classmethod
     def _add_paging_to_query(cls, filter_args: dict[str, Any], query: Select) -> Select:
-        if offset := filter_args.get("offset"):
+        if "cursor" in filter_args:
+            if filter_args["cursor"]:
+                query = cls._add_cursor_to_query(filter_args, query)
+        elif offset := filter_args.get("offset"):
             query = query.offset(offset)
         if limit := filter_args.get("limit"):
             query = query.limit(limit)
         return query
 
+    @classmethod
+    def _add_list_loading_to_query(cls, query: Select) -> Select:
+        news_items = selectinload(cls.news_items)
+        return query.options(
+            news_items.selectinload(NewsItem.tags),
+            news_items.selectinload(NewsItem.attributes),
+            news_items.selectinload(NewsItem.osint_source),
+            selectinload(cls.attributes),
+            selectinload(cls.misp_auto_update),
+        )
+
+    @classmethod
+    def parse_worker_fields(cls, fields: Sequence[str] | None) -> dict[str, set[str] | None] | None:
+        """Map requested worker fields to story keys and the news item fields to serialize (None for all of them).
+
+        Returns None when no fields were requested, which selects the complete worker dict.
+        """
+        if not fields:
+            return None
+        story_columns = set(cls.__table__.columns.keys()) - {"search_vector", *STATUS_ATTRIBUTE_COLUMNS.values()}
+        news_item_fields = set(NewsItem.__table__.columns.keys()) | {"tags"}
+        projection: dict[str, set[str] | None] = {"id": None}
+        for field in fields:
+            key, _, news_item_field = field.partition(".")
+            if news_item_field:
+                if key != "news_items" or news_item_field not in news_item_fields:
+                    raise ValueError(f"Unknown field: {field}")
+                if (requested := projection.setdefault("news_items", {"id"})) is not None:
+                    requested.add(news_item_field)
+            elif key in story_columns or key in WORKER_STORY_RELATIONS:
+                projection[key] = None
+            else:
+                raise ValueError(f"Unknown field: {field}")
+        return projection
+
+    @classmethod
+    def _add_worker_loading_to_query(
+        cls, filter_args: dict[str, Any], query: Select, projection: dict[str, set[str] | None] | None
+    ) -> Select:
+        if projection is None:
+            return cls._add_list_loading_to_query(query)
+        _, sort_keys = cls._get_sort_keys(filter_args)
+        columns = {key for key in projection if key not in WORKER_STORY_RELATIONS} | {name for name, _ in sort_keys}
+        options = [load_only(*(getattr(cls, name) for name in columns))]
+        if "news_items" in projection or "tags" in projection:
+            news_item_fields = projection.get("news_items", {"id"})
+            news_item_options = []
+            if news_item_fields is not None:
+                news_item_options.append(load_only(*(getattr(NewsItem, name) for name in (news_item_fields - {"tags"}) | {"id", "story_id"})))
+            if "tags" in projection or news_item_fields is None or "tags" in news_item_fields:
+                news_item_options.append(selectinload(NewsItem.tags))
+            options.append(selectinload(cls.news_items).options(*news_item_options))
+        if "attributes" in projection:
+            options.append(selectinload(cls.attributes))
+        if "misp_auto_update" in projection:
+            options.append(selectinload(cls.misp_auto_update))
+        return query.options(*options)
+
+    @classmethod
+    def _add_summary_loading_to_query(cls, query: Select) -> Select:
+        news_items = selectinload(cls.news_items).options(
+            load_only(
+                NewsItem.id,
+                NewsItem.title,
+                NewsItem.source,
+                NewsItem.link,
+                NewsItem.language,
+                NewsItem.osint_source_id,
+                NewsItem.story_id,
+                NewsItem.published,
+                NewsItem.collected,
+            ),
+            with_expression(NewsItem.content_teaser, func.substr(NewsItem.content, 1, STORY_SUMMARY_CONTENT_LENGTH)),
+        )
+        return query.options(
+            load_only(
+                cls.id,
+                cls.title,
+                cls.created,
+                cls.updated,
+                cls.read,
+                cls.important,
+                cls.likes,
+                cls.dislikes,
+                cls.relevance,
+                cls.relevance_override,
+                cls.summary,
+                cls.revision,
+                cls.last_change,
+            ),
+            news_items.selectinload(NewsItem.tags),
+            selectinload(cls.misp_auto_update),
+        )
+
     @classmethod
     def _add_ACL_check(cls, query: Select, user: User) -> Select:
         rbac = RBACQuery(user=user, resource_type=ItemType.OSINT_SOURCE)
@@ -595,60 +843,81 @@ class Story(BaseModel):
 
     @classmethod
     def get_by_filter(cls, filter_args: dict[str, Any], user: User | None = None) -> tuple[list[dict[str, Any]], dict[str, int] | None]:
+        stories, counts, _ = cls.get_page_by_filter(filter_args, user)
+        return stories, counts
+
+    @classmethod
+    def get_page_by_filter(
+        cls, filter_args: dict[str, Any], user: User | None = None
+    ) -> tuple[list[dict[str, Any]], dict[str, int] | None, str | None]:
         if user:
             filter_args = {**filter_args, "_user": user}
         base_query = cls.get_filter_query(filter_args)
+        unrestricted = True
         if user:
-            base_query = cls._add_ACL_check(base_query, user)
-            base_query = cls._add_TLP_check(base_query, user)
+            filtered_query = cls._add_TLP_check(cls._add_ACL_check(base_query, user), user)
+            unrestricted = filtered_query is base_query
+            base_query = filtered_query
 
         query = cls._add_sorting_to_query(filter_args, base_query)
         query = cls._add_paging_to_query(filter_args, query)
 
         if filter_args.get("worker", False) or not user:
-            return [s.to_worker_dict() for s in cls.get_filtered(query) or []], None
+            projection = cls.parse_worker_fields(filter_args.get("fields"))
+            results = cls.get_filtered(cls._add_worker_loading_to_query(filter_args, query, projection)) or []
+            return [s.to_worker_dict(projection) for s in results], None, cls._next_cursor(filter_args, results)
+
+        summary = filter_args.get("projection") == "summary"
+        query = cls._add_summary_loading_to_query(query) if summary else cls._add_list_loading_to_query(query)
 
         if filter_args.get("no_count", False):
             stories = []
-            for story in cls.get_filtered(query) or []:
-                story_data = story.to_dict()
+            results = cls.get_filtered(query) or []
+            for story in results:
+                story_data = story.to_summary_dict() if summary else story.to_dict()
                 story_data["revision_count"] = story.get_revision_count()
                 stories.append(story_data)
-            return stories, None
+            return stories, None, cls._next_cursor(filter_args, results)
 
         stories = []
+        results = []
         biggest_story = 0
         query = cls.enhance_with_user_votes(query, user.id)
         query = cls.enhance_with_report_count(query)
 
         for story, user_vote, report_count in db.session.execute(query):
-            story_data = story.to_dict()
+            story_data = story.to_summary_dict() if summary else story.to_dict()
             story_data["revision_count"] = story.get_revision_count()
             story_data["user_vote"] = user_vote
             story_data["in_reports_count"] = report_count
             biggest_story = max(biggest_story, len(story_data["news_items"]))
             stories.append(story_data)
+            results.append(story)
 
-        additional_counts = cls.get_additional_counts(base_query)
+        count_dict = {**cls.get_counts(filter_args, base_query, unrestricted), "biggest_story": biggest_story}
 
-        count_dict = {
-            "total_count": additional_counts.total_count,
-            "read_count": additional_counts.read_count,
-            "important_count": additional_counts.important_count,
-            "in_reports_count": additional_counts.in_reports_count,
-            "biggest_story": biggest_story,
-        }
+        return stories, count_dict, cls._next_cursor(filter_args, results)
 
-        return stories, count_dict
+    @classmethod
+    def _next_cursor(cls, filter_args: dict[str, Any], results: Sequence["Story"]) -> str | None:
+        if "cursor" not in filter_args or not results:
+            return None
+        limit = filter_args.get("limit")
+        if not limit or len(results) < int(limit):
+            return None
+        return cls.encode_cursor(results[-1], filter_args)
 
     @classmethod
     def get_by_filter_json(cls, filter_args: dict[str, Any], user: User | None):
-        stories, count = cls.get_by_filter(filter_args=filter_args, user=user)
+        stories, count, next_cursor = cls.get_page_by_filter(filter_args=filter_args, user=user)
 
+        response: dict[str, Any] = {"items": stories}
         if count:
-            return {"items": stories, "counts": count}, 200
+            response["counts"] = count
+        if "cursor" in filter_args:
+            response["next_cursor"] = next_cursor
 
-        return {"items": stories}, 200
+        return response, 200
 
     @classmethod
     def get_for_worker(cls, filter_args: dict[str, Any]) -> list[dict[str, Any]]:
@@ -656,6 +925,12 @@ class Story(BaseModel):
         stories, _ = cls.get_by_filter(filter_args=filter_args)
         return stories
 
+    @classmethod
+    def get_page_for_worker(cls, filter_args: dict[str, Any]) -> dict[str, Any]:
+        filter_args["worker"] = True
+        stories, _, next_cursor = cls.get_page_by_filter(filter_args=filter_args)
+        return {"items": stories, "next_cursor": next_cursor}
+
     @classmethod
     def delete_news_items(cls, news_items_to_delete: list[str]):
         for news_item_id in news_items_to_delete:
@@ -829,28 +1104,14 @@ class Story(BaseModel):
 
     @classmethod
     def add_news_items(cls, news_items_list: list[dict], user: User | None = None):
-        story_ids = []
-        news_item_ids = []
-        skipped_count = 0
+        from core.service.story_ingest import StoryIngestService
+
         try:
-            for news_item in news_items_list:
-                normalized_news_item, err = cls.check_news_item_data(news_item)
-                if err:
-                    logger.warning(err)
-                    skipped_count += 1
-                    continue
-                if normalized_news_item is None:
-                    skipped_count += 1
-                    continue
-                message, status = cls.add_from_news_item(normalized_news_item, user=user)
-                if status > 299:
-                    skipped_count += 1
-                    continue
-                story_ids.append(message["story_id"])
-                news_item_ids += message["news_item_ids"]
+            story_ids, news_item_ids, skipped_count = StoryIngestService.add_news_items(news_items_list, user=user)
             db.session.commit()
         except Exception:
             logger.exception("Failed to add news items")
+            db.session.rollback()
             return {"error": "Failed to add news items"}, 400
 
         result = {"story_ids": story_ids, "news_item_ids": news_item_ids, "message": f"{len(news_item_ids)} News items added successfully"}
@@ -1030,12 +1291,18 @@ class Story(BaseModel):
             if (attr := self.find_attribute_by_key(key)) and key != "TLP":
                 self.attributes.remove(attr)
                 db.session.delete(attr)
+                self._sync_status_column(key, None)
 
     def upsert_attribute(self, attribute: NewsItemAttribute) -> None:
         if existing_attribute := self.find_attribute_by_key(attribute.key):
             existing_attribute.value = attribute.value
         else:
             self.attributes.append(attribute)
+        self._sync_status_column(attribute.key, attribute.value)
+
+    def _sync_status_column(self, key: str, value: str | None) -> None:
+        if column := STATUS_ATTRIBUTE_COLUMNS.get(key):
+            setattr(self, column, value)
 
     def find_attribute_by_key(self, key: str) -> NewsItemAttribute | None:
         return next((attribute for attribute in self.attributes if attribute.key == key), None)
@@ -1347,8 +1614,11 @@ class Story(BaseModel):
         return new_story.id or None
 
     def get_cybersecurity_status(self) -> str:
-        status_list = [news_item.get_cybersecurity_status() for news_item in self.news_items]
-        status_set = frozenset(status_list)
+        return self.cybersecurity_status_for([news_item.get_cybersecurity_status() for news_item in self.news_items])
+
+    @staticmethod
+    def cybersecurity_status_for(news_item_statuses: list[str]) -> str:
+        status_set = frozenset(news_item_statuses)
 
         if "none" in status_set and len(status_set) > 1:
             return "incomplete"
@@ -1361,7 +1631,11 @@ class Story(BaseModel):
         return status_map.get(status_set, "none")
 
     def get_story_sentiment(self) -> str:
-        counts = Counter(item.get_sentiment() for item in self.news_items)
+        return self.sentiment_for([item.get_sentiment() for item in self.news_items])
+
+    @staticmethod
+    def sentiment_for(news_item_sentiments: list[str]) -> str:
+        counts = Counter(news_item_sentiments)
 
         pos = counts.get("positive", 0)
         neg = counts.get("negative", 0)
@@ -1384,13 +1658,13 @@ class Story(BaseModel):
             return True
         return False
 
-    def update_status(self, change: str | None = None, refresh_timestamps: bool = True):
+    def update_status(self, change: str | None = None, refresh_timestamps: bool = True, in_reports_count: int | None = None):
         if self.remove_empty_story():
             return
         if refresh_timestamps:
             self.update_timestamps()
         self.update_status_attributes()
-        self.recompute_relevance()
+        self.recompute_relevance(in_reports_count)
         if change is not None:
             self.last_change = change
         elif not self._is_actor_change(self.last_change):
@@ -1428,10 +1702,11 @@ class Story(BaseModel):
 
         tlp_levels: list[TLPLevel] = []
         for news_item in self.news_items:
-            if not news_item.tlp_level:
-                news_item.add_attribute(NewsItemAttribute("TLP", news_item.tlp_level))
+            tlp_level = news_item.tlp_level
+            if not tlp_level:
+                news_item.add_attribute(NewsItemAttribute("TLP", tlp_level))
             logger.debug(f"News item {news_item.id} has TLP level")
-            tlp_levels.append(news_item.tlp_level)
+            tlp_levels.append(tlp_level)
         tlp_levels += [input_tlp] if input_tlp else []
 
         most_restrictive_tlp = TLPLevel.get_most_restrictive_tlp(tlp_levels)
@@ -1441,7 +1716,7 @@ class Story(BaseModel):
 
     @property
     def tlp_level(self) -> TLPLevel:
-        return next((TLPLevel(attr.value) for attr in self.attributes if attr.key == "TLP"), TLPLevel.CLEAR)
+        return TLPLevel.get_tlp_level(self.tlp) or TLPLevel.CLEAR
 
     def to_dict(self) -> dict[str, Any]:
         data = super().to_dict()
@@ -1450,20 +1725,45 @@ class Story(BaseModel):
         data["links"] = self.links
         if self.misp_auto_update:
             data["misp_auto_update"] = self.misp_auto_update.to_dict()
-        del data["search_vector"]
+        for column in ("search_vector", *STATUS_ATTRIBUTE_COLUMNS.values()):
+            del data[column]
+        return data
+
+    def to_summary_dict(self) -> dict[str, Any]:
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "created": self.serialize_datetime(self.created) if self.created else None,
+            "updated": self.serialize_datetime(self.updated) if self.updated else None,
+            "read": self.read,
+            "important": self.important,
+            "likes": self.likes,
+            "dislikes": self.dislikes,
+            "relevance": self.relevance,
+            "relevance_override": self.relevance_override,
+            "summary": self.summary,
+            "last_change": self.last_change,
+            "news_items": [news_item.to_summary_dict(STORY_SUMMARY_CONTENT_LENGTH) for news_item in self.news_items],
+            "tags": [tag.to_dict() for tag in self.tags],
+            "links": self.links,
+        }
+        if self.misp_auto_update:
+            data["misp_auto_update"] = self.misp_auto_update.to_dict()
         return data
 
-    def to_detail_dict(self) -> dict[str, Any]:
+    def to_detail_dict(self, in_reports_count: int | None = None) -> dict[str, Any]:
         data = self.to_dict()
         data["tags"] = [tag.to_dict() for tag in self.tags]
         data["attributes"] = [attribute.to_small_dict() for attribute in self.attributes]
         data["detail_view"] = True
-        data["in_reports_count"] = ReportItemStory.count(self.id)
+        data["in_reports_count"] = ReportItemStory.count(self.id) if in_reports_count is None else in_reports_count
         data["links"] = self.links
         data["revision_count"] = self.get_revision_count()
         return data
 
-    def to_worker_dict(self) -> dict[str, Any]:
+    def to_worker_dict(self, projection: dict[str, set[str] | None] | None = None) -> dict[str, Any]:
+        if projection is not None:
+            return self._to_projected_worker_dict(projection)
         data = super().to_dict()
         data["news_items"] = [news_item.to_dict() for news_item in self.news_items]
         data["tags"] = {tag.name: tag.to_dict() for tag in self.tags}
@@ -1471,10 +1771,26 @@ class Story(BaseModel):
             data["misp_auto_update"] = self.misp_auto_update.to_dict()
         if attributes := self.attributes:
             data["attributes"] = {attribute.key: attribute.to_small_dict() for attribute in attributes}
-        del data["search_vector"]
+        for column in ("search_vector", *STATUS_ATTRIBUTE_COLUMNS.values()):
+            del data[column]
 
         return data
 
+    def _to_projected_worker_dict(self, projection: dict[str, set[str] | None]) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for key, news_item_fields in projection.items():
+            if key == "news_items":
+                data[key] = [news_item.to_worker_dict(news_item_fields) for news_item in self.news_items]
+            elif key == "tags":
+                data[key] = {tag.name: tag.to_dict() for tag in self.tags}
+            elif key == "attributes":
+                data[key] = {attribute.key: attribute.to_small_dict() for attribute in self.attributes}
+            elif key == "misp_auto_update":
+                data[key] = self.misp_auto_update.to_dict() if self.misp_auto_update else None
+            else:
+                data[key] = self.serialize_value(getattr(self, key))
+        return data
+
     def record_revision(self, user: User | None = None, note: str | None = None) -> StoryRevision | None:
         if not self.id:
             return None
@@ -1592,6 +1908,13 @@ class ReportItemStory(BaseModel):
     def count(cls, story_id: str) -> int:
         return cls.get_filtered_count(db.select(cls).where(cls.story_id == story_id))
 
+    @classmethod
+    def count_by_story_ids(cls, story_ids: Sequence[str]) -> dict[str, int]:
+        counts = dict.fromkeys(story_ids, 0)
+        rows = db.session.execute(db.select(cls.story_id, func.count()).where(cls.story_id.in_(story_ids)).group_by(cls.story_id)).tuples()
+        counts.update(rows.all())
+        return counts
+
 
 class StoryBookmark(BaseModel):
     __tablename__ = "story_bookmark"
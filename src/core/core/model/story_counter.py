@@ -0,0 +1,270 @@
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from datetime import date
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Index, event, false, func, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, Session, attributes
+from sqlalchemy.orm.base import PASSIVE_NO_INITIALIZE
+
+from core.managers.db_manager import db
+from core.model.base_model import UUID_STR_LENGTH, BaseModel
+
+
+ALL_SOURCES = "*"
+UNDATED_DAY = date(1970, 1, 1)
+REFRESH_CHUNK_SIZE = 100
+
+PENDING_STORY_IDS_KEY = "story_counter_story_ids"
+PENDING_REBUILD_KEY = "story_counter_rebuild"
+
+STORY_COUNTER_ATTRIBUTES = ("created", "read", "important", "news_items")
+NEWS_ITEM_COUNTER_ATTRIBUTES = ("story_id", "osint_source_id")
+COUNTER_KEY_COLUMNS = ("day", "osint_source_id", "read", "important", "in_report")
+
+
+class StoryCounter(BaseModel):
+    """Story counts per creation day, OSINT source and read/important/in-report state.
+
+    Rows with osint_source_id "*" count every story of a day once, the per-source
+    rows count stories with at least one news item from that source. Changed stories
+    add the difference between their previous and current StoryCounterEntry rows to
+    the counters, so transactions never rewrite counter rows of other stories.
+    """
+
+    __tablename__ = "story_counter"
+    __table_args__ = (Index("ix_story_counter_source_day", "osint_source_id", "day"),)
+
+    day: Mapped[date] = db.Column(db.Date, primary_key=True)
+    osint_source_id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True)
+    read: Mapped[bool] = db.Column(db.Boolean, primary_key=True)
+    important: Mapped[bool] = db.Column(db.Boolean, primary_key=True)
+    in_report: Mapped[bool] = db.Column(db.Boolean, primary_key=True)
+    story_count: Mapped[int] = db.Column(db.Integer, nullable=False, default=0)
+
+    def __init__(self, day: date, osint_source_id: str, read: bool, important: bool, in_report: bool, story_count: int = 0):
+        self.day = day
+        self.osint_source_id = osint_source_id
+        self.read = read
+        self.important = important
+        self.in_report = in_report
+        self.story_count = story_count
+
+    @classmethod
+    def get_counts(
+        cls,
+        source_ids: Sequence[str] | None = None,
+        since: date | None = None,
+        read: bool | None = None,
+        important: bool | None = None,
+        in_report: bool | None = None,
+    ) -> dict[str, int]:
+        cls.sync()
+        query = db.select(cls.read, cls.important, cls.in_report, func.sum(cls.story_count)).group_by(cls.read, cls.important, cls.in_report)
+        query = query.where(cls.osint_source_id.in_(source_ids)) if source_ids else query.where(cls.osint_source_id == ALL_SOURCES)
+        if since:
+            query = query.where(cls.day >= since)
+        for column, value in ((cls.read, read), (cls.important, important), (cls.in_report, in_report)):
+            if value is not None:
+                query = query.where(column == (true() if value else false()))
+
+        counts = {"total_count": 0, "read_count": 0, "important_count": 0, "in_reports_count": 0}
+        for row_read, row_important, row_in_report, story_count in db.session.execute(query):
+            story_count = int(story_count or 0)
+            counts["total_count"] += story_count
+            counts["read_count"] += story_count if row_read else 0
+            counts["important_count"] += story_count if row_important else 0
+            counts["in_reports_count"] += story_count if row_in_report else 0
+        return counts
+
+    @classmethod
+    def mark_stories(cls, story_ids: Iterable[str], session=None) -> None:
+        """Queue stories changed through bulk statements that bypass the ORM."""
+        session = session or db.session
+        session.info.setdefault(PENDING_STORY_IDS_KEY, set()).update(story_id for story_id in story_ids if story_id)
+
+    @classmethod
+    def mark_rebuild(cls, session=None) -> None:
+        session = session or db.session
+        session.info[PENDING_REBUILD_KEY] = True
+
+    @classmethod
+    def discard_pending(cls, session=None) -> None:
+        session = session or db.session
+        for key in (PENDING_STORY_IDS_KEY, PENDING_REBUILD_KEY):
+            session.info.pop(key, None)
+
+    @classmethod
+    def sync(cls, session=None) -> None:
+        session = session or db.session
+        session.flush()
+        rebuild = session.info.pop(PENDING_REBUILD_KEY, False)
+        story_ids = session.info.pop(PENDING_STORY_IDS_KEY, set())
+        if rebuild:
+            cls.rebuild_all(session=session)
+            return
+        cls.refresh_for_stories(story_ids, session=session)
+
+    @classmethod
+    def refresh_for_stories(cls, story_ids: set[str], session=None) -> None:
+        from core.model.story import Story
+
+        if not story_ids:
+            return
+        session = session or db.session
+        ordered_ids = sorted(story_ids)
+        deltas: Counter[tuple] = Counter()
+        for offset in range(0, len(ordered_ids), REFRESH_CHUNK_SIZE):
+            chunk = ordered_ids[offset : offset + REFRESH_CHUNK_SIZE]
+            # Concurrent refreshes of a story run one after the other, so each one subtracts the entries the previous one committed.
+            session.execute(db.select(Story.id).where(Story.id.in_(chunk)).order_by(Story.id).with_for_update())
+            entries_query = db.select(*StoryCounterEntry.counter_columns()).where(StoryCounterEntry.story_id.in_(chunk))
+            deltas.subtract(tuple(row) for row in session.execute(entries_query))
+            session.execute(db.delete(StoryCounterEntry).where(StoryCounterEntry.story_id.in_(chunk)))
+            cls._insert_entries(Story.id.in_(chunk), session=session)
+            deltas.update(tuple(row) for row in session.execute(entries_query))
+        cls._apply_deltas(deltas, session=session)
+
+    @classmethod
+    def rebuild_all(cls, session=None) -> None:
+        session = session or db.session
+        session.execute(db.delete(cls))
+        session.execute(db.delete(StoryCounterEntry))
+        cls._insert_entries(true(), session=session)
+        counter_columns = StoryCounterEntry.counter_columns()
+        session.execute(
+            db.insert(cls).from_select(
+                [*COUNTER_KEY_COLUMNS, "story_count"],
+                db.select(*counter_columns, func.count()).group_by(*counter_columns),
+            )
+        )
+
+    @classmethod
+    def rebuild_if_empty(cls) -> bool:
+        from core.model.story import Story
+
+        if (
+            db.session.execute(db.select(StoryCounterEntry.story_id).limit(1)).first()
+            or not db.session.execute(db.select(Story.id).limit(1)).first()
+        ):
+            return False
+        cls.rebuild_all()
+        db.session.commit()
+        return True
+
+    @classmethod
+    def _insert_entries(cls, condition, session) -> None:
+        from core.model.news_item import NewsItem
+        from core.model.osint_source import OSINTSource
+        from core.model.story import ReportItemStory, Story
+
+        story_rows = (
+            db.select(
+                Story.id.label("story_id"),
+                func.coalesce(func.date(Story.created), db.literal(UNDATED_DAY, db.Date)).label("day"),
+                func.coalesce(Story.read, false()).label("read"),
+                func.coalesce(Story.important, false()).label("important"),
+                db.exists().where(ReportItemStory.story_id == Story.id).label("in_report"),
+                NewsItem.osint_source_id.label("osint_source_id"),
+            )
+            .join(NewsItem, NewsItem.story_id == Story.id)
+            .join(OSINTSource, NewsItem.osint_source_id == OSINTSource.id)
+            .where(condition)
+            .subquery()
+        )
+        state_columns = (story_rows.c.read, story_rows.c.important, story_rows.c.in_report)
+        all_sources = db.select(story_rows.c.story_id, story_rows.c.day, db.literal(ALL_SOURCES, db.String), *state_columns)
+        per_source = db.select(story_rows.c.story_id, story_rows.c.day, story_rows.c.osint_source_id, *state_columns)
+        session.execute(db.insert(StoryCounterEntry).from_select(["story_id", *COUNTER_KEY_COLUMNS], db.union(all_sources, per_source)))
+
+    @classmethod
+    def _apply_deltas(cls, deltas: Counter[tuple], session) -> None:
+        rows = [dict(zip((*COUNTER_KEY_COLUMNS, "story_count"), (*key, delta))) for key, delta in sorted(deltas.items()) if delta]
+        if not rows:
+            return
+        insert = pg_insert(cls) if db.engine.dialect.name == "postgresql" else sqlite_insert(cls)
+        session.execute(
+            insert.on_conflict_do_update(
+                index_elements=list(COUNTER_KEY_COLUMNS),
+                set_={"story_count": cls.story_count + insert.excluded.story_count},
+            ),
+            rows,
+        )
+
+    @staticmethod
+    def _history_values(instance: Any, key: str) -> list[Any]:
+        return list(attributes.get_history(instance, key).sum())
+
+    @staticmethod
+    def _has_changes(instance: Any, keys: Sequence[str]) -> bool:
+        return any(attributes.get_history(instance, key, passive=PASSIVE_NO_INITIALIZE).has_changes() for key in keys)
+
+    @classmethod
+    def collect_changes(cls, session: Session) -> None:
+        """Record the stories touched by the pending flush."""
+        from core.model.news_item import NewsItem
+        from core.model.report_item import ReportItem
+        from core.model.story import ReportItemStory, Story
+
+        story_ids: set[str] = set()
+        with session.no_autoflush:
+            for instance in chain(session.new, session.dirty, session.deleted):
+                is_dirty = instance in session.dirty
+                if isinstance(instance, Story):
+                    if is_dirty and not cls._has_changes(instance, STORY_COUNTER_ATTRIBUTES):
+                        continue
+                    story_ids.add(instance.id)
+                    added_items = attributes.get_history(instance, "news_items", passive=PASSIVE_NO_INITIALIZE).added or []
+                    story_ids.update(news_item.story_id for news_item in added_items if news_item.story_id)
+                elif isinstance(instance, NewsItem):
+                    if is_dirty and not cls._has_changes(instance, NEWS_ITEM_COUNTER_ATTRIBUTES):
+                        continue
+                    story_ids.update(story_id for story_id in cls._history_values(instance, "story_id") if story_id)
+                elif isinstance(instance, ReportItem):
+                    if instance in session.deleted:
+                        story_ids.update(
+                            session.execute(
+                                db.select(ReportItemStory.story_id).where(ReportItemStory.report_item_id == instance.id)
+                            ).scalars()
+                        )
+                        continue
+                    history = attributes.get_history(instance, "stories", passive=PASSIVE_NO_INITIALIZE)
+                    story_ids.update(story.id for story in chain(history.added or [], history.deleted or []))
+
+        cls.mark_stories(story_ids, session=session)
+
+
+class StoryCounterEntry(BaseModel):
+    """The counter rows a story currently contributes to, one per OSINT source plus "*"."""
+
+    __tablename__ = "story_counter_entry"
+
+    story_id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True)
+    osint_source_id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True)
+    day: Mapped[date] = db.Column(db.Date, nullable=False)
+    read: Mapped[bool] = db.Column(db.Boolean, nullable=False)
+    important: Mapped[bool] = db.Column(db.Boolean, nullable=False)
+    in_report: Mapped[bool] = db.Column(db.Boolean, nullable=False)
+
+    @classmethod
+    def counter_columns(cls) -> tuple:
+        return tuple(getattr(cls, column) for column in COUNTER_KEY_COLUMNS)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_story_counter_changes(session: Session, flush_context, instances) -> None:
+    StoryCounter.collect_changes(session)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_story_counters(session: Session) -> None:
+    StoryCounter.sync(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_story_counter_changes(session: Session, previous_transaction) -> None:
+    if not session.in_transaction():
+        StoryCounter.discard_pending(session)
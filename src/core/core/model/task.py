@@ -79,6 +79,20 @@ class Task(BaseModel):
         new_entry = cls.add(entry_data)
         return new_entry.to_dict(), 201
 
+    @classmethod
+    def update_result_data(cls, job_id: str, values: dict[str, Any]) -> None:
+        """Merge values into the data of a recorded result, e.g. details core computed while applying it."""
+        if not (entry := cls.get_by_job_id(job_id)):
+            return
+        result = entry.to_dict()["result"]
+        data = result.get("data") or {}
+        if not isinstance(data, dict):
+            logger.warning("Task %s has non-object result data, not recording %s", job_id, sorted(values))
+            return
+        result["data"] = {**data, **values}
+        entry.result = cls._serialize_result(result)
+        db.session.commit()
+
     def to_dict(self):
         try:
             result = json.loads(self.result) if self.result else None
@@ -10,7 +10,7 @@ class TokenBlacklist(BaseModel):
     __tablename__ = "token_blacklist"
 
     id: Mapped[str] = db.Column(db.String(UUID_STR_LENGTH), primary_key=True, default=BaseModel.uuid7_str)
-    token: Mapped[str] = db.Column(db.String(), nullable=False)
+    token: Mapped[str] = db.Column(db.String(), nullable=False, index=True)
     created: Mapped[datetime] = db.Column(db.DateTime, default=BaseModel.utcnow)
 
     def __init__(self, token):
@@ -18,15 +18,22 @@ class TokenBlacklist(BaseModel):
         self.token = token
 
     @classmethod
-    def add(cls, token: str):
-        db.session.add(TokenBlacklist(token))
+    def add(cls, token: str) -> "TokenBlacklist":
+        entry = TokenBlacklist(token)
+        entry.created = cls.utcnow()
+        db.session.add(entry)
         db.session.commit()
+        return entry
 
     @classmethod
     def invalid(cls, token: str) -> bool:
         query = db.select(db.exists().where(cls.token == token))
         return db.session.execute(query).scalar_one()
 
+    @classmethod
+    def get_revoked(cls) -> dict[str, datetime]:
+        return dict(db.session.execute(db.select(cls.token, cls.created)).tuples().all())
+
     @classmethod
     def delete_older(cls, check_time: datetime):
         db.session.execute(db.delete(cls).where(cls.created < check_time))
@@ -17,7 +17,7 @@ from models.user import (
 )
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, Session, joinedload, relationship, selectinload
 from sqlalchemy.sql import Select
 from werkzeug.security import generate_password_hash
 
@@ -80,6 +80,21 @@ class User(BaseModel):
     def find_by_name(cls, username: str) -> "User|None":
         return cls.get_first(db.select(cls).filter_by(username=username))
 
+    @classmethod
+    def load_detached(cls, username: str) -> "User|None":
+        """Load a user with roles, permissions and organization outside the request session.
+
+        The instance is detached, so it can be shared between requests and merged into
+        their sessions without a query.
+        """
+        query = (
+            db.select(cls)
+            .filter_by(username=username)
+            .options(selectinload(cls.roles).selectinload(Role.permissions), joinedload(cls.organization))
+        )
+        with Session(db.engine) as session:
+            return session.scalar(query)
+
     @classmethod
     def find_by_role(cls, role_id: str) -> "Sequence[User]":
         return cls.get_filtered(db.select(cls).join(Role, Role.id == role_id)) or []
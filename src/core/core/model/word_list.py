@@ -10,7 +10,7 @@ from sqlalchemy.sql import Select
 from core.log import logger
 from core.managers.db_manager import db
 from core.model.base_model import UUID_STR_LENGTH, BaseModel
-from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.role_based_access import ItemType
 from core.model.user import User
 from core.service.role_based_access import RBACQuery, RoleBasedAccessService
 
@@ -139,7 +139,7 @@ class WordList(BaseModel):
         return usage < (2 ** len(WordListUsage))
 
     def allowed_with_acl(self, user: User, require_write_access) -> bool:
-        if not RoleBasedAccess.is_enabled() or not user:
+        if not user:
             return True
 
         query = RBACQuery(user=user, resource_id=str(self.id), resource_type=ItemType.WORD_LIST, require_write_access=require_write_access)
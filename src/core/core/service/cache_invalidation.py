@@ -1,13 +1,16 @@
-from collections.abc import Iterable, Mapping
+from collections.abc import Collection, Iterable, Mapping
 
 from models.cache_contract import (
-    build_model_detail_pattern,
-    build_model_list_pattern,
-    build_model_pattern,
-    build_namespace_pattern,
-    build_user_profile_pattern,
+    build_model_detail_index_key,
+    build_model_index_key,
+    build_model_list_index_key,
+    build_namespace_index_key,
+    build_user_profile_key,
+    delete_cache_keys,
+    delete_indexed_keys,
     get_secret_value,
 )
+from models.task import TaskAffectedEntities
 from redis import Redis
 from redis.exceptions import RedisError
 
@@ -25,6 +28,10 @@ SCOPE_REPORT_VIEWS = "report_views"
 SCOPE_PUBLISH_VIEWS = "publish_views"
 SCOPE_USER_VIEWS = "user_views"
 
+# Above this many objects of one model, dropping the whole model is cheaper than one index set per object.
+MAX_TARGETED_OBJECT_IDS = 500
+ObjectIds = Mapping[str, str | Collection[str]]
+
 
 SCOPE_MODEL_NAMES: dict[str, tuple[str, ...]] = {
     SCOPE_SCHEDULE: (
@@ -61,6 +68,16 @@ SCOPE_MODEL_NAMES: dict[str, tuple[str, ...]] = {
     ),
 }
 
+TASK_ENTITY_MODEL_NAMES: dict[str, str] = {
+    "story_ids": "story",
+    "osint_source_ids": "osint_source",
+    "bot_ids": "bot",
+    "product_ids": "product",
+    "word_list_ids": "word_list",
+}
+# Views showing or aggregating over stories and their news items; a changed story can show up in any of their entries.
+STORY_DEPENDENT_MODEL_NAMES = ("news_item", "story_bookmark", "filter_lists", "report_item", "dashboard", "trending_clusters", "clusters")
+
 
 class FrontendCacheInvalidationService:
     def __init__(self):
@@ -91,35 +108,36 @@ class FrontendCacheInvalidationService:
             self._client = None
         return self._client
 
-    def _delete_matching_patterns(self, patterns: Iterable[str]) -> int:
+    def _delete_indexed_keys(self, index_keys: Iterable[str]) -> int:
         client = self._get_client()
         if client is None:
             return 0
-
-        keys_to_delete: list[str] = []
-        seen: set[str] = set()
-        for pattern in patterns:
-            for key in client.scan_iter(match=pattern, count=1000):
-                key_str = str(key)
-                if key_str in seen:
-                    continue
-                seen.add(key_str)
-                keys_to_delete.append(key_str)
-
-        return client.delete(*keys_to_delete) if keys_to_delete else 0
+        return delete_indexed_keys(client, Config.CACHE_KEY_PREFIX, index_keys)
+
+    @staticmethod
+    def get_model_index_keys(model_name: str, object_ids: str | Collection[str] | None = None) -> list[str]:
+        """Index sets for a whole model, or for its lists and the detail entries of the given objects."""
+        if isinstance(object_ids, str):
+            object_ids = (object_ids,)
+        if not object_ids or len(object_ids) > MAX_TARGETED_OBJECT_IDS:
+            return [build_model_index_key(Config.CACHE_KEY_PREFIX, model_name)]
+        return [
+            build_model_list_index_key(Config.CACHE_KEY_PREFIX, model_name),
+            *(build_model_detail_index_key(Config.CACHE_KEY_PREFIX, model_name, object_id) for object_id in dict.fromkeys(object_ids)),
+        ]
 
     def invalidate_all(self) -> int:
-        return self._delete_matching_patterns([build_namespace_pattern(Config.CACHE_KEY_PREFIX)])
+        return self._delete_indexed_keys([build_namespace_index_key(Config.CACHE_KEY_PREFIX)])
 
     def invalidate_model(self, model_name: str, object_id: str | None = None) -> int:
-        if object_id is None:
-            patterns = [build_model_pattern(Config.CACHE_KEY_PREFIX, model_name)]
-        else:
-            patterns = [
-                build_model_detail_pattern(Config.CACHE_KEY_PREFIX, model_name, object_id),
-                build_model_list_pattern(Config.CACHE_KEY_PREFIX, model_name),
-            ]
-        return self._delete_matching_patterns(patterns)
+        return self._delete_indexed_keys(self.get_model_index_keys(model_name, object_id))
+
+    def invalidate_models(self, model_names: Iterable[str], object_ids: ObjectIds | None = None) -> int:
+        object_ids = object_ids or {}
+        index_keys: list[str] = []
+        for model_name in dict.fromkeys(model_names):
+            index_keys.extend(self.get_model_index_keys(model_name, object_ids.get(model_name)))
+        return self._delete_indexed_keys(index_keys)
 
     def get_scope_model_names(self, scope_name: str) -> tuple[str, ...]:
         model_names = SCOPE_MODEL_NAMES.get(scope_name)
@@ -128,12 +146,30 @@ class FrontendCacheInvalidationService:
             return ()
         return model_names
 
-    def invalidate_scope(self, scope_name: str, object_ids: Mapping[str, str] | None = None) -> int:
-        object_ids = object_ids or {}
-        return sum(self.invalidate_model(model_name, object_ids.get(model_name)) for model_name in self.get_scope_model_names(scope_name))
+    def invalidate_scope(self, scope_name: str, object_ids: ObjectIds | None = None) -> int:
+        return self.invalidate_models(self.get_scope_model_names(scope_name), object_ids)
+
+    def invalidate_task_entities(self, affected: TaskAffectedEntities) -> int:
+        """Drop the entries showing what a finished task changed, leaving the rest of the cache warm."""
+        model_names: list[str] = []
+        object_ids: dict[str, list[str]] = {}
+        for field_name, model_name in TASK_ENTITY_MODEL_NAMES.items():
+            if entity_ids := getattr(affected, field_name):
+                model_names.append(model_name)
+                object_ids[model_name] = entity_ids
+        if affected.story_ids:
+            model_names.extend(STORY_DEPENDENT_MODEL_NAMES)
+        if affected.osint_source_ids or affected.bot_ids:
+            model_names.append("admin_menu_badges")
+        if affected.schedule:
+            model_names.extend(self.get_scope_model_names(SCOPE_SCHEDULE_STATUS))
+        return self.invalidate_models(model_names, object_ids)
 
     def invalidate_user_profile(self, username: str) -> int:
-        return self._delete_matching_patterns([build_user_profile_pattern(Config.CACHE_KEY_PREFIX, username)])
+        client = self._get_client()
+        if client is None:
+            return 0
+        return delete_cache_keys(client, Config.CACHE_KEY_PREFIX, [build_user_profile_key(Config.CACHE_KEY_PREFIX, username)])
 
 
 cache_invalidation_service = FrontendCacheInvalidationService()
@@ -146,13 +182,12 @@ def invalidate_frontend_cache_on_success(
     models: Iterable[str] = (),
     scopes: Iterable[str] = (),
     user_profiles: Iterable[str] = (),
-    object_ids: dict[str, str] | None = None,
+    object_ids: ObjectIds | None = None,
 ) -> int:
     if not 200 <= status_code < 300:
         return 0
 
     deleted = 0
-    object_ids = object_ids or {}
     if full:
         deleted += cache_invalidation_service.invalidate_all()
 
@@ -164,7 +199,5 @@ def invalidate_frontend_cache_on_success(
         model_names.extend(cache_invalidation_service.get_scope_model_names(scope_name))
     model_names.extend(models)
 
-    for model_name in dict.fromkeys(model_names):
-        deleted += cache_invalidation_service.invalidate_model(model_name, object_ids.get(model_name))
-
+    deleted += cache_invalidation_service.invalidate_models(model_names, object_ids)
     return deleted
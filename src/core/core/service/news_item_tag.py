@@ -1,7 +1,12 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import func
+from sqlalchemy.orm import selectinload
 
 from core.log import logger
 from core.managers.db_manager import db
@@ -9,10 +14,32 @@ from core.model.base_model import BaseModel
 from core.model.news_item import NewsItem
 from core.model.news_item_attribute import NewsItemAttribute
 from core.model.news_item_tag import NewsItemTag, NewsItemTagCluster
-from core.model.story import Story
+from core.model.osint_source import OSINTSource
+from core.model.revision import StoryRevision
+from core.model.story import ReportItemStory, Story
 from core.service.misp_auto_update import refresh_misp_auto_update_jobs
 
 
+BOT_RESULT_BATCH_SIZE = 500
+
+
+@dataclass
+class BotResultApplication:
+    story_ids: set[str] = field(default_factory=set)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def timings_ms(self) -> dict[str, float]:
+        return {name: round(seconds * 1000, 1) for name, seconds in self.timings.items()}
+
+
 class NewsItemTagService:
     @classmethod
     def find_largest_tag_clusters(cls, days: int = 7, limit: int = 12, min_count: int = 2):
@@ -109,39 +136,122 @@ class NewsItemTagService:
         logger.debug(f"Found {len(largest_tag_types)} tag clusters")
         return dict(sorted(largest_tag_types.items(), key=lambda item: item[1]["size"], reverse=True))
 
+    @classmethod
+    def set_found_bot_tags(cls, found_tags: dict[str, Any], *, actor: str | None = None) -> set[str]:
+        return cls.apply_bot_result(found_tags, actor=actor, note="set_news_item_tags").story_ids
+
+    @classmethod
+    def set_worker_execution_attribute(cls, *, worker_type: str, worker_id: str, found_tags: dict[str, Any]) -> set[str]:
+        return cls.apply_bot_result(
+            found_tags, worker_type=worker_type, worker_id=worker_id, apply_tags=False, note="set_worker_execution_attribute"
+        ).story_ids
+
+    @classmethod
+    def apply_bot_result(
+        cls,
+        found_tags: dict[str, Any],
+        *,
+        worker_type: str | None = None,
+        worker_id: str | None = None,
+        actor: str | None = "bot",
+        apply_tags: bool = True,
+        note: str = "apply_bot_result",
+    ) -> BotResultApplication:
+        """Apply bot tags and the worker execution attribute set-wise, committing once per batch of stories.
+
+        Stories whose tags changed get their status refreshed; every touched story gets a single revision per run.
+        """
+        application = BotResultApplication()
+        with application.phase("load"):
+            story_ids_by_news_item = cls._story_ids_by_news_item(list(found_tags))
+        tag_counts_by_story: dict[str, int] = {}
+        for news_item_id, story_id in story_ids_by_news_item.items():
+            tag_counts_by_story[story_id] = tag_counts_by_story.get(story_id, 0) + len(found_tags[news_item_id])
+
+        now = datetime.now(UTC).isoformat()
+        story_change = Story.resolve_actor(actor=actor)
+        created_by_id = getattr(Story.user_for_actor(story_change), "id", None)
+        story_ids = list(tag_counts_by_story)
+        for start in range(0, len(story_ids), BOT_RESULT_BATCH_SIZE):
+            batch_ids = story_ids[start : start + BOT_RESULT_BATCH_SIZE]
+            with application.phase("load"):
+                stories = cls._load_stories_for_bot_result(batch_ids)
+                in_reports_counts = ReportItemStory.count_by_story_ids(batch_ids)
+
+            changed_story_ids: set[str] = set()
+            if apply_tags:
+                with application.phase("tags"):
+                    summary_keys = set()
+                    for story in stories:
+                        for news_item in story.news_items:
+                            if (tags := found_tags.get(news_item.id)) and (changed_keys := cls._merge_bot_tags(news_item, tags)):
+                                summary_keys.update(changed_keys)
+                                changed_story_ids.add(story.id)
+                    db.session.flush()
+                with application.phase("tag_clusters"):
+                    NewsItemTagCluster.refresh_for_keys(summary_keys)
+
+            with application.phase("stories"), db.session.no_autoflush:
+                for story in stories:
+                    if story.id in changed_story_ids:
+                        story.update_status(change=story_change, in_reports_count=in_reports_counts[story.id])
+                    if worker_type:
+                        attribute_value = f"worker_id={worker_id}|count={tag_counts_by_story[story.id]}|{now}"
+                        story.upsert_attribute(NewsItemAttribute(key=f"{worker_type}", value=attribute_value))
+
+            revised_stories = stories if worker_type else [story for story in stories if story.id in changed_story_ids]
+            with application.phase("revisions"):
+                StoryRevision.create_for_stories(revised_stories, in_reports_counts, created_by_id=created_by_id, note=note)
+            application.story_ids.update(story.id for story in revised_stories)
+            with application.phase("commit"):
+                db.session.commit()
+        return application
+
     @staticmethod
-    def set_found_bot_tags(found_tags: dict[str, Any], *, actor: str | None = None) -> set[str]:
-        story_ids = set()
-        for news_item_id, tags in found_tags.items():
-            if not tags:
-                continue
-            news_item = NewsItem.get(news_item_id)
-            if not news_item:
-                continue
-            _, status = news_item.set_tags(tags, actor=actor, replace=False)
-            if status == 200 and news_item.story_id:
-                story_ids.add(news_item.story_id)
+    def _story_ids_by_news_item(news_item_ids: list[str]) -> dict[str, str]:
+        story_ids: dict[str, str] = {}
+        for start in range(0, len(news_item_ids), BOT_RESULT_BATCH_SIZE):
+            chunk = news_item_ids[start : start + BOT_RESULT_BATCH_SIZE]
+            rows = db.session.execute(db.select(NewsItem.id, NewsItem.story_id).where(NewsItem.id.in_(chunk), NewsItem.story_id.is_not(None)))
+            story_ids.update(rows.tuples().all())
         return story_ids
 
     @staticmethod
-    def set_worker_execution_attribute(*, worker_type: str, worker_id: str, found_tags: dict[str, Any]) -> set[str]:
-        now = datetime.now(UTC).isoformat()
-        tag_counts_by_story: dict[str, int] = {}
-        stories_by_id: dict[str, Story] = {}
-
-        for news_item_id, tags in found_tags.items():
-            if (news_item := NewsItem.get(news_item_id)) and (story := news_item.story):
-                stories_by_id[story.id] = story
-                tag_counts_by_story[story.id] = tag_counts_by_story.get(story.id, 0) + len(tags)
+    def _load_stories_for_bot_result(story_ids: list[str]) -> list[Story]:
+        query = (
+            db.select(Story)
+            .where(Story.id.in_(story_ids))
+            .options(
+                selectinload(Story.attributes),
+                selectinload(Story.misp_auto_update),
+                selectinload(Story.news_items).selectinload(NewsItem.attributes),
+                selectinload(Story.news_items).selectinload(NewsItem.tags),
+                selectinload(Story.news_items).selectinload(NewsItem.osint_source).selectinload(OSINTSource.parameters),
+            )
+        )
+        return list(db.session.execute(query).scalars())
 
-        for story_id, tag_count in tag_counts_by_story.items():
-            story = stories_by_id[story_id]
-            attribute_value = f"worker_id={worker_id}|count={tag_count}|{now}"
-            story.upsert_attribute(NewsItemAttribute(key=f"{worker_type}", value=attribute_value))
-            story.record_revision(note="set_worker_execution_attribute")
+    @staticmethod
+    def _merge_bot_tags(news_item: NewsItem, tags: list | dict) -> set[tuple[str, str]]:
+        """Add new tags and retype existing ones in place; return the cluster keys the change touched."""
+        try:
+            parsed_tags = NewsItemTag.parse_tags(tags)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid bot tags for news item {news_item.id}")
+            return set()
 
-        db.session.commit()
-        return set(stories_by_id)
+        existing_tags = {tag.name: tag for tag in news_item.tags}
+        changed_keys: set[tuple[str, str]] = set()
+        for name, tag in parsed_tags.items():
+            if (existing_tag := existing_tags.get(name)) is None:
+                news_item.tags.append(tag)
+            elif existing_tag.tag_type != tag.tag_type:
+                changed_keys.update(NewsItemTag.get_summary_keys_for_tag_types(name, existing_tag.tag_type))
+                existing_tag.tag_type = tag.tag_type
+            else:
+                continue
+            changed_keys.update(NewsItemTag.get_summary_keys_for_tag_types(name, tag.tag_type))
+        return changed_keys
 
     @classmethod
     def delete_tags_by_name(cls, tag_name: str):
@@ -1,13 +1,14 @@
-from base64 import b64decode
+import shutil
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
-from flask import Response, current_app, send_file
+from flask import current_app, send_file
 from models.product import validate_linkable_url
 from sqlalchemy import select
 
 from core.log import logger
 from core.managers import queue_manager
+from core.managers.artifact_store import CHUNK_SIZE, ArtifactNotFoundError, get_artifact_store
 from core.managers.db_manager import db
 from core.model.product import Product
 from core.model.report_item import ReportItem
@@ -22,7 +23,7 @@ class ProductService:
         return Path(current_app.config["DATA_FOLDER"]).resolve() / cls.PUBLISHED_REPORTS_FOLDER
 
     @classmethod
-    def get_render(cls, product_id: str):
+    def get_render(cls, product_id: str, as_attachment: bool = True):
         render_error = Task.get_latest_matching(
             exact_ids={product_id, f"presenter_task_{product_id}"},
             prefixes=[f"presenter_task_{product_id}_"],
@@ -32,19 +33,30 @@ class ProductService:
             logger.error(f"Failed to render product {product_id}: {render_error.to_dict()}")
             return {"error": render_error.result}, 200
         if product_data := Product.get_render(product_id):
-            binary = b64decode(product_data["blob"])
-            return Response(
-                binary,
+            return cls.send_render(product_data, as_attachment=as_attachment)
+        return {"error": "Product not found"}, 404
+
+    @classmethod
+    def send_render(cls, product_data: dict, as_attachment: bool = True):
+        try:
+            response = get_artifact_store().send(
+                product_data["digest"],
                 mimetype=product_data["mime_type"],
-                headers={"Content-Disposition": f'attachment; filename="{product_data["filename"]}"'},
-                status=200,
+                download_name=product_data["filename"],
+                as_attachment=as_attachment,
             )
-        return {"error": "Product not found"}, 404
+        except ArtifactNotFoundError:
+            logger.error(f"Render artifact {product_data['digest']} is missing")
+            return {"error": "Rendered product not found"}, 404
+        if not as_attachment:
+            response.headers["Content-Security-Policy"] = "sandbox"
+            response.headers["X-Content-Type-Options"] = "nosniff"
+        return response
 
     @classmethod
     def publish_to_taranis(cls, product_id: str):
         product = Product.get(product_id)
-        if not product or not product.render_result:
+        if not product or not product.render_digest:
             return {"error": "Rendered product not found"}, 404
 
         report_directory = cls._published_reports_directory()
@@ -53,10 +65,16 @@ class ProductService:
 
         temporary_path = None
         try:
-            with NamedTemporaryFile(dir=report_directory, delete=False) as temporary_file:
-                temporary_file.write(b64decode(product.render_result))
+            with (
+                get_artifact_store().open(product.render_digest) as rendered,
+                NamedTemporaryFile(dir=report_directory, delete=False) as temporary_file,
+            ):
                 temporary_path = Path(temporary_file.name)
+                shutil.copyfileobj(rendered, temporary_file, CHUNK_SIZE)
             temporary_path.replace(report_path)
+        except ArtifactNotFoundError:
+            logger.error(f"Render artifact {product.render_digest} of Product {product.id} is missing")
+            return {"error": "Rendered product not found"}, 404
         finally:
             if temporary_path:
                 temporary_path.unlink(missing_ok=True)
@@ -1,11 +1,13 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 
-from sqlalchemy import String, cast, select
-from sqlalchemy.orm import aliased
+from sqlalchemy import String, cast, func, select
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.expression import true
 
+from core.managers.auth_cache_manager import auth_cache_manager
 from core.managers.db_manager import db
+from core.model.role import TLPLevel
 from core.model.role_based_access import ItemType, RBACRole, RoleBasedAccess
 from core.model.user import User
 
@@ -24,169 +26,149 @@ class RBACQuery:
         self.require_write_access = require_write_access
 
 
-class RoleBasedAccessService:
-    @classmethod
-    def user_has_access_to_resource(cls, rbac_query: RBACQuery) -> bool:
-        """
-        Check if a user has access to a resource based on RBACQuery parameters.
-        """
-        if cls._user_bypasses_acl(rbac_query.user):
-            return True
+@dataclass(frozen=True)
+class AccessContext:
+    """ACL and TLP access of one set of roles, compiled once and shared by every user holding it.
 
-        if not cls._is_enabled_for_resource_type(rbac_query.resource_type):
-            return True
-        return any(cls._is_authorized(acl_entry, rbac_query) for role in rbac_query.user.roles for acl_entry in role.acls)
+    Item ids granted through an OSINT source group ACL are also listed under OSINT_SOURCE,
+    so source checks are plain set lookups. A "*" entry grants access to every item of its type.
+    """
 
-    @classmethod
-    def _is_authorized(cls, acl_entry: RoleBasedAccess, rbac_query: RBACQuery) -> bool:
-        if not acl_entry.enabled:
-            return False
-        if rbac_query.require_write_access and acl_entry.read_only:
-            return False
+    bypasses_acl: bool
+    tlp_level: TLPLevel
+    enabled_types: frozenset[ItemType] = frozenset()
+    readable_ids: dict[ItemType, frozenset[str]] = field(default_factory=dict)
+    writable_ids: dict[ItemType, frozenset[str]] = field(default_factory=dict)
 
-        resource_type = rbac_query.resource_type
-        acl_item_type = acl_entry.item_type
+    @property
+    def accessible_tlps(self) -> list[str]:
+        return self.tlp_level.get_accessible_levels()
 
-        if acl_item_type == resource_type:
-            return acl_entry.item_id in [rbac_query.resource_id, "*"]
+    def is_enabled_for(self, resource_type: ItemType) -> bool:
+        if resource_type == ItemType.OSINT_SOURCE:
+            return bool({ItemType.OSINT_SOURCE, ItemType.OSINT_SOURCE_GROUP} & self.enabled_types)
+        return resource_type in self.enabled_types
 
-        if resource_type == ItemType.OSINT_SOURCE and acl_item_type == ItemType.OSINT_SOURCE_GROUP:
-            return acl_entry.item_id == "*" or cls._source_is_in_group(rbac_query.resource_id, acl_entry.item_id)
+    def accessible_ids(self, resource_type: ItemType, require_write_access: bool = False) -> frozenset[str] | None:
+        """Ids of the accessible items of a type, or None if every item is accessible."""
+        if self.bypasses_acl or not self.is_enabled_for(resource_type):
+            return None
+        item_ids = (self.writable_ids if require_write_access else self.readable_ids).get(resource_type, frozenset())
+        return None if "*" in item_ids else item_ids
 
-        return False
+    def allows(self, resource_type: ItemType, resource_id: str | None, require_write_access: bool = False) -> bool:
+        item_ids = self.accessible_ids(resource_type, require_write_access)
+        return item_ids is None or resource_id in item_ids
 
-    @staticmethod
-    def _user_bypasses_acl(user: User) -> bool:
+
+class RoleBasedAccessService:
+    @classmethod
+    def get_access_context(cls, user: User) -> AccessContext:
+        """Compiled access of the user's roles, cached until ACLs, roles or source groups change."""
         try:
-            return "ADMIN_OPERATIONS" in (user.get_permissions() or [])
+            role_ids = tuple(sorted(role.id for role in user.roles if role))
         except (AttributeError, TypeError):
-            return False
+            return cls._compile_access_context(user, ())
+        return auth_cache_manager.get_access_context(role_ids, lambda: cls._compile_access_context(user, role_ids))
 
     @classmethod
-    def _is_enabled_for_resource_type(cls, resource_type: ItemType) -> bool:
-        if resource_type == ItemType.OSINT_SOURCE:
-            return RoleBasedAccess.is_enabled_for_type(ItemType.OSINT_SOURCE) or RoleBasedAccess.is_enabled_for_type(
-                ItemType.OSINT_SOURCE_GROUP
-            )
-        return RoleBasedAccess.is_enabled_for_type(resource_type)
+    def _compile_access_context(cls, user: User, role_ids: tuple[str, ...]) -> AccessContext:
+        tlp_level = user.get_highest_tlp()
+        if cls._user_bypasses_acl(user):
+            return AccessContext(bypasses_acl=True, tlp_level=tlp_level)
+
+        enabled_types = frozenset(
+            db.session.execute(select(RoleBasedAccess.item_type).where(RoleBasedAccess.enabled == true()).distinct()).scalars()
+        )
+        readable: dict[ItemType, set[str]] = defaultdict(set)
+        writable: dict[ItemType, set[str]] = defaultdict(set)
+        if enabled_types and role_ids:
+            entries = db.session.execute(
+                select(RoleBasedAccess.item_type, RoleBasedAccess.item_id, RoleBasedAccess.read_only)
+                .join(RBACRole, RoleBasedAccess.id == RBACRole.acl_id)
+                .where(RoleBasedAccess.enabled == true(), RBACRole.role_id.in_(role_ids))
+            ).tuples()
+            for item_type, item_id, read_only in entries:
+                readable[item_type].add(item_id)
+                if not read_only:
+                    writable[item_type].add(item_id)
+            cls._add_group_sources(readable)
+            cls._add_group_sources(writable)
+
+        return AccessContext(
+            bypasses_acl=False,
+            tlp_level=tlp_level,
+            enabled_types=enabled_types,
+            readable_ids={item_type: frozenset(item_ids) for item_type, item_ids in readable.items()},
+            writable_ids={item_type: frozenset(item_ids) for item_type, item_ids in writable.items()},
+        )
 
     @staticmethod
-    def _source_is_in_group(source_id: str | None, group_id: str | None) -> bool:
-        if not source_id or not group_id:
-            return False
+    def _add_group_sources(item_ids: dict[ItemType, set[str]]) -> None:
+        if not (group_ids := item_ids.get(ItemType.OSINT_SOURCE_GROUP)):
+            return
+        if "*" in group_ids:
+            item_ids[ItemType.OSINT_SOURCE].add("*")
+            return
 
         from core.model.osint_source import OSINTSourceGroupOSINTSource
 
-        query = select(
-            db.exists().where(
-                OSINTSourceGroupOSINTSource.osint_source_id == source_id,
-                OSINTSourceGroupOSINTSource.osint_source_group_id == group_id,
-            )
+        item_ids[ItemType.OSINT_SOURCE].update(
+            db.session.execute(
+                select(OSINTSourceGroupOSINTSource.osint_source_id).where(OSINTSourceGroupOSINTSource.osint_source_group_id.in_(group_ids))
+            ).scalars()
         )
-        return bool(db.session.execute(query).scalar())
 
     @classmethod
-    def filter_query_with_tlp(cls, query: Select, user: User) -> Select:
-        from core.model.news_item_attribute import NewsItemAttribute
-        from core.model.story import Story, StoryNewsItemAttribute
-
-        user_tlp_level = user.get_highest_tlp()
-        if user_tlp_level.value == "red":
-            return query
+    def user_has_access_to_resource(cls, rbac_query: RBACQuery) -> bool:
+        """
+        Check if a user has access to a resource based on RBACQuery parameters.
+        """
+        context = cls.get_access_context(rbac_query.user)
+        return context.allows(rbac_query.resource_type, rbac_query.resource_id, rbac_query.require_write_access)
 
-        accessible_tlps = user_tlp_level.get_accessible_levels()
+    @staticmethod
+    def _user_bypasses_acl(user: User) -> bool:
+        try:
+            return "ADMIN_OPERATIONS" in (user.get_permissions() or [])
+        except (AttributeError, TypeError):
+            return False
 
-        TLPAttr = aliased(NewsItemAttribute)
-        SNA = aliased(StoryNewsItemAttribute)
+    @classmethod
+    def filter_query_with_tlp(cls, query: Select, user: User) -> Select:
+        from core.model.story import Story
 
-        query = (
-            query.outerjoin(SNA, SNA.story_id == Story.id)
-            .outerjoin(TLPAttr, db.and_(TLPAttr.id == SNA.news_item_attribute_id, TLPAttr.key == "TLP"))
-            .filter(db.or_(TLPAttr.value.in_(accessible_tlps), TLPAttr.id.is_(None)))
-        )
+        context = cls.get_access_context(user)
+        if context.tlp_level == TLPLevel.RED:
+            return query
 
-        return query
+        return query.where(db.or_(Story.tlp.is_(None), Story.tlp.in_(context.accessible_tlps)))
 
     @classmethod
     def filter_report_query_with_tlp(cls, query: Select, user: User) -> Select:
         from core.model.report_item import AttributeType, ReportItem, ReportItemAttribute
 
-        user_tlp_level = user.get_highest_tlp()
-        accessible_tlps = user_tlp_level.get_accessible_levels()
-
-        TLPAttr = aliased(ReportItemAttribute)
-
-        return query.outerjoin(TLPAttr, db.and_(TLPAttr.report_item_id == ReportItem.id, TLPAttr.attribute_type == AttributeType.TLP)).filter(
-            db.or_(
-                TLPAttr.value.in_(accessible_tlps),
-                TLPAttr.id.is_(None),
-            )
+        restricted_tlp = db.exists().where(
+            ReportItemAttribute.report_item_id == ReportItem.id,
+            ReportItemAttribute.attribute_type == AttributeType.TLP,
+            func.coalesce(ReportItemAttribute.value, "").not_in(cls.get_access_context(user).accessible_tlps),
         )
+        return query.where(~restricted_tlp)
 
     @classmethod
     def filter_query_with_acl(cls, query: Select, rbac_query: RBACQuery) -> Select:
-        role_ids = [role.id for role in rbac_query.user.roles]
         item_type = rbac_query.resource_type
-        if cls._user_bypasses_acl(rbac_query.user) or not cls._is_enabled_for_resource_type(item_type):
+        item_ids = cls.get_access_context(rbac_query.user).accessible_ids(item_type, rbac_query.require_write_access)
+        if item_ids is None:
             return query
 
-        if item_type == ItemType.OSINT_SOURCE:
-            return cls._filter_osint_source_query_with_acl(query, role_ids, rbac_query.require_write_access)
-
         model_class = cls.get_model_class(item_type)
-        access_check_query = cls._acl_item_ids_query(item_type, role_ids, rbac_query.require_write_access)
-
-        if cls._has_wildcard_access(access_check_query):
-            return query
-
         if item_type in {ItemType.REPORT_ITEM_TYPE, ItemType.PRODUCT_TYPE, ItemType.WORD_LIST}:
             id_field = cast(model_class.id, String)  # type: ignore
         else:
             id_field = model_class.id
 
-        return query.where(id_field.in_(access_check_query))  # type: ignore
-
-    @classmethod
-    def _filter_osint_source_query_with_acl(cls, query: Select, role_ids: list[str], require_write_access: bool) -> Select:
-        from core.model.osint_source import OSINTSource, OSINTSourceGroupOSINTSource
-
-        source_access_query = cls._acl_item_ids_query(ItemType.OSINT_SOURCE, role_ids, require_write_access)
-        group_access_query = cls._acl_item_ids_query(ItemType.OSINT_SOURCE_GROUP, role_ids, require_write_access)
-
-        if cls._has_wildcard_access(source_access_query) or cls._has_wildcard_access(group_access_query):
-            return query
-
-        inherited_source_ids = (
-            select(OSINTSourceGroupOSINTSource.osint_source_id)
-            .where(OSINTSourceGroupOSINTSource.osint_source_group_id.in_(group_access_query))
-            .distinct()
-        )
-
-        return query.where(db.or_(OSINTSource.id.in_(source_access_query), OSINTSource.id.in_(inherited_source_ids)))
-
-    @staticmethod
-    def _acl_item_ids_query(item_type: ItemType, role_ids: list[str], require_write_access: bool) -> Select:
-        rbac_role_alias = aliased(RBACRole)
-        role_based_access_alias = aliased(RoleBasedAccess)
-
-        query = (
-            select(role_based_access_alias.item_id)
-            .join(rbac_role_alias, role_based_access_alias.id == rbac_role_alias.acl_id)
-            .where(
-                role_based_access_alias.item_type == item_type,
-                role_based_access_alias.enabled == true(),
-                rbac_role_alias.role_id.in_(role_ids),
-            )
-            .distinct()
-        )
-        if require_write_access:
-            query = query.where(role_based_access_alias.read_only.is_(False))
-        return query
-
-    @staticmethod
-    def _has_wildcard_access(access_query: Select) -> bool:
-        access_subquery = access_query.subquery()
-        return bool(db.session.execute(select(db.exists().where(access_subquery.c.item_id == "*"))).scalar())
+        return query.where(id_field.in_(sorted(item_ids)))  # type: ignore
 
     @classmethod
     def get_model_class(cls, resource_type: ItemType):
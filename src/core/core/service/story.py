@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from flask import Response, abort, jsonify
 from flask_jwt_extended import current_user
 from sqlalchemy import Row, bindparam, func
+from sqlalchemy.orm import selectinload
 
 from core.log import logger
 from core.managers import queue_manager
@@ -13,7 +14,8 @@ from core.managers.db_manager import db
 from core.model.news_item import NewsItem
 from core.model.news_item_attribute import NewsItemAttribute
 from core.model.revision import StoryRevision
-from core.model.story import Story
+from core.model.story import ReportItemStory, Story
+from core.model.story_counter import StoryCounter
 from core.model.user import User
 from core.service.cache_invalidation import invalidate_frontend_cache_on_success
 from core.service.misp_auto_update import cancel_misp_auto_update_jobs, refresh_misp_auto_update_jobs
@@ -50,6 +52,7 @@ class StoryService:
     @classmethod
     def delete_all(cls) -> tuple[dict, int]:
         story_ids = db.session.execute(db.select(Story.id)).scalars().all()
+        StoryCounter.mark_rebuild()
         result = Story.delete_all()
         if result[1] == 200:
             cancel_misp_auto_update_jobs(story_ids)
@@ -242,6 +245,88 @@ class StoryService:
         db.session.commit()
         refresh_misp_auto_update_jobs([story.id])
 
+    @staticmethod
+    def bulk_update_attributes(
+        news_item_attributes: dict[str, Any], story_updates: dict[str, Any], actor: str | None = None
+    ) -> tuple[dict[str, Any], int]:
+        """Apply many news item and story attribute patches in one transaction.
+
+        ``news_item_attributes`` maps news item ids to attributes, ``story_updates`` maps story ids
+        to ``{"attributes": ..., "summary": ..., "title": ...}``. All affected rows are loaded with a
+        few IN queries, every touched story gets its status recomputed and one revision, written
+        with a single bulk insert, and everything is committed at once. Unknown ids and invalid patches are reported per id.
+        """
+        errors: dict[str, str] = {}
+        news_items = {
+            news_item.id: news_item
+            for news_item in db.session.execute(db.select(NewsItem).where(NewsItem.id.in_(list(news_item_attributes)))).scalars()
+        }
+        story_ids = set(story_updates) | {news_item.story_id for news_item in news_items.values() if news_item.story_id}
+        story_query = (
+            db.select(Story)
+            .where(Story.id.in_(list(story_ids)))
+            .options(selectinload(Story.attributes), selectinload(Story.news_items).selectinload(NewsItem.attributes))
+        )
+        stories = {story.id: story for story in db.session.execute(story_query).scalars()}
+
+        touched_story_ids: set[str] = set()
+        for news_item_id, attributes in news_item_attributes.items():
+            if not (news_item := news_items.get(news_item_id)):
+                errors[news_item_id] = "News item not found"
+                continue
+            try:
+                parsed_attributes = NewsItemAttribute.parse_attributes(attributes)
+            except TypeError:
+                parsed_attributes = {}
+            if not parsed_attributes:
+                errors[news_item_id] = "Invalid attributes"
+                continue
+            for attribute in parsed_attributes.values():
+                news_item.upsert_attribute(attribute)
+            news_item.last_change = actor or "internal"
+            if news_item.story_id:
+                touched_story_ids.add(news_item.story_id)
+
+        for story_id, update in story_updates.items():
+            if not (story := stories.get(story_id)):
+                errors[story_id] = "Story not found"
+                continue
+            if not isinstance(update, dict) or not update.keys() & {"attributes", "summary", "title"}:
+                errors[story_id] = "Invalid story update"
+                continue
+            try:
+                if attributes := update.get("attributes"):
+                    story.patch_attributes(attributes)
+            except TypeError:
+                errors[story_id] = "Invalid attributes"
+                continue
+            if isinstance(summary := update.get("summary"), str):
+                story.summary = summary
+            if isinstance(title := update.get("title"), str) and title:
+                story.title = title
+            touched_story_ids.add(story_id)
+
+        try:
+            in_reports_counts = ReportItemStory.count_by_story_ids(sorted(touched_story_ids))
+            revised_stories: list[Story] = []
+            for story_id in sorted(touched_story_ids):
+                story = stories[story_id]
+                story.update_status(change=actor, in_reports_count=in_reports_counts[story_id])
+                if story not in db.session.deleted:
+                    revised_stories.append(story)
+            StoryRevision.create_for_stories(revised_stories, in_reports_counts, note="bulk_update_attributes")
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            logger.exception("Failed to apply bulk attribute update")
+            return {"error": "Failed to update attributes"}, 500
+        refresh_misp_auto_update_jobs(list(touched_story_ids))
+
+        result: dict[str, Any] = {"message": "Attributes updated", "stories": len(touched_story_ids)}
+        if errors:
+            return {**result, "message": "Some attributes failed to update", "errors": errors}, 207
+        return result, 200
+
     @staticmethod
     def fetch_and_create_story(parameters: dict[str, Any], user_id: str | None = None) -> tuple[dict[str, Any], int]:
         result = queue_manager.queue_manager.fetch_single_news_item(parameters=parameters, user_id=user_id)
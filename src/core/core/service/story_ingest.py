@@ -0,0 +1,250 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from models.assess import NewsItem as AssessNewsItem
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
+
+from core.log import logger
+from core.managers.db_manager import db
+from core.model.base_model import BaseModel
+from core.model.news_item import NewsItem, NewsItemNewsItemAttribute
+from core.model.news_item_attribute import NewsItemAttribute
+from core.model.news_item_tag import NewsItemTag, NewsItemTagCluster
+from core.model.osint_source import OSINTSource
+from core.model.revision import StoryRevision
+from core.model.role import TLPLevel
+from core.model.story import STATUS_ATTRIBUTE_COLUMNS, Story, StoryNewsItemAttribute
+from core.model.story_counter import StoryCounter
+from core.model.user import User
+
+
+LOOKUP_CHUNK_SIZE = 500
+
+
+@dataclass
+class IngestRow:
+    story: dict[str, Any]
+    news_item: dict[str, Any]
+    news_item_attributes: list[NewsItemAttribute] = field(default_factory=list)
+    story_attributes: list[NewsItemAttribute] = field(default_factory=list)
+    tags: list[NewsItemTag] = field(default_factory=list)
+
+
+class StoryIngestService:
+    """Set-based ingestion of collected news items, one new story per news item."""
+
+    @classmethod
+    def add_news_items(cls, news_items_list: list[dict], user: User | None = None) -> tuple[list[str], list[str], int]:
+        payloads = cls._validate_payloads(news_items_list)
+        payloads = cls._drop_known_hashes(payloads)
+        sources = cls._resolve_sources(payloads)
+        source_tlp_levels = {source.id: source.tlp_level for source in set(sources.values())}
+        rows = [row for payload in payloads if (row := cls._build_row(payload, sources, source_tlp_levels, user))]
+
+        inserted_rows = cls._insert_rows(rows)
+        story_ids = [row.story["id"] for row in inserted_rows]
+        news_item_ids = [row.news_item["id"] for row in inserted_rows]
+        cls._record_created_revisions(story_ids)
+        StoryCounter.mark_stories(story_ids)
+        NewsItemTagCluster.refresh_for_keys(
+            {key for row in inserted_rows for tag in row.tags for key in NewsItemTag.get_summary_keys_for_tag_types(tag.name, tag.tag_type)}
+        )
+        return story_ids, news_item_ids, len(news_items_list) - len(inserted_rows)
+
+    @staticmethod
+    def _validate_payloads(news_items_list: list[dict]) -> list[AssessNewsItem]:
+        payloads = []
+        for news_item in news_items_list:
+            normalized_news_item, err = Story.check_news_item_data(news_item)
+            if err or normalized_news_item is None:
+                logger.warning(err or "Invalid news item data")
+                continue
+            payloads.append(normalized_news_item)
+        return payloads
+
+    @staticmethod
+    def _chunks(values: Sequence[Any], size: int = LOOKUP_CHUNK_SIZE) -> Iterable[Sequence[Any]]:
+        for start in range(0, len(values), size):
+            yield values[start : start + size]
+
+    @classmethod
+    def _drop_known_hashes(cls, payloads: list[AssessNewsItem]) -> list[AssessNewsItem]:
+        unique_payloads: dict[str, AssessNewsItem] = {}
+        for payload in payloads:
+            unique_payloads.setdefault(payload.hash or "", payload)
+
+        known_hashes: set[str] = set()
+        for chunk in cls._chunks(list(unique_payloads)):
+            known_hashes.update(db.session.execute(db.select(NewsItem.hash).where(NewsItem.hash.in_(chunk))).scalars())
+        if known_hashes:
+            logger.warning(f"Identical news items found. Skipping {len(known_hashes)}...")
+        return [payload for item_hash, payload in unique_payloads.items() if item_hash not in known_hashes]
+
+    @classmethod
+    def _resolve_sources(cls, payloads: list[AssessNewsItem]) -> dict[str, OSINTSource]:
+        source_ids = list({payload.osint_source_id for payload in payloads})
+        sources: dict[str, OSINTSource] = {}
+        for chunk in cls._chunks(source_ids):
+            query = db.select(OSINTSource).where(OSINTSource.id.in_(chunk)).options(selectinload(OSINTSource.parameters))
+            sources.update({source.id: source for source in db.session.execute(query).scalars()})
+        if missing := set(source_ids) - set(sources):
+            logger.warning(f"OSINT Sources {sorted(missing)} not found. Setting osint_source_id to manual.")
+            manual_source = OSINTSource.get_manual()
+            sources.update(dict.fromkeys(missing, manual_source))
+        return sources
+
+    @classmethod
+    def _build_row(
+        cls,
+        payload: AssessNewsItem,
+        sources: dict[str, OSINTSource],
+        source_tlp_levels: dict[str, TLPLevel],
+        user: User | None,
+    ) -> IngestRow | None:
+        source = sources[payload.osint_source_id]
+        try:
+            news_item_id = BaseModel.normalize_uuid_id(payload.id)
+            attributes = NewsItemAttribute.load_multiple([attribute for attribute in payload.attributes or [] if isinstance(attribute, dict)])
+            tags = list(NewsItemTag.parse_tags(payload.tags or {}).values())
+        except (TypeError, ValueError):
+            logger.exception(f"Failed to add news item: {payload.hash}")
+            return None
+
+        manual_source = Story._is_manual_source(source)
+        story_id = BaseModel.uuid7_str()
+        now = BaseModel.utcnow()
+        published = payload.published or now
+        story_actor = Story.last_change_for_user(user) or ("internal" if manual_source else Story.last_change_for_source(source))
+        news_item_actor = "internal" if manual_source else Story.last_change_for_source(source)
+
+        story_attributes = [
+            NewsItemAttribute(key="TLP", value=NewsItemAttribute.get_tlp_level(attributes) or source_tlp_levels[source.id]),
+            NewsItemAttribute(
+                key="cybersecurity", value=Story.cybersecurity_status_for([NewsItem.cybersecurity_status_from_attributes(attributes)])
+            ),
+            NewsItemAttribute(key="sentiment", value=Story.sentiment_for([NewsItem.sentiment_from_attributes(attributes)])),
+        ]
+        story_attributes = [attribute for attribute in story_attributes if attribute.value != "none"]
+        status_columns = dict.fromkeys(STATUS_ATTRIBUTE_COLUMNS.values()) | {
+            STATUS_ATTRIBUTE_COLUMNS[attribute.key]: attribute.value for attribute in story_attributes
+        }
+
+        return IngestRow(
+            story={
+                "id": story_id,
+                "title": payload.title or "",
+                "description": "",
+                "created": published,
+                "updated": published,
+                "read": False,
+                "important": False,
+                "likes": 0,
+                "dislikes": 0,
+                "relevance": source.rank or 0,
+                "relevance_override": 0,
+                "comments": "",
+                "summary": "",
+                "revision": 1,
+                "last_change": story_actor or "internal",
+                **status_columns,
+            },
+            news_item={
+                "id": news_item_id,
+                "hash": payload.hash,
+                "title": payload.title or "",
+                "review": payload.review or "",
+                "author": payload.author or "",
+                "source": payload.source or "",
+                "link": payload.link or "",
+                "language": payload.language or "",
+                "content": payload.content or "",
+                "collected": payload.collected or now,
+                "published": published,
+                "updated": now,
+                "last_change": news_item_actor or payload.last_change or "external",
+                "osint_source_id": source.id,
+                "story_id": story_id,
+            },
+            news_item_attributes=attributes,
+            story_attributes=story_attributes,
+            tags=tags,
+        )
+
+    @staticmethod
+    def _insert(model: type[BaseModel]):
+        if db.engine.dialect.name == "postgresql":
+            return pg_insert(model).on_conflict_do_nothing()
+        return sqlite_insert(model).on_conflict_do_nothing()
+
+    @staticmethod
+    def _attribute_row(attribute: NewsItemAttribute) -> dict[str, Any]:
+        return {
+            "id": attribute.id,
+            "key": attribute.key,
+            "value": attribute.value,
+            "binary_mime_type": attribute.binary_mime_type,
+            "binary_data": attribute.binary_data,
+            "created": BaseModel.utcnow(),
+        }
+
+    @classmethod
+    def _insert_rows(cls, rows: list[IngestRow]) -> list[IngestRow]:
+        if not rows:
+            return []
+
+        db.session.execute(cls._insert(Story), [row.story for row in rows])
+        inserted_news_item_ids = set(
+            db.session.execute(cls._insert(NewsItem).returning(NewsItem.id), [row.news_item for row in rows]).scalars()
+        )
+        inserted_rows = [row for row in rows if row.news_item["id"] in inserted_news_item_ids]
+        if orphaned_story_ids := [row.story["id"] for row in rows if row.news_item["id"] not in inserted_news_item_ids]:
+            logger.warning(f"Skipping {len(orphaned_story_ids)} news items that were ingested concurrently")
+            for chunk in cls._chunks(orphaned_story_ids):
+                db.session.execute(db.delete(Story).where(Story.id.in_(chunk)))
+
+        attribute_rows = []
+        news_item_attribute_links = []
+        story_attribute_links = []
+        tag_rows = []
+        for row in inserted_rows:
+            for attribute in row.news_item_attributes:
+                attribute_rows.append(cls._attribute_row(attribute))
+                news_item_attribute_links.append({"news_item_id": row.news_item["id"], "news_item_attribute_id": attribute.id})
+            for attribute in row.story_attributes:
+                attribute_rows.append(cls._attribute_row(attribute))
+                story_attribute_links.append({"story_id": row.story["id"], "news_item_attribute_id": attribute.id})
+            tag_rows.extend(
+                {"id": tag.id, "name": tag.name, "tag_type": tag.tag_type, "news_item_id": row.news_item["id"]} for tag in row.tags
+            )
+
+        for model, values in (
+            (NewsItemAttribute, attribute_rows),
+            (NewsItemNewsItemAttribute, news_item_attribute_links),
+            (StoryNewsItemAttribute, story_attribute_links),
+            (NewsItemTag, tag_rows),
+        ):
+            if values:
+                db.session.execute(cls._insert(model), values)
+        return inserted_rows
+
+    @classmethod
+    def _record_created_revisions(cls, story_ids: list[str]) -> None:
+        for chunk in cls._chunks(story_ids):
+            query = (
+                db.select(Story)
+                .where(Story.id.in_(chunk))
+                .options(
+                    selectinload(Story.attributes),
+                    selectinload(Story.misp_auto_update),
+                    selectinload(Story.news_items).selectinload(NewsItem.attributes),
+                    selectinload(Story.news_items).selectinload(NewsItem.tags),
+                    selectinload(Story.news_items).selectinload(NewsItem.osint_source),
+                )
+            )
+            StoryRevision.insert_snapshots(
+                [(story.id, story.revision, story.to_detail_dict(in_reports_count=0)) for story in db.session.execute(query).scalars()],
+                note="created",
+            )
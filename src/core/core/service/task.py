@@ -2,15 +2,16 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from models.task import Task as TaskResponseModel
-from models.task import TaskHistoryResponse, TaskResultEnvelope, TaskSubmission, UserTaskFilter, UserTaskList
+from models.task import TaskAffectedEntities, TaskHistoryResponse, TaskResultEnvelope, TaskSubmission, UserTaskFilter, UserTaskList
 
 from core.config import Config
 from core.log import logger
+from core.managers.auth_cache_manager import auth_cache_manager
 from core.managers.sse_manager import sse_manager
 from core.model.osint_source import CollectorHTTPState
 from core.model.product import Product
+from core.model.revision import RevisionNewsItem
 from core.model.task import Task as TaskModel
-from core.model.token_blacklist import TokenBlacklist
 from core.model.word_list import WordList
 from core.service import cache_invalidation as cache_invalidation_module
 from core.service.misp_auto_update import refresh_misp_auto_update_jobs
@@ -66,9 +67,13 @@ class TaskService:
         retention_days = Config.TASK_HISTORY_RETENTION_DAYS
         cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=retention_days)
         deleted = TaskModel.delete_older_than_last_run(cutoff)
+        revision_news_items_deleted = RevisionNewsItem.delete_unreferenced()
+        artifacts_deleted = Product.prune_renders()
         return {
             "message": "Task history cleanup completed",
             "deleted": deleted,
+            "revision_news_items_deleted": revision_news_items_deleted,
+            "artifacts_deleted": artifacts_deleted,
             "cutoff": cutoff.isoformat(),
             "retention_days": retention_days,
         }, 200
@@ -76,7 +81,7 @@ class TaskService:
     @classmethod
     def save_task_result(cls, submission: TaskSubmission) -> tuple[dict[str, Any], int]:
         task_kind = cls._resolve_task_kind(submission.id, submission.task)
-        result_payload = submission.result.model_dump(mode="json", exclude_none=False)
+        result_payload = submission.result.model_dump(mode="json", exclude_none=False, exclude={"affected"})
         payload: dict[str, Any] = {
             "id": submission.id,
             "result": result_payload,
@@ -125,28 +130,33 @@ class TaskService:
 
     @classmethod
     def _handle_success_result(cls, submission: TaskSubmission) -> None:
-        cache_invalidation_module.invalidate_frontend_cache_on_success(200, full=True)
+        affected = TaskAffectedEntities(schedule=True).merge(submission.result.affected)
+        affected = affected.merge(cls._apply_success_result(submission))
+        cache_invalidation_module.cache_invalidation_service.invalidate_task_entities(affected)
+
+    @classmethod
+    def _apply_success_result(cls, submission: TaskSubmission) -> TaskAffectedEntities | None:
+        """Apply a successful task result and return the entities it changed besides those the worker reported."""
         task_kind = cls._resolve_task_kind(submission.id, submission.task)
         if not task_kind:
-            return
+            return None
 
         if task_kind == "cleanup_token_blacklist":
             check_time = datetime.now(UTC).replace(tzinfo=None) - Config.JWT_ACCESS_TOKEN_EXPIRES
-            TokenBlacklist.delete_older(check_time)
-            return
+            auth_cache_manager.prune(check_time)
+            return None
 
         if task_kind == "collector_task":
             logger.info(
                 f"Collector task {submission.id} completed with result: {submission.result.model_dump(mode='json', exclude_none=False)}"
             )
-            cache_invalidation_module.cache_invalidation_service.invalidate_model("osint_source", submission.worker_id)
-            return
+            return TaskAffectedEntities(osint_source_ids=[submission.worker_id] if submission.worker_id else [])
 
         result_data = cls._get_result_dict_data(submission.result)
         if task_kind == "connector_task":
             if result_data is None:
                 logger.error("Invalid connector task result payload")
-                return
+                return None
             handle_misp_connector_result(result_data)
             sse_manager.news_items_updated()
             cache_invalidation_module.invalidate_frontend_cache_on_success(
@@ -157,60 +167,62 @@ class TaskService:
                     cache_invalidation_module.SCOPE_SCHEDULE,
                 ),
             )
-            return
+            return None
 
         if task_kind == "gather_word_list":
             if result_data is None:
                 logger.error("Invalid gather_word_list result payload")
-                return
+                return None
             WordList.update_word_list(**result_data)
-            return
+            return TaskAffectedEntities(word_list_ids=[str(result_data["word_list_id"])])
 
         if task_kind == "presenter_task":
-            cls._handle_presenter_result(result_data)
-            return
+            return cls._handle_presenter_result(result_data)
 
         if task_kind == "bot_task":
-            cls._handle_bot_result(submission, result_data)
+            return cls._handle_bot_result(submission, result_data)
+        return None
 
     @staticmethod
-    def _handle_presenter_result(result_data: dict[str, Any] | None) -> None:
+    def _handle_presenter_result(result_data: dict[str, Any] | None) -> TaskAffectedEntities | None:
         if result_data is None:
             logger.error("Invalid presenter task result payload")
-            return
+            return None
 
         product_id = result_data.get("product_id")
-        rendered_product = result_data.get("render_result")
+        render_digest = result_data.get("render_digest")
 
-        if not isinstance(product_id, str) or not isinstance(rendered_product, str):
+        if not isinstance(product_id, str) or not isinstance(render_digest, str):
             logger.error(f"Product {product_id} not found or no render result")
-            return
+            return None
 
-        Product.update_render_for_id(product_id, rendered_product)
+        Product.update_render_for_id(product_id, render_digest)
+        return TaskAffectedEntities(product_ids=[product_id])
 
     @staticmethod
-    def _handle_bot_result(submission: TaskSubmission, result_data: dict[str, Any] | None) -> None:
+    def _handle_bot_result(submission: TaskSubmission, result_data: dict[str, Any] | None) -> TaskAffectedEntities | None:
         worker_type = submission.worker_type or ""
         worker_id = submission.worker_id or "UNKNOWN_ID"
         if result_data is None:
             logger.error("Invalid bot task result payload")
-            return
+            return None
 
         bot_result = result_data.get("result")
         if not isinstance(bot_result, dict):
             logger.error("Invalid bot task result data payload")
-            return
+            return None
 
         affected_story_ids = set()
-        if worker_type in TAGGING_BOTS:
-            affected_story_ids = NewsItemTagService.set_found_bot_tags(bot_result, actor="bot")
-
         if worker_type == "INTEL_OWL_BOT":
             TaskService._handle_intelowl_bot_result(bot_result, worker_id)
+            # Enrichments are keyed by IOC value and show up on every story mentioning it.
+            cache_invalidation_module.cache_invalidation_service.invalidate_model("story")
         else:
-            affected_story_ids.update(
-                NewsItemTagService.set_worker_execution_attribute(worker_type=worker_type, worker_id=worker_id, found_tags=bot_result)
+            application = NewsItemTagService.apply_bot_result(
+                bot_result, worker_type=worker_type, worker_id=worker_id, apply_tags=worker_type in TAGGING_BOTS
             )
+            affected_story_ids = application.story_ids
+            TaskModel.update_result_data(submission.id, {"apply_timings_ms": application.timings_ms()})
 
         refresh_misp_auto_update_jobs(affected_story_ids)
 
@@ -223,6 +235,7 @@ class TaskService:
                 filter_data if isinstance(filter_data, dict) else None,
                 user_id=submission.user_id,
             )
+        return TaskAffectedEntities(story_ids=sorted(affected_story_ids), bot_ids=[worker_id] if submission.worker_id else [])
 
     @staticmethod
     def _handle_intelowl_bot_result(bot_result: dict[str, Any], worker_id: str) -> None:
@@ -0,0 +1,13 @@
+-- Mark parent stories dirty per news_item row and rebuild each of them once at commit.
+CREATE TRIGGER trg_newsitem_mark_parent_story_dirty
+AFTER INSERT OR UPDATE OF story_id, title, content OR DELETE
+ON news_item
+FOR EACH ROW
+EXECUTE FUNCTION fts_mark_parent_story_dirty();
+
+CREATE CONSTRAINT TRIGGER trg_story_search_vector_dirty_flush
+AFTER INSERT
+ON story_search_vector_dirty
+DEFERRABLE INITIALLY DEFERRED
+FOR EACH ROW
+EXECUTE FUNCTION fts_flush_dirty_story_vectors_trigger();
@@ -0,0 +1,6 @@
+-- Rebuild the parent story vector for every changed news_item row.
+CREATE TRIGGER trg_newsitem_refresh_parent_story_vector
+AFTER INSERT OR UPDATE OF story_id, title, content OR DELETE
+ON news_item
+FOR EACH ROW
+EXECUTE FUNCTION fts_refresh_parent_story_vector();
@@ -110,12 +110,74 @@ BEGIN
 END;
 $$;
 
+-- Deferred maintenance: news_item rows only mark their stories dirty and every dirty story is
+-- rebuilt once when the transaction commits, instead of once per changed news_item row.
+CREATE UNLOGGED TABLE IF NOT EXISTS story_search_vector_dirty (
+    story_id varchar(64) PRIMARY KEY
+);
+
+CREATE OR REPLACE FUNCTION fts_mark_parent_story_dirty()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    old_story_id varchar(64);
+    new_story_id varchar(64);
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        new_story_id := NEW.story_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        old_story_id := OLD.story_id;
+    ELSE
+        old_story_id := OLD.story_id;
+        new_story_id := NEW.story_id;
+    END IF;
+
+    IF new_story_id IS NOT NULL THEN
+        INSERT INTO story_search_vector_dirty (story_id) VALUES (new_story_id) ON CONFLICT DO NOTHING;
+    END IF;
+
+    IF old_story_id IS NOT NULL AND old_story_id IS DISTINCT FROM new_story_id THEN
+        INSERT INTO story_search_vector_dirty (story_id) VALUES (old_story_id) ON CONFLICT DO NOTHING;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fts_flush_dirty_story_vectors()
+RETURNS integer
+LANGUAGE sql
+AS $$
+WITH dirty AS (
+    DELETE FROM story_search_vector_dirty
+    RETURNING story_id
+),
+updated AS (
+    UPDATE story s
+    SET search_vector = fts_build_story_search_vector(s.id)
+    FROM dirty
+    WHERE s.id = dirty.story_id
+    RETURNING s.id
+)
+SELECT count(*)::integer FROM updated;
+$$;
+
+-- Only the first mark of a story per transaction queues an event; the first event flushes all of them.
+CREATE OR REPLACE FUNCTION fts_flush_dirty_story_vectors_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM fts_flush_dirty_story_vectors();
+    RETURN NULL;
+END;
+$$;
+
+-- The news_item triggers are installed by the fts_maintenance_<mode>.sql file selected by FTS_MAINTENANCE.
 DROP TRIGGER IF EXISTS trg_newsitem_refresh_parent_story_vector ON news_item;
-CREATE TRIGGER trg_newsitem_refresh_parent_story_vector
-AFTER INSERT OR UPDATE OF story_id, title, content OR DELETE
-ON news_item
-FOR EACH ROW
-EXECUTE FUNCTION fts_refresh_parent_story_vector();
+DROP TRIGGER IF EXISTS trg_newsitem_mark_parent_story_dirty ON news_item;
+DROP TRIGGER IF EXISTS trg_story_search_vector_dirty_flush ON story_search_vector_dirty;
 
 CREATE INDEX IF NOT EXISTS ix_story_search_vector_gin
   ON story USING GIN (search_vector);
@@ -0,0 +1,20 @@
+# pyright: reportMissingTypeStubs=false
+"""
+index story.created for the story_counter day refresh
+"""
+
+from yoyo import step
+
+
+__depends__ = {"20260710_01_m3P7q-add-product-last-published-url"}
+
+steps = [
+    step(
+        """
+        CREATE INDEX IF NOT EXISTS ix_story_created ON story (created);
+        """,
+        """
+        DROP INDEX IF EXISTS ix_story_created;
+        """,
+    )
+]
@@ -0,0 +1,20 @@
+# pyright: reportMissingTypeStubs=false
+"""
+index token_blacklist.token for revocation checks that miss the in-process cache
+"""
+
+from yoyo import step
+
+
+__depends__ = {"20261018_01_c7Tn2-add-story-created-index"}
+
+steps = [
+    step(
+        """
+        CREATE INDEX IF NOT EXISTS ix_token_blacklist_token ON token_blacklist (token);
+        """,
+        """
+        DROP INDEX IF EXISTS ix_token_blacklist_token;
+        """,
+    )
+]
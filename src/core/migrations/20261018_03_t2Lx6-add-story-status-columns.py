@@ -0,0 +1,63 @@
+# pyright: reportMissingTypeStubs=false
+"""
+mirror the TLP, cybersecurity and sentiment story attributes into indexed story columns
+"""
+
+from yoyo import step
+
+
+__depends__ = {"20261018_02_r5Jw8-add-token-blacklist-token-index"}
+
+# Several TLP attributes on one story resolve to the most restrictive level, not the alphabetically largest.
+BACKFILL_STATUS_COLUMNS = """
+UPDATE story
+SET tlp = status.tlp,
+    cybersecurity = status.cybersecurity,
+    sentiment = status.sentiment
+FROM (
+    SELECT
+        snia.story_id,
+        CASE max(
+            CASE attr.value WHEN 'red' THEN 4 WHEN 'amber+strict' THEN 3 WHEN 'amber' THEN 2 WHEN 'green' THEN 1 WHEN 'clear' THEN 0 END
+        ) FILTER (WHERE attr.key = 'TLP')
+            WHEN 4 THEN 'red' WHEN 3 THEN 'amber+strict' WHEN 2 THEN 'amber' WHEN 1 THEN 'green' WHEN 0 THEN 'clear'
+        END AS tlp,
+        max(attr.value) FILTER (WHERE attr.key = 'cybersecurity') AS cybersecurity,
+        max(attr.value) FILTER (WHERE attr.key = 'sentiment') AS sentiment
+    FROM story_news_item_attribute snia
+    JOIN news_item_attribute attr ON attr.id = snia.news_item_attribute_id
+    WHERE attr.key IN ('TLP', 'cybersecurity', 'sentiment')
+    GROUP BY snia.story_id
+) status
+WHERE status.story_id = story.id;
+"""
+
+steps = [
+    step(
+        """
+        ALTER TABLE story
+        ADD COLUMN IF NOT EXISTS tlp character varying,
+        ADD COLUMN IF NOT EXISTS cybersecurity character varying,
+        ADD COLUMN IF NOT EXISTS sentiment character varying;
+        """,
+        """
+        ALTER TABLE story
+        DROP COLUMN IF EXISTS tlp,
+        DROP COLUMN IF EXISTS cybersecurity,
+        DROP COLUMN IF EXISTS sentiment;
+        """,
+    ),
+    step(BACKFILL_STATUS_COLUMNS),
+    step(
+        """
+        CREATE INDEX IF NOT EXISTS ix_story_tlp ON story (tlp);
+        CREATE INDEX IF NOT EXISTS ix_story_cybersecurity ON story (cybersecurity);
+        CREATE INDEX IF NOT EXISTS ix_story_sentiment ON story (sentiment);
+        """,
+        """
+        DROP INDEX IF EXISTS ix_story_tlp;
+        DROP INDEX IF EXISTS ix_story_cybersecurity;
+        DROP INDEX IF EXISTS ix_story_sentiment;
+        """,
+    ),
+]
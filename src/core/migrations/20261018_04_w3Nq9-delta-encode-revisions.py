@@ -0,0 +1,85 @@
+# pyright: reportMissingTypeStubs=false
+"""
+store story and report revisions as keyframes and deltas with deduplicated news items
+"""
+
+import json
+
+from yoyo import step
+
+from core.model import revision_codec
+
+
+__depends__ = {"20261018_03_t2Lx6-add-story-status-columns"}
+
+REVISION_TABLES = {"story_revision": "story_id", "report_revision": "report_item_id"}
+
+
+def _parent_histories(cursor, table: str, parent_column: str):
+    cursor.execute(f"SELECT DISTINCT {parent_column} FROM {table};")
+    for (parent_id,) in cursor.fetchall():
+        cursor.execute(
+            f"SELECT id, revision, data, keyframe_revision FROM {table} WHERE {parent_column} = %s ORDER BY revision;",
+            (parent_id,),
+        )
+        yield cursor.fetchall()
+
+
+def _compact_revisions(connection):
+    with connection.cursor() as cursor:
+        for table, parent_column in REVISION_TABLES.items():
+            for history in _parent_histories(cursor, table, parent_column):
+                if any(keyframe_revision is not None for *_, keyframe_revision in history):
+                    continue
+                keyframe = None
+                updates = []
+                news_items: dict[str, dict] = {}
+                for revision_id, revision, data, keyframe_revision in history:
+                    stored, keyframe_revision, referenced = revision_codec.encode(data, revision, keyframe)
+                    news_items.update(referenced)
+                    if keyframe_revision is None:
+                        keyframe = (revision, stored)
+                    updates.append((json.dumps(stored, default=str), keyframe_revision, revision_id))
+                cursor.executemany(
+                    "INSERT INTO revision_news_item (digest, data) VALUES (%s, CAST(%s AS json)) ON CONFLICT DO NOTHING;",
+                    [(digest, json.dumps(news_item, default=str)) for digest, news_item in news_items.items()],
+                )
+                cursor.executemany(
+                    f"UPDATE {table} SET data = CAST(%s AS json), keyframe_revision = %s WHERE id = %s;",
+                    updates,
+                )
+
+
+def _expand_revisions(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT digest, data FROM revision_news_item;")
+        news_items = dict(cursor.fetchall())
+        for table, parent_column in REVISION_TABLES.items():
+            for history in _parent_histories(cursor, table, parent_column):
+                stored_by_revision = {revision: data for _, revision, data, _ in history}
+                updates = []
+                for revision_id, _, data, keyframe_revision in history:
+                    keyframe_data = None if keyframe_revision is None else stored_by_revision[keyframe_revision]
+                    snapshot = revision_codec.expand_snapshot(revision_codec.decode(data, keyframe_data), news_items)
+                    updates.append((json.dumps(snapshot, default=str), revision_id))
+                cursor.executemany(f"UPDATE {table} SET data = CAST(%s AS json) WHERE id = %s;", updates)
+
+
+steps = [
+    step(
+        """
+        CREATE TABLE IF NOT EXISTS revision_news_item (
+            digest character varying(64) PRIMARY KEY,
+            data json NOT NULL
+        );
+        ALTER TABLE story_revision ADD COLUMN IF NOT EXISTS keyframe_revision integer;
+        ALTER TABLE report_revision ADD COLUMN IF NOT EXISTS keyframe_revision integer;
+        """,
+        """
+        ALTER TABLE story_revision DROP COLUMN IF EXISTS keyframe_revision;
+        ALTER TABLE report_revision DROP COLUMN IF EXISTS keyframe_revision;
+        DROP TABLE IF EXISTS revision_news_item;
+        """,
+    ),
+    step(_compact_revisions, _expand_revisions),
+]
@@ -0,0 +1,72 @@
+# pyright: reportMissingTypeStubs=false
+"""
+move rendered products from the base64 render_result column into the artifact store
+
+Renders that cannot be decoded are logged and kept in render_result, which is only dropped once it is empty.
+"""
+
+import binascii
+from base64 import b64decode, b64encode
+
+from yoyo import step
+
+from core.log import logger
+from core.managers.artifact_store import EmptyArtifactError, get_artifact_store
+
+
+__depends__ = {"20261018_04_w3Nq9-delta-encode-revisions"}
+
+
+def _store_renders(connection):
+    store = get_artifact_store()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id FROM product WHERE render_result IS NOT NULL;")
+        for (product_id,) in cursor.fetchall():
+            cursor.execute("SELECT render_result FROM product WHERE id = %s;", (product_id,))
+            (render_result,) = cursor.fetchone()
+            try:
+                render_digest = store.put_bytes(b64decode(render_result)).digest
+            except EmptyArtifactError:
+                render_digest = None
+            except (binascii.Error, ValueError):
+                logger.warning(f"Render of Product {product_id} is no valid base64 and stays in product.render_result")
+                continue
+            cursor.execute("UPDATE product SET render_digest = %s, render_result = NULL WHERE id = %s;", (render_digest, product_id))
+
+
+def _drop_render_result(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM product WHERE render_result IS NOT NULL;")
+        if (remaining := cursor.fetchone()[0]) > 0:
+            logger.warning(f"Keeping product.render_result, {remaining} renders in it could not be moved to the artifact store")
+            return
+        cursor.execute("ALTER TABLE product DROP COLUMN IF EXISTS render_result;")
+
+
+def _restore_renders(connection):
+    store = get_artifact_store()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id, render_digest FROM product WHERE render_digest IS NOT NULL;")
+        for product_id, render_digest in cursor.fetchall():
+            if not store.exists(render_digest):
+                continue
+            with store.open(render_digest) as artifact:
+                render_result = b64encode(artifact.read()).decode("ascii")
+            cursor.execute("UPDATE product SET render_result = %s WHERE id = %s;", (render_result, product_id))
+
+
+steps = [
+    step(
+        """
+        ALTER TABLE product ADD COLUMN IF NOT EXISTS render_digest character varying(64);
+        ALTER TABLE product ADD COLUMN IF NOT EXISTS render_result TEXT;
+        CREATE INDEX IF NOT EXISTS ix_product_render_digest ON product (render_digest);
+        """,
+        """
+        DROP INDEX IF EXISTS ix_product_render_digest;
+        ALTER TABLE product DROP COLUMN IF EXISTS render_digest;
+        """,
+    ),
+    step(_store_renders, _restore_renders),
+    step(_drop_render_result, "ALTER TABLE product ADD COLUMN IF NOT EXISTS render_result TEXT;"),
+]
@@ -0,0 +1,20 @@
+# pyright: reportMissingTypeStubs=false
+"""
+track when revision news items were last stored or reused, so unreferenced ones are only deleted after a grace period
+"""
+
+from yoyo import step
+
+
+__depends__ = {"20261018_05_h8Vd3-move-product-renders-to-artifact-store"}
+
+steps = [
+    step(
+        """
+        ALTER TABLE revision_news_item ADD COLUMN IF NOT EXISTS last_used timestamp without time zone NOT NULL DEFAULT now();
+        """,
+        """
+        ALTER TABLE revision_news_item DROP COLUMN IF EXISTS last_used;
+        """,
+    )
+]
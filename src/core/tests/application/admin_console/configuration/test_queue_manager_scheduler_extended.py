@@ -63,7 +63,7 @@ class _FakeRedis:
                 redis.zsets.setdefault(key, {}).pop(member, None)
                 return self
 
-            def xadd(self, key, values):
+            def xadd(self, key, values, **_kwargs):
                 redis.events.append((key, values))
                 return self
 
@@ -508,6 +508,14 @@ def workflow_publish_resources(app):
         db.session.commit()
 
 
+@pytest.fixture
+def artifact_store(app, monkeypatch, tmp_path):
+    from core.managers.artifact_store import ArtifactStore, FileSystemArtifactBackend
+
+    monkeypatch.setitem(app.config, "ARTIFACT_FOLDER", str(tmp_path / "artifacts"))
+    yield ArtifactStore(FileSystemArtifactBackend(tmp_path / "artifacts"))
+
+
 @pytest.fixture(scope="class")
 def pdf_product(app):
     with app.app_context():
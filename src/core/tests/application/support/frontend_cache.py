@@ -0,0 +1,19 @@
+from collections.abc import Iterable
+
+from models.cache_contract import is_cache_index_key, register_cache_key
+
+
+FRONTEND_CACHE_PREFIX = "taranis_frontend"
+
+
+def seed_frontend_cache(client, keys: Iterable[str], timeout: int = 300) -> None:
+    """Write cache entries the way the frontend does, including their index registrations."""
+    pipeline = client.pipeline()
+    for key in keys:
+        pipeline.set(key, "1", ex=timeout)
+        register_cache_key(pipeline, FRONTEND_CACHE_PREFIX, key, timeout)
+    pipeline.execute()
+
+
+def cached_frontend_keys(client) -> set[str]:
+    return {key for key in client.scan_iter(match="*") if not is_cache_index_key(FRONTEND_CACHE_PREFIX, key)}
@@ -1,5 +1,7 @@
 import uuid
 
+import pytest
+
 from tests.application.support.api_test_base import BaseTest
 
 
@@ -370,6 +372,35 @@ class TestAssessStories(BaseTest):
         response = client.get("/api/assess/stories?limit=1", headers=auth_header)
         assert len(response.get_json()["items"]) == 1
 
+    @pytest.mark.parametrize("sort", ["date_desc", "date_asc", "relevance", "updated_desc", "updated_asc"])
+    def test_get_stories_cursor_pagination_matches_offset_paging(self, client, stories, auth_header, sort):
+        response = client.get("/api/assess/stories", query_string={"sort": sort, "limit": 10, "no_count": "true"}, headers=auth_header)
+        expected_ids = [item["id"] for item in response.get_json()["items"]]
+
+        paged_ids = []
+        cursor = ""
+        while cursor is not None:
+            response = client.get(
+                "/api/assess/stories", query_string={"sort": sort, "limit": 1, "cursor": cursor, "no_count": "true"}, headers=auth_header
+            )
+            assert response.status_code == 200
+            paged_ids.extend(item["id"] for item in response.get_json()["items"])
+            cursor = response.get_json()["next_cursor"]
+
+        assert paged_ids == expected_ids
+        assert len(paged_ids) == len(stories)
+
+    def test_get_stories_rejects_cursor_from_other_sort(self, client, stories, auth_header):
+        response = client.get("/api/assess/stories", query_string={"sort": "date_desc", "limit": 1, "cursor": ""}, headers=auth_header)
+        cursor = response.get_json()["next_cursor"]
+        assert response.get_json()["counts"]["total_count"] == len(stories)
+
+        response = client.get("/api/assess/stories", query_string={"sort": "relevance", "limit": 1, "cursor": cursor}, headers=auth_header)
+        assert response.status_code == 400
+
+        response = client.get("/api/assess/stories", query_string={"limit": 1, "cursor": "not-a-cursor"}, headers=auth_header)
+        assert response.status_code == 400
+
     def test_get_stories_include_revision_count(self, client, stories, auth_header):
         response = self.assert_get_ok(client, "stories", auth_header)
         items = {item["id"]: item for item in response.get_json()["items"]}
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from core.model.report_item import ReportItem
+from core.model.story import Story
+from core.model.story_counter import StoryCounter
+from core.model.user import User
+from tests.application.support.builders import build_news_item_payload, create_osint_source, create_report, create_story
+
+
+COUNTER_FILTERS = [
+    {},
+    {"read": "true"},
+    {"important": "false"},
+    {"in_report": "true"},
+    {"range": "week"},
+    {"range": "last7", "read": "false"},
+]
+
+
+def assert_counter_counts_match_exact(filter_args: dict) -> None:
+    filter_query = Story.get_filter_query(filter_args)
+    counter_counts = Story._get_counter_counts(filter_args, estimated=False)
+    exact = Story.get_additional_counts(filter_query)
+
+    assert counter_counts == {
+        "total_count": exact.total_count,
+        "read_count": exact.read_count,
+        "important_count": exact.important_count,
+        "in_reports_count": exact.in_reports_count,
+    }, filter_args
+
+
+@pytest.fixture
+def counted_stories(session):
+    source = create_osint_source(rank=1)
+    return source, [
+        create_story(news_items=[build_news_item_payload(source.id)]),
+        create_story(news_items=[build_news_item_payload(source.id), build_news_item_payload("manual")]),
+        create_story(news_items=[build_news_item_payload("manual")]),
+    ]
+
+
+@pytest.mark.usefixtures("app")
+def test_story_counters_follow_story_mutations(counted_stories, story_relevance_report_payload_factory):
+    source, stories = counted_stories
+    admin = User.find_by_name("admin")
+    assert admin is not None
+    filters = [*COUNTER_FILTERS, {"source": [source.id]}, {"source": [source.id], "read": "true"}]
+
+    for filter_args in filters:
+        assert_counter_counts_match_exact(filter_args)
+
+    _, status = Story.update(stories[0].id, {"read": True, "important": True})
+    assert status == 200
+    report = create_report(story_relevance_report_payload_factory(title="Counter Report"))
+    _, status = ReportItem.add_stories(report.id, [stories[1].id], admin)
+    assert status == 200
+    for filter_args in filters:
+        assert_counter_counts_match_exact(filter_args)
+
+    _, status = Story.delete_by_id(stories[2].id, admin)
+    assert status == 200
+    _, status = ReportItem.delete(report.id)
+    assert status == 200
+    for filter_args in filters:
+        assert_counter_counts_match_exact(filter_args)
+
+
+@pytest.mark.usefixtures("app")
+def test_story_counters_follow_bulk_ingestion(session):
+    source = create_osint_source(rank=1)
+    _, status = Story.add_news_items([build_news_item_payload(source.id) for _ in range(3)])
+    assert status == 200
+
+    assert Story._get_counter_counts({"source": [source.id]}, estimated=False) == {
+        "total_count": 3,
+        "read_count": 0,
+        "important_count": 0,
+        "in_reports_count": 0,
+    }
+    assert_counter_counts_match_exact({})
+
+
+@pytest.mark.usefixtures("app")
+def test_story_counters_merge_commits_of_two_sessions_on_the_same_day(session, counted_stories):
+    _, stories = counted_stories
+    make_session = sessionmaker(bind=session.get_bind())
+    first_session, second_session = make_session(), make_session()
+    try:
+        first_session.get(Story, stories[0].id).read = True
+        first_session.flush()
+        second_session.get(Story, stories[1].id).important = True
+        second_session.flush()
+        first_session.commit()
+        second_session.commit()
+    finally:
+        first_session.close()
+        second_session.close()
+    session.expire_all()
+
+    assert {story.created.date() for story in stories} == {stories[0].created.date()}
+    for filter_args in COUNTER_FILTERS:
+        assert_counter_counts_match_exact(filter_args)
+    assert StoryCounter.get_counts(read=True)["total_count"] == 1
+    assert StoryCounter.get_counts(important=True)["total_count"] == 1
+
+
+@pytest.mark.usefixtures("app")
+def test_story_counters_rebuild_matches_incremental_counts(counted_stories):
+    incremental = StoryCounter.get_counts()
+    StoryCounter.rebuild_all()
+
+    assert StoryCounter.get_counts() == incremental
+
+
+@pytest.mark.usefixtures("app")
+def test_story_counts_fall_back_to_exact_counting_for_search(counted_stories):
+    assert Story._get_counter_counts({"search": "News Item"}, estimated=False) is None
+    assert Story._get_counter_counts({"source": ["a", "b"]}, estimated=False) is None
+
+
+@pytest.mark.usefixtures("app")
+def test_estimated_story_counts_sum_source_counters(counted_stories):
+    source, _ = counted_stories
+    filter_args = {"source": [source.id, "manual"], "counts": "estimated"}
+
+    counts = Story.get_counts(filter_args, Story.get_filter_query(filter_args), unrestricted=True)
+    exact = Story.get_additional_counts(Story.get_filter_query(filter_args))
+
+    assert counts["estimated"] is True
+    assert counts["total_count"] >= exact.total_count
+
+
+def test_story_list_reports_estimated_counts(client, auth_header, counted_stories):
+    source, _ = counted_stories
+    response = client.get("/api/assess/stories", headers=auth_header, query_string={"source": [source.id, "manual"], "counts": "estimated"})
+
+    assert response.status_code == 200
+    assert response.get_json()["counts"]["estimated"] is True
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import threading
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from core.managers.db_manager import db
+from core.model.story import STORY_SUMMARY_CONTENT_LENGTH, Story
+from core.model.user import User
+from tests.application.support.builders import build_news_item_payload, create_story
+
+
+@contextmanager
+def count_statements():
+    statements: list[str] = []
+    thread_id = threading.get_ident()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # Background threads such as the auth cache listener share the engine.
+        if threading.get_ident() == thread_id:
+            statements.append(statement)
+
+    engine = db.session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def clustered_stories(session):
+    stories = []
+    for index in range(4):
+        news_items = [
+            build_news_item_payload(title_prefix=f"Cluster {index}") | {"tags": [{"name": f"tag-{index}", "tag_type": "misc"}]}
+            for _ in range(index + 1)
+        ]
+        stories.append(create_story(news_items=news_items))
+    return stories
+
+
+@pytest.mark.usefixtures("app")
+@pytest.mark.parametrize(
+    "filter_args",
+    [{}, {"no_count": True}, {"worker": True}, {"projection": "summary"}],
+    ids=["counts", "no-count", "worker", "summary"],
+)
+def test_story_list_query_count_is_independent_of_page_size(clustered_stories, filter_args):
+    story_ids = [story.id for story in clustered_stories]
+    admin = User.find_by_name("admin")
+    assert admin is not None
+
+    def statements_for(limit: int) -> tuple[int, list[dict]]:
+        db.session.expire_all()
+        with count_statements() as statements:
+            stories, _ = Story.get_by_filter({**filter_args, "story_ids": story_ids, "limit": limit}, admin)
+        return len(statements), stories
+
+    statements_for(1)  # compiles and caches the access context of the admin roles
+    single_count, single_page = statements_for(1)
+    full_count, full_page = statements_for(len(story_ids))
+
+    assert len(single_page) == 1
+    assert len(full_page) == len(story_ids)
+    assert full_count == single_count
+    assert {tag["name"] for story in full_page for tag in (story["tags"].values() if filter_args.get("worker") else story["tags"])} == {
+        f"tag-{index}" for index in range(len(story_ids))
+    }
+
+
+@pytest.mark.usefixtures("app")
+def test_story_list_summary_projection_truncates_news_item_content(session):
+    long_content = "x" * (STORY_SUMMARY_CONTENT_LENGTH * 4)
+    news_item = build_news_item_payload(content=long_content) | {"tags": [{"name": "summary-tag", "tag_type": "misc"}]}
+    story = create_story(news_items=[news_item])
+    admin = User.find_by_name("admin")
+    assert admin is not None
+
+    db.session.expire_all()
+    full_page, _ = Story.get_by_filter({"story_ids": [story.id]}, admin)
+    db.session.expire_all()
+    summary_page, counts = Story.get_by_filter({"story_ids": [story.id], "projection": "summary"}, admin)
+
+    assert counts is not None and counts["total_count"] == 1
+    [full_story] = full_page
+    [summary_story] = summary_page
+    [summary_item] = summary_story["news_items"]
+    assert summary_item["content"] == long_content[:STORY_SUMMARY_CONTENT_LENGTH]
+    assert summary_item["link"] == news_item["link"]
+    assert summary_item["source"] == news_item["source"]
+    assert [tag["name"] for tag in summary_story["tags"]] == ["summary-tag"]
+    assert summary_story["in_reports_count"] == full_story["in_reports_count"]
+    assert summary_story["user_vote"] == full_story["user_vote"]
+    assert {"search_vector", "description", "comments"}.isdisjoint(summary_story)
+    assert len(json.dumps(summary_page)) * 2 < len(json.dumps(full_page))
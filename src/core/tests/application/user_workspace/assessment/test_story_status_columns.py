@@ -0,0 +1,75 @@
+import uuid
+from pathlib import Path
+
+from yoyo import read_migrations
+
+from core.managers.db_manager import db
+from core.model.news_item_attribute import NewsItemAttribute
+from core.model.story import Story
+from core.model.user import User
+
+
+def _ingest_story(attributes: list[dict]) -> Story:
+    result, status = Story.add_news_items(
+        [
+            {
+                "title": "Story status column item",
+                "content": "content",
+                "link": f"https://example.invalid/status/{uuid.uuid4()}",
+                "source": "https://example.invalid/feed",
+                "osint_source_id": "manual",
+                "attributes": attributes,
+            }
+        ]
+    )
+    assert status == 200, result
+    story = Story.get(result["story_ids"][0])
+    assert story is not None
+    return story
+
+
+def test_status_columns_follow_story_attributes(app):
+    with app.app_context():
+        story = _ingest_story([{"key": "cybersecurity_bot", "value": "yes"}])
+        assert (story.tlp, story.cybersecurity) == ("clear", "yes")
+        assert "tlp" not in story.to_dict()
+
+        story.patch_attributes([NewsItemAttribute(key="TLP", value="amber"), NewsItemAttribute(key="sentiment", value="positive")])
+        db.session.commit()
+        assert (story.tlp, story.sentiment) == ("amber", "positive")
+
+        story.remove_attributes(["sentiment", "TLP"])
+        db.session.commit()
+        assert (story.tlp, story.sentiment) == ("amber", None)
+
+        assert Story.delete_by_id(story.id, User.find_by_name("admin"))[1] == 200
+
+
+def test_status_filters_use_columns(app):
+    with app.app_context():
+        story = _ingest_story([{"key": "cybersecurity_bot", "value": "yes"}])
+        for filter_args in ({"cybersecurity": "yes"}, {"include_attr": "TLP"}, {"exclude_attr": "sentiment"}):
+            statement = Story.get_filter_query(filter_args)
+            assert "story_news_item_attribute" not in str(statement)
+            assert story.id in db.session.execute(statement.with_only_columns(Story.id)).scalars().all()
+
+        assert Story.delete_by_id(story.id, User.find_by_name("admin"))[1] == 200
+
+
+def test_status_column_backfill_keeps_most_restrictive_tlp(app):
+    migrations = read_migrations(str(Path(app.root_path).parent / "migrations"))
+    migration = next(migration for migration in migrations if migration.id == "20261018_03_t2Lx6-add-story-status-columns")
+    migration.load()
+
+    with app.app_context():
+        story = _ingest_story([])
+        story.attributes.extend(NewsItemAttribute(key="TLP", value=value) for value in ("clear", "amber", "green"))
+        db.session.commit()
+        db.session.execute(db.update(Story).where(Story.id == story.id).values(tlp=None))
+
+        db.session.execute(db.text(migration.module.BACKFILL_STATUS_COLUMNS))
+        db.session.commit()
+        db.session.refresh(story)
+        assert story.tlp == "amber"
+
+        assert Story.delete_by_id(story.id, User.find_by_name("admin"))[1] == 200
@@ -1,9 +1,10 @@
-import base64
 from datetime import UTC, datetime
 from urllib.parse import quote
 
 import pytest
 
+from core.config import Config
+from core.model.product import Product
 from tests.application.support.api_test_base import BaseTest
 
 
@@ -27,9 +28,10 @@ class TestPublishApi(BaseTest):
         assert response.get_json()["total_count"] == 1
         assert response.get_json()["items"][0]["title"] == cleanup_product["title"]
 
-    def test_rendered_product_download_returns_attachment(self, app, client, auth_header, pdf_product):
+    def test_rendered_product_download_returns_attachment(self, app, client, auth_header, artifact_store, pdf_product):
         file_bytes = b"This is a pdf"
-        pdf_product.update_render(base64.b64encode(file_bytes).decode())
+        render_digest = artifact_store.put_bytes(file_bytes).digest
+        pdf_product.update_render(render_digest)
         expected_filename = f"Test Product_{datetime.now(UTC).strftime('%d-%m-%Y_%H-%M')}.pdf"
 
         response = client.get(self.concat_url(f"products/{pdf_product.id}/render"), headers=auth_header)
@@ -37,9 +39,34 @@ class TestPublishApi(BaseTest):
         assert response.data == file_bytes
         assert response.mimetype == "application/pdf"
         assert response.headers.get("Content-Disposition") == f'attachment; filename="{expected_filename}"'
+        assert response.headers["ETag"] == f'"{render_digest}"'
+
+        ranged = client.get(self.concat_url(f"products/{pdf_product.id}/render"), headers={**auth_header, "Range": "bytes=0-3"})
+        assert ranged.status_code == 206
+        assert ranged.data == file_bytes[:4]
+
+        inline = client.get(self.concat_url(f"products/{pdf_product.id}/render?inline=true"), headers=auth_header)
+        assert inline.headers["Content-Disposition"].startswith("inline")
+        assert inline.headers["Content-Security-Policy"] == "sandbox"
+
+    def test_rerender_prunes_unreferenced_artifact_after_grace_period(self, app, artifact_store, monkeypatch, pdf_product):
+        first = artifact_store.put_bytes(b"first render").digest
+        second = artifact_store.put_bytes(b"second render").digest
+
+        assert pdf_product.update_render(first)
+        assert pdf_product.update_render(second)
+
+        assert artifact_store.exists(first)
+        assert Product.prune_renders() == 0
+        monkeypatch.setattr(Config, "ARTIFACT_GRACE_MINUTES", 0)
+        assert Product.prune_renders() == 1
+        assert not artifact_store.exists(first)
+        assert artifact_store.exists(second)
+        assert not pdf_product.update_render("0" * 64)
+        assert pdf_product.render_digest == second
 
     def test_taranis_publish_stores_and_serves_report_without_authentication(
-        self, app, client, auth_header, api_header, monkeypatch, pdf_product, tmp_path
+        self, app, client, auth_header, api_header, artifact_store, monkeypatch, pdf_product, tmp_path
     ):
         invalidations = []
 
@@ -48,7 +75,7 @@ class TestPublishApi(BaseTest):
 
         file_bytes = b"Public report"
         pdf_product.last_published_url = "https://previous.example/report.pdf"
-        pdf_product.update_render(base64.b64encode(file_bytes).decode())
+        pdf_product.update_render(artifact_store.put_bytes(file_bytes).digest)
         monkeypatch.chdir(tmp_path)
         monkeypatch.setitem(app.config, "DATA_FOLDER", "taranis_data")
         monkeypatch.setattr("core.api.worker.invalidate_frontend_cache_on_success", capture_invalidation)
@@ -85,13 +112,13 @@ class TestPublishApi(BaseTest):
         assert public_response.headers["Content-Security-Policy"] == "sandbox allow-scripts allow-downloads"
         assert public_response.headers["X-Content-Type-Options"] == "nosniff"
 
-    def test_failed_taranis_publish_keeps_previous_url(self, app, monkeypatch, pdf_product, tmp_path):
+    def test_failed_taranis_publish_keeps_previous_url(self, app, artifact_store, monkeypatch, pdf_product, tmp_path):
         from core.managers.db_manager import db
         from core.service.product import ProductService
 
         previous_url = "https://previous.example/report.pdf"
         pdf_product.last_published_url = previous_url
-        pdf_product.update_render(base64.b64encode(b"Public report").decode())
+        pdf_product.update_render(artifact_store.put_bytes(b"Public report").digest)
         monkeypatch.setitem(app.config, "DATA_FOLDER", str(tmp_path))
 
         def fail_replace(self, target):
@@ -148,6 +148,69 @@ class TestBotsApi(BaseTest):
             )
         ]
 
+    def test_bulk_attribute_update(self, client, stories, auth_header, api_header):
+        story_id = stories[1]
+        response = client.get(f"/api/assess/story/{story_id}", headers=auth_header)
+        self.assert_json_ok(response)
+        original_story = response.get_json()
+        news_item_ids = [news_item["id"] for news_item in original_story["news_items"]]
+
+        response = client.patch(
+            f"{self.base_uri}/attributes",
+            json={
+                "news_items": {news_item_id: [{"key": "cybersecurity_bot", "value": "yes"}] for news_item_id in news_item_ids}
+                | {"missing-news-item": [{"key": "cybersecurity_bot", "value": "no"}]},
+                "stories": {story_id: {"attributes": [{"key": "CYBERSEC_CLASSIFIER_BOT", "value": "1"}], "summary": "Bulk summary"}},
+            },
+            headers=api_header,
+        )
+
+        assert response.status_code == 207
+        assert response.get_json()["errors"] == {"missing-news-item": "News item not found"}
+        assert response.get_json()["stories"] == 1
+
+        response = client.get(f"/api/assess/story/{story_id}", headers=auth_header)
+        self.assert_json_ok(response)
+        updated_story = response.get_json()
+        attr_by_key = {attr["key"]: attr["value"] for attr in updated_story["attributes"]}
+        assert attr_by_key["CYBERSEC_CLASSIFIER_BOT"] == "1"
+        assert attr_by_key["cybersecurity"] == "yes"
+        assert updated_story["summary"] == "Bulk summary"
+        assert updated_story["last_change"] == "bot"
+        assert updated_story["revision_count"] == original_story["revision_count"] + 1
+
+    def test_bulk_attribute_update_records_revisions_in_one_batch(self, client, stories, auth_header, api_header, monkeypatch):
+        from core.model.revision import StoryRevision
+
+        story_ids = stories[:2]
+        revision_counts = {
+            story_id: client.get(f"/api/assess/story/{story_id}", headers=auth_header).get_json()["revision_count"] for story_id in story_ids
+        }
+
+        def fail_single_revision(*args, **kwargs):
+            raise AssertionError("bulk updates must not record revisions one story at a time")
+
+        monkeypatch.setattr(StoryRevision, "create_from_story", fail_single_revision)
+        response = client.patch(
+            f"{self.base_uri}/attributes",
+            json={"stories": {story_id: {"summary": f"Batch summary {story_id}"} for story_id in story_ids}},
+            headers=api_header,
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["stories"] == 2
+        for story_id in story_ids:
+            story = client.get(f"/api/assess/story/{story_id}", headers=auth_header).get_json()
+            assert story["summary"] == f"Batch summary {story_id}"
+            assert story["revision_count"] == revision_counts[story_id] + 1
+
+    def test_bulk_attribute_update_rejects_invalid_payload(self, client, api_header):
+        response = client.patch(f"{self.base_uri}/attributes", json=[{"key": "tech", "value": "in_progress"}], headers=api_header)
+        assert response.status_code == 400
+
+        response = client.patch(f"{self.base_uri}/attributes", json={"news_items": {}, "stories": {}}, headers=api_header)
+        assert response.status_code == 400
+
 
 class TestTaggingBotsResults(BaseTest):
     base_uri = "/api/tasks"
@@ -64,6 +64,7 @@ def test_task_history_cleanup_deletes_old_rows_regardless_of_type(app, client, a
         assert payload["deleted"] >= 1
         assert isinstance(payload["cutoff"], str)
         assert payload["retention_days"] == 7
+        assert isinstance(payload["revision_news_items_deleted"], int)
 
         with app.app_context():
             assert TaskModel.get(old_job_id) is None
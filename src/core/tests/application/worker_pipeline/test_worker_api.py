@@ -1,13 +1,17 @@
 # pyright: reportAttributeAccessIssue=false
+import hashlib
 import importlib.util
+import os
 import sys
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from tests.application.support.frontend_cache import cached_frontend_keys, seed_frontend_cache
+
 
 def _tag_names(tags: list[dict] | dict[str, dict]) -> set[str]:
     if isinstance(tags, dict):
@@ -133,6 +137,45 @@ class TestWorkerApi:
                 if Task.get(task_id):
                     Task.delete(task_id)
 
+    def test_worker_stories_cursor_pagination(self, client, stories, api_header):
+        story_ids = []
+        cursor = ""
+        while cursor is not None:
+            response = client.get(f"{self.base_uri}/stories", headers=api_header, query_string={"limit": 2, "cursor": cursor})
+            assert response.status_code == 200
+            page = response.get_json()
+            story_ids.extend(story["id"] for story in page["items"])
+            cursor = page["next_cursor"]
+
+        assert sorted(story_ids) == sorted(stories)
+
+        response = client.get(f"{self.base_uri}/stories", headers=api_header, query_string={"cursor": "invalid"})
+        assert response.status_code == 400
+
+    def test_worker_stories_field_projection(self, client, stories, api_header):
+        fields = ["title", "tags", "news_items.title", "news_items.content"]
+        response = client.get(f"{self.base_uri}/stories", headers=api_header, query_string={"cursor": "", "fields": fields})
+        assert response.status_code == 200
+        items = response.get_json()["items"]
+
+        assert sorted(story["id"] for story in items) == sorted(stories)
+        assert all(set(story) == {"id", "title", "tags", "news_items"} for story in items)
+        assert all(set(news_item) == {"id", "title", "content"} for story in items for news_item in story["news_items"])
+
+        response = client.get(f"{self.base_uri}/stories", headers=api_header, query_string={"fields": ["news_items.password"]})
+        assert response.status_code == 400
+
+    def test_worker_known_news_items(self, client, stories, api_header):
+        response = client.get(f"{self.base_uri}/stories", headers=api_header, query_string={"cursor": "", "fields": ["news_items.hash"]})
+        known_hashes = sorted({news_item["hash"] for story in response.get_json()["items"] for news_item in story["news_items"]})
+
+        response = client.post(f"{self.base_uri}/news-items/known", headers=api_header, json={"hashes": [*known_hashes, "0" * 64]})
+        assert response.status_code == 200
+        assert response.get_json() == {"hashes": known_hashes}
+
+        response = client.post(f"{self.base_uri}/news-items/known", headers=api_header, json={"hashes": "0" * 64})
+        assert response.status_code == 400
+
     def test_worker_story_update(self, client, stories, cleanup_story_update_data, api_header):
         """
         This test queries the story update authenticated.
@@ -519,24 +562,32 @@ class TestWorkerTaskResults:
         assert response.status_code == 400
         assert "task" in response.get_json()["error"]
 
-    def test_worker_task_results_updates_product_render(self, client, api_header, app, cleanup_product):
+    def test_worker_task_results_updates_product_render(self, client, api_header, app, artifact_store, cleanup_product):
         from core.model.product import Product
         from core.model.task import Task
 
         product_id = str(uuid.uuid7())
         task_id = f"presenter-job-{uuid.uuid4().hex}"
-        render_result = "YmFzZTY0"
 
         with app.app_context():
             Product.add({**cleanup_product, "id": product_id})
 
+        upload = client.post(
+            "/api/worker/artifacts",
+            data=b"rendered product",
+            headers={"Authorization": api_header["Authorization"], "Content-Type": "application/octet-stream"},
+        )
+        assert upload.status_code == 201
+        render_digest = upload.get_json()["digest"]
+        assert upload.get_json()["size"] == len(b"rendered product")
+
         payload = {
             "id": task_id,
             "task": "presenter_task",
             "result": {
                 "message": "ok",
                 "retryable": False,
-                "data": {"product_id": product_id, "render_result": render_result},
+                "data": {"product_id": product_id, "render_digest": render_digest},
             },
             "status": "SUCCESS",
         }
@@ -548,7 +599,13 @@ class TestWorkerTaskResults:
             with app.app_context():
                 product = Product.get(product_id)
                 assert product is not None
-                assert product.render_result == render_result
+                assert product.render_digest == render_digest
+                assert product.to_worker_dict()["render_digest"] == render_digest
+
+            render = client.get(f"/api/worker/products/{product_id}/render", headers=api_header)
+            assert render.status_code == 200
+            assert render.data == b"rendered product"
+            assert render.headers["ETag"] == f'"{render_digest}"'
         finally:
             with app.app_context():
                 if Task.get(task_id):
@@ -557,8 +614,11 @@ class TestWorkerTaskResults:
                     Product.delete(product_id)
 
     def test_worker_task_results_apply_bot_tags(self, client, stories, auth_header, api_header, app, wordlist_bot_result, monkeypatch):
+        from core.model.story import Story
         from core.model.task import Task
 
+        with app.app_context():
+            revisions_before = {story_id: Story.get(story_id).revision for story_id in stories}
         refreshed = []
         monkeypatch.setattr("core.service.task.refresh_misp_auto_update_jobs", refreshed.append)
         task_id = f"cron-bot-wordlist-{uuid.uuid4().hex}"
@@ -590,6 +650,11 @@ class TestWorkerTaskResults:
                 assert structured_tags == expected_tags
                 attr_by_key = {attribute.get("key"): attribute.get("value") for attribute in story_data.get("attributes", [])}
                 assert attr_by_key["WORDLIST_BOT"].startswith(f"worker_id={wordlist_bot_result['worker_id']}")
+                assert story_data["revision"] == revisions_before[story_id] + 1
+
+            with app.app_context():
+                timings = Task.get(task_id).to_dict()["result"]["data"]["apply_timings_ms"]
+            assert {"load", "tags", "tag_clusters", "stories", "revisions", "commit"} <= set(timings)
         finally:
             with app.app_context():
                 if Task.get(task_id):
@@ -752,7 +817,7 @@ class TestWorkerTaskResults:
             "taranis_frontend:user:alice:model:worker_stats:detail:singleton",
             "taranis_frontend:user:alice:model:story:list:default",
         }
-        redis_client.mset(dict.fromkeys(cached_keys, "1"))
+        seed_frontend_cache(redis_client, cached_keys)
 
         service = cache_invalidation_module.FrontendCacheInvalidationService()
         service._client = redis_client
@@ -790,13 +855,13 @@ class TestWorkerTaskResults:
                 "taranis_frontend:user:alice:model:worker_stats:detail:singleton",
                 "taranis_frontend:user:alice:model:story:list:default",
             }
-            assert set(redis_client.scan_iter(match="*")) == expected_keys
+            assert cached_frontend_keys(redis_client) == expected_keys
         finally:
             with app.app_context():
                 if Task.get(task_id):
                     Task.delete(task_id)
 
-    def test_collector_success_result_restores_full_cache_invalidation(self, client, api_header, app, monkeypatch):
+    def test_collector_success_result_invalidates_only_affected_entities(self, client, api_header, app, monkeypatch):
         import fakeredis
 
         from core.model.task import Task
@@ -805,20 +870,30 @@ class TestWorkerTaskResults:
         source_id = f"source-{uuid.uuid4().hex}"
         task_id = f"collect_rss_collector_{source_id}"
         redis_client = fakeredis.FakeRedis(decode_responses=True)
-        cached_keys = {
-            "taranis_frontend:user:alice:model:osint_source:list:default",
-            f"taranis_frontend:user:alice:model:osint_source:detail:{source_id}",
+        untouched_keys = {
             "taranis_frontend:user:alice:model:osint_source:detail:other-source",
             f"taranis_frontend:user:alice:model:task:detail:{task_id}",
-            "taranis_frontend:user:alice:model:job:list:default",
-            "taranis_frontend:user:alice:model:task_history_response:detail:singleton",
             "taranis_frontend:user:alice:model:active_job:list:default",
-            "taranis_frontend:user:alice:model:failed_job:list:default",
-            "taranis_frontend:user:alice:model:queue_status:list:default",
             "taranis_frontend:user:alice:model:worker_stats:detail:singleton",
-            "taranis_frontend:user:alice:model:story:list:default",
+            "taranis_frontend:user:alice:model:story:detail:story-2",
+            "taranis_frontend:user:alice:model:product:list:default",
         }
-        redis_client.mset(dict.fromkeys(cached_keys, "1"))
+        seed_frontend_cache(
+            redis_client,
+            untouched_keys
+            | {
+                "taranis_frontend:user:alice:model:osint_source:list:default",
+                f"taranis_frontend:user:alice:model:osint_source:detail:{source_id}",
+                "taranis_frontend:user:alice:model:admin_menu_badges:detail:singleton",
+                "taranis_frontend:user:alice:model:job:list:default",
+                "taranis_frontend:user:alice:model:task_history_response:detail:singleton",
+                "taranis_frontend:user:alice:model:story:list:default",
+                "taranis_frontend:user:alice:model:story:detail:story-1",
+                "taranis_frontend:user:alice:model:news_item:detail:item-1",
+                "taranis_frontend:user:alice:model:filter_lists:detail:singleton",
+                "taranis_frontend:user:alice:model:dashboard:detail:singleton",
+            },
+        )
 
         service = cache_invalidation_module.FrontendCacheInvalidationService()
         service._client = redis_client
@@ -835,6 +910,7 @@ class TestWorkerTaskResults:
                 "message": "Collected 3 new items",
                 "retryable": False,
                 "data": {"source_id": source_id},
+                "affected": {"story_ids": ["story-1"], "osint_source_ids": [source_id]},
             },
             "status": "SUCCESS",
         }
@@ -844,7 +920,8 @@ class TestWorkerTaskResults:
 
             assert response.status_code == 200
             assert response.get_json()["status"] == "SUCCESS"
-            assert set(redis_client.scan_iter(match="*")) == set()
+            assert "affected" not in response.get_json()["result"]
+            assert cached_frontend_keys(redis_client) == untouched_keys
         finally:
             with app.app_context():
                 if Task.get(task_id):
@@ -976,7 +1053,7 @@ class TestWorkerTaskResults:
             f"taranis_frontend:user:alice:model:osint_source:detail:{source_id}",
             "taranis_frontend:user:alice:model:osint_source:detail:other-source",
         }
-        redis_client.mset(dict.fromkeys(cached_keys, "1"))
+        seed_frontend_cache(redis_client, cached_keys)
 
         service = cache_invalidation_module.FrontendCacheInvalidationService()
         service._client = redis_client
@@ -1016,7 +1093,7 @@ class TestWorkerTaskResults:
             )
 
             assert response.status_code == 200
-            assert "taranis_frontend:user:alice:model:admin_menu_badges:detail:singleton" not in set(redis_client.scan_iter(match="*"))
+            assert "taranis_frontend:user:alice:model:admin_menu_badges:detail:singleton" not in cached_frontend_keys(redis_client)
         finally:
             with app.app_context():
                 if Task.get(task_id):
@@ -1053,7 +1130,7 @@ class TestWorkerTaskResults:
             f"taranis_frontend:user:alice:model:osint_source:detail:{source_id}",
             "taranis_frontend:user:alice:model:osint_source:detail:other-source",
         }
-        redis_client.mset(dict.fromkeys(cached_keys, "1"))
+        seed_frontend_cache(redis_client, cached_keys)
 
         service = cache_invalidation_module.FrontendCacheInvalidationService()
         service._client = redis_client
@@ -1079,7 +1156,7 @@ class TestWorkerTaskResults:
             assert response.status_code == 200
             with app.app_context():
                 assert Task.get(task_id) is None
-            assert set(redis_client.scan_iter(match="*")) == {
+            assert cached_frontend_keys(redis_client) == {
                 "taranis_frontend:user:alice:model:bot:list:default",
                 "taranis_frontend:user:alice:model:osint_source:detail:other-source",
             }
@@ -1089,6 +1166,67 @@ class TestWorkerTaskResults:
                     Task.delete(task_id)
 
 
+class TestWorkerArtifacts:
+    base_uri = "/api/worker/artifacts"
+
+    @staticmethod
+    def upload(client, api_header, data: bytes):
+        return client.post(
+            "/api/worker/artifacts",
+            data=data,
+            headers={"Authorization": api_header["Authorization"], "Content-Type": "application/octet-stream"},
+        )
+
+    def test_upload_is_content_addressed(self, client, api_header, artifact_store):
+        data = b"%PDF-1.7 rendered report"
+
+        first = self.upload(client, api_header, data)
+        second = self.upload(client, api_header, data)
+
+        assert first.status_code == 201
+        assert first.get_json() == {"digest": hashlib.sha256(data).hexdigest(), "size": len(data)}
+        assert second.get_json() == first.get_json()
+        assert artifact_store.exists(first.get_json()["digest"])
+
+    def test_upload_requires_api_key_and_content(self, client, api_header, artifact_store):
+        assert client.post(self.base_uri, data=b"data").status_code == 401
+        assert self.upload(client, api_header, b"").status_code == 400
+        assert not [path for path in artifact_store.backend.root.rglob("*") if path.is_file()]
+
+    def test_download_supports_etag_and_ranges(self, client, api_header, artifact_store):
+        data = bytes(range(256)) * 4
+        digest = artifact_store.put_bytes(data).digest
+
+        response = client.get(f"{self.base_uri}/{digest}", headers=api_header)
+        assert response.status_code == 200
+        assert response.data == data
+        assert response.headers["ETag"] == f'"{digest}"'
+        assert response.headers["Accept-Ranges"] == "bytes"
+
+        not_modified = client.get(f"{self.base_uri}/{digest}", headers={**api_header, "If-None-Match": f'"{digest}"'})
+        assert not_modified.status_code == 304
+
+        partial = client.get(f"{self.base_uri}/{digest}", headers={**api_header, "Range": "bytes=100-199"})
+        assert partial.status_code == 206
+        assert partial.data == data[100:200]
+        assert partial.headers["Content-Range"] == f"bytes 100-199/{len(data)}"
+
+        assert client.head(f"{self.base_uri}/{digest}", headers=api_header).status_code == 200
+
+    def test_head_keeps_artifact_from_being_pruned(self, client, api_header, artifact_store):
+        digest = artifact_store.put_bytes(b"rendered earlier").digest
+        os.utime(artifact_store.backend.path(digest), (0, 0))
+
+        assert client.head(f"{self.base_uri}/{digest}", headers=api_header).status_code == 200
+
+        assert artifact_store.prune(set(), datetime.now(UTC) - timedelta(minutes=1)) == 0
+        assert artifact_store.exists(digest)
+
+    @pytest.mark.parametrize("digest", ["0" * 64, "..", "not-a-digest"])
+    def test_download_unknown_artifact(self, client, api_header, artifact_store, digest):
+        assert client.get(f"{self.base_uri}/{digest}", headers=api_header).status_code == 404
+
+
 class TestConnector:
     base_uri = "/api/worker"
 
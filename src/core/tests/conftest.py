@@ -1,6 +1,7 @@
 import contextlib
 import os
 import sys
+import time
 from unittest.mock import patch
 from urllib.parse import urlparse
 
@@ -18,6 +19,8 @@ if not current_path.endswith("src/core"):
     sys.exit("Tests must be run from within src/core")
 
 load_dotenv(dotenv_path=env_file, override=True)
+# Tests change users and roles in flushed but uncommitted sessions, which the identity cache only sees after commit.
+os.environ["JWT_IDENTITY_CACHE_SECONDS"] = "0"
 
 
 @pytest.fixture(scope="session")
@@ -43,6 +46,10 @@ def app():
                 "SERVER_NAME": "localhost",
             }
         )
+        from core.managers.auth_cache_manager import auth_cache_manager
+
+        if not auth_cache_manager.active:
+            auth_cache_manager._synced.wait(timeout=5)
 
         yield app
 
@@ -75,7 +82,11 @@ def db(app):
 
         yield db
 
-        # Clean up all data and drop tables at the end of the session
+        from core.managers.auth_cache_manager import RESYNC_CHECK_SECONDS, auth_cache_manager
+
+        # Stop the auth cache listener, then clean up all data and drop tables at the end of the session
+        auth_cache_manager._redis = None
+        time.sleep(RESYNC_CHECK_SECONDS)
         with contextlib.suppress(Exception):
             db.session.remove()
             db.drop_all()
@@ -188,10 +199,12 @@ def access_token_no_permissions(app):
 
 @pytest.fixture
 def clear_blacklist(app):
+    from core.managers.auth_cache_manager import auth_cache_manager
     from core.model.token_blacklist import TokenBlacklist
 
     with app.app_context():
         TokenBlacklist.delete_all()
+        auth_cache_manager.reload()
 
 
 @pytest.fixture
@@ -0,0 +1,50 @@
+"""Standalone load tests for core hot paths.
+
+Run from ``src/core`` with ``python -m tests.load_testing.<module>``. Each module
+creates a throwaway SQLite database and an in-process Redis fake, so nothing here
+touches a running instance. Point ``BENCHMARK_DATABASE_URI`` at a PostgreSQL
+database to measure with the production dialect.
+"""
+
+import contextlib
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from unittest.mock import patch
+
+import fakeredis
+from dotenv import load_dotenv
+from flask import Flask
+
+
+BENCHMARK_DATABASE_FILE = "/tmp/taranis_ai_benchmark.db"
+
+
+@contextlib.contextmanager
+def benchmark_app() -> Iterator[Flask]:
+    load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env"), override=True)
+    os.environ["SQLALCHEMY_DATABASE_URI"] = os.getenv("BENCHMARK_DATABASE_URI", f"sqlite:///{BENCHMARK_DATABASE_FILE}")
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(BENCHMARK_DATABASE_FILE)
+
+    redis_server = fakeredis.FakeServer()
+
+    def isolated_redis_from_url(url, *args, **kwargs):
+        return fakeredis.FakeRedis.from_url(url, *args, server=redis_server, **kwargs)
+
+    with patch("redis.Redis.from_url", side_effect=isolated_redis_from_url):
+        from core import create_app
+
+        app = create_app()
+        logging.getLogger("Core").setLevel(logging.ERROR)
+        with app.app_context():
+            yield app
+
+
+def timed(label: str, func: Callable[[], object], units: int, unit_name: str = "items") -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s  {units / elapsed:10.1f} {unit_name}/s")
+    return elapsed
@@ -0,0 +1,70 @@
+"""Compare authenticated requests with and without the revocation and identity caches.
+
+python -m tests.load_testing.auth_requests [REQUEST_COUNT]
+
+Requests hit a trivial endpoint guarded by a permission check, so the numbers are dominated
+by token verification, the blocklist check and the user lookup.
+"""
+
+import sys
+import time
+
+from sqlalchemy import event
+
+from tests.load_testing import benchmark_app, timed
+
+
+def main(count: int) -> None:
+    with benchmark_app() as app:
+        from flask_jwt_extended import create_access_token
+
+        from core.config import Config
+        from core.managers.auth_cache_manager import auth_cache_manager
+        from core.managers.auth_manager import auth_required
+        from core.managers.db_manager import db
+        from core.model.user import User
+
+        @app.get("/benchmark/auth")
+        @auth_required("ASSESS_ACCESS")
+        def benchmark_endpoint():
+            return {}, 200
+
+        headers = {"Authorization": f"Bearer {create_access_token(identity=User.find_by_name('admin'))}"}
+        client = app.test_client()
+        statements = 0
+
+        def count_statement(*args):
+            nonlocal statements
+            statements += 1
+
+        event.listen(db.engine, "before_cursor_execute", count_statement)
+
+        def run_requests():
+            for _ in range(count):
+                assert client.get("/benchmark/auth", headers=headers).status_code == 200
+                db.session.remove()
+
+        def measure(label: str) -> float:
+            nonlocal statements
+            run_requests()
+            statements = 0
+            elapsed = timed(label, run_requests, count, "req")
+            print(f"{'':<40} {statements / count:8.2f} SQL statements per request")
+            return elapsed
+
+        redis_client = auth_cache_manager._redis
+        auth_cache_manager._redis = None
+        uncached_seconds = measure("blocklist query and user lookup")
+
+        auth_cache_manager._redis = redis_client
+        while not auth_cache_manager.active:
+            time.sleep(0.01)
+        Config.JWT_IDENTITY_CACHE_SECONDS = 0
+        measure("revocation cache only")
+        Config.JWT_IDENTITY_CACHE_SECONDS = 30
+        cached_seconds = measure("revocation and identity cache")
+        print(f"speedup: {uncached_seconds / cached_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
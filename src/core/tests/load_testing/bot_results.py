@@ -0,0 +1,81 @@
+"""Measure how long core takes to apply a tagging bot result.
+
+python -m tests.load_testing.bot_results [STORY_COUNT]
+
+Submits a WORDLIST_BOT task result tagging every news item with two tags, the way a
+wordlist bot run over the whole Assess view does, and reports time, SQL statements and
+the size of the story revisions written.
+"""
+
+import sys
+import uuid
+
+from sqlalchemy import event, func
+
+from tests.load_testing import benchmark_app, timed
+
+
+def main(story_count: int) -> None:
+    with benchmark_app():
+        from models.task import TaskSubmission
+
+        from core.managers.db_manager import db
+        from core.model.news_item import NewsItem
+        from core.model.revision import RevisionNewsItem, StoryRevision
+        from core.model.story import Story
+        from core.service.task import TaskService
+
+        Story.add_news_items(
+            [
+                {
+                    "title": f"Benchmark item {index}",
+                    "content": "content " * 200,
+                    "link": f"https://example.invalid/item/{index}",
+                    "source": "https://example.invalid/feed",
+                    "osint_source_id": "manual",
+                }
+                for index in range(story_count)
+            ]
+        )
+        news_item_ids = db.session.execute(db.select(NewsItem.id)).scalars().all()
+        found_tags = {
+            news_item_id: {"APT28": "threat_actor", f"tag-{index % 50}": "misc"} for index, news_item_id in enumerate(news_item_ids)
+        }
+        submission = TaskSubmission.model_validate(
+            {
+                "id": f"bot-benchmark-{uuid.uuid4().hex}",
+                "task": "bot_task",
+                "worker_id": "benchmark-bot",
+                "worker_type": "WORDLIST_BOT",
+                "result": {
+                    "message": "Bot executed successfully",
+                    "data": {"bot_id": "benchmark-bot", "trigger_dependents": False, "result": found_tags},
+                },
+                "status": "SUCCESS",
+            }
+        )
+        statements = 0
+
+        def count_statement(*args):
+            nonlocal statements
+            statements += 1
+
+        def revision_bytes() -> int:
+            return sum(
+                db.session.execute(db.select(func.coalesce(func.sum(func.length(column)), 0))).scalar_one()
+                for column in (StoryRevision.stored_data, RevisionNewsItem.data)
+            )
+
+        event.listen(db.engine, "before_cursor_execute", count_statement)
+        bytes_before = revision_bytes()
+        revisions_before = StoryRevision.get_filtered_count(db.select(StoryRevision))
+        statements = 0
+        timed("apply tagging bot result", lambda: TaskService.save_task_result(submission), len(news_item_ids), "items")
+        applied_statements = statements
+        revisions = StoryRevision.get_filtered_count(db.select(StoryRevision)) - revisions_before
+        print(f"{len(news_item_ids)} news items, {applied_statements} SQL statements")
+        print(f"{revisions} revisions written, {(revision_bytes() - bytes_before) / 1024:.0f} KiB of revision data")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
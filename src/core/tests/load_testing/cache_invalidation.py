@@ -0,0 +1,72 @@
+"""Compare SCAN MATCH invalidation against the key-index sets of the frontend cache.
+
+python -m tests.load_testing.cache_invalidation [KEY_COUNT]
+
+Set ``BENCHMARK_REDIS_URL`` to measure against a real Redis server (the database it
+points at is flushed); the default of one million keys needs one. Without it the
+in-process fake is used with a small key count, which only works as a smoke test:
+the fake scans whole sets on every set command.
+"""
+
+import os
+import sys
+
+import fakeredis
+from models.cache_contract import build_model_index_key, build_model_pattern, delete_indexed_keys, register_cache_key
+from redis import Redis
+
+from tests.load_testing import timed
+
+
+PREFIX = "taranis_frontend"
+MODEL_NAMES = ("story", "news_item", "report_item", "osint_source", "product", "dashboard", "word_list", "user")
+USER_COUNT = 500
+SEED_CHUNK_SIZE = 10_000
+
+
+def redis_client() -> Redis:
+    if redis_url := os.getenv("BENCHMARK_REDIS_URL"):
+        return Redis.from_url(redis_url, decode_responses=True)
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def cache_keys(count: int) -> list[str]:
+    return [
+        f"{PREFIX}:user:user-{index % USER_COUNT}:model:{MODEL_NAMES[index % len(MODEL_NAMES)]}:list:{index:08d}" for index in range(count)
+    ]
+
+
+def seed(client: Redis, keys: list[str]) -> None:
+    client.flushdb()
+    for offset in range(0, len(keys), SEED_CHUNK_SIZE):
+        pipeline = client.pipeline(transaction=False)
+        for key in keys[offset : offset + SEED_CHUNK_SIZE]:
+            pipeline.set(key, "{}", ex=3600)
+            register_cache_key(pipeline, PREFIX, key, 3600)
+        pipeline.execute()
+
+
+def scan_invalidate(client: Redis, model_name: str) -> int:
+    keys = [str(key) for key in client.scan_iter(match=build_model_pattern(PREFIX, model_name), count=1000)]
+    return sum(client.delete(*keys[offset : offset + 500]) for offset in range(0, len(keys), 500))
+
+
+def main(count: int) -> None:
+    client = redis_client()
+    keys = cache_keys(count)
+    affected = sum(1 for key in keys if ":model:story:" in key)
+    print(f"{count} cache keys, {affected} of them for the invalidated model")
+
+    seed(client, keys)
+    scan_seconds = timed("SCAN MATCH invalidation", lambda: scan_invalidate(client, "story"), affected, "keys")
+    seed(client, keys)
+    index_seconds = timed(
+        "index set invalidation", lambda: delete_indexed_keys(client, PREFIX, [build_model_index_key(PREFIX, "story")]), affected, "keys"
+    )
+    timed("index set invalidation, nothing cached", lambda: delete_indexed_keys(client, PREFIX, [build_model_index_key(PREFIX, "story")]), 1)
+    print(f"speedup: {scan_seconds / index_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    default_count = 1_000_000 if os.getenv("BENCHMARK_REDIS_URL") else 2_000
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else default_count)
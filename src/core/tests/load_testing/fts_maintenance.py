@@ -0,0 +1,70 @@
+"""Compare story search vector maintenance with the news_item trigger off, immediate and deferred.
+
+Needs PostgreSQL, the full-text search triggers are not installed on SQLite:
+
+BENCHMARK_DATABASE_URI=postgresql+psycopg://... python -m tests.load_testing.fts_maintenance [ITEM_COUNT]
+"""
+
+import sys
+import uuid
+
+from sqlalchemy import text
+
+from tests.load_testing import benchmark_app, timed
+
+
+MODES = ("off", "immediate", "deferred")
+
+
+def news_item_payloads(count: int, source_id: str) -> list[dict]:
+    run_id = uuid.uuid4()
+    return [
+        {
+            "title": f"Benchmark item {run_id} {index}",
+            "content": f"CVE-2026-{index:05d} affects vendor {index % 50} " * 20,
+            "link": f"https://example.invalid/{run_id}/{index}",
+            "source": "https://example.invalid/feed",
+            "osint_source_id": source_id,
+        }
+        for index in range(count)
+    ]
+
+
+def main(count: int) -> None:
+    with benchmark_app():
+        from core.managers.db_manager import db, setup_fts
+        from core.model.osint_source import OSINTSource
+        from core.model.story import Story
+
+        if db.engine.dialect.name != "postgresql":
+            print("Set BENCHMARK_DATABASE_URI to a PostgreSQL database to run this benchmark")
+            return
+
+        source_id = OSINTSource.get_manual().id
+
+        def use_mode(mode: str) -> None:
+            db.session.remove()
+            setup_fts(db.engine, "deferred" if mode == "off" else mode)
+            if mode == "off":
+                with db.engine.begin() as conn:
+                    conn.execute(text("DROP TRIGGER IF EXISTS trg_newsitem_mark_parent_story_dirty ON news_item"))
+
+        def ingest_cluster():
+            Story.add({"title": f"Benchmark cluster {uuid.uuid4()}", "news_items": news_item_payloads(count, source_id)})
+
+        def group(mode: str):
+            result, _ = Story.add_news_items(news_item_payloads(count, source_id))
+            story_ids = result["story_ids"]
+            timed(f"{mode}: group {count} stories", lambda: Story.group_stories(story_ids), count)
+
+        print(f"Ingesting and grouping {count} news items into one story")
+        for mode in MODES:
+            use_mode(mode)
+            timed(f"{mode}: ingest one cluster", ingest_cluster, count)
+            group(mode)
+        db.session.remove()
+        setup_fts(db.engine)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,108 @@
+"""Measure ACL and TLP overhead of story reads for a user restricted to one source group.
+
+python -m tests.load_testing.story_acl [SOURCE_COUNT] [REQUEST_COUNT]
+
+Compares compiling the access context on every call against the cached context, for
+story list queries and for per-item access checks.
+"""
+
+import sys
+import time
+import uuid
+
+from sqlalchemy import event
+
+from tests.load_testing import benchmark_app, timed
+
+
+def main(source_count: int, request_count: int) -> None:
+    with benchmark_app():
+        from core.managers.auth_cache_manager import auth_cache_manager
+        from core.managers.db_manager import db
+        from core.model.osint_source import OSINTSource, OSINTSourceGroup
+        from core.model.role_based_access import ItemType, RoleBasedAccess
+        from core.model.story import Story
+        from core.model.user import User
+
+        sources = [
+            OSINTSource(
+                id=str(uuid.uuid4()),
+                name=f"Benchmark source {index}",
+                description="",
+                type="rss_collector",
+                parameters={"FEED_URL": f"https://example.invalid/{index}.xml"},
+            )
+            for index in range(source_count)
+        ]
+        db.session.add_all(sources)
+        group = OSINTSourceGroup(id=str(uuid.uuid4()), name="Benchmark group", description="")
+        group.osint_sources = sources[: source_count // 2]
+        db.session.add(group)
+        user = User.find_by_name("user")
+        assert user is not None
+        db.session.add(
+            RoleBasedAccess(
+                name="Benchmark group ACL",
+                description="",
+                item_type=ItemType.OSINT_SOURCE_GROUP,
+                item_id=group.id,
+                roles=[role.id for role in user.roles],
+            )
+        )
+        db.session.commit()
+        Story.add_news_items(
+            [
+                {
+                    "title": f"Benchmark item {index}",
+                    "content": "content",
+                    "link": f"https://example.invalid/item/{index}",
+                    "source": "https://example.invalid/feed",
+                    "osint_source_id": sources[index % source_count].id,
+                }
+                for index in range(source_count * 2)
+            ]
+        )
+        news_items = [news_item for story in db.session.execute(db.select(Story)).scalars() for news_item in story.news_items]
+        statements = 0
+
+        def count_statement(*args):
+            nonlocal statements
+            statements += 1
+
+        event.listen(db.engine, "before_cursor_execute", count_statement)
+
+        def list_stories():
+            for _ in range(request_count):
+                Story.get_by_filter({"limit": 20, "no_count": True}, user)
+
+        def check_items():
+            for news_item in news_items:
+                news_item.allowed_with_acl(user, require_write_access=False)
+
+        def measure(label: str) -> tuple[float, float]:
+            nonlocal statements
+            list_stories()
+            statements = 0
+            list_seconds = timed(f"{label}: story lists", list_stories, request_count, "req")
+            list_statements = statements / request_count
+            statements = 0
+            check_seconds = timed(f"{label}: item checks", check_items, len(news_items), "items")
+            print(f"{'':<40} {list_statements:6.2f} SQL statements per list, {statements / len(news_items):6.2f} per item check")
+            return list_seconds, check_seconds
+
+        print(f"{source_count} sources, {source_count // 2} of them readable through a group ACL, {len(news_items)} news items")
+        redis_client = auth_cache_manager._redis
+        auth_cache_manager._redis = None
+        uncached = measure("compiled per call")
+        auth_cache_manager._redis = redis_client
+        while not auth_cache_manager.active:
+            time.sleep(0.01)
+        cached = measure("cached")
+        print(f"speedup: {uncached[0] / cached[0]:.1f}x story lists, {uncached[1] / cached[1]:.1f}x item checks")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
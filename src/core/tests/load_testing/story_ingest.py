@@ -0,0 +1,57 @@
+"""Compare per-item story creation against the set-based ingestion path.
+
+python -m tests.load_testing.story_ingest [ITEM_COUNT]
+"""
+
+import sys
+import uuid
+
+from tests.load_testing import benchmark_app, timed
+
+
+def news_item_payloads(count: int, source_id: str) -> list[dict]:
+    run_id = uuid.uuid4()
+    return [
+        {
+            "title": f"Benchmark item {run_id} {index}",
+            "content": f"CVE-2026-{index:05d} affects vendor {index % 50} " * 20,
+            "link": f"https://example.invalid/{run_id}/{index}",
+            "source": "https://example.invalid/feed",
+            "osint_source_id": source_id,
+            "tags": [{"name": f"vendor-{index % 50}", "tag_type": "misc"}],
+            "attributes": [{"key": "cybersecurity_bot", "value": "yes"}],
+        }
+        for index in range(count)
+    ]
+
+
+def main(count: int) -> None:
+    with benchmark_app():
+        from core.managers.db_manager import db
+        from core.model.osint_source import OSINTSource
+        from core.model.story import Story
+
+        source_id = OSINTSource.get_manual().id
+
+        def per_item_loop():
+            for payload in news_item_payloads(count, source_id):
+                Story.add_single_news_item(payload)
+            db.session.commit()
+
+        def bulk():
+            Story.add_news_items(news_item_payloads(count, source_id))
+
+        def bulk_all_known():
+            payloads = news_item_payloads(count, source_id)
+            Story.add_news_items(payloads)
+            timed("bulk, every item already known", lambda: Story.add_news_items(payloads), count)
+
+        print(f"Ingesting {count} news items")
+        loop_seconds = timed("per-item add_single_news_item loop", per_item_loop, count)
+        bulk_seconds = timed("Story.add_news_items", bulk, count)
+        bulk_all_known()
+        print(f"speedup: {loop_seconds / bulk_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
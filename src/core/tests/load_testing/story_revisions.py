@@ -0,0 +1,68 @@
+"""Measure size and write latency of story revision history.
+
+python -m tests.load_testing.story_revisions [STORY_COUNT] [UPDATE_COUNT]
+
+Creates stories with a large news item, records UPDATE_COUNT small edits per story and
+reports the time per revision written, the time to reconstruct every revision and the
+bytes stored for the history, counting revision rows and deduplicated news items.
+"""
+
+import sys
+
+from sqlalchemy import inspect, text
+
+from tests.load_testing import benchmark_app, timed
+
+
+def main(story_count: int, update_count: int) -> None:
+    with benchmark_app():
+        from core.managers.db_manager import db
+        from core.model.revision import StoryRevision
+        from core.model.story import Story
+
+        Story.add_news_items(
+            [
+                {
+                    "title": f"Benchmark item {index}",
+                    "content": "content " * 500,
+                    "link": f"https://example.invalid/item/{index}",
+                    "source": "https://example.invalid/feed",
+                    "osint_source_id": "manual",
+                }
+                for index in range(story_count)
+            ]
+        )
+        stories = db.session.execute(db.select(Story)).scalars().all()
+
+        def record_updates():
+            for update in range(update_count):
+                for story in stories:
+                    story.description = f"Benchmark description, edit {update}"
+                    story.record_revision(note="update")
+                db.session.commit()
+
+        def reconstruct():
+            for revision in db.session.execute(db.select(StoryRevision)).scalars():
+                assert revision.data["news_items"]
+
+        def table_bytes(table: str) -> int:
+            if not inspect(db.engine).has_table(table):
+                return 0
+            return db.session.execute(text(f"SELECT coalesce(sum(length(data)), 0) FROM {table}")).scalar_one()
+
+        revision_count = story_count * update_count
+        timed("record story revisions", record_updates, revision_count, "revisions")
+        db.session.expunge_all()
+        total = StoryRevision.get_filtered_count(db.select(StoryRevision))
+        timed("reconstruct story revisions", reconstruct, total, "revisions")
+        revision_bytes = table_bytes("story_revision")
+        news_item_bytes = table_bytes("revision_news_item")
+        print(f"{total} revisions: {revision_bytes / 1024:.0f} KiB revision data, {news_item_bytes / 1024:.0f} KiB news items")
+        print(f"{(revision_bytes + news_item_bytes) / total:.0f} bytes per revision")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
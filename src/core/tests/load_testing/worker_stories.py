@@ -0,0 +1,70 @@
+"""Compare full and field-projected story pages served to bots.
+
+python -m tests.load_testing.worker_stories [STORY_COUNT] [PAGE_SIZE]
+
+Walks /worker/stories with cursors the way BaseBot.iter_stories does, once with complete
+worker dicts and once with the fields the IOC and wordlist bots request, and reports time,
+response bytes and the largest page.
+"""
+
+import sys
+from datetime import datetime
+
+from tests.load_testing import benchmark_app, timed
+
+
+TAGGING_FIELDS = ["news_items.title", "news_items.review", "news_items.content", "news_items.tags"]
+
+
+def main(story_count: int, page_size: int) -> None:
+    with benchmark_app() as app:
+        from core.config import Config
+        from core.model.story import Story
+
+        published = datetime.now().isoformat()
+        Story.add_news_items(
+            [
+                {
+                    "title": f"Benchmark item {index}",
+                    "content": "content " * 400,
+                    "review": "review " * 20,
+                    "link": f"https://example.invalid/item/{index}",
+                    "source": "https://example.invalid/feed",
+                    "osint_source_id": "manual",
+                    "published": published,
+                    "tags": [{"name": "APT28", "tag_type": "threat_actor"}],
+                    "attributes": [{"key": "cybersecurity_bot", "value": "yes"}],
+                }
+                for index in range(story_count)
+            ]
+        )
+        client = app.test_client()
+        headers = {"Authorization": f"Bearer {Config.API_KEY.get_secret_value()}"}
+
+        def walk(fields: list[str] | None) -> tuple[int, int]:
+            total_bytes = largest_page = 0
+            cursor = ""
+            while cursor is not None:
+                query = {"worker": "true", "limit": page_size, "cursor": cursor, **({"fields": fields} if fields else {})}
+                response = client.get("/api/worker/stories", headers=headers, query_string=query)
+                assert response.status_code == 200
+                total_bytes += len(response.data)
+                largest_page = max(largest_page, len(response.data))
+                cursor = response.get_json()["next_cursor"]
+            return total_bytes, largest_page
+
+        def measure(label: str, fields: list[str] | None) -> None:
+            sizes: list[tuple[int, int]] = []
+            timed(label, lambda: sizes.append(walk(fields)), story_count, "stories")
+            total_bytes, largest_page = sizes[0]
+            print(f"{'':<40} {total_bytes / 1024:8.0f} KiB total, {largest_page / 1024:6.0f} KiB largest page")
+
+        measure("complete worker dicts", None)
+        measure("tagging bot fields", TAGGING_FIELDS)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
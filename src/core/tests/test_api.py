@@ -88,6 +88,40 @@ def test_auth_refresh_is_header_only_and_rejects_revoked_tokens(client, app, mon
     assert client.get("/api/auth/refresh", headers=headers).status_code == 401
 
 
+def test_identity_cache_enforces_role_changes_and_logout_on_the_next_request(client, app, monkeypatch):
+    from core.managers.auth_cache_manager import auth_cache_manager
+    from core.managers.db_manager import db
+    from core.model.permission import Permission
+    from core.model.user import User
+
+    monkeypatch.setattr("core.managers.auth_cache_manager.Config.JWT_IDENTITY_CACHE_SECONDS", 30)
+    assert auth_cache_manager.active
+    login_response = client.post("/api/auth/login", json={"username": "user", "password": os.getenv("PRE_SEED_PASSWORD_USER")})
+    headers = {"Authorization": f"Bearer {login_response.json['access_token']}"}
+    assert client.get("/api/assess/stories", headers=headers).status_code == 200
+
+    with app.app_context():
+        user = User.find_by_name("user")
+        assert user is not None
+        roles = [role for role in user.roles if "ASSESS_ACCESS" in role.get_permissions()]
+        original_permissions = {role.id: role.get_permissions() for role in roles}
+        for role in roles:
+            role.permissions = [permission for permission in role.permissions if permission.code != "ASSESS_ACCESS"]
+        db.session.commit()
+    try:
+        assert client.get("/api/assess/stories", headers=headers).status_code == 403
+    finally:
+        with app.app_context():
+            for role in User.find_by_name("user").roles:
+                if role.id in original_permissions:
+                    role.permissions = Permission.get_bulk(original_permissions[role.id])
+            db.session.commit()
+
+    assert client.get("/api/assess/stories", headers=headers).status_code == 200
+    assert client.delete("/api/auth/logout", headers=headers).status_code == 200
+    assert client.get("/api/assess/stories", headers=headers).status_code == 401
+
+
 def test_auth_login_sets_suffixed_path_scoped_cookies(client, app, monkeypatch):
     from core.config import Settings
 
@@ -332,6 +366,7 @@ def test_user_info_excludes_finished_admin_onboarding_task(app, client, auth_hea
 
 
 def test_auth_logout(app, client, auth_header):
+    from core.managers.auth_cache_manager import auth_cache_manager
     from core.model.token_blacklist import TokenBlacklist
 
     response = client.delete("/api/auth/logout", headers=auth_header)
@@ -339,3 +374,4 @@ def test_auth_logout(app, client, auth_header):
 
     with app.app_context():
         TokenBlacklist.delete_all()
+        auth_cache_manager.reload()
@@ -6,9 +6,10 @@ from datetime import datetime
 import pytest
 
 from core.managers.db_manager import db
+from core.model import revision_codec
 from core.model.news_item import NewsItem
 from core.model.report_item import ReportItem
-from core.model.revision import ReportRevision, StoryRevision
+from core.model.revision import UNUSED_GRACE_PERIOD, ReportRevision, RevisionNewsItem, StoryRevision
 from core.model.story import Story
 from core.service.news_item import NewsItemService
 from core.service.news_item_tag import NewsItemTagService
@@ -477,3 +478,85 @@ def test_report_title_retag_happens_before_revision_and_commit(sample_report_typ
         ReportItem.update_report_item(report_item.id, {"title": "Renamed Report"}, admin_user)
 
     assert events == ["remove_report_attribute", "add_report_attribute", "record_revision", "commit"]
+
+
+@pytest.mark.usefixtures("session")
+def test_story_add_news_items_skips_duplicates_and_records_created_revisions():
+    existing_story = _create_story()
+    existing_payload = existing_story.to_worker_dict()["news_items"][0]
+    new_payload = _news_item_payload(source="manual")
+    new_payload["tags"] = [{"name": "APT29", "tag_type": "threat_actor"}]
+    new_payload["attributes"] = [{"key": "cybersecurity_bot", "value": "yes"}]
+    repeated_payload = {**new_payload, "id": str(uuid.uuid4())}
+
+    response, status = Story.add_news_items([new_payload, repeated_payload, existing_payload, {"osint_source_id": "manual"}])
+
+    assert status == 200
+    assert response["warning"] == "3 items were skipped"
+    assert response["news_item_ids"] == [new_payload["id"]]
+    story = db.session.get(Story, response["story_ids"][0])
+    assert story is not None
+    assert story.revision == 1
+    assert story.last_change == "internal"
+    assert [tag.name for tag in story.tags] == ["APT29"]
+    assert {attribute.key: attribute.value for attribute in story.attributes} == {"TLP": "clear", "cybersecurity": "yes"}
+    revisions = _fetch_story_revisions(story.id)
+    assert [(revision.revision, revision.note) for revision in revisions] == [(1, "created")]
+    assert revisions[0].data["news_items"][0]["id"] == new_payload["id"]
+
+
+@pytest.mark.usefixtures("session")
+def test_story_add_news_items_defaults_missing_dates_to_now():
+    payload = _news_item_payload(source="manual")
+    del payload["published"], payload["collected"]
+    before = datetime.utcnow()
+
+    response, status = Story.add_news_items([payload])
+
+    assert status == 200
+    news_item = db.session.get(NewsItem, payload["id"])
+    assert news_item is not None
+    assert news_item.published >= before.replace(microsecond=0)
+    assert news_item.collected >= before.replace(microsecond=0)
+    story = db.session.get(Story, response["story_ids"][0])
+    assert story is not None
+    assert story.created == story.updated == news_item.published
+
+
+@pytest.mark.usefixtures("session")
+def test_story_revisions_are_stored_as_deltas_and_reconstructed(admin_user):
+    story = _create_story(news_item_count=2)
+    Story.update(story.id, {"title": "Delta Title"}, admin_user)
+    db.session.commit()
+
+    created, updated = _fetch_story_revisions(story.id)
+    assert created.keyframe_revision is None
+    assert updated.keyframe_revision == created.revision
+    assert isinstance(updated.stored_data, list)
+    assert all("content" not in news_item for news_item in created.stored_data["news_items"])
+    assert db.session.scalar(db.select(db.func.count()).select_from(RevisionNewsItem)) >= 2
+    assert updated.data["title"] == "Delta Title"
+    assert updated.data["news_items"] == StoryRevision.snapshot_story(story)["news_items"]
+
+
+@pytest.mark.usefixtures("session")
+def test_delete_unreferenced_revision_news_items_keeps_referenced_and_recently_used_ones():
+    kept_story = _create_story()
+    deleted_story = _create_story(news_item_count=2)
+    kept_digests = revision_codec.news_item_references([revision.stored_data for revision in _fetch_story_revisions(kept_story.id)])
+    deleted_digests = revision_codec.news_item_references([revision.stored_data for revision in _fetch_story_revisions(deleted_story.id)])
+    assert kept_digests and len(deleted_digests) == 2 and not kept_digests & deleted_digests
+
+    db.session.execute(db.delete(StoryRevision).where(StoryRevision.story_id == deleted_story.id))
+    db.session.commit()
+    RevisionNewsItem.delete_unreferenced()
+    assert RevisionNewsItem.load(deleted_digests).keys() == deleted_digests
+
+    reused_digest = min(deleted_digests)
+    db.session.execute(db.update(RevisionNewsItem).values(last_used=RevisionNewsItem.utcnow() - UNUSED_GRACE_PERIOD * 2))
+    RevisionNewsItem.store(RevisionNewsItem.load([reused_digest]))
+    db.session.commit()
+
+    assert RevisionNewsItem.delete_unreferenced() >= 1
+    assert RevisionNewsItem.load(kept_digests).keys() == kept_digests
+    assert RevisionNewsItem.load(deleted_digests).keys() == {reused_digest}
@@ -0,0 +1,131 @@
+import base64
+import hashlib
+import io
+import os
+import sqlite3
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from yoyo import read_migrations
+
+from core.managers.artifact_store import ArtifactNotFoundError, ArtifactStore, EmptyArtifactError, FileSystemArtifactBackend, is_digest
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(FileSystemArtifactBackend(tmp_path))
+
+
+def test_put_stores_content_once_by_digest(store, tmp_path):
+    data = b"rendered" * 200_000
+
+    first = store.put(io.BytesIO(data))
+    second = store.put_bytes(data)
+
+    assert first == second
+    assert first.digest == hashlib.sha256(data).hexdigest()
+    assert first.size == len(data)
+    assert (tmp_path / first.digest[:2] / first.digest).read_bytes() == data
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [first.digest]
+
+
+def test_open_and_delete(store):
+    digest = store.put_bytes(b"report").digest
+
+    with store.open(digest) as artifact:
+        assert artifact.read() == b"report"
+
+    store.delete(digest)
+    assert not store.exists(digest)
+    with pytest.raises(ArtifactNotFoundError):
+        store.open(digest)
+
+
+@pytest.mark.parametrize("value", [None, "", "../" + "a" * 61, "A" * 64, "a" * 63])
+def test_rejects_values_that_are_no_digest(store, value):
+    assert not is_digest(value)
+    assert not store.exists(value)
+    with pytest.raises(ArtifactNotFoundError):
+        store.open(value)
+
+
+def _age(store, digest: str, seconds: int) -> None:
+    modified = time.time() - seconds
+    os.utime(store.backend.path(digest), (modified, modified))
+
+
+def test_prune_keeps_referenced_and_recently_used_artifacts(store):
+    referenced = store.put_bytes(b"referenced").digest
+    unreferenced = store.put_bytes(b"unreferenced").digest
+    reused = store.put_bytes(b"reused").digest
+    looked_up = store.put_bytes(b"looked up").digest
+    for digest in (referenced, unreferenced, reused, looked_up):
+        _age(store, digest, 7200)
+    store.put_bytes(b"reused")
+    store.touch(looked_up)
+
+    assert store.prune({referenced}, datetime.now(UTC) - timedelta(hours=1)) == 1
+
+    assert not store.exists(unreferenced)
+    assert all(store.exists(digest) for digest in (referenced, reused, looked_up))
+
+
+def test_put_stores_nothing_for_empty_content(store, tmp_path):
+    with pytest.raises(EmptyArtifactError):
+        store.put_bytes(b"")
+
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+class _Cursor:
+    """DB-API cursor of the migration, with the psycopg parameter style mapped onto sqlite3."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.cursor = connection.cursor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cursor.close()
+
+    def execute(self, sql: str, parameters=()):
+        self.cursor.execute(sql.replace("%s", "?"), parameters)
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+
+class _Connection:
+    def __init__(self):
+        self.sqlite = sqlite3.connect(":memory:")
+
+    def cursor(self) -> _Cursor:
+        return _Cursor(self.sqlite)
+
+
+def test_render_migration_keeps_undecodable_renders(store, monkeypatch):
+    migrations = read_migrations(str(Path(__file__).parents[2] / "migrations"))
+    migration = next(migration for migration in migrations if migration.id == "20261018_05_h8Vd3-move-product-renders-to-artifact-store")
+    migration.load()
+    monkeypatch.setattr(migration.module, "get_artifact_store", lambda: store)
+    connection = _Connection()
+    connection.sqlite.execute("CREATE TABLE product (id TEXT PRIMARY KEY, render_digest TEXT, render_result TEXT)")
+    connection.sqlite.executemany(
+        "INSERT INTO product (id, render_result) VALUES (?, ?)",
+        [("valid", base64.b64encode(b"rendered").decode()), ("broken", "not base64!"), ("empty", "")],
+    )
+
+    migration.module._store_renders(connection)
+    migration.module._drop_render_result(connection)
+
+    rows = {product_id: (digest, result) for product_id, digest, result in connection.sqlite.execute("SELECT * FROM product")}
+    assert rows["valid"] == (hashlib.sha256(b"rendered").hexdigest(), None)
+    assert rows["broken"] == (None, "not base64!")
+    assert rows["empty"] == (None, None)
+    assert store.exists(rows["valid"][0])
@@ -0,0 +1,155 @@
+import os
+import time
+from datetime import timedelta
+
+import fakeredis
+import pytest
+from redis.exceptions import RedisError
+
+from core.managers import auth_cache_manager as auth_cache_module
+from core.managers.auth_cache_manager import AuthCacheManager
+from core.managers.db_manager import db
+from core.model.token_blacklist import TokenBlacklist
+from core.model.user import User
+
+
+def _synced_manager(app, server: fakeredis.FakeServer | None = None) -> AuthCacheManager:
+    manager = AuthCacheManager()
+    manager._app = app
+    manager._redis = fakeredis.FakeRedis(server=server or fakeredis.FakeServer(), decode_responses=True)
+    manager._listener_pid = os.getpid()
+    manager._synced.set()
+    return manager
+
+
+def _wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def identity_cache(monkeypatch):
+    monkeypatch.setattr("core.managers.auth_cache_manager.Config.JWT_IDENTITY_CACHE_SECONDS", 30)
+
+
+def test_revocations_are_answered_from_memory(app, monkeypatch):
+    with app.app_context():
+        manager = _synced_manager(app)
+        manager.revoke("revoked-jti")
+        monkeypatch.setattr(TokenBlacklist, "invalid", lambda token: pytest.fail("blocklist query while the cache is active"))
+
+        assert manager.is_revoked("revoked-jti")
+        assert not manager.is_revoked("other-jti")
+        TokenBlacklist.delete_all()
+
+
+def test_revocations_fall_back_to_database_until_synced(app):
+    with app.app_context():
+        manager = _synced_manager(app)
+        manager._synced.clear()
+        TokenBlacklist.add("stored-jti")
+
+        assert manager.is_revoked("stored-jti")
+        assert "stored-jti" not in manager.revoked
+        TokenBlacklist.delete_all()
+
+
+def test_prune_drops_expired_revocations(app):
+    with app.app_context():
+        manager = _synced_manager(app)
+        manager.revoke("old-jti")
+        manager.revoke("new-jti")
+        manager.revoked["old-jti"] -= timedelta(days=2)
+        db.session.execute(db.update(TokenBlacklist).where(TokenBlacklist.token == "old-jti").values(created=manager.revoked["old-jti"]))
+        db.session.commit()
+
+        manager.prune(TokenBlacklist.utcnow() - timedelta(days=1))
+
+        assert set(manager.revoked) == {"new-jti"}
+        assert set(TokenBlacklist.get_revoked()) == {"new-jti"}
+        TokenBlacklist.delete_all()
+
+
+def test_listener_applies_revocations_from_other_processes(app):
+    server = fakeredis.FakeServer()
+    with app.app_context():
+        publisher = _synced_manager(app, server)
+        subscriber = AuthCacheManager()
+        subscriber._app = app
+        subscriber._redis = fakeredis.FakeRedis(server=server, decode_responses=True)
+
+        assert _wait_for(lambda: subscriber.active)
+        publisher.revoke("remote-jti")
+
+        assert _wait_for(lambda: "remote-jti" in subscriber.revoked)
+        TokenBlacklist.delete_all()
+        subscriber._redis = None
+
+
+def test_failed_publish_makes_other_processes_reload_from_database(app, monkeypatch):
+    server = fakeredis.FakeServer()
+    with app.app_context():
+        publisher = _synced_manager(app)
+        subscriber = AuthCacheManager()
+        subscriber._app = app
+        subscriber._redis = fakeredis.FakeRedis(server=server, decode_responses=True)
+        assert _wait_for(lambda: subscriber.active)
+
+        def failing_publish(*args, **kwargs):
+            raise RedisError("connection lost")
+
+        monkeypatch.setattr(publisher._redis, "publish", failing_publish)
+        publisher.revoke("unpublished-jti")
+
+        assert _wait_for(lambda: "unpublished-jti" in subscriber.revoked)
+        assert subscriber.active
+        TokenBlacklist.delete_all()
+        subscriber._redis = None
+
+
+def test_load_user_reuses_identity_until_invalidated(app, identity_cache, monkeypatch):
+    with app.app_context():
+        manager = _synced_manager(app)
+        first = manager.load_user("jti-1", "user")
+        assert first is not None
+        assert first in db.session
+        assert first.get_permissions()
+
+        monkeypatch.setattr(User, "load_detached", classmethod(lambda cls, username: pytest.fail("identity loaded twice")))
+        assert manager.load_user("jti-1", "user").id == first.id
+
+        manager.invalidate_identities(["user"])
+        assert manager.identities == {}
+
+
+def test_committed_user_changes_invalidate_cached_identities(app, identity_cache, monkeypatch):
+    with app.app_context():
+        manager = _synced_manager(app)
+        monkeypatch.setattr(auth_cache_module, "auth_cache_manager", manager)
+        manager.load_user("jti-1", "user")
+        manager.load_user("jti-2", "admin")
+
+        user = User.find_by_name("user")
+        assert user is not None
+        original_name = user.name
+        user.name = "Renamed user"
+        db.session.commit()
+
+        assert set(manager.identities) == {"jti-2"}
+        user.name = original_name
+        db.session.commit()
+
+
+def test_revoking_a_token_drops_its_identity(app, identity_cache):
+    with app.app_context():
+        manager = _synced_manager(app)
+        manager.load_user("jti-1", "user")
+
+        manager.revoke("jti-1")
+
+        assert "jti-1" not in manager.identities
+        TokenBlacklist.delete_all()
@@ -1,4 +1,6 @@
 import fakeredis
+from models.cache_contract import build_model_index_key, delete_cache_keys, register_cache_key
+from models.task import TaskAffectedEntities
 
 from core.service.cache_invalidation import (
     SCOPE_ASSESS_VIEWS,
@@ -6,13 +8,14 @@ from core.service.cache_invalidation import (
     SCOPE_SCHEDULE_STATUS,
     SCOPE_USER_VIEWS,
     FrontendCacheInvalidationService,
+    invalidate_frontend_cache_on_success,
 )
+from tests.application.support.frontend_cache import cached_frontend_keys, seed_frontend_cache
 
 
 def _build_service(keys: list[str]) -> FrontendCacheInvalidationService:
     client = fakeredis.FakeRedis(decode_responses=True)
-    for key in keys:
-        client.set(key, "1")
+    seed_frontend_cache(client, keys)
 
     service = FrontendCacheInvalidationService()
     service._client = client
@@ -34,7 +37,7 @@ def test_invalidate_model_clears_keys_across_all_user_namespaces(monkeypatch):
     deleted = service.invalidate_model("story")
 
     assert deleted == 3
-    assert set(service._client.scan_iter(match="*")) == {"taranis_frontend:user:bob:model:product:detail:7"}
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:bob:model:product:detail:7"}
 
 
 def test_invalidate_model_for_object_clears_detail_and_lists_only(monkeypatch):
@@ -52,7 +55,7 @@ def test_invalidate_model_for_object_clears_detail_and_lists_only(monkeypatch):
     deleted = service.invalidate_model("story", object_id="1")
 
     assert deleted == 3
-    assert set(service._client.scan_iter(match="*")) == {"taranis_frontend:user:alice:model:story:detail:2"}
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:alice:model:story:detail:2"}
 
 
 def test_invalidate_scope_schedule_clears_scheduler_related_models(monkeypatch):
@@ -69,7 +72,7 @@ def test_invalidate_scope_schedule_clears_scheduler_related_models(monkeypatch):
     deleted = service.invalidate_scope(SCOPE_SCHEDULE)
 
     assert deleted == 2
-    assert set(service._client.scan_iter(match="*")) == {"taranis_frontend:user:alice:model:story:list:one"}
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:alice:model:story:list:one"}
 
 
 def test_invalidate_scope_schedule_status_keeps_queue_runtime_models(monkeypatch):
@@ -89,7 +92,7 @@ def test_invalidate_scope_schedule_status_keeps_queue_runtime_models(monkeypatch
     deleted = service.invalidate_scope(SCOPE_SCHEDULE_STATUS)
 
     assert deleted == 2
-    assert set(service._client.scan_iter(match="*")) == {
+    assert cached_frontend_keys(service._client) == {
         "taranis_frontend:user:alice:model:active_job:list:one",
         "taranis_frontend:user:alice:model:failed_job:list:one",
         "taranis_frontend:user:alice:model:queue_status:list:one",
@@ -113,7 +116,72 @@ def test_invalidate_scope_uses_object_ids_for_scoped_models(monkeypatch):
     deleted = service.invalidate_scope(SCOPE_ASSESS_VIEWS, object_ids={"news_item": "1"})
 
     assert deleted == 4
-    assert set(service._client.scan_iter(match="*")) == {"taranis_frontend:user:alice:model:news_item:detail:2"}
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:alice:model:news_item:detail:2"}
+
+
+def test_invalidate_models_accepts_several_object_ids_and_falls_back_to_whole_model(monkeypatch):
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_ENABLED", True)
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_KEY_PREFIX", "taranis_frontend")
+    monkeypatch.setattr("core.service.cache_invalidation.MAX_TARGETED_OBJECT_IDS", 2)
+    service = _build_service(
+        [
+            "taranis_frontend:user:alice:model:story:list:one",
+            "taranis_frontend:user:alice:model:story:detail:1",
+            "taranis_frontend:user:alice:model:story:detail:2",
+            "taranis_frontend:user:alice:model:story:detail:3",
+            "taranis_frontend:user:alice:model:product:detail:1",
+            "taranis_frontend:user:alice:model:product:detail:2",
+        ]
+    )
+
+    assert service.invalidate_models(["story"], {"story": ["1", "2"]}) == 3
+    assert service.invalidate_models(["product"], {"product": ["1", "2", "3"]}) == 2
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:alice:model:story:detail:3"}
+
+
+def test_invalidate_task_entities_keeps_unrelated_entries(monkeypatch):
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_ENABLED", True)
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_KEY_PREFIX", "taranis_frontend")
+    service = _build_service(
+        [
+            "taranis_frontend:user:alice:model:story:list:one",
+            "taranis_frontend:user:alice:model:story:detail:story-1",
+            "taranis_frontend:user:alice:model:story:detail:story-2",
+            "taranis_frontend:user:alice:model:dashboard:detail:singleton",
+            "taranis_frontend:user:alice:model:bot:detail:bot-1",
+            "taranis_frontend:user:alice:model:bot:detail:bot-2",
+            "taranis_frontend:user:alice:model:admin_menu_badges:detail:singleton",
+            "taranis_frontend:user:alice:model:job:list:default",
+            "taranis_frontend:user:alice:model:queue_status:list:default",
+        ]
+    )
+
+    service.invalidate_task_entities(TaskAffectedEntities(story_ids=["story-1"], bot_ids=["bot-1"], schedule=True))
+
+    assert cached_frontend_keys(service._client) == {
+        "taranis_frontend:user:alice:model:story:detail:story-2",
+        "taranis_frontend:user:alice:model:bot:detail:bot-2",
+        "taranis_frontend:user:alice:model:queue_status:list:default",
+    }
+
+
+def test_invalidate_task_entities_of_bot_result_clears_story_dependent_views(monkeypatch):
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_ENABLED", True)
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_KEY_PREFIX", "taranis_frontend")
+    service = _build_service(
+        [
+            "taranis_frontend:user:alice:model:story:detail:story-1",
+            "taranis_frontend:user:alice:model:news_item:detail:item-1",
+            "taranis_frontend:user:alice:model:news_item:list:one",
+            "taranis_frontend:user:alice:model:story_bookmark:list:one",
+            "taranis_frontend:user:alice:model:filter_lists:detail:singleton",
+            "taranis_frontend:user:alice:model:product:detail:7",
+        ]
+    )
+
+    service.invalidate_task_entities(TaskAffectedEntities(story_ids=["story-1"], bot_ids=["bot-1"]))
+
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:alice:model:product:detail:7"}
 
 
 def test_invalidate_scope_user_views_clears_user_facing_content_models(monkeypatch):
@@ -139,4 +207,68 @@ def test_invalidate_scope_user_views_clears_user_facing_content_models(monkeypat
     deleted = service.invalidate_scope(SCOPE_USER_VIEWS)
 
     assert deleted == 11
-    assert set(service._client.scan_iter(match="*")) == {"taranis_frontend:user:alice:model:asset:list:one"}
+    assert cached_frontend_keys(service._client) == {"taranis_frontend:user:alice:model:asset:list:one"}
+
+
+def test_invalidation_uses_key_indexes_instead_of_scanning(monkeypatch):
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_ENABLED", True)
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_KEY_PREFIX", "taranis_frontend")
+    service = _build_service(
+        [
+            "taranis_frontend:user:alice:model:story:list:one",
+            "taranis_frontend:user:alice:model:story:detail:1",
+            "taranis_frontend:user:@acl-abc:model:osint_source:list:default",
+            "taranis_frontend:user:bob:model:user_profile:profile:self",
+        ]
+    )
+
+    def fail_scan(*args, **kwargs):
+        raise AssertionError("invalidation must not scan the keyspace")
+
+    monkeypatch.setattr(service._client, "scan_iter", fail_scan)
+    monkeypatch.setattr("core.service.cache_invalidation.cache_invalidation_service", service)
+
+    assert invalidate_frontend_cache_on_success(200, scopes=[SCOPE_ASSESS_VIEWS], models=["osint_source"], object_ids={"story": "1"}) == 3
+    assert service.invalidate_user_profile("bob") == 1
+    assert service._client.zrange(build_model_index_key("taranis_frontend", "story"), 0, -1) == []
+    assert service._client.keys("*") == []
+
+
+def test_invalidate_all_clears_indexed_keys_and_keeps_unrelated_keys(monkeypatch):
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_ENABLED", True)
+    monkeypatch.setattr("core.service.cache_invalidation.Config.CACHE_KEY_PREFIX", "taranis_frontend")
+    service = _build_service(
+        [
+            "taranis_frontend:user:alice:model:story:list:one",
+            "taranis_frontend:user:bob:model:product:detail:7",
+        ]
+    )
+    service._client.set("other_app:key", "1")
+
+    assert service.invalidate_all() == 2
+    assert service._client.keys("*") == ["other_app:key"]
+
+
+def test_index_deletion_keeps_members_registered_after_the_read():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    read_key = "taranis_frontend:user:alice:model:story:list:one"
+    concurrent_key = "taranis_frontend:user:bob:model:story:list:one"
+    seed_frontend_cache(client, [read_key])
+    members = client.zrange(build_model_index_key("taranis_frontend", "story"), 0, -1)
+    seed_frontend_cache(client, [concurrent_key])
+
+    assert delete_cache_keys(client, "taranis_frontend", members) == 1
+
+    assert cached_frontend_keys(client) == {concurrent_key}
+    assert client.zrange(build_model_index_key("taranis_frontend", "story"), 0, -1) == [concurrent_key]
+
+
+def test_index_writes_trim_expired_members():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    index_key = build_model_index_key("taranis_frontend", "story")
+    pipeline = client.pipeline()
+    register_cache_key(pipeline, "taranis_frontend", "taranis_frontend:user:alice:model:story:list:old", 300, now=1000.0)
+    register_cache_key(pipeline, "taranis_frontend", "taranis_frontend:user:alice:model:story:list:new", 300, now=2000.0)
+    pipeline.execute()
+
+    assert client.zrange(index_key, 0, -1) == ["taranis_frontend:user:alice:model:story:list:new"]
@@ -0,0 +1,41 @@
+from typing import get_args
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.config import Config
+from core.managers.db_manager import setup_fts
+
+
+def executed_sql(maintenance: str | None) -> list[str]:
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+    conn = engine.begin.return_value.__enter__.return_value
+    setup_fts(engine, maintenance)
+    return [call.args[0].text for call in conn.execute.call_args_list]
+
+
+def test_defaults_to_deferred_maintenance():
+    assert Config.FTS_MAINTENANCE == "deferred"
+    common_sql, maintenance_sql = executed_sql(None)
+
+    assert "DROP TRIGGER IF EXISTS trg_newsitem_refresh_parent_story_vector ON news_item" in common_sql
+    assert "CREATE TRIGGER trg_newsitem_mark_parent_story_dirty" in maintenance_sql
+    assert "DEFERRABLE INITIALLY DEFERRED" in maintenance_sql
+    assert "fts_refresh_parent_story_vector" not in maintenance_sql
+
+
+@pytest.mark.parametrize("maintenance", get_args(Config.model_fields["FTS_MAINTENANCE"].annotation))
+def test_every_maintenance_mode_installs_one_news_item_trigger(maintenance):
+    _common_sql, maintenance_sql = executed_sql(maintenance)
+
+    assert maintenance_sql.count("ON news_item") == 1
+
+
+def test_skipped_on_sqlite():
+    engine = MagicMock()
+    engine.dialect.name = "sqlite"
+
+    setup_fts(engine)
+
+    engine.begin.assert_not_called()
@@ -0,0 +1,41 @@
+from core.model import revision_codec
+
+
+def _snapshot(title: str, content: str = "body") -> dict:
+    return {
+        "id": "story-1",
+        "title": title,
+        "description": "A longer story description. " * 10,
+        "attributes": {"TLP": {"key": "TLP", "value": "clear"}},
+        "news_items": [{"id": "item-1", "title": "Item", "content": content}],
+    }
+
+
+def test_compacted_snapshot_references_news_items_by_digest():
+    compacted, news_items = revision_codec.compact_snapshot(_snapshot("Story"))
+
+    (digest,) = news_items
+    assert compacted["news_items"] == [{"id": "item-1", revision_codec.NEWS_ITEM_REF_KEY: digest}]
+    assert revision_codec.news_item_references(compacted) == {digest}
+    assert revision_codec.expand_snapshot(compacted, news_items) == _snapshot("Story")
+
+
+def test_small_changes_are_stored_as_delta_against_keyframe():
+    keyframe, keyframe_revision, _ = revision_codec.encode(_snapshot("Story"), 1, None)
+    assert keyframe_revision is None
+
+    target = _snapshot("Story/renamed")
+    target["attributes"]["TLP"]["value"] = "amber"
+    del target["id"]
+    stored, keyframe_revision, news_items = revision_codec.encode(target, 2, (1, keyframe))
+
+    assert keyframe_revision == 1
+    assert {operation["path"] for operation in stored} == {"/id", "/title", "/attributes/TLP/value"}
+    assert revision_codec.expand_snapshot(revision_codec.decode(stored, keyframe), news_items) == target
+
+
+def test_keyframes_are_written_periodically_and_for_large_changes():
+    keyframe, _, _ = revision_codec.encode(_snapshot("Story"), 1, None)
+
+    assert revision_codec.encode(_snapshot("Story"), 1 + revision_codec.KEYFRAME_INTERVAL, (1, keyframe))[1] is None
+    assert revision_codec.encode({"title": "x" * 1000}, 2, (1, keyframe))[1] is None
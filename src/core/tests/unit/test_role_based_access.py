@@ -0,0 +1,75 @@
+import os
+
+import fakeredis
+
+from core.managers import auth_cache_manager as auth_cache_module
+from core.managers.auth_cache_manager import AuthCacheManager
+from core.managers.db_manager import db
+from core.model.role import TLPLevel
+from core.model.role_based_access import ItemType, RoleBasedAccess
+from core.model.user import User
+from core.service.role_based_access import AccessContext, RoleBasedAccessService
+
+
+def test_access_context_resolves_wildcards_and_write_access():
+    context = AccessContext(
+        bypasses_acl=False,
+        tlp_level=TLPLevel.CLEAR,
+        enabled_types=frozenset({ItemType.WORD_LIST, ItemType.PRODUCT_TYPE, ItemType.OSINT_SOURCE_GROUP}),
+        readable_ids={
+            ItemType.WORD_LIST: frozenset({"1", "2"}),
+            ItemType.PRODUCT_TYPE: frozenset({"*"}),
+            ItemType.OSINT_SOURCE: frozenset({"s1"}),
+        },
+        writable_ids={ItemType.WORD_LIST: frozenset({"2"})},
+    )
+
+    assert context.accessible_ids(ItemType.WORD_LIST) == {"1", "2"}
+    assert context.allows(ItemType.WORD_LIST, "2", require_write_access=True)
+    assert not context.allows(ItemType.WORD_LIST, "1", require_write_access=True)
+    assert context.accessible_ids(ItemType.PRODUCT_TYPE) is None
+    assert context.accessible_ids(ItemType.REPORT_ITEM_TYPE) is None
+    assert context.allows(ItemType.OSINT_SOURCE, "s1")
+    assert not context.allows(ItemType.OSINT_SOURCE, "s2")
+
+
+def test_bypassing_context_allows_everything():
+    context = AccessContext(bypasses_acl=True, tlp_level=TLPLevel.RED, enabled_types=frozenset(ItemType))
+
+    assert all(context.accessible_ids(item_type, require_write_access=True) is None for item_type in ItemType)
+
+
+def test_access_context_is_cached_until_acls_change(app, monkeypatch):
+    manager = AuthCacheManager()
+    manager._redis = fakeredis.FakeRedis(decode_responses=True)
+    manager._listener_pid = os.getpid()
+    manager._synced.set()
+    monkeypatch.setattr(auth_cache_module, "auth_cache_manager", manager)
+    monkeypatch.setattr("core.service.role_based_access.auth_cache_manager", manager)
+
+    with app.app_context():
+        user = User.find_by_name("user")
+        assert user is not None
+        acl = RoleBasedAccess(
+            name="Cached word list ACL",
+            description="",
+            item_type=ItemType.WORD_LIST,
+            item_id="4711",
+            roles=[role.id for role in user.roles],
+        )
+        db.session.add(acl)
+        db.session.commit()
+
+        try:
+            context = RoleBasedAccessService.get_access_context(user)
+            assert context.accessible_ids(ItemType.WORD_LIST) == {"4711"}
+            assert RoleBasedAccessService.get_access_context(user) is context
+
+            acl.item_id = "*"
+            db.session.commit()
+            assert RoleBasedAccessService.get_access_context(user).accessible_ids(ItemType.WORD_LIST) is None
+        finally:
+            db.session.delete(acl)
+            db.session.commit()
+
+        assert manager.access_contexts == {}
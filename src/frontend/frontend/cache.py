@@ -1,3 +1,4 @@
+import hashlib
 import json
 from typing import Any, TypeVar
 
@@ -5,14 +6,28 @@ from flask import Flask
 from models.base import TaranisBaseModel
 from models.cache_contract import (
     CACHE_DEFAULT_TIMEOUT_DEFAULT,
+    CACHE_INDEX_VERSION,
     CACHE_KEY_PREFIX_DEFAULT,
+    CACHE_SCOPE_PERMISSIONS,
+    build_index_version_key,
+    build_model_detail_index_key,
     build_model_detail_key,
+    build_model_index_key,
+    build_model_list_index_key,
     build_model_list_key,
+    build_namespace_index_key,
     build_namespace_pattern,
+    build_permission_scope,
     build_user_profile_key,
     build_user_profile_pattern,
+    delete_cache_keys,
+    delete_indexed_keys,
     get_secret_value,
+    is_cache_index_key,
+    is_permission_scoped_key,
+    parse_cache_key,
     parse_user_profile_key,
+    register_cache_key,
 )
 from models.user import UserProfile
 from pydantic import ValidationError
@@ -30,6 +45,11 @@ class FrontendCache:
         self.client: Redis | None = None
         self.key_prefix = CACHE_KEY_PREFIX_DEFAULT
         self.default_timeout = CACHE_DEFAULT_TIMEOUT_DEFAULT
+        self.share_by_permissions = True
+        self.hits = {"user": 0, "shared": 0}
+        self.misses = {"user": 0, "shared": 0}
+        self.model_hits: dict[str, int] = {}
+        self.model_misses: dict[str, int] = {}
 
     @property
     def enabled(self) -> bool:
@@ -38,6 +58,7 @@ class FrontendCache:
     def init(self, app: Flask):
         self.key_prefix = app.config["CACHE_KEY_PREFIX"]
         self.default_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+        self.share_by_permissions = app.config.get("CACHE_SHARE_BY_PERMISSIONS", True)
 
         if not app.config.get("CACHE_ENABLED", True):
             self.client = None
@@ -54,6 +75,7 @@ class FrontendCache:
         try:
             self.client = Redis.from_url(redis_url, password=redis_password, decode_responses=True)
             self.client.ping()
+            self.drop_unindexed_keys()
             logger.info("Frontend cache initialized with Redis backend")
         except RedisError, ValueError:
             self.client = None
@@ -64,6 +86,7 @@ class FrontendCache:
             return None
         try:
             raw_value = self.client.get(key)
+            self._record_lookup(key, hit=raw_value is not None)
             if raw_value is None:
                 return None
             return json.loads(raw_value)
@@ -71,13 +94,58 @@ class FrontendCache:
             logger.exception("Failed to read from cache")
             return None
 
+    def _record_lookup(self, key: str, hit: bool) -> None:
+        tier = "shared" if is_permission_scoped_key(key) else "user"
+        counters = self.hits if hit else self.misses
+        counters[tier] += 1
+        if parsed := parse_cache_key(self.key_prefix, key):
+            model_counters = self.model_hits if hit else self.model_misses
+            model_counters[parsed[1]] = model_counters.get(parsed[1], 0) + 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit ratios of this process, overall and per model, and the memory used by the cache namespace."""
+        lookups = {tier: self.hits[tier] + self.misses[tier] for tier in self.hits}
+        total_lookups = sum(lookups.values())
+        model_lookups = {
+            model_name: self.model_hits.get(model_name, 0) + self.model_misses.get(model_name, 0)
+            for model_name in self.model_hits.keys() | self.model_misses.keys()
+        }
+        stats: dict[str, Any] = {
+            "enabled": self.enabled,
+            "share_by_permissions": self.share_by_permissions,
+            "hits": dict(self.hits),
+            "misses": dict(self.misses),
+            "hit_ratio": round(sum(self.hits.values()) / total_lookups, 4) if total_lookups else None,
+            "tier_hit_ratio": {tier: round(self.hits[tier] / count, 4) if count else None for tier, count in lookups.items()},
+            "model_hit_ratio": {
+                model_name: round(self.model_hits.get(model_name, 0) / count, 4) for model_name, count in sorted(model_lookups.items())
+            },
+            "keys": {"user": 0, "shared": 0},
+            "namespace_memory_bytes": {"user": 0, "shared": 0},
+            "redis_used_memory_bytes": None,
+        }
+        if self.client is None:
+            return stats
+        try:
+            for key in self.entry_keys():
+                tier = "shared" if is_permission_scoped_key(key) else "user"
+                stats["keys"][tier] += 1
+                stats["namespace_memory_bytes"][tier] += int(self.client.memory_usage(key) or 0)
+            stats["redis_used_memory_bytes"] = self.client.info("memory").get("used_memory")
+        except RedisError:
+            logger.exception("Failed to read cache memory usage")
+        return stats
+
     def set(self, key: str, value: Any, timeout: int | None = None) -> bool:
         if self.client is None:
             return False
         timeout = self.default_timeout if timeout is None else timeout
         try:
             serialized = json.dumps(value)
-            return bool(self.client.set(name=key, value=serialized, ex=timeout))
+            pipeline = self.client.pipeline(transaction=True)
+            pipeline.set(name=key, value=serialized, ex=timeout)
+            register_cache_key(pipeline, self.key_prefix, key, timeout)
+            return bool(pipeline.execute()[0])
         except RedisError, TypeError, ValueError:
             logger.exception("Failed to write to cache")
             return False
@@ -86,7 +154,7 @@ class FrontendCache:
         if self.client is None:
             return 0
         try:
-            return int(self.client.delete(key))
+            return delete_cache_keys(self.client, self.key_prefix, [key])
         except RedisError:
             logger.exception("Failed to delete cache key")
             return 0
@@ -95,13 +163,43 @@ class FrontendCache:
         if self.client is None:
             return 0
         try:
+            return delete_indexed_keys(self.client, self.key_prefix, [build_namespace_index_key(self.key_prefix)])
+        except RedisError:
+            logger.exception("Failed to clear cache namespace")
+            return 0
+
+    def invalidate_model(self, model_name: str, object_id: str | None = None) -> int:
+        if self.client is None:
+            return 0
+        if object_id is None:
+            index_keys = [build_model_index_key(self.key_prefix, model_name)]
+        else:
+            index_keys = [
+                build_model_detail_index_key(self.key_prefix, model_name, object_id),
+                build_model_list_index_key(self.key_prefix, model_name),
+            ]
+        try:
+            return delete_indexed_keys(self.client, self.key_prefix, index_keys)
+        except RedisError:
+            logger.exception("Failed to invalidate cached model")
+            return 0
+
+    def drop_unindexed_keys(self) -> int:
+        """Remove entries and index sets written before the current index format; they could not be invalidated otherwise."""
+        if self.client is None:
+            return 0
+        version_key = build_index_version_key(self.key_prefix)
+        try:
+            if self.client.get(version_key) == CACHE_INDEX_VERSION:
+                return 0
             keys = self.scan_keys(self.namespace_pattern())
             deleted = 0
             for index in range(0, len(keys), 500):
                 deleted += int(self.client.delete(*keys[index : index + 500]))
+            self.client.set(version_key, CACHE_INDEX_VERSION)
             return deleted
         except RedisError:
-            logger.exception("Failed to clear cache namespace")
+            logger.exception("Failed to drop unindexed cache keys")
             return 0
 
     def scan_keys(self, pattern: str) -> list[str]:
@@ -113,6 +211,36 @@ class FrontendCache:
             logger.exception("Failed to scan cache keys")
             return []
 
+    def entry_keys(self) -> list[str]:
+        return [key for key in self.scan_keys(self.namespace_pattern()) if not is_cache_index_key(self.key_prefix, key)]
+
+    @staticmethod
+    def permission_fingerprint(user: Any) -> str | None:
+        """Hash of everything core uses to filter payloads for a user: roles (ACL and TLP), permissions and organization."""
+        if user is None:
+            return None
+        roles = getattr(user, "roles", None) or []
+        permissions = getattr(user, "permissions", None) or []
+        if not roles and not permissions:
+            return None
+        organization = getattr(user, "organization", None)
+        payload = {
+            "roles": sorted(
+                json.dumps({"id": role.get("id"), "tlp_level": role.get("tlp_level")}, sort_keys=True)
+                if isinstance(role, dict)
+                else str(role)
+                for role in roles
+            ),
+            "permissions": sorted(str(permission) for permission in permissions),
+            "organization": organization.get("id") if isinstance(organization, dict) else organization,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+    def owner_scope(self, model: type[TaranisBaseModel] | TaranisBaseModel, username: str, user: Any = None) -> str:
+        if self.share_by_permissions and model._cache_scope == CACHE_SCOPE_PERMISSIONS and (fingerprint := self.permission_fingerprint(user)):
+            return build_permission_scope(fingerprint)
+        return username
+
     def model_list_key(self, username: str, model_name: str, suffix: str | None) -> str:
         return build_model_list_key(self.key_prefix, username, model_name, suffix)
 
@@ -158,7 +286,7 @@ def remove_user_from_cache(username: str):
 
 
 def get_cache_keys() -> list[str]:
-    return cache.scan_keys(cache.namespace_pattern())
+    return cache.entry_keys()
 
 
 def get_cached_users() -> list[UserProfile]:
@@ -38,7 +38,12 @@ class Settings(BaseSettings):
     TARANIS_BASE_PATH: str = "/"
     SSL_VERIFICATION: bool = False
     REQUESTS_TIMEOUT: int = 60
+    REQUESTS_CONNECT_TIMEOUT: float | None = None
     REQUESTS_TRUST_ENV: bool = True
+    CORE_API_POOL_CONNECTIONS: int = 10
+    CORE_API_POOL_MAXSIZE: int = 20
+    CORE_API_POOL_BLOCK: bool = False
+    CORE_API_HTTP2: bool = False
     CORE_API_KEY: SecretStr = SecretStr("supersecret")
     MAX_CONTENT_LENGTH: int = 50 * 1024 * 1024
     OSINT_SOURCE_ICON_MAX_BYTES: int = 5 * 1024 * 1024
@@ -51,6 +56,7 @@ class Settings(BaseSettings):
     CACHE_ENABLED: bool = CACHE_ENABLED_DEFAULT
     CACHE_DEFAULT_TIMEOUT: int = CACHE_DEFAULT_TIMEOUT_DEFAULT
     CACHE_KEY_PREFIX: str = CACHE_KEY_PREFIX_DEFAULT
+    CACHE_SHARE_BY_PERMISSIONS: bool = True
     CACHE_REDIS_URL: str | None = None
     CACHE_REDIS_PASSWORD: SecretStr | None = None
     REDIS_URL: str = "redis://localhost:6379"
@@ -1,7 +1,10 @@
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from typing import IO, Any, cast
 
 import requests
 from flask import Response, request
+from requests.adapters import HTTPAdapter
 from werkzeug.exceptions import Forbidden, HTTPException
 from werkzeug.wsgi import wrap_file
 
@@ -9,17 +12,92 @@ from frontend.config import Config
 from frontend.log import logger
 
 
+_pooled_session: requests.Session | None = None
+_pooled_session_lock = threading.Lock()
+# Forwarded for streamed downloads, so that browsers can revalidate and seek within rendered products.
+CONDITIONAL_REQUEST_HEADERS = frozenset({"range", "if-range", "if-none-match", "if-modified-since"})
+PROXIED_RESPONSE_HEADERS = frozenset(
+    {"etag", "last-modified", "cache-control", "accept-ranges", "content-range", "content-security-policy", "x-content-type-options"}
+)
+
+
+def _enable_http2() -> None:
+    try:
+        from urllib3.http2 import inject_into_urllib3
+    except ImportError:
+        logger.warning("CORE_API_HTTP2 is enabled but urllib3 HTTP/2 support is not available, falling back to HTTP/1.1")
+        return
+    try:
+        inject_into_urllib3()
+    except ImportError as e:
+        logger.warning(f"CORE_API_HTTP2 is enabled but HTTP/2 could not be enabled ({e}), falling back to HTTP/1.1")
+
+
+def _create_pooled_session() -> requests.Session:
+    if Config.CORE_API_HTTP2:
+        _enable_http2()
+
+    session = requests.Session()
+    session.trust_env = Config.REQUESTS_TRUST_ENV
+    session.verify = Config.SSL_VERIFICATION
+    # The session is shared by all users of this process, so it must never keep cookies from core responses.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=Config.CORE_API_POOL_CONNECTIONS,
+        pool_maxsize=Config.CORE_API_POOL_MAXSIZE,
+        pool_block=Config.CORE_API_POOL_BLOCK,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_pooled_session() -> requests.Session:
+    """Return the process wide keep-alive session used for all calls to core."""
+    global _pooled_session
+    if _pooled_session is None:
+        with _pooled_session_lock:
+            if _pooled_session is None:
+                _pooled_session = _create_pooled_session()
+    return _pooled_session
+
+
+def reset_pooled_session() -> None:
+    global _pooled_session
+    with _pooled_session_lock:
+        if _pooled_session is not None:
+            _pooled_session.close()
+        _pooled_session = None
+
+
+def get_pool_stats() -> dict[str, int]:
+    """Connection reuse counters of the pooled session.
+
+    A hit is a request served on an already open connection, a miss had to open a new one.
+    """
+    stats = {"pools": 0, "requests": 0, "hits": 0, "misses": 0}
+    if _pooled_session is None:
+        return stats
+    adapters = {id(adapter): adapter for adapter in _pooled_session.adapters.values() if isinstance(adapter, HTTPAdapter)}
+    for adapter in adapters.values():
+        for pool_key in list(adapter.poolmanager.pools.keys()):
+            if (pool := adapter.poolmanager.pools.get(pool_key)) is None:
+                continue
+            stats["pools"] += 1
+            stats["requests"] += pool.num_requests
+            stats["misses"] += pool.num_connections
+    stats["hits"] = max(stats["requests"] - stats["misses"], 0)
+    return stats
+
+
 class CoreApi:
     def __init__(self, jwt_token: str | None = None):
-        self.session = requests.Session()
-        self.session.trust_env = Config.REQUESTS_TRUST_ENV
+        self.session = get_pooled_session()
         self.api_url = Config.TARANIS_CORE_URL
         self.jwt_token = self.get_jwt_from_request()
         self.headers = self.get_headers()
-        self.session.headers.update(self.headers)
         self.verify = Config.SSL_VERIFICATION
-        self.session.verify = self.verify
-        self.timeout = Config.REQUESTS_TIMEOUT
+        self.timeout = self.get_timeout()
 
     @staticmethod
     def _extract_forbidden_message(response: requests.Response) -> str:
@@ -32,6 +110,12 @@ class CoreApi:
             message = response.text or message
         return message
 
+    @staticmethod
+    def get_timeout() -> float | tuple[float, float]:
+        if Config.REQUESTS_CONNECT_TIMEOUT is None:
+            return Config.REQUESTS_TIMEOUT
+        return (Config.REQUESTS_CONNECT_TIMEOUT, Config.REQUESTS_TIMEOUT)
+
     def get_headers(self) -> dict[str, str]:
         return {"Authorization": f"Bearer {self.jwt_token}", "Content-type": "application/json"}
 
@@ -54,7 +138,7 @@ class CoreApi:
     def check_if_core_connected(self):
         try:
             url = f"{self.api_url}/isalive"
-            response = self.session.get(url=url, timeout=self.timeout)
+            response = self.session.get(url=url, headers=self.headers, timeout=self.timeout)
             if response.ok and response.json().get("isalive") is True:
                 return True
 
@@ -112,8 +196,11 @@ class CoreApi:
             logger.error(f"Export users failed: {e}")
             return None
 
-    def download_product(self, product_id: str) -> requests.Response:
-        return self.api_download(f"/publish/products/{product_id}/render")
+    def download_product(self, product_id: str, inline: bool = False) -> requests.Response:
+        url = f"{self.api_url}/publish/products/{product_id}/render"
+        headers = self.headers | {name: value for name, value in request.headers.items() if name.lower() in CONDITIONAL_REQUEST_HEADERS}
+        params = {"inline": "true"} if inline else None
+        return self.session.get(url=url, headers=headers, timeout=self.timeout, params=params, stream=True)
 
     def render_product(self, product_id: str) -> requests.Response:
         return self.api_post(f"/publish/products/{product_id}/render")
@@ -268,11 +355,13 @@ class CoreApi:
             cast(IO[bytes], response.raw),
         )
 
+        headers = {"Content-Disposition": disposition}
+        headers |= {name: value for name, value in response.headers.items() if name.lower() in PROXIED_RESPONSE_HEADERS}
         return Response(
             file_wrapper,
             status=response.status_code,
             content_type=response.headers.get("Content-Type", "application/octet-stream"),
-            headers={"Content-Disposition": disposition},
+            headers=headers,
             direct_passthrough=True,
         )
 
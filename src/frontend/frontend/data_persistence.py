@@ -3,9 +3,9 @@ import json
 from typing import Any
 
 from flask import request
-from flask_jwt_extended import get_jwt_identity
+from flask_jwt_extended import get_current_user, get_jwt_identity
 from models.base import T, TaranisBaseModel
-from models.cache_contract import CACHE_DEFAULT_LIST_SUFFIX, build_model_pattern
+from models.cache_contract import CACHE_DEFAULT_LIST_SUFFIX
 from models.dashboard import CoreHealth
 from pydantic import ValidationError
 from requests import Response
@@ -36,6 +36,13 @@ class DataPersistenceLayer:
             identity = None
         return str(identity or "anonymous")
 
+    def get_cache_owner(self, object_model: type[TaranisBaseModel]) -> str:
+        try:
+            user = get_current_user()
+        except RuntimeError:
+            user = None
+        return cache.owner_scope(object_model, self.get_cache_username(), user)
+
     @staticmethod
     def _make_filter_key(filter_data: Any) -> str:
         json_str = json.dumps(filter_data, sort_keys=True, separators=(",", ":"))
@@ -105,10 +112,10 @@ class DataPersistenceLayer:
 
     def make_list_cache_key(self, object_model: type[T], endpoint: str, paging_data: PagingData | None = None) -> str:
         suffix = self._build_list_cache_suffix(endpoint, paging_data)
-        return cache.model_list_key(self.get_cache_username(), object_model._model_name, suffix)
+        return cache.model_list_key(self.get_cache_owner(object_model), object_model._model_name, suffix)
 
     def make_detail_cache_key(self, object_model: type[T], object_id: str | None = None) -> str:
-        return cache.model_detail_key(self.get_cache_username(), object_model._model_name, object_id)
+        return cache.model_detail_key(self.get_cache_owner(object_model), object_model._model_name, object_id)
 
     @staticmethod
     def _deserialize_object(object_model: type[T], payload: dict[str, Any]) -> T:
@@ -175,8 +182,7 @@ class DataPersistenceLayer:
         )
 
     def invalidate_model_cache_locally(self, object_model: TaranisBaseModel | type[TaranisBaseModel], _object_id: str | None = None) -> int:
-        pattern = build_model_pattern(Config.CACHE_KEY_PREFIX, object_model._model_name)
-        return sum(cache.delete(key) for key in cache.scan_keys(pattern))
+        return cache.invalidate_model(object_model._model_name)
 
     def get_objects_by_endpoint(self, object_model: type[T], endpoint: str, paging_data: PagingData | None = None) -> CacheObject[T]:
         cache_key = self.make_list_cache_key(object_model, endpoint, paging_data)
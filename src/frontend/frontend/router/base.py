@@ -3,7 +3,8 @@ from flask.views import MethodView
 from models.assess import FilterLists
 
 from frontend.auth import auth_required, logout
-from frontend.cache import get_cache_keys, get_cached_users
+from frontend.cache import cache, get_cache_keys, get_cached_users
+from frontend.core_api import get_pool_stats
 from frontend.data_persistence import DataPersistenceLayer
 from frontend.omnisearch import build_omnisearch_context, build_omnisearch_navigation, needs_assess_filter_lists
 from frontend.views import AuthView, DashboardView, OnboardingPromptView
@@ -36,6 +37,18 @@ class ListUserCache(MethodView):
         return jsonify(get_cached_users())
 
 
+class CacheStats(MethodView):
+    @auth_required("ADMIN_OPERATIONS")
+    def get(self):
+        return jsonify(cache.stats())
+
+
+class CoreApiPoolStats(MethodView):
+    @auth_required("ADMIN_OPERATIONS")
+    def get(self):
+        return jsonify(get_pool_stats())
+
+
 class LogoutView(MethodView):
     def get(self):
         return logout()
@@ -171,5 +184,7 @@ def init(app: Flask):
     base_bp.add_url_rule("/invalidate_cache/<string:suffix>", view_func=InvalidateCache.as_view("invalidate_cache_suffix"))
     base_bp.add_url_rule("/list_cache_keys", view_func=ListCacheKeys.as_view("list_cache_keys"))
     base_bp.add_url_rule("/list_user_cache", view_func=ListUserCache.as_view("list_user_cache"))
+    base_bp.add_url_rule("/cache_stats", view_func=CacheStats.as_view("cache_stats"))
+    base_bp.add_url_rule("/core_api_pool_stats", view_func=CoreApiPoolStats.as_view("core_api_pool_stats"))
 
     app.register_blueprint(base_bp)
@@ -78,7 +78,8 @@ class ProductView(BaseView):
     def product_download(cls, product_id: str):
         error = "Failed to download product"
         try:
-            core_resp = CoreApi().download_product(product_id)
+            inline = request.args.get("inline", "").lower() == "true"
+            core_resp = CoreApi().download_product(product_id, inline=inline)
             if core_resp.ok:
                 return CoreApi.stream_proxy(core_resp, "products_export")
 
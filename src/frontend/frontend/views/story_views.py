@@ -29,7 +29,7 @@ from werkzeug.datastructures import FileStorage
 from werkzeug.exceptions import HTTPException
 
 from frontend.auth import auth_required, update_current_user_cache
-from frontend.cache import add_model_to_cache, get_model_from_cache
+from frontend.cache import add_model_to_cache, cache, get_model_from_cache
 from frontend.cache_models import CacheObject, PagingData
 from frontend.core_api import CoreApi
 from frontend.data_persistence import DataPersistenceLayer
@@ -174,11 +174,12 @@ class StoryView(BaseView):
     @staticmethod
     def get_filter_lists() -> FilterLists:
         username = getattr(current_user, "username", getattr(current_user, "id", "anonymous"))
-        if filter_lists := get_model_from_cache(FilterLists._model_name, "", username):
+        owner = cache.owner_scope(FilterLists, username, current_user)
+        if filter_lists := get_model_from_cache(FilterLists._model_name, "", owner):
             return FilterLists(**filter_lists)
         if filter_lists_content := CoreApi().get_filter_lists():
             filter_lists = FilterLists(**filter_lists_content)
-            add_model_to_cache(filter_lists, "", username)
+            add_model_to_cache(filter_lists, "", owner)
             return filter_lists
         return FilterLists(tags=[], sources=[], groups=[])
 
@@ -832,8 +833,9 @@ class StoryView(BaseView):
         request_params: dict[str, list[str]],
         selected_story_ids: list[str] | None = None,
     ):
+        story_paging_data = paging_data.model_copy(update={"query_params": {**(paging_data.query_params or {}), "projection": "summary"}})
         try:
-            items = DataPersistenceLayer().get_objects(cls.model, paging_data=paging_data)
+            items = DataPersistenceLayer().get_objects(cls.model, paging_data=story_paging_data)
             error = None if items else f"No {cls.model_name()} items found"
         except ValidationError as exc:
             logger.exception(format_pydantic_errors(exc, cls.model))
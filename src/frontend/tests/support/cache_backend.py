@@ -28,5 +28,61 @@ class InMemoryRedisClient:
         self.store.clear()
         return deleted
 
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        members = self.store.setdefault(key, {})
+        added = len(mapping.keys() - members.keys())
+        members.update(mapping)
+        return added
+
+    def zrem(self, key: str, *members: str) -> int:
+        index = self.store.get(key, {})
+        removed = sum(1 for member in members if index.pop(member, None) is not None)
+        if not index:
+            self.store.pop(key, None)
+        return removed
+
+    def zremrangebyscore(self, key: str, min: float | str, max: float | str) -> int:
+        index = self.store.get(key, {})
+        expired = [member for member, score in index.items() if score <= float(max)]
+        return self.zrem(key, *expired) if expired else 0
+
+    def zrange(self, key: str, start: int, end: int) -> list[str]:
+        members = sorted(self.store.get(key, {}).items(), key=lambda item: item[1])
+        return [member for member, _score in members][start : None if end == -1 else end + 1]
+
+    def expire(self, key: str, time: int, **_kwargs: Any) -> bool:
+        return key in self.store
+
+    def persist(self, key: str) -> bool:
+        return key in self.store
+
+    def pipeline(self, transaction: bool = True) -> InMemoryPipeline:
+        return InMemoryPipeline(self)
+
     def scan_iter(self, match: str, count: int = 1000):
         yield from sorted(key for key in self.store if fnmatch(key, match))
+
+    def memory_usage(self, key: str) -> int | None:
+        value = self.store.get(key)
+        return None if value is None else len(str(value))
+
+    def info(self, section: str | None = None) -> dict[str, Any]:
+        return {"used_memory": sum(len(str(value)) for value in self.store.values())}
+
+
+class InMemoryPipeline:
+    def __init__(self, client: InMemoryRedisClient):
+        self.client = client
+        self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any, **kwargs: Any) -> InMemoryPipeline:
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        results = [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+        self.commands = []
+        return results
@@ -1,4 +1,8 @@
-from models.assess import NewsItem
+from fnmatch import fnmatch
+
+from models.admin import OSINTSource
+from models.assess import NewsItem, Story
+from models.cache_contract import build_model_pattern, build_permission_scope, is_permission_scoped_key
 from models.user import USER_PRODUCT_OVERVIEW_TASK_ID, UserProfile
 
 from frontend.cache import FrontendCache, add_user_to_cache, cache, get_cache_keys, get_cached_users, get_user_from_cache
@@ -47,3 +51,103 @@ def test_user_cache_round_trips_user_profile(app, test_cache_backend):
         assert get_user_from_cache("admin") == cached_user
         assert get_cache_keys() == ["taranis_frontend:user:admin:model:user_profile:profile:self"]
         assert get_cached_users() == [cached_user]
+
+
+def _profile(username: str, role_ids: list[str], permissions: list[str] | None = None) -> UserProfile:
+    return UserProfile(
+        username=username,
+        name=username,
+        organization={"id": "1", "name": "Org"},
+        permissions=permissions or ["CONFIG_ACCESS"],
+        roles=[{"id": role_id, "name": f"Role {role_id}"} for role_id in role_ids],
+    )
+
+
+def test_permission_scoped_models_share_cache_keys_between_equal_permission_sets(app, monkeypatch, test_cache_backend):
+    import frontend.data_persistence as data_persistence_module
+    from frontend.data_persistence import DataPersistenceLayer
+
+    users = {"alice": _profile("alice", ["2", "3"]), "bob": _profile("bob", ["3", "2"]), "carol": _profile("carol", ["2"])}
+
+    def keys_for(username: str) -> tuple[str, str]:
+        monkeypatch.setattr(data_persistence_module, "get_jwt_identity", lambda: username)
+        monkeypatch.setattr(data_persistence_module, "get_current_user", lambda: users[username])
+        persistence = DataPersistenceLayer(jwt_token="token")
+        return (
+            persistence.make_list_cache_key(OSINTSource, OSINTSource._core_endpoint),
+            persistence.make_list_cache_key(Story, Story._core_endpoint),
+        )
+
+    with app.app_context():
+        alice_source_key, alice_story_key = keys_for("alice")
+        bob_source_key, bob_story_key = keys_for("bob")
+        carol_source_key, _ = keys_for("carol")
+
+    assert alice_source_key == bob_source_key
+    assert is_permission_scoped_key(alice_source_key)
+    assert carol_source_key != alice_source_key
+    assert alice_story_key != bob_story_key
+    assert ":user:alice:" in alice_story_key
+    assert fnmatch(alice_source_key, build_model_pattern(cache.key_prefix, OSINTSource._model_name))
+
+
+def test_permission_scope_falls_back_to_username_when_disabled(monkeypatch):
+    local_cache = FrontendCache()
+    monkeypatch.setattr(local_cache, "share_by_permissions", False)
+
+    assert local_cache.owner_scope(OSINTSource, "alice", _profile("alice", ["2"])) == "alice"
+    assert local_cache.owner_scope(OSINTSource, "alice", None) == "alice"
+
+
+def test_cache_stats_report_hit_ratio_per_tier(app, test_cache_backend):
+    with app.app_context():
+        shared_key = cache.model_list_key(build_permission_scope("abc"), OSINTSource._model_name, None)
+        user_key = cache.model_list_key("alice", Story._model_name, None)
+        cache.hits = {"user": 0, "shared": 0}
+        cache.misses = {"user": 0, "shared": 0}
+        cache.model_hits = {}
+        cache.model_misses = {}
+        cache.get(shared_key)
+        cache.set(shared_key, {"items": []})
+        cache.get(shared_key)
+        cache.get(user_key)
+
+        stats = cache.stats()
+
+    assert stats["hits"] == {"user": 0, "shared": 1}
+    assert stats["misses"] == {"user": 1, "shared": 1}
+    assert stats["tier_hit_ratio"] == {"user": 0.0, "shared": 0.5}
+    assert stats["model_hit_ratio"] == {OSINTSource._model_name: 0.5, Story._model_name: 0.0}
+    assert stats["keys"] == {"user": 0, "shared": 1}
+    assert stats["namespace_memory_bytes"]["shared"] > 0
+    assert stats["redis_used_memory_bytes"] > 0
+
+
+def test_model_invalidation_uses_key_indexes(app, monkeypatch, test_cache_backend):
+    with app.app_context():
+        story_key = cache.model_list_key("alice", Story._model_name, None)
+        story_detail_key = cache.model_detail_key("bob", Story._model_name, "story-1")
+        source_key = cache.model_list_key(build_permission_scope("abc"), OSINTSource._model_name, None)
+        for key in (story_key, story_detail_key, source_key):
+            cache.set(key, {"items": []})
+
+        def fail_scan(*args, **kwargs):
+            raise AssertionError("invalidation must not scan the keyspace")
+
+        monkeypatch.setattr(test_cache_backend, "scan_iter", fail_scan)
+
+        assert cache.invalidate_model(Story._model_name, "story-1") == 2
+        assert cache.get(source_key) == {"items": []}
+        assert cache.clear() == 1
+        assert test_cache_backend.store == {}
+
+
+def test_unindexed_keys_are_dropped_once(app, test_cache_backend):
+    with app.app_context():
+        legacy_key = cache.model_list_key("alice", Story._model_name, None)
+        test_cache_backend.set(legacy_key, "{}")
+
+        assert cache.drop_unindexed_keys() == 1
+        cache.set(legacy_key, {"items": []})
+        assert cache.drop_unindexed_keys() == 0
+        assert get_cache_keys() == [legacy_key]
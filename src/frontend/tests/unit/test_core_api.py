@@ -0,0 +1,101 @@
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+
+from frontend.config import Config
+from frontend.core_api import CoreApi, get_pool_stats, get_pooled_session, reset_pooled_session
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"isalive": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "core_session=leaked")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def pooled_session() -> Iterator[None]:
+    reset_pooled_session()
+    yield
+    reset_pooled_session()
+
+
+@pytest.fixture
+def keep_alive_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.usefixtures("pooled_session")
+def test_core_api_instances_share_session_with_per_request_auth(app):
+    responses.add(responses.GET, f"{Config.TARANIS_CORE_URL}/users", json={"items": []})
+
+    with app.test_request_context(headers={"Cookie": f"{Config.JWT_ACCESS_COOKIE_NAME}=token-a"}):
+        first = CoreApi()
+        first.api_get("/users")
+    with app.test_request_context(headers={"Cookie": f"{Config.JWT_ACCESS_COOKIE_NAME}=token-b"}):
+        second = CoreApi()
+        second.api_get("/users")
+
+    assert first.session is second.session is get_pooled_session()
+    assert "Authorization" not in first.session.headers
+    assert [call.request.headers["Authorization"] for call in responses.calls] == ["Bearer token-a", "Bearer token-b"]
+
+
+@pytest.mark.withoutresponses
+@pytest.mark.usefixtures("pooled_session")
+def test_pooled_session_reuses_connections_and_reports_stats(app, keep_alive_server, monkeypatch):
+    monkeypatch.setattr(Config, "TARANIS_CORE_URL", keep_alive_server)
+
+    with app.test_request_context():
+        for _ in range(3):
+            assert CoreApi().check_if_core_connected() is True
+
+    assert get_pool_stats() == {"pools": 1, "requests": 3, "hits": 2, "misses": 1}
+    assert len(get_pooled_session().cookies) == 0
+
+
+def test_pool_stats_are_empty_without_session(pooled_session):
+    assert get_pool_stats() == {"pools": 0, "requests": 0, "hits": 0, "misses": 0}
+
+
+@pytest.mark.usefixtures("pooled_session")
+def test_product_download_forwards_range_and_validator_headers(app):
+    responses.add(
+        responses.GET,
+        f"{Config.TARANIS_CORE_URL}/publish/products/product-1/render",
+        body=b"%PD",
+        status=206,
+        content_type="application/pdf",
+        headers={"ETag": '"digest"', "Accept-Ranges": "bytes", "Content-Range": "bytes 0-2/10", "Content-Disposition": "inline"},
+    )
+
+    with app.test_request_context(headers={"Range": "bytes=0-2", "If-None-Match": '"previous"'}):
+        response = CoreApi.stream_proxy(CoreApi().download_product("product-1", inline=True), "products_export")
+
+    core_request = responses.calls[0].request
+    assert core_request.headers["Range"] == "bytes=0-2"
+    assert core_request.headers["If-None-Match"] == '"previous"'
+    assert core_request.url.endswith("?inline=true")
+    assert response.status_code == 206
+    assert response.headers["ETag"] == '"digest"'
+    assert response.headers["Content-Range"] == "bytes 0-2/10"
+    assert response.headers["Content-Disposition"] == "inline"
@@ -53,7 +53,7 @@ def test_product_view_always_shows_last_publication_section(app, last_published_
         report_items=[],
         supported_reports=[],
         last_published_url=last_published_url,
-        render_result=None,
+        render_digest=None,
         mime_type=None,
     )
 
@@ -108,7 +108,7 @@ def test_product_download_streams_core_response(authenticated_client):
 
         response = authenticated_client.get(f"/product/{product_id}/download")
 
-    core_api_instance.download_product.assert_called_once_with(product_id)
+    core_api_instance.download_product.assert_called_once_with(product_id, inline=False)
     assert response.status_code == core_response.status_code
     assert response.data == expected_content
     assert response.headers["Content-Type"] == headers["Content-Type"]
@@ -666,6 +666,25 @@ def test_assess_search_form_uses_single_htmx_submission_path(authenticated_clien
     assert search_input.get("hx-trigger") is None
 
 
+def test_assess_story_list_requests_summary_projection(authenticated_client, responses_mock):
+    responses_mock.get(
+        f"{Config.TARANIS_CORE_URL}/assess/filter-lists",
+        json={"tags": [], "sources": [], "groups": []},
+    )
+    responses_mock.get(
+        f"{Config.TARANIS_CORE_URL}/assess/stories",
+        json={"items": [], "total_count": 0},
+    )
+
+    response = authenticated_client.get(url_for("assess.assess", search="projection"))
+
+    assert response.status_code == 200
+    story_request = next(call for call in responses_mock.calls if urlparse(call.request.url).path.endswith("/assess/stories"))
+    parsed_query = parse_qs(urlparse(story_request.request.url).query)
+    assert parsed_query["projection"] == ["summary"]
+    assert parsed_query["search"] == ["projection"]
+
+
 def test_story_read_action_replaces_story_card(app):
     story = SimpleNamespace(id="1", read=False, important=False, revision_count=0)
 
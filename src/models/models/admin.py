@@ -137,6 +137,7 @@ class Address(TaranisBaseModel):
 class Organization(TaranisBaseModel):
     _core_endpoint = "/config/organizations"
     _model_name = "organization"
+    _cache_scope = "permissions"
 
     id: str | None = None
     name: str = ""
@@ -147,6 +148,7 @@ class Organization(TaranisBaseModel):
 class Permission(TaranisBaseModel):
     _core_endpoint = "/config/permissions"
     _model_name = "permission"
+    _cache_scope = "permissions"
     id: str | None = None
     code: str | None = None
     name: str
@@ -156,6 +158,7 @@ class Permission(TaranisBaseModel):
 class ACL(TaranisBaseModel):
     _core_endpoint = "/config/acls"
     _model_name = "acl"
+    _cache_scope = "permissions"
     _pretty_name = "ACL"
 
     id: str | None = None
@@ -173,6 +176,7 @@ class ACL(TaranisBaseModel):
 class ParameterValue(TaranisBaseModel):
     _core_endpoint = "/config/parameter-values"
     _model_name = "parameter_value"
+    _cache_scope = "permissions"
     id: str | None = None
     parameter: str = ""
     value: str | None = ""
@@ -181,6 +185,7 @@ class ParameterValue(TaranisBaseModel):
 class Worker(TaranisBaseModel):
     _core_endpoint = "/config/worker-types"
     _model_name = "worker_type"
+    _cache_scope = "permissions"
     _pretty_name = "Worker Type"
 
     id: str | None = None
@@ -194,6 +199,7 @@ class Worker(TaranisBaseModel):
 class Role(TaranisBaseModel):
     _core_endpoint = "/config/roles"
     _model_name = "role"
+    _cache_scope = "permissions"
     _pretty_name = "Role"
 
     id: str | None = None
@@ -206,6 +212,7 @@ class Role(TaranisBaseModel):
 class User(TaranisBaseModel):
     _core_endpoint = "/config/users"
     _model_name = "user"
+    _cache_scope = "permissions"
 
     id: str | None = None
     name: str
@@ -260,6 +267,7 @@ class TaranisConfig(TaranisBaseModel):
 class Settings(TaranisBaseModel):
     _core_endpoint = "/settings/settings"
     _model_name = "settings"
+    _cache_scope = "permissions"
     _pretty_name = "Settings"
     _cache_timeout = 30
     id: str | None = Field(default=None, frozen=True, exclude=True)
@@ -275,6 +283,7 @@ class WordListEntry(TaranisBaseModel):
 class WordList(TaranisBaseModel):
     _core_endpoint = "/config/word-lists"
     _model_name = "word_list"
+    _cache_scope = "permissions"
     _pretty_name = "Word List"
 
     id: str | None = None
@@ -288,6 +297,7 @@ class WordList(TaranisBaseModel):
 class OSINTSource(TaranisBaseModel):
     _core_endpoint = "/config/osint-sources"
     _model_name = "osint_source"
+    _cache_scope = "permissions"
     _pretty_name = "OSINT Source"
 
     id: str | None = None
@@ -315,6 +325,7 @@ class OSINTSourceUpdateModel(TaranisBaseModel):
 class OSINTSourceGroup(TaranisBaseModel):
     _core_endpoint = "/config/osint-source-groups"
     _model_name = "osint_source_group"
+    _cache_scope = "permissions"
     _pretty_name = "OSINT Source Group"
 
     id: str | None = None
@@ -334,6 +345,7 @@ class ProductParameterValue(TaranisBaseModel):
 class ProductType(TaranisBaseModel):
     _core_endpoint = "/config/product-types"
     _model_name = "product_type"
+    _cache_scope = "permissions"
     _pretty_name = "Product Type"
 
     id: str | None = None
@@ -348,6 +360,7 @@ class ProductType(TaranisBaseModel):
 class PublisherPreset(TaranisBaseModel):
     _core_endpoint = "/config/publisher-presets"
     _model_name = "publisher_preset"
+    _cache_scope = "permissions"
     _pretty_name = "Publisher Preset"
 
     id: str | None = None
@@ -382,6 +395,7 @@ class ReportItemAttributeGroup(TaranisBaseModel):
 class ReportItemType(TaranisBaseModel):
     _core_endpoint = "/config/report-item-types"
     _model_name = "report_item_type"
+    _cache_scope = "permissions"
     _pretty_name = "Report Item Type"
 
     id: str | None = None
@@ -393,6 +407,7 @@ class ReportItemType(TaranisBaseModel):
 class Template(TaranisBaseModel):
     _core_endpoint = "/config/templates"
     _model_name = "template"
+    _cache_scope = "permissions"
     _pretty_name = "Template"
 
     id: str
@@ -412,6 +427,7 @@ class AttributeEnum(TaranisBaseModel):
 class Attribute(TaranisBaseModel):
     _core_endpoint = "/config/attributes"
     _model_name = "attribute"
+    _cache_scope = "permissions"
     _pretty_name = "Attribute"
 
     id: str | None = None
@@ -425,6 +441,7 @@ class Attribute(TaranisBaseModel):
 class Bot(TaranisBaseModel):
     _core_endpoint = "/config/bots"
     _model_name = "bot"
+    _cache_scope = "permissions"
     _pretty_name = "Bot"
 
     id: str | None = None
@@ -440,6 +457,7 @@ class Bot(TaranisBaseModel):
 class Connector(TaranisBaseModel):
     _core_endpoint = "/config/connectors"
     _model_name = "connector"
+    _cache_scope = "permissions"
     _pretty_name = "Connector"
 
     id: str | None = None
@@ -463,6 +481,7 @@ class WorkerParameterValue(TaranisBaseModel):
 class WorkerParameter(TaranisBaseModel):
     _core_endpoint = "/config/worker-parameters"
     _model_name = "worker_parameter"
+    _cache_scope = "permissions"
     _pretty_name = "Worker Parameter"
 
     id: str
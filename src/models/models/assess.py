@@ -265,6 +265,7 @@ class AssessSource(TaranisBaseModel):
 class Connector(TaranisBaseModel):
     _core_endpoint = "/assess/connectors"
     _model_name = "connector"
+    _cache_scope = "permissions"
     _pretty_name = "Connector"
 
     id: str | None = None
@@ -276,6 +277,7 @@ class Connector(TaranisBaseModel):
 class FilterLists(TaranisBaseModel):
     _core_endpoint = "/assess/filterlists"
     _model_name = "filter_lists"
+    _cache_scope = "permissions"
     _pretty_name = "Filter Lists"
 
     tags: list[str] = Field(default_factory=list)
@@ -9,6 +9,8 @@ T = TypeVar("T", bound="TaranisBaseModel")
 class TaranisBaseModel(BaseModel):
     _core_endpoint: ClassVar[str]
     _cache_timeout: ClassVar[int]
+    # "permissions" marks payloads that only depend on the requester's roles and may be cached once per permission set.
+    _cache_scope: ClassVar[str] = "user"
     _model_name: ClassVar[str] = ""
     _pretty_name: ClassVar[str] = ""
 
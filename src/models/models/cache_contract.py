@@ -1,3 +1,5 @@
+import time
+from collections.abc import Iterable
 from typing import Any
 
 from models.user import UserProfile
@@ -15,6 +17,13 @@ CACHE_PROFILE_KIND = "profile"
 CACHE_SINGLETON_SUFFIX = "singleton"
 CACHE_DEFAULT_LIST_SUFFIX = "default"
 CACHE_USER_PROFILE_MODEL_NAME = UserProfile._model_name
+CACHE_SCOPE_USER = "user"
+CACHE_SCOPE_PERMISSIONS = "permissions"
+CACHE_PERMISSION_SCOPE_PREFIX = "@acl-"
+CACHE_INDEX_SEGMENT = "index"
+CACHE_INDEX_ALL = "all"
+CACHE_INDEX_VERSION = "2"
+CACHE_INDEX_CHUNK_SIZE = 500
 
 
 def get_secret_value(value: Any) -> str | None:
@@ -32,6 +41,18 @@ def normalize_cache_suffix(value: str | None) -> str:
     return str(value)
 
 
+def build_permission_scope(fingerprint: str) -> str:
+    """Owner segment for entries shared by all users with the same roles and permissions.
+
+    It takes the place of the username, so the user:* invalidation patterns keep matching.
+    """
+    return f"{CACHE_PERMISSION_SCOPE_PREFIX}{fingerprint}"
+
+
+def is_permission_scoped_key(key: str) -> bool:
+    return f":{CACHE_USER_SEGMENT}:{CACHE_PERMISSION_SCOPE_PREFIX}" in key
+
+
 def build_cache_key(prefix: str, username: str, model_name: str, kind: str, suffix: str | None) -> str:
     return f"{prefix}:{CACHE_USER_SEGMENT}:{username}:{CACHE_MODEL_SEGMENT}:{model_name}:{kind}:{normalize_cache_suffix(suffix)}"
 
@@ -68,6 +89,118 @@ def build_user_profile_pattern(prefix: str, username: str = "*") -> str:
     return f"{prefix}:{CACHE_USER_SEGMENT}:{username}:{CACHE_MODEL_SEGMENT}:{CACHE_USER_PROFILE_MODEL_NAME}:{CACHE_PROFILE_KIND}:*"
 
 
+def build_index_prefix(prefix: str) -> str:
+    return f"{prefix}:{CACHE_INDEX_SEGMENT}"
+
+
+def build_namespace_index_key(prefix: str) -> str:
+    return f"{build_index_prefix(prefix)}:{CACHE_INDEX_ALL}"
+
+
+def build_index_version_key(prefix: str) -> str:
+    return f"{build_index_prefix(prefix)}:version"
+
+
+def build_model_index_key(prefix: str, model_name: str) -> str:
+    return f"{build_index_prefix(prefix)}:{CACHE_MODEL_SEGMENT}:{model_name}"
+
+
+def build_model_list_index_key(prefix: str, model_name: str) -> str:
+    return f"{build_model_index_key(prefix, model_name)}:{CACHE_LIST_KIND}"
+
+
+def build_model_detail_index_key(prefix: str, model_name: str, object_id: str) -> str:
+    return f"{build_model_index_key(prefix, model_name)}:{CACHE_DETAIL_KIND}:{object_id}"
+
+
+def is_cache_index_key(prefix: str, key: str) -> bool:
+    return key.startswith(f"{build_index_prefix(prefix)}:")
+
+
+def parse_cache_key(prefix: str, key: str) -> tuple[str, str, str, str] | None:
+    """Split a cache key into owner, model name, kind and suffix."""
+    head = f"{prefix}:{CACHE_USER_SEGMENT}:"
+    if not key.startswith(head):
+        return None
+    owner, separator, model_part = key.removeprefix(head).partition(f":{CACHE_MODEL_SEGMENT}:")
+    parts = model_part.split(":", 2)
+    if not owner or not separator or len(parts) != 3:
+        return None
+    model_name, kind, suffix = parts
+    return owner, model_name, kind, suffix
+
+
+def build_cache_index_keys(prefix: str, key: str) -> tuple[str, ...]:
+    """Index sets a cache key is registered in, mirroring the model, list and detail patterns."""
+    index_keys = [build_namespace_index_key(prefix)]
+    if parsed := parse_cache_key(prefix, key):
+        _owner, model_name, kind, suffix = parsed
+        index_keys.append(build_model_index_key(prefix, model_name))
+        if kind == CACHE_LIST_KIND:
+            index_keys.append(build_model_list_index_key(prefix, model_name))
+        elif kind == CACHE_DETAIL_KIND:
+            index_keys.append(build_model_detail_index_key(prefix, model_name, suffix))
+    return tuple(index_keys)
+
+
+def register_cache_key(pipeline: Any, prefix: str, key: str, timeout: int | None, now: float | None = None) -> None:
+    """Queue the index updates for a cache write on a Redis pipeline.
+
+    Index sets are sorted sets scored by the expiry time of their members. Every write trims the
+    members that expired since, and the index lives at least as long as its longest-lived member,
+    so an entry can't outlive the index it is invalidated through.
+    """
+    now = time.time() if now is None else now
+    expires_at = now + timeout if timeout else float("inf")
+    for index_key in build_cache_index_keys(prefix, key):
+        pipeline.zremrangebyscore(index_key, "-inf", now)
+        pipeline.zadd(index_key, {key: expires_at})
+        if timeout:
+            pipeline.expire(index_key, timeout, nx=True)
+            pipeline.expire(index_key, timeout, gt=True)
+        else:
+            pipeline.persist(index_key)
+
+
+def delete_cache_keys(client: Any, prefix: str, keys: Iterable[str]) -> int:
+    """Delete cache keys and remove exactly them from their index sets, in one transaction.
+
+    Members registered concurrently stay in place, so their entries remain invalidatable.
+    """
+    keys = sorted(set(keys))
+    if not keys:
+        return 0
+    members: dict[str, list[str]] = {}
+    for key in keys:
+        for index_key in build_cache_index_keys(prefix, key):
+            members.setdefault(index_key, []).append(key)
+
+    pipeline = client.pipeline(transaction=True)
+    delete_commands = 0
+    for offset in range(0, len(keys), CACHE_INDEX_CHUNK_SIZE):
+        pipeline.delete(*keys[offset : offset + CACHE_INDEX_CHUNK_SIZE])
+        delete_commands += 1
+    for index_key, index_members in members.items():
+        for offset in range(0, len(index_members), CACHE_INDEX_CHUNK_SIZE):
+            pipeline.zrem(index_key, *index_members[offset : offset + CACHE_INDEX_CHUNK_SIZE])
+    results = pipeline.execute()
+    return sum(int(result) for result in results[:delete_commands])
+
+
+def delete_indexed_keys(client: Any, prefix: str, index_keys: Iterable[str]) -> int:
+    """Delete every cache entry registered in the given index sets, without scanning the keyspace."""
+    index_keys = list(dict.fromkeys(index_keys))
+    if not index_keys:
+        return 0
+    now = time.time()
+    pipeline = client.pipeline(transaction=False)
+    for index_key in index_keys:
+        pipeline.zremrangebyscore(index_key, "-inf", now)
+        pipeline.zrange(index_key, 0, -1)
+    results = pipeline.execute()
+    return delete_cache_keys(client, prefix, set().union(*results[1::2]))
+
+
 def parse_user_profile_key(key: str) -> str | None:
     parts = key.split(":")
     if len(parts) != 7:
@@ -25,6 +25,7 @@ class DashboardHealth(BaseModel):
 class CoreHealth(TaranisBaseModel):
     _core_endpoint = "/health"
     _model_name = "core_health"
+    _cache_scope = "permissions"
     _pretty_name = "Core Health"
     _cache_timeout = 5
 
@@ -59,6 +60,7 @@ class Dashboard(TaranisBaseModel):
 class TrendingCluster(TaranisBaseModel):
     _core_endpoint = "/dashboard/trending-clusters"
     _model_name = "trending_clusters"
+    _cache_scope = "permissions"
     _pretty_name = "Trending Clusters"
 
     name: str
@@ -69,6 +71,7 @@ class TrendingCluster(TaranisBaseModel):
 class Cluster(TaranisBaseModel):
     _core_endpoint = "/dashboard/cluster"
     _model_name = "clusters"
+    _cache_scope = "permissions"
     _pretty_name = "Clusters"
 
     name: str
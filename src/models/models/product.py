@@ -49,6 +49,7 @@ class ProductParameterValue(TaranisBaseModel):
 class ProductType(TaranisBaseModel):
     _core_endpoint = "/publish/product-types"
     _model_name = "product_type"
+    _cache_scope = "permissions"
     _pretty_name = "Product Type"
 
     id: str | None = None
@@ -62,6 +63,7 @@ class ProductType(TaranisBaseModel):
 class PublisherPreset(TaranisBaseModel):
     _core_endpoint = "/publish/publisher-presets"
     _model_name = "publisher_preset"
+    _cache_scope = "permissions"
     _pretty_name = "Publisher Preset"
 
     id: str | None = None
@@ -86,7 +88,7 @@ class Product(TaranisBaseModel):
     report_items: list[str] = Field(default_factory=list)
     last_rendered: datetime | None = None
     last_published_url: str | None = None
-    render_result: str | None = None
+    render_digest: str | None = None
     mime_type: str | None = None
 
     @field_validator("last_published_url", mode="after")
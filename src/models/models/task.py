@@ -44,11 +44,35 @@ class CronTaskSpec(TaranisBaseModel):
         return self
 
 
+class TaskAffectedEntities(TaranisBaseModel):
+    """Entities changed by a task; core invalidates only the frontend cache entries showing them."""
+
+    story_ids: list[str] = Field(default_factory=list)
+    osint_source_ids: list[str] = Field(default_factory=list)
+    bot_ids: list[str] = Field(default_factory=list)
+    product_ids: list[str] = Field(default_factory=list)
+    word_list_ids: list[str] = Field(default_factory=list)
+    schedule: bool = False
+
+    def merge(self, other: "TaskAffectedEntities | None") -> "TaskAffectedEntities":
+        if other is None:
+            return self
+        return TaskAffectedEntities(
+            story_ids=list(dict.fromkeys([*self.story_ids, *other.story_ids])),
+            osint_source_ids=list(dict.fromkeys([*self.osint_source_ids, *other.osint_source_ids])),
+            bot_ids=list(dict.fromkeys([*self.bot_ids, *other.bot_ids])),
+            product_ids=list(dict.fromkeys([*self.product_ids, *other.product_ids])),
+            word_list_ids=list(dict.fromkeys([*self.word_list_ids, *other.word_list_ids])),
+            schedule=self.schedule or other.schedule,
+        )
+
+
 class TaskResultEnvelope(TaranisBaseModel):
     message: str
     reason: str | None = None
     retryable: bool = False
     data: Any = None
+    affected: TaskAffectedEntities | None = Field(default=None, exclude_if=lambda value: value is None)
 
 
 class UserTaskResult(TaranisBaseModel):
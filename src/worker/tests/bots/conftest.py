@@ -1,12 +1,16 @@
 import json
 import os
-import re
 
 import pytest
 
 from worker.config import Config
 
 
+@pytest.fixture(autouse=True)
+def disable_inference_cache(monkeypatch):
+    monkeypatch.setattr(Config, "INFERENCE_CACHE", "")
+
+
 @pytest.fixture(scope="session")
 def stories():
     dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -27,6 +31,11 @@ def story_get_mock(requests_mock, stories):
     yield requests_mock.get(f"{Config.TARANIS_CORE_URL}/worker/stories", json=stories)
 
 
+@pytest.fixture
+def story_page_get_mock(requests_mock, stories):
+    yield requests_mock.get(f"{Config.TARANIS_CORE_URL}/worker/stories", json={"items": stories, "next_cursor": None})
+
+
 @pytest.fixture
 def tags_update_mock(requests_mock):
     yield requests_mock.put(f"{Config.TARANIS_CORE_URL}/worker/tags", json={"message": "Successfully updated news item tags"})
@@ -46,33 +55,11 @@ def ner_bot_mock(requests_mock):
 
 
 @pytest.fixture
-def news_item_attribute_update_mock(requests_mock):
-    def match_callback(request, context):
-        news_item_id = request.url.split("/")[6]
-        return {"message": f"Successfully updated attributes oif news item with id: '{news_item_id}'"}
-
-    yield requests_mock.put(re.compile(rf"{Config.TARANIS_CORE_URL}/bots/news-item/.+/attributes"), json=match_callback)
-
-
-@pytest.fixture
-def story_attribute_update_mock(requests_mock):
-    def match_callback(request, context):
-        story_id = request.url.split("/")[6]
-        return {"message": f"Successfully updated attributes oif news item with id: '{story_id}'"}
-
-    yield requests_mock.patch(re.compile(rf"{Config.TARANIS_CORE_URL}/bots/story/.+/attributes"), json=match_callback)
+def bulk_attribute_update_mock(requests_mock):
+    yield requests_mock.patch(f"{Config.TARANIS_CORE_URL}/bots/attributes", json={"message": "Attributes updated"})
 
 
 @pytest.fixture
 def cybersec_classifier_mock(requests_mock):
     print(f"Mocking: {Config.CYBERSEC_CLASSIFIER_API_ENDPOINT}/")
     yield requests_mock
-
-
-@pytest.fixture
-def story_update_mock(requests_mock):
-    def match_callback(request, context):
-        story_id = request.url.rsplit("/", 1)[-1]
-        return {"message": f"Successfully updated story with id: '{story_id}'"}
-
-    yield requests_mock.put(re.compile(rf"{Config.TARANIS_CORE_URL}/bots/story/.+"), json=match_callback)
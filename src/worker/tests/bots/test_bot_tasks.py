@@ -99,6 +99,14 @@ class TestBotTask:
                 "trigger_dependents": True,
                 "result": bot_execution_result,
             },
+            "affected": {
+                "story_ids": [],
+                "osint_source_ids": [],
+                "bot_ids": ["bot-456"],
+                "product_ids": [],
+                "word_list_ids": [],
+                "schedule": False,
+            },
         }
 
         # Verify return value includes worker metadata
@@ -33,13 +33,31 @@ def test_filter_timefrom_is_forwarded_to_story_query(parameters):
     assert filter_dict["timefrom"] == "2026-07-01T00:00:00"
 
 
-def test_ioc_bot(story_get_mock):
+def test_ioc_bot(story_page_get_mock):
     from worker import bots
 
     ioc_bot = bots.IOCBot()
     ioc_bot.execute()
 
-    assert story_get_mock.call_count == 1
+    assert story_page_get_mock.call_count == 1
+    assert story_page_get_mock.last_request.qs["fields"] == ["news_items.title", "news_items.review", "news_items.content"]
+
+
+def test_iter_stories_follows_cursor_pages(stories, requests_mock):
+    pages_mock = requests_mock.get(
+        f"{Config.TARANIS_CORE_URL}/worker/stories",
+        [
+            {"json": {"items": stories[:1], "next_cursor": "next-page"}},
+            {"json": {"items": stories[1:], "next_cursor": None}},
+        ],
+    )
+
+    story_ids = [story["id"] for story in BaseBot().iter_stories({}, ("title",), page_size=1)]
+
+    assert story_ids == [story["id"] for story in stories]
+    assert pages_mock.call_count == 2
+    assert pages_mock.request_history[1].qs["cursor"] == ["next-page"]
+    assert all(request.qs["fields"] == ["title"] and request.qs["limit"] == ["1"] for request in pages_mock.request_history)
 
 
 def test_analyst_bot_returns_meaningful_result_when_no_stories(monkeypatch):
@@ -84,15 +102,14 @@ def test_nlp_bot_uses_requests_timeout_parameter(story_get_mock, ner_bot_mock):
 
 def test_summary_bot_uses_configured_summary_and_default_title_endpoints(
     stories,
-    story_update_mock,
-    story_attribute_update_mock,
+    bulk_attribute_update_mock,
     requests_mock,
     monkeypatch,
 ):
     from worker import bots
 
     story = {**stories[0], "news_items": [stories[0]["news_items"][0], stories[1]["news_items"][0]]}
-    story_get_mock = requests_mock.get(f"{Config.TARANIS_CORE_URL}/worker/stories", json=[story])
+    story_get_mock = requests_mock.get(f"{Config.TARANIS_CORE_URL}/worker/stories", json={"items": [story], "next_cursor": None})
     requests_mock.post("http://summary-bot.test/summary", json={"summary": "Configured summary"})
     requests_mock.post("http://summary-bot.test/title", json={"title": "Configured title"})
     monkeypatch.setattr(Config, "TITLE_API_ENDPOINT", "http://summary-bot.test/title")
@@ -105,24 +122,22 @@ def test_summary_bot_uses_configured_summary_and_default_title_endpoints(
 
     summary_calls = [req for req in requests_mock.request_history if req.url == "http://summary-bot.test/summary"]
     title_calls = [req for req in requests_mock.request_history if req.url == "http://summary-bot.test/title"]
-    update_calls = [req for req in story_update_mock.request_history if req.method == "PUT"]
 
     assert len(summary_calls) == 1
     assert len(title_calls) == 1
-    assert len(update_calls) == 1
     assert all("news_items" in call.json() for call in summary_calls)
     assert all("news_items" in call.json() for call in title_calls)
     assert all(all(set(item.keys()) == {"title", "content"} for item in call.json()["news_items"]) for call in summary_calls + title_calls)
-    assert all("summary" in call.json() for call in update_calls)
-    assert all("title" in call.json() for call in update_calls)
-    assert story_attribute_update_mock.call_count == 1
+    assert bulk_attribute_update_mock.call_count == 1
+    assert bulk_attribute_update_mock.last_request.json()["stories"] == {
+        story["id"]: {"summary": "Configured summary", "title": "Configured title", "attributes": [{"key": "SUMMARY_BOT", "value": 1}]}
+    }
 
 
 def test_summary_bot_skips_title_generation_when_title_endpoint_is_unset(
     stories,
-    story_get_mock,
-    story_update_mock,
-    story_attribute_update_mock,
+    story_page_get_mock,
+    bulk_attribute_update_mock,
     requests_mock,
 ):
     from worker import bots
@@ -136,23 +151,29 @@ def test_summary_bot_skips_title_generation_when_title_endpoint_is_unset(
     result_msg = summary_bot.execute()
 
     assert result_msg == {"message": f"Summarized {len(stories)} stories"}
-    assert story_get_mock.call_count == 1
+    assert story_page_get_mock.call_count == 1
     summary_calls = [req for req in requests_mock.request_history if req.url == Config.SUMMARY_API_ENDPOINT]
     assert len(summary_calls) == len(stories)
     assert all("news_items" in call.json() for call in summary_calls)
     assert all(all(set(item.keys()) == {"title", "content"} for item in call.json()["news_items"]) for call in summary_calls)
-    assert story_update_mock.call_count == len(stories)
-    assert all(list(call.json().keys()) == ["summary"] for call in story_update_mock.request_history if call.method == "PUT")
-    assert story_attribute_update_mock.call_count >= len(stories)
+    story_updates = {
+        story_id: update for call in bulk_attribute_update_mock.request_history for story_id, update in call.json()["stories"].items()
+    }
+    assert set(story_updates) == {story["id"] for story in stories}
+    assert all(update["summary"] == "Concise story summary" and "title" not in update for update in story_updates.values())
 
 
-def test_cybersec_class_bot(stories, story_get_mock, news_item_attribute_update_mock, story_attribute_update_mock, cybersec_classifier_mock):
+def test_cybersec_class_bot(stories, story_get_mock, bulk_attribute_update_mock, cybersec_classifier_mock):
     from worker import bots
 
-    def extract_attributes(request_json):
-        if isinstance(request_json, dict):
-            return request_json.get("attributes", [])
-        return request_json
+    def story_statuses(requests):
+        return {
+            attribute["value"]
+            for request in requests
+            for update in request.json()["stories"].values()
+            for attribute in update["attributes"]
+            if attribute["key"] == "cybersecurity"
+        }
 
     num_stories = len(stories)
     num_news_items = sum(len(story.get("news_items", [])) for story in stories)
@@ -169,25 +190,17 @@ def test_cybersec_class_bot(stories, story_get_mock, news_item_attribute_update_
     result_msg = cybersec_class_bot.execute()
     assert result_msg == {"message": f"Classified {num_news_items} news items"}
     assert story_get_mock.call_count == 1
-    assert news_item_attribute_update_mock.call_count == num_news_items
-    assert story_attribute_update_mock.call_count == num_stories
-
-    request_json_list = [req.json() for req in story_attribute_update_mock.request_history if req.method == "PATCH"][:num_stories]
-    cybersec_status_list = [
-        d["value"] for attributes_list in request_json_list for d in extract_attributes(attributes_list) if d["key"] == "cybersecurity"
-    ]
-    assert set(cybersec_status_list) == {"no"}
+    first_run = list(bulk_attribute_update_mock.request_history)
+    assert sum(len(request.json()["news_items"]) for request in first_run) == num_news_items
+    assert sum(len(request.json()["stories"]) for request in first_run) == num_stories
+    assert len(first_run) < num_news_items + num_stories
+    assert story_statuses(first_run) == {"no"}
 
     # threshold 0.5 -> all news items classified as yes
     Config.CYBERSEC_CLASSIFIER_THRESHOLD = 0.5
     _ = cybersec_class_bot.execute()
-    request_json_list = [req.json() for req in story_attribute_update_mock.request_history if req.method == "PATCH"][
-        num_stories : 2 * num_stories
-    ]
-    cybersec_status_list = [
-        d["value"] for attributes_list in request_json_list for d in extract_attributes(attributes_list) if d["key"] == "cybersecurity"
-    ]
-    assert set(cybersec_status_list) == {"yes"}
+    second_run = bulk_attribute_update_mock.request_history[len(first_run) :]
+    assert story_statuses(second_run) == {"yes"}
 
     # bot API not reachable -> all news items classified as none
     cybersec_classifier_mock.post(
@@ -198,17 +211,15 @@ def test_cybersec_class_bot(stories, story_get_mock, news_item_attribute_update_
     result_msg = cybersec_class_bot.execute()
 
     assert result_msg == {"message": "Classified 0 news items"}
-    request_json_list = [req.json() for req in story_attribute_update_mock.request_history if req.method == "PATCH"][2 * num_stories :]
-    cybersec_status_list = [
-        d["value"] for attributes_list in request_json_list for d in extract_attributes(attributes_list) if d["key"] == "cybersecurity"
-    ]
-    assert set(cybersec_status_list) == {"none"}
+    third_run = bulk_attribute_update_mock.request_history[len(first_run) + len(second_run) :]
+    assert all(not request.json()["news_items"] for request in third_run)
+    assert story_statuses(third_run) == {"none"}
 
 
 def test_sentiment_analysis_bot_accepts_flat_response_and_normalizes_label(
     stories,
     story_get_mock,
-    news_item_attribute_update_mock,
+    bulk_attribute_update_mock,
     requests_mock,
 ):
     from worker import bots
@@ -223,11 +234,14 @@ def test_sentiment_analysis_bot_accepts_flat_response_and_normalizes_label(
 
     assert result_msg == {"message": "Sentiment analysis complete"}
     assert story_get_mock.call_count == 1
-    assert news_item_attribute_update_mock.call_count > 0
+    assert bulk_attribute_update_mock.call_count > 0
 
-    request_json_list = [req.json() for req in news_item_attribute_update_mock.request_history if req.method == "PUT"]
     sentiment_categories = [
-        attr["value"] for payload in request_json_list for attr in payload.get("attributes", []) if attr["key"] == "sentiment_category"
+        attr["value"]
+        for request in bulk_attribute_update_mock.request_history
+        for attributes in request.json()["news_items"].values()
+        for attr in attributes
+        if attr["key"] == "sentiment_category"
     ]
     assert sentiment_categories
     assert set(sentiment_categories) == {"neutral"}
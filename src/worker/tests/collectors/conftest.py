@@ -71,7 +71,12 @@ def web_collector_url_mock(requests_mock):
 
 
 @pytest.fixture
-def collectors_mock(requests_mock, osint_source_update_mock, news_item_upload_mock):
+def known_news_items_mock(requests_mock):
+    yield requests_mock.post(f"{Config.TARANIS_CORE_URL}/worker/news-items/known", json={"hashes": []})
+
+
+@pytest.fixture
+def collectors_mock(requests_mock, osint_source_update_mock, news_item_upload_mock, known_news_items_mock):
     icon_endpoint = re.compile(rf"{re.escape(Config.TARANIS_CORE_URL)}/worker/osint-sources/[^/]+/icon$")
     requests_mock.put(icon_endpoint, json={})
 
@@ -119,7 +124,7 @@ def browser_web_collector_mock(monkeypatch) -> MagicMock:
     mock_manager.fetch_content_with_js.return_value = html, "Tue, 11 Aug 2026 09:07:03 GMT"
     mock_manager.stop_playwright_if_needed.return_value = None
 
-    def fake_playwright_manager_ctor(proxies, headers):
+    def fake_playwright_manager_ctor(proxies, headers, max_pages):
         mock_manager.request_headers = headers
         return mock_manager
 
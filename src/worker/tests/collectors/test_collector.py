@@ -63,6 +63,34 @@ def test_rss_collector(rss_collector_mock, rss_collector):
     assert result is None
 
 
+def test_rss_collector_skips_known_entries(rss_collector_mock, rss_collector, requests_mock):
+    from tests.testdata import rss_collector_source_data, rss_collector_targets
+
+    known_news_items_mock = requests_mock.post(
+        f"{Config.TARANIS_CORE_URL}/worker/news-items/known", json=lambda request, context: {"hashes": request.json()["hashes"][:2]}
+    )
+
+    rss_collector.collect(rss_collector_source_data)
+
+    assert len(known_news_items_mock.last_request.json()["hashes"]) == 3
+    fetched_urls = {request.url for request in requests_mock.request_history}
+    assert rss_collector_targets[2] in fetched_urls
+    assert not fetched_urls & set(rss_collector_targets[:2])
+    assert [news_item.link for news_item in rss_collector.news_items] == [rss_collector_targets[2]]
+
+
+def test_rss_collector_raises_no_change_when_all_entries_are_known(rss_collector_mock, rss_collector, requests_mock):
+    from tests.testdata import rss_collector_source_data
+    from worker.collectors.base_web_collector import NoChangeError
+
+    requests_mock.post(
+        f"{Config.TARANIS_CORE_URL}/worker/news-items/known", json=lambda request, context: {"hashes": request.json()["hashes"]}
+    )
+
+    with pytest.raises(NoChangeError, match="All news items were skipped"):
+        rss_collector.collect(rss_collector_source_data)
+
+
 def test_rss_collector_get_feed(rss_collector_mock, rss_collector):
     from tests.testdata import (
         rss_collector_source_data_no_content,
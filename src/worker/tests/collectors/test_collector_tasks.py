@@ -91,6 +91,36 @@ def test_collector_task_no_change_persists_not_modified_status(current_job, requ
     }
 
 
+def test_collector_task_success_reports_published_stories_as_affected(current_job, requests_mock, monkeypatch):
+    source = {"id": "source-1", "name": "Source 1", "type": "rss_collector", "parameters": {}}
+
+    class FakeCollector:
+        name = "RSS Collector"
+        published_story_ids: list[str] = []
+
+        def collect(self, source_data, manual):
+            self.published_story_ids.extend(["story-1", "story-2"])
+            return "2 News items added successfully"
+
+    monkeypatch.setattr(collector_tasks.Collector, "get_source", lambda self, osint_source_id: source)
+    monkeypatch.setattr(collector_tasks.Collector, "get_collector", lambda self, source_data: FakeCollector())
+    requests_mock.put(f"{Config.TARANIS_CORE_URL}/worker/post-collection-bots", json={"message": "queued"})
+    requests_mock.post(f"{Config.TARANIS_CORE_URL}/tasks", json={"message": "saved"})
+
+    collector_tasks.collector_task("source-1", False)
+
+    post_calls = [req for req in requests_mock.request_history if req.method == "POST" and req.url.endswith("/tasks")]
+    assert post_calls[0].json()["status"] == "SUCCESS"
+    assert post_calls[0].json()["result"]["affected"] == {
+        "story_ids": ["story-1", "story-2"],
+        "osint_source_ids": ["source-1"],
+        "bot_ids": [],
+        "product_ids": [],
+        "word_list_ids": [],
+        "schedule": False,
+    }
+
+
 def test_empty_rss_feed_result_is_preserved_after_not_modified_response(current_job, requests_mock, monkeypatch):
     feed_url = "https://example.com/feed"
     empty_feed = "<rss version='2.0'><channel><title>Empty</title><link>https://example.com/</link></channel></rss>"
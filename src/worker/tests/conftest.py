@@ -45,7 +45,7 @@ class FakeQueue:
         self.name = name
         self.connection = connection
 
-    def enqueue(self, task, *args, job_id=None, **kwargs):
+    def enqueue(self, task, *args, job_id=None, pipeline=None, **kwargs):
         type(self).enqueued_calls.append(
             {
                 "task": task,
@@ -0,0 +1,107 @@
+"""Compare a polling scheduler cycle against the cached, event-driven one.
+
+python -m tests.cron_scheduler_load_testing [SPEC_COUNT] [DUE_COUNT]
+
+Uses an in-process Redis fake unless BENCHMARK_REDIS_URL is set (its database is flushed).
+With a real server the batched drain also saves one network round trip per job.
+"""
+
+import json
+import os
+import sys
+import time
+
+import fakeredis
+from redis import Redis
+from rq import Queue
+
+from worker.cron_scheduler import (
+    DEFS_KEY,
+    NEXT_KEY,
+    CronSpecCache,
+    _decode,
+    _enqueue_due_job,
+    _sync_next_index,
+    drain_due_jobs,
+    seconds_until_next_due,
+)
+
+
+def redis_client() -> Redis:
+    if redis_url := os.getenv("BENCHMARK_REDIS_URL"):
+        return Redis.from_url(redis_url, decode_responses=False)
+    return fakeredis.FakeRedis(decode_responses=False)
+
+
+def register_specs(redis: Redis, spec_count: int, now_ts: float) -> None:
+    redis.flushdb()
+    specs = {
+        f"osint_source_{index}": json.dumps(
+            {
+                "queue_name": "collectors",
+                "func_path": "collector_task",
+                "interval": 3600,
+                "args": [f"source-{index}", False],
+                "meta": {"name": f"Collector: source {index}"},
+            }
+        )
+        for index in range(spec_count)
+    }
+    redis.hset(DEFS_KEY, mapping=specs)
+    redis.zadd(NEXT_KEY, {job_id: now_ts + 600 + index for index, job_id in enumerate(specs)})
+
+
+def make_due(redis: Redis, due_count: int, now_ts: float) -> None:
+    job_ids = [_decode(job_id) for job_id in redis.zrange(NEXT_KEY, 0, due_count - 1)]
+    redis.zadd(NEXT_KEY, dict.fromkeys(job_ids, now_ts - 1))
+
+
+def polling_cycle(redis: Redis, queues: dict[str, Queue], now_ts: float) -> None:
+    """One poll of the previous scheduler loop: full reload, then one round trip per due job."""
+    specs = _sync_next_index(redis, now_ts)
+    for raw_job_id in redis.zrangebyscore(NEXT_KEY, min=0, max=now_ts, start=0, num=100):
+        job_id = _decode(raw_job_id)
+        due_ts = float(redis.zscore(NEXT_KEY, job_id) or now_ts)
+        _enqueue_due_job(redis, queues, job_id, specs[job_id], due_ts)
+
+
+def measure(label: str, func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<48} {elapsed * 1000:10.2f} ms")
+    return elapsed
+
+
+def run(spec_count: int, due_count: int) -> None:
+    redis = redis_client()
+    queues: dict[str, Queue] = {}
+    now_ts = time.time()
+    register_specs(redis, spec_count, now_ts)
+    print(f"{spec_count} registered specs, {due_count} due jobs")
+
+    idle_poll = measure("idle poll cycle", lambda: polling_cycle(redis, queues, now_ts), 5)
+    spec_cache = CronSpecCache(redis, full_sync_interval_seconds=300)
+    measure("full spec cache sync (start and every 5 min)", lambda: spec_cache.full_sync(now_ts), 1)
+
+    def idle_wake_up():
+        drain_due_jobs(redis, queues, spec_cache, now_ts, retry_delay_seconds=15)
+        spec_cache.wait_for_changes(min(seconds_until_next_due(redis, 15), 0.001))
+
+    idle_cached = measure("idle wake-up with cached specs", idle_wake_up, 5)
+    print(f"idle speedup: {idle_poll / idle_cached:.0f}x")
+
+    make_due(redis, due_count, now_ts)
+    cycles = -(-due_count // 100)
+    poll_drain = measure(f"drain by polling ({cycles} poll cycles)", lambda: [polling_cycle(redis, queues, now_ts) for _ in range(cycles)], 1)
+    make_due(redis, due_count, now_ts)
+    batch_drain = measure("batched drain", lambda: drain_due_jobs(redis, queues, spec_cache, now_ts, retry_delay_seconds=15), 1)
+    print(f"drain speedup: {poll_drain / batch_drain:.1f}x (polling also waits CRON_POLL_INTERVAL_SECONDS between cycles)")
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1_000,
+    )
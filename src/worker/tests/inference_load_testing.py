@@ -0,0 +1,87 @@
+"""Measure InferenceClient throughput against a local stub model endpoint with artificial latency.
+
+python -m tests.inference_load_testing [ITEM_COUNT] [LATENCY_SECONDS]
+
+The stub answers {"text": ...} with one result and {"batch": [...]} with one result per input,
+paying the latency once per request like a model server running a batch in one forward pass.
+Compares one item per request sequentially with parallel requests, batching and both combined.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from worker.inference_client import InferenceClient
+
+
+class StubModelServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float):
+        super().__init__(("127.0.0.1", 0), StubModelHandler)
+        self.latency = latency
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubModelHandler(BaseHTTPRequestHandler):
+    server: StubModelServer
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        time.sleep(self.server.latency)
+        if "batch" in payload:
+            result = [self.classify(item) for item in payload["batch"]]
+        else:
+            result = self.classify(payload)
+        body = json.dumps(result).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def classify(item: dict) -> dict:
+        return {"label": "cybersecurity" if "vulnerability" in item["text"] else "other"}
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(item_count: int, latency: float) -> None:
+    server = StubModelServer(latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    payloads = [{"text": f"Item {index} about a vulnerability" if index % 2 else f"Item {index}"} for index in range(item_count)]
+    expected = [StubModelHandler.classify(payload) for payload in payloads]
+
+    def infer(label: str, batch_size: int, max_parallel_requests: int) -> float:
+        client = InferenceClient(server.base_url, batch_size=batch_size, max_parallel_requests=max_parallel_requests)
+        start = time.perf_counter()
+        results = client.infer_many("/", payloads)
+        elapsed = time.perf_counter() - start
+        assert results == expected
+        metrics = client.metrics.as_dict()
+        print(f"{label:<40} {elapsed:8.2f} s {item_count / elapsed:8.1f} items/s   requests: {metrics['requests']}")
+        return elapsed
+
+    print(f"{item_count} items, {latency:.2f}s latency per request")
+    sequential = infer("sequential", 1, 1)
+    parallel = infer("MAX_PARALLEL_REQUESTS=4", 1, 4)
+    batched = infer("BATCH_SIZE=16", 16, 1)
+    combined = infer("BATCH_SIZE=16, MAX_PARALLEL_REQUESTS=4", 16, 4)
+    print(f"speedup: {sequential / parallel:.1f}x parallel, {sequential / batched:.1f}x batched, {sequential / combined:.1f}x both")
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 128,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.05,
+    )
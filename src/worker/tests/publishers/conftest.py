@@ -48,8 +48,8 @@ class RecordingCoreApi:
         self.seen["publisher_id"] = publisher_id
         return self.publisher
 
-    def get_product_render(self, product_id):
-        self.seen["render_product_id"] = product_id
+    def get_artifact(self, digest, mime_type=None):
+        self.seen["render_digest"] = digest
         return self.rendered_product
 
     def api_put(self, url: str, json_data=None):
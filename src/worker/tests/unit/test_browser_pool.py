@@ -0,0 +1,124 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from worker.collectors import browser_pool
+from worker.config import Config
+
+
+FAKE_BROWSER = """import http.server
+import pathlib
+import sys
+
+user_data_dir = next(arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--user-data-dir="))
+
+
+class DevToolsHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = http.server.HTTPServer(("127.0.0.1", 0), DevToolsHandler)
+pathlib.Path(user_data_dir, "DevToolsActivePort").write_text(f"{server.server_address[1]}\\n/devtools/browser/fake")
+server.serve_forever()
+"""
+
+
+@pytest.fixture
+def fake_browser(tmp_path, monkeypatch):
+    script = tmp_path / "fake_browser.py"
+    script.write_text(FAKE_BROWSER)
+    executable = tmp_path / "fake-browser"
+    executable.write_text(f'#!/bin/sh\nexec {sys.executable} {script} "$@"\n')
+    executable.chmod(0o755)
+    monkeypatch.setattr(Config, "BROWSER_POOL_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "BROWSER_POOL_MAX_PAGES", 10)
+    monkeypatch.setenv(browser_pool.OWNER_ENV, "test")
+    yield str(executable)
+    browser_pool.shutdown()
+
+
+def browser_pid() -> int:
+    with browser_pool._locked_state() as state:
+        return state["pid"]
+
+
+def test_browser_is_reused_until_recycling_limit(fake_browser):
+    endpoint = browser_pool.acquire(fake_browser)
+    pid = browser_pid()
+
+    browser_pool.release(4)
+    assert browser_pool.acquire(fake_browser) == endpoint
+
+    browser_pool.release(6)
+    assert browser_pool.acquire(fake_browser) != endpoint
+    assert browser_pid() != pid
+    assert not browser_pool._is_running(pid)
+
+
+def test_unhealthy_browser_is_restarted(fake_browser):
+    endpoint = browser_pool.acquire(fake_browser)
+    pid = browser_pid()
+    os.killpg(pid, 9)
+    os.waitpid(pid, 0)
+
+    assert browser_pool.acquire(fake_browser) != endpoint
+
+
+def test_shutdown_stops_browser(fake_browser):
+    browser_pool.acquire(fake_browser)
+    pid = browser_pid()
+
+    browser_pool.shutdown()
+
+    assert not browser_pool._is_running(pid)
+    assert not browser_pool._state_path().exists()
+
+
+def playwright_browsers(tmp_path, *binaries: str) -> str:
+    for binary in binaries:
+        path = tmp_path / binary
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    return str(tmp_path / "chromium-1200" / "chrome-linux64" / "chrome")
+
+
+def test_headless_shell_is_started_when_only_the_shell_is_installed(tmp_path):
+    executable_path = playwright_browsers(tmp_path, "chromium_headless_shell-1200/chrome-headless-shell-linux64/chrome-headless-shell")
+
+    assert browser_pool.resolve_executable(executable_path) == str(
+        tmp_path / "chromium_headless_shell-1200" / "chrome-headless-shell-linux64" / "chrome-headless-shell"
+    )
+
+
+def test_full_browser_is_started_without_headless_shell(tmp_path):
+    executable_path = playwright_browsers(tmp_path, "chromium-1200/chrome-linux64/chrome")
+
+    assert browser_pool.resolve_executable(executable_path) == executable_path
+
+
+def test_missing_browser_is_reported(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        browser_pool.resolve_executable(playwright_browsers(tmp_path))
+
+
+def test_browser_is_launched_per_run_when_pool_cannot_start(tmp_path, monkeypatch):
+    from worker.collectors.playwright_manager import PlaywrightManager
+
+    playwright = MagicMock()
+    playwright.chromium.executable_path = playwright_browsers(tmp_path)
+    playwright.chromium.launch = AsyncMock(return_value="browser")
+    monkeypatch.setattr(Config, "BROWSER_POOL", True)
+    monkeypatch.setattr(Config, "BROWSER_POOL_DIR", str(tmp_path))
+    manager = PlaywrightManager()
+
+    assert asyncio.run(manager._connect(playwright)) == "browser"
+    assert manager.pooled is False
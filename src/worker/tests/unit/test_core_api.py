@@ -1,3 +1,5 @@
+import hashlib
+
 from worker.config import Config
 from worker.core_api import CoreApi
 
@@ -25,3 +27,54 @@ def test_run_post_collection_bots_forwards_current_job_user(requests_mock, monke
 
     assert result == {"message": "scheduled"}
     assert requests_mock.request_history[0].json() == {"source_id": "source-1", "user_id": "user-1"}
+
+
+def test_attribute_update_buffer_merges_and_flushes_in_bulk(requests_mock):
+    bulk_mock = requests_mock.patch(
+        f"{Config.TARANIS_CORE_URL}/bots/attributes",
+        [{"json": {"message": "Attributes updated"}}, {"status_code": 207, "json": {"errors": {"story-2": "Story not found"}}}],
+    )
+
+    with CoreApi().attribute_update_buffer(max_size=2) as updates:
+        updates.add_news_item_attributes("item-1", [{"key": "sentiment_category", "value": "neutral"}])
+        updates.add_news_item_attributes("item-1", [{"key": "sentiment_score", "value": "0.5"}])
+        updates.add_story_attributes("story-1", [{"key": "SUMMARY_BOT", "value": 1}])
+        updates.update_story("story-2", summary="Summary")
+
+    assert bulk_mock.call_count == 2
+    assert bulk_mock.request_history[0].json() == {
+        "news_items": {"item-1": [{"key": "sentiment_category", "value": "neutral"}, {"key": "sentiment_score", "value": "0.5"}]},
+        "stories": {"story-1": {"attributes": [{"key": "SUMMARY_BOT", "value": 1}]}},
+    }
+    assert bulk_mock.request_history[1].json() == {"news_items": {}, "stories": {"story-2": {"summary": "Summary"}}}
+    assert updates.failed == {"story-2": "Story not found"}
+
+
+def test_upload_artifact_sends_raw_bytes_once(requests_mock):
+    data = b"%PDF-1.7 rendered report"
+    digest = hashlib.sha256(data).hexdigest()
+    artifact_url = f"{Config.TARANIS_CORE_URL}/worker/artifacts"
+    head_mock = requests_mock.head(f"{artifact_url}/{digest}", [{"status_code": 404}, {"status_code": 200}])
+    upload_mock = requests_mock.post(artifact_url, status_code=201, json={"digest": digest, "size": len(data)})
+
+    assert CoreApi().upload_artifact(data) == digest
+    assert CoreApi().upload_artifact(data) == digest
+
+    assert head_mock.call_count == 2
+    assert upload_mock.call_count == 1
+    assert upload_mock.last_request.body == data
+    assert upload_mock.last_request.headers["Content-Type"] == "application/octet-stream"
+
+
+def test_get_artifact_verifies_digest(requests_mock):
+    data = b"rendered report"
+    digest = hashlib.sha256(data).hexdigest()
+    requests_mock.get(f"{Config.TARANIS_CORE_URL}/worker/artifacts/{digest}", content=data)
+    requests_mock.get(f"{Config.TARANIS_CORE_URL}/worker/artifacts/{'0' * 64}", content=data)
+
+    artifact = CoreApi().get_artifact(digest, "application/pdf")
+
+    assert artifact is not None
+    assert artifact.data == data
+    assert artifact.mime_type == "application/pdf"
+    assert CoreApi().get_artifact("0" * 64) is None
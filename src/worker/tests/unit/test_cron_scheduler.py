@@ -5,9 +5,28 @@ import fakeredis
 import pytest
 from models.task import CronTaskSpec
 from pydantic import ValidationError
+from redis.client import Pipeline
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from worker import cron_scheduler
-from worker.cron_scheduler import DEFS_KEY, NEXT_KEY, _decode, _enqueue_due_job, _enqueue_key, _normalize_spec, _sync_next_index
+from worker.cron_scheduler import (
+    DEFS_KEY,
+    DUE_BATCH_SIZE,
+    EVENTS_KEY,
+    NEXT_KEY,
+    CronSpecCache,
+    _decode,
+    _enqueue_due_job,
+    _enqueue_key,
+    _normalize_spec,
+    _sync_next_index,
+    drain_due_jobs,
+    seconds_until_next_due,
+)
+
+
+def _interval_spec(interval: int = 30) -> str:
+    return json.dumps({"queue_name": "misc", "func_path": "cleanup_token_blacklist", "interval": interval})
 
 
 def test_cron_task_spec_rejects_missing_required_fields():
@@ -161,3 +180,60 @@ def test_enqueue_due_job_skips_missing_func_path_without_crashing(monkeypatch: p
     assert rq_job_id is None
     assert fake_queue.enqueued_calls == []
     assert redis_conn.zscore(NEXT_KEY, "job-invalid") is not None
+
+
+def test_spec_cache_applies_definition_events_without_full_reload():
+    redis_conn = fakeredis.FakeRedis(decode_responses=False)
+    redis_conn.hset(DEFS_KEY, "job_a", _interval_spec(30))
+    redis_conn.xadd(EVENTS_KEY, {"op": "upsert", "job_id": "job_a"})
+    spec_cache = CronSpecCache(redis_conn, full_sync_interval_seconds=300)
+    spec_cache.full_sync(1000.0)
+
+    assert not spec_cache.needs_full_sync
+    assert spec_cache.wait_for_changes(0.01) == set()
+
+    redis_conn.hset(DEFS_KEY, "job_a", _interval_spec(60))
+    redis_conn.hset(DEFS_KEY, "job_b", _interval_spec(45))
+    redis_conn.hdel(DEFS_KEY, "job_a")
+    redis_conn.xadd(EVENTS_KEY, {"op": "upsert", "job_id": "job_b"})
+    redis_conn.xadd(EVENTS_KEY, {"op": "delete", "job_id": "job_a"})
+
+    assert spec_cache.wait_for_changes(0.01) == {"job_a", "job_b"}
+    assert set(spec_cache.specs) == {"job_b"}
+    assert spec_cache.specs["job_b"]["interval"] == 45
+
+
+def test_drain_due_jobs_enqueues_batches_and_skips_missed_runs(monkeypatch: pytest.MonkeyPatch, fake_queue: Any):
+    redis_conn = fakeredis.FakeRedis(decode_responses=False)
+    monkeypatch.setattr(cron_scheduler, "Queue", fake_queue)
+    job_count = DUE_BATCH_SIZE + 5
+    for index in range(job_count):
+        redis_conn.hset(DEFS_KEY, f"job_{index}", _interval_spec(60))
+        redis_conn.zadd(NEXT_KEY, {f"job_{index}": 100.0})
+    redis_conn.zadd(NEXT_KEY, {"removed_job": 100.0, "future_job": 5000.0})
+    spec_cache = CronSpecCache(redis_conn, full_sync_interval_seconds=300)
+
+    enqueued = drain_due_jobs(redis_conn, {}, spec_cache, now_ts=1000.0, retry_delay_seconds=15)
+
+    assert len(enqueued) == job_count
+    assert len(fake_queue.enqueued_calls) == job_count
+    assert {call["job_id"] for call in fake_queue.enqueued_calls} == {f"cron_job_{index}_100" for index in range(job_count)}
+    assert redis_conn.zscore(NEXT_KEY, "job_0") == 1060.0
+    assert redis_conn.zscore(NEXT_KEY, "removed_job") is None
+    assert seconds_until_next_due(redis_conn, 15) == 0.0
+
+
+def test_drain_due_jobs_keeps_jobs_due_when_the_pipeline_fails(monkeypatch: pytest.MonkeyPatch, fake_queue: Any):
+    redis_conn = fakeredis.FakeRedis(decode_responses=False)
+    monkeypatch.setattr(cron_scheduler, "Queue", fake_queue)
+    redis_conn.hset(DEFS_KEY, "job_a", _interval_spec(60))
+    redis_conn.zadd(NEXT_KEY, {"job_a": 100.0})
+    spec_cache = CronSpecCache(redis_conn, full_sync_interval_seconds=300)
+
+    def fail_execute(self, raise_on_error: bool = True):
+        raise RedisConnectionError("connection lost")
+
+    monkeypatch.setattr(Pipeline, "execute", fail_execute)
+
+    assert drain_due_jobs(redis_conn, {}, spec_cache, now_ts=1000.0, retry_delay_seconds=15) == []
+    assert redis_conn.zscore(NEXT_KEY, "job_a") == 100.0
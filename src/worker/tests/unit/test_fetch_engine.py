@@ -0,0 +1,52 @@
+import threading
+import time
+
+from worker.collectors.fetch_engine import FetchEngine, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_after_429_is_retried(requests_mock):
+    url = "https://example.com/article"
+    requests_mock.get(url, [{"status_code": 429, "headers": {"Retry-After": "0"}}, {"text": "article"}])
+
+    response = FetchEngine().get(url)
+
+    assert response.text == "article"
+    assert requests_mock.call_count == 2
+
+
+def test_429_without_retry_after_is_returned(requests_mock):
+    url = "https://example.com/article"
+    requests_mock.get(url, status_code=429)
+
+    assert FetchEngine().get(url).status_code == 429
+    assert requests_mock.call_count == 1
+
+
+def test_map_keeps_order_and_limits_requests_per_host():
+    engine = FetchEngine(max_concurrent_requests=4, max_requests_per_host=2)
+    lock = threading.Lock()
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def fetch(url: str) -> str:
+        host = url.split("/")[2]
+        with engine.host_limiter(url).slot():
+            with lock:
+                in_flight[host] = in_flight.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), in_flight[host])
+            time.sleep(0.02)
+            with lock:
+                in_flight[host] -= 1
+        return url
+
+    urls = [f"https://host-{index % 2}.example/{index}" for index in range(8)]
+
+    assert list(engine.map(fetch, urls)) == urls
+    assert peak == {"host-0.example": 2, "host-1.example": 2}
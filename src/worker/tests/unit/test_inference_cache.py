@@ -0,0 +1,38 @@
+import itertools
+import time
+
+import fakeredis
+import pytest
+
+from worker.inference_cache import DiskCacheBackend, InferenceCache, RedisCacheBackend
+
+
+@pytest.fixture(params=["redis", "disk"])
+def backend_factory(request, tmp_path):
+    if request.param == "redis":
+        connection = fakeredis.FakeRedis(decode_responses=False)
+        return lambda max_entries: RedisCacheBackend(connection, max_entries=max_entries)
+    return lambda max_entries: DiskCacheBackend(tmp_path / "cache.sqlite3", max_entries=max_entries)
+
+
+def test_results_are_keyed_by_bot_model_and_normalized_content(backend_factory):
+    backend = backend_factory(100)
+    cache = InferenceCache(backend, "NLP_BOT", "model-1")
+    cache.set_many(["Some  article\ntext", "other"], [{"tags": ["a"]}, None])
+
+    assert cache.get_many(["Some article text", "other", " Some article text "]) == [{"tags": ["a"]}, None, {"tags": ["a"]}]
+    assert cache.as_dict() == {"hits": 2, "misses": 1, "hit_rate": 0.667}
+    assert InferenceCache(backend, "NLP_BOT", "model-2").get_many(["Some article text"]) == [None]
+    assert InferenceCache(backend, "IOC_BOT", "model-1").get_many(["Some article text"]) == [None]
+
+
+def test_least_recently_used_entries_are_evicted(backend_factory, monkeypatch):
+    clock = itertools.count(time.time())
+    monkeypatch.setattr("worker.inference_cache.time.time", lambda: next(clock))
+    cache = InferenceCache(backend_factory(2), "IOC_BOT", "ioc-finder")
+    cache.set_many(["a"], [1])
+    cache.set_many(["b"], [2])
+    cache.get_many(["a"])
+    cache.set_many(["c"], [3])
+
+    assert cache.get_many(["a", "b", "c"]) == [1, None, 3]
@@ -0,0 +1,54 @@
+from worker.inference_cache import DiskCacheBackend, InferenceCache
+from worker.inference_client import InferenceClient
+
+
+ENDPOINT = "http://inference.test"
+
+
+def echo_texts(request, context):
+    payload = request.json()
+    if "batch" in payload:
+        return [{"echo": item["text"]} for item in payload["batch"]]
+    return {"echo": payload["text"]}
+
+
+def test_infer_many_batches_requests_and_keeps_order(requests_mock):
+    model_mock = requests_mock.post(f"{ENDPOINT}/", json=echo_texts)
+    client = InferenceClient(ENDPOINT, batch_size=3, max_parallel_requests=2)
+
+    results = client.infer_many("/", [{"text": str(index)} for index in range(7)])
+
+    assert results == [{"echo": str(index)} for index in range(7)]
+    assert model_mock.call_count == 3
+    assert client.metrics.as_dict()["items"] == 7
+
+
+def test_endpoint_without_batch_support_gets_single_requests(requests_mock):
+    model_mock = requests_mock.post(f"{ENDPOINT}/", [{"status_code": 422, "json": {"error": "text missing"}}, {"json": {"label": "a"}}])
+    client = InferenceClient(ENDPOINT, batch_size=4)
+
+    assert client.infer_many("/", [{"text": "a"}, {"text": "b"}]) == [{"label": "a"}, {"label": "a"}]
+    assert model_mock.call_count == 3
+    assert not client.batching
+
+
+def test_transient_errors_are_retried(requests_mock):
+    model_mock = requests_mock.post(f"{ENDPOINT}/", [{"status_code": 503, "headers": {"Retry-After": "0"}}, {"json": {"label": "a"}}])
+    client = InferenceClient(ENDPOINT)
+
+    assert client.api_post("/", {"text": "a"}) == {"label": "a"}
+    assert model_mock.call_count == 2
+    assert client.metrics.as_dict()["retries"] == 1
+    assert client.metrics.as_dict()["failed_items"] == 0
+
+
+def test_cached_results_are_not_requested_again(requests_mock, tmp_path):
+    model_mock = requests_mock.post(f"{ENDPOINT}/", json=echo_texts)
+    client = InferenceClient(ENDPOINT, batch_size=2)
+    client.cache = InferenceCache(DiskCacheBackend(tmp_path / "cache.sqlite3"), "NLP_BOT", ENDPOINT)
+
+    assert client.infer_many("/", [{"text": "a"}, {"text": "b"}]) == [{"echo": "a"}, {"echo": "b"}]
+    assert client.infer_many("/", [{"text": " a\n"}, {"text": "c"}]) == [{"echo": "a"}, {"echo": "c"}]
+    assert model_mock.call_count == 2
+    assert model_mock.last_request.json() == {"text": "c"}
+    assert client.cache.as_dict() == {"hits": 1, "misses": 3, "hit_rate": 0.25}
@@ -107,6 +107,14 @@ def test_gather_word_list_persists_canonical_success_payload(monkeypatch):
                 "content": "alpha,beta",
                 "content_type": "text/csv",
             },
+            "affected": {
+                "story_ids": [],
+                "osint_source_ids": [],
+                "bot_ids": [],
+                "product_ids": [],
+                "word_list_ids": ["word-list-1"],
+                "schedule": False,
+            },
         },
         "status": "SUCCESS",
     }
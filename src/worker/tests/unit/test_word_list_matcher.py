@@ -0,0 +1,49 @@
+import re
+
+import pytest
+
+from worker.bots.wordlist_bot import WordlistBot
+from worker.word_list_matcher import WordListMatcher, clear_word_list_matcher_cache, get_word_list_matcher
+
+
+ENTRIES = ["Microsoft", "Microsoft Exchange", "Exchange", "C++", ".NET", "CVE-2024-1234", "Straße", "İstanbul", "micro", "_internal"]
+TEXTS = [
+    "Critical flaw in microsoft exchange server",
+    "Microsoft-Exchange and C++ code in .NET apps",
+    "Use C++11 instead of c++, also foo.NET",
+    "Patch CVE-2024-1234 now; CVE-2024-12345 is unrelated",
+    "Reise nach STRASSE und straße, İstanbul",
+    "microsoftexchange _internal_ _internal",
+    "",
+]
+
+
+@pytest.mark.parametrize("ignore_case", [True, False])
+@pytest.mark.parametrize("text", TEXTS)
+def test_word_list_matcher_matches_regex_semantics(text, ignore_case):
+    flags = re.IGNORECASE if ignore_case else re.NOFLAG
+    expected = {entry for entry in ENTRIES if re.search(r"\b" + re.escape(entry) + r"\b", text, flags)}
+
+    matcher = WordListMatcher(ENTRIES, ignore_case=ignore_case)
+
+    assert matcher.find_all(text) == expected
+    assert matcher.search(text) is bool(expected)
+
+
+def test_get_word_list_matcher_reuses_matcher_for_same_entries():
+    clear_word_list_matcher_cache()
+
+    matcher = get_word_list_matcher(["Exchange", "Microsoft"])
+
+    assert get_word_list_matcher(["Microsoft", "Exchange"]) is matcher
+    assert get_word_list_matcher(["Microsoft", "Exchange"], ignore_case=False) is not matcher
+    assert get_word_list_matcher(["Microsoft"]) is not matcher
+
+
+def test_wordlist_bot_find_tags_respects_existing_tags():
+    entries = [{"value": "Exchange", "category": "Software"}, {"value": "Microsoft", "category": "Vendor"}]
+    news_item = {"title": "Microsoft Exchange", "content": "", "tags": {"Microsoft": {"name": "Microsoft"}}}
+
+    assert WordlistBot()._find_tags(news_item, entries, True, re.IGNORECASE) == {"Exchange": "Software", "Microsoft": "Vendor"}
+    assert WordlistBot()._find_tags(news_item, entries, False, re.IGNORECASE) == {"Exchange": "Software"}
+    assert WordlistBot()._find_tags({"title": "microsoft", "content": ""}, entries, True, re.NOFLAG) == {}
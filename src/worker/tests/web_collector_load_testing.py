@@ -0,0 +1,136 @@
+"""Measure RSS article fetching against local stub HTTP servers with artificial latency.
+
+python -m tests.web_collector_load_testing [ENTRY_COUNT] [LATENCY_SECONDS] [HOST_COUNT]
+
+Articles are spread over HOST_COUNT stub servers. Compares sequential fetching with the
+default and a higher MAX_CONCURRENT_REQUESTS and reports the peak number of parallel
+requests each stub host saw, which MAX_REQUESTS_PER_HOST has to bound. The last run answers
+the first request for every article with 429 and a Retry-After header.
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from worker.collectors.fetch_engine import DEFAULT_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_REQUESTS_PER_HOST
+from worker.collectors.rss_collector import RSSCollector
+
+
+ARTICLE = """<html><head><title>Article {path}</title><meta name="author" content="Benchmark"></head>
+<body><article><h1>Article {path}</h1>{paragraphs}</article></body></html>"""
+PARAGRAPH = "<p>Benchmark paragraph about a vulnerability in a widely deployed product, with a few details.</p>"
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float, feed: str = ""):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.feed = feed
+        self.throttle = False
+        self.throttled: set[str] = set()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self, throttle: bool = False) -> None:
+        self.throttle = throttle
+        self.throttled.clear()
+        self.peak = 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+
+    def do_GET(self):
+        if self.path == "/feed.xml":
+            return self.respond(200, self.server.feed.encode(), "application/rss+xml")
+
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.peak = max(self.server.peak, self.server.in_flight)
+            throttled = self.server.throttle and self.path not in self.server.throttled
+            self.server.throttled.add(self.path)
+        try:
+            time.sleep(self.server.latency)
+            if throttled:
+                return self.respond(429, b"", "text/plain", {"Retry-After": "1"})
+            self.respond(200, ARTICLE.format(path=self.path, paragraphs=PARAGRAPH * 30).encode(), "text/html")
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def respond(self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def build_feed(article_urls: list[str]) -> str:
+    items = "".join(f"<item><title>Entry {index}</title><link>{url}</link></item>" for index, url in enumerate(article_urls))
+    return f'<rss version="2.0"><channel><title>Benchmark</title><link>http://127.0.0.1</link>{items}</channel></rss>'
+
+
+def run(entry_count: int, latency: float, host_count: int) -> None:
+    article_hosts = [StubServer(latency) for _ in range(host_count)]
+    article_urls = [f"{article_hosts[index % host_count].base_url}/article/{index}" for index in range(entry_count)]
+    feed_host = StubServer(0, build_feed(article_urls))
+    for server in [feed_host, *article_hosts]:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def collect(label: str, max_concurrent_requests: int, throttle: bool = False) -> float:
+        collector = RSSCollector()
+        source = {
+            "id": "benchmark",
+            "parameters": {"FEED_URL": f"{feed_host.base_url}/feed.xml", "MAX_CONCURRENT_REQUESTS": max_concurrent_requests},
+        }
+        collector.parse_source(source)
+        collector.configure_primary_http_resource(source, collector.feed_url, manual=True)
+        entries = collector.get_feed()["entries"]
+        for server in article_hosts:
+            server.reset(throttle)
+
+        start = time.perf_counter()
+        news_items = collector.parse_feed(entries, source)
+        elapsed = time.perf_counter() - start
+        collector.fetch_engine.close()
+
+        assert [news_item.link for news_item in news_items] == article_urls
+        assert all(news_item.content for news_item in news_items)
+        peak = max(server.peak for server in article_hosts)
+        print(f"{label:<44} {elapsed:8.2f} s {entry_count / elapsed:8.1f} articles/s   peak per host: {peak}")
+        return elapsed
+
+    print(f"{entry_count} feed entries on {host_count} hosts, {latency:.2f}s latency, MAX_REQUESTS_PER_HOST={DEFAULT_MAX_REQUESTS_PER_HOST}")
+    sequential = collect("sequential (MAX_CONCURRENT_REQUESTS=1)", 1)
+    default = collect(f"MAX_CONCURRENT_REQUESTS={DEFAULT_MAX_CONCURRENT_REQUESTS}", DEFAULT_MAX_CONCURRENT_REQUESTS)
+    wide = collect("MAX_CONCURRENT_REQUESTS=16", 16)
+    collect(
+        f"MAX_CONCURRENT_REQUESTS={DEFAULT_MAX_CONCURRENT_REQUESTS}, 429 once per article", DEFAULT_MAX_CONCURRENT_REQUESTS, throttle=True
+    )
+    print(f"speedup: {sequential / default:.1f}x default, {sequential / wide:.1f}x with 16 threads")
+
+    for server in [feed_host, *article_hosts]:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 42,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.5,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 4,
+    )
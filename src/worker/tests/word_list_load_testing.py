@@ -0,0 +1,58 @@
+import random
+import re
+import string
+import time
+
+from worker.word_list_matcher import WordListMatcher
+
+
+def generate_entries(n: int) -> list[str]:
+    entries = set()
+    while len(entries) < n:
+        words = ["".join(random.choices(string.ascii_letters, k=random.randint(4, 10))) for _ in range(random.randint(1, 3))]
+        entries.add(" ".join(words))
+    return list(entries)
+
+
+def generate_texts(entries: list[str], n: int = 200, words_per_text: int = 800) -> list[str]:
+    vocabulary = [word for entry in random.sample(entries, min(len(entries), 2000)) for word in entry.split()]
+    texts = []
+    for _ in range(n):
+        words = random.choices(vocabulary, k=words_per_text) + random.sample(entries, 5)
+        random.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def regex_find_all(entries: list[str], text: str) -> set[str]:
+    return {entry for entry in entries if re.search(r"\b" + re.escape(entry) + r"\b", text, re.IGNORECASE)}
+
+
+def run(entry_count: int, baseline_texts: int = 2) -> None:
+    entries = generate_entries(entry_count)
+    texts = generate_texts(entries)
+
+    start = time.perf_counter()
+    matcher = WordListMatcher(entries)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [matcher.find_all(text) for text in texts]
+    matcher_time = (time.perf_counter() - start) / len(texts)
+
+    start = time.perf_counter()
+    expected = [regex_find_all(entries, text) for text in texts[:baseline_texts]]
+    regex_time = (time.perf_counter() - start) / baseline_texts
+
+    assert results[:baseline_texts] == expected
+    print(
+        f"{entry_count} entries: build {build_time * 1000:.1f} ms, "
+        f"matcher {matcher_time * 1000:.2f} ms/item, regex loop {regex_time * 1000:.1f} ms/item, "
+        f"speedup {regex_time / matcher_time:.0f}x"
+    )
+
+
+if __name__ == "__main__":
+    random.seed(42)
+    for count in (10_000, 100_000):
+        run(count)
@@ -11,6 +11,7 @@ Usage:
     rq worker presenters publishers connectors misc bots collectors
 """
 
+import os
 import sys
 from typing import Any
 
@@ -66,6 +67,8 @@ def resolve_worker_class() -> type[Worker]:
 
 def start_worker():
     """Start RQ worker with configured queues."""
+    from worker.collectors import browser_pool
+
     # Initialize core API for worker tasks to use
     CoreApi()
 
@@ -78,6 +81,9 @@ def start_worker():
 
     worker_class = resolve_worker_class()
 
+    # Work horses share this process's pooled browser, see worker.collectors.browser_pool.
+    os.environ[browser_pool.OWNER_ENV] = str(os.getpid())
+
     redis_conn = get_redis_connection(spawn_safe=worker_class is SpawnWorker)
 
     queues = [Queue(name, connection=redis_conn) for name in queue_names]
@@ -91,4 +97,7 @@ def start_worker():
         exception_handlers=[rq_failure_exception_handler],
         work_horse_killed_handler=rq_work_horse_killed_handler,
     )
-    worker.work(with_scheduler=True)
+    try:
+        worker.work(with_scheduler=True)
+    finally:
+        browser_pool.shutdown()
@@ -1,4 +1,5 @@
-from urllib.parse import urlencode
+import threading
+from urllib.parse import urlencode, urlparse
 
 import niquests as requests
 
@@ -6,6 +7,20 @@ from worker.config import Config
 from worker.log import logger
 
 
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url: str) -> requests.Session:
+    """Process-wide session per bot service, so its connections are reused across requests and bot runs."""
+    parsed_url = urlparse(url)
+    key = f"{parsed_url.scheme}://{parsed_url.netloc}"
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = requests.Session(disable_http3=Config.DISABLE_HTTP3)
+        return _sessions[key]
+
+
 class BotApi:
     def __init__(
         self,
@@ -51,12 +66,12 @@ class BotApi:
         url = f"{self.api_url}{url}"
         if not json_data:
             json_data = {}
-        response = requests.post(url=url, headers=self.headers, verify=self.verify, json=json_data, timeout=self.timeout)
+        response = get_session(url).post(url=url, headers=self.headers, verify=self.verify, json=json_data, timeout=self.timeout)
         return self.check_response(response, url)
 
     def api_get(self, url: str, params: dict | None = None):
         url = f"{self.api_url}{url}"
         if params:
             url += f"?{urlencode(params)}"
-        response = requests.get(url=url, headers=self.headers, verify=self.verify, timeout=self.timeout)
+        response = get_session(url).get(url=url, headers=self.headers, verify=self.verify, timeout=self.timeout)
         return self.check_response(response, url)
@@ -25,31 +25,26 @@ class AnalystBot(BaseBot):
         bots_params = dict(zip(self.regexp, self.attr_name))
         if not (data := self.get_stories(parameters)):
             return {"message": "No new stories found", "result": {}}
-        for story in data:
-            for item in story.get("news_items", []):
-                news_item_id = item["id"]
-                title = item["title"]
-                review = item["review"]
-                content = item["content"]
-
-                analyzed_text = set((title + review + content).split())
-
-                for element in analyzed_text:
-                    attributes = []
-                    for key, value in bots_params.items():
-                        if finding := re.search(f"({value})", element.strip(".,")):
-                            value = finding[1]
-
-                            news_attribute = {
-                                "key": key,
-                                "value": value,
-                            }
-
-                            attributes.append(news_attribute)
-
-                            self.core_api.update_news_item_attributes(
-                                news_item_id,
-                                attributes,
-                            )
+        with self.core_api.attribute_update_buffer() as updates:
+            for story in data:
+                for item in story.get("news_items", []):
+                    news_item_id = item["id"]
+                    title = item["title"]
+                    review = item["review"]
+                    content = item["content"]
+
+                    analyzed_text = set((title + review + content).split())
+
+                    for element in analyzed_text:
+                        for key, value in bots_params.items():
+                            if finding := re.search(f"({value})", element.strip(".,")):
+                                value = finding[1]
+
+                                news_attribute = {
+                                    "key": key,
+                                    "value": value,
+                                }
+
+                                updates.add_news_item_attributes(news_item_id, [news_attribute])
 
         return {"message": "Analyst bot completed", "result": {}}
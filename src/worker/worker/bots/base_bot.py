@@ -1,10 +1,16 @@
+from collections.abc import Iterator, Sequence
 from typing import Any
 from urllib.parse import parse_qs
 
 from worker.core_api import CoreApi
+from worker.inference_cache import InferenceCache, build_backend
+from worker.inference_client import InferenceClient
 from worker.log import logger
 
 
+STORY_PAGE_SIZE = 100
+
+
 class BaseBot:
     def __init__(self):
         self.core_api = CoreApi()
@@ -14,6 +20,8 @@ class BaseBot:
         self.language: str | None = None
         self.model: str | None = None
         self.bot_api: Any = None
+        self.inference_clients: dict[str, InferenceClient] = {}
+        self.inference_caches: dict[str, InferenceCache] = {}
 
     def execute(self, parameters: dict | None = None) -> dict[str, dict[str, str] | str]:
         if not parameters:
@@ -39,9 +47,12 @@ class BaseBot:
 
         return filter_dict
 
-    def update_filter_for_pagination(self, filter_dict, limit=100):
+    def update_filter_for_pagination(self, filter_dict, limit=100, next_cursor: str | None = None):
         filter_dict["limit"] = limit
-        if "offset" in filter_dict:
+        if next_cursor is not None:
+            filter_dict.pop("offset", None)
+            filter_dict["cursor"] = next_cursor
+        elif "offset" in filter_dict:
             filter_dict["offset"] += limit
         else:
             filter_dict["offset"] = limit
@@ -55,6 +66,57 @@ class BaseBot:
             return []
         return data
 
+    def iter_stories(self, parameters: dict, fields: Sequence[str] | None = None, page_size: int = STORY_PAGE_SIZE) -> Iterator[dict]:
+        """Yield the stories matching the bot filter one cursor page at a time.
+
+        Only one page is held in memory and the first stories can be processed before the last
+        page is fetched. ``fields`` limits the story and news item fields core returns, e.g.
+        ``("news_items.title", "news_items.content")``; the story id is always included.
+        """
+        filter_dict = self.get_filter_dict(parameters)
+        if fields:
+            filter_dict["fields"] = list(fields)
+        next_cursor: str | None = ""
+        while next_cursor is not None:
+            page = self.core_api.get_stories_page(self.update_filter_for_pagination(filter_dict, page_size, next_cursor))
+            if not page:
+                logger.debug(f"No Stories for filter: {filter_dict}")
+                return
+            yield from page.get("items", [])
+            next_cursor = page.get("next_cursor")
+
+    def build_inference_client(
+        self,
+        parameters: dict,
+        default_endpoint: str,
+        endpoint_parameter: str = "BOT_ENDPOINT",
+        name: str = "model",
+        cache: bool = False,
+    ) -> InferenceClient:
+        """Inference client configured from the bot parameters, whose metrics end up in the task result.
+
+        With ``cache`` its results are cached per endpoint and MODEL_VERSION parameter.
+        """
+        client = InferenceClient.from_parameters(parameters, default_endpoint, endpoint_parameter)
+        if cache:
+            client.cache = self.build_inference_cache(f"{client.api_url} {parameters.get('MODEL_VERSION') or ''}", name)
+        self.inference_clients[name] = client
+        return client
+
+    def build_inference_cache(self, model_version: str, name: str = "model") -> InferenceCache | None:
+        """Result cache for this bot type and model version, None if INFERENCE_CACHE is disabled."""
+        if (backend := build_backend()) is None:
+            return None
+        cache = InferenceCache(backend, self.type, model_version)
+        self.inference_caches[name] = cache
+        return cache
+
+    def inference_metrics(self) -> dict[str, dict[str, Any]]:
+        return {name: client.metrics.as_dict() for name, client in self.inference_clients.items() if client.metrics.requests}
+
+    def cache_metrics(self) -> dict[str, dict[str, Any]]:
+        return {name: cache.as_dict() for name, cache in self.inference_caches.items() if cache.hits or cache.misses}
+
     def refresh(self):
         logger.info(f"Refreshing Bot: {self.type} ...")
         self.execute()
@@ -3,6 +3,7 @@
 Functions for executing bots to process news items.
 """
 
+from models.task import TaskAffectedEntities
 from rq import get_current_job
 
 import worker.bots
@@ -37,9 +38,14 @@ def bot_task(bot_id: str, filter: dict | None = None, trigger_dependents: bool =
             raise ValueError(f"Bot with id {bot_id} not found")
 
         worker_type = bot_config.get("type", worker_type).upper()
-        bot_result = _execute_by_config(bot_config, filter, bot_id)
+        bot, bot_result = _execute_by_config(bot_config, filter, bot_id)
         if bot_result is None:
             raise RuntimeError(f"Bot {bot_id} returned no result")
+        base_data = {"bot_id": bot_id, "filter": filter, "trigger_dependents": trigger_dependents}
+        if inference_metrics := getattr(bot, "inference_metrics", dict)():
+            base_data["inference"] = inference_metrics
+        if cache_metrics := getattr(bot, "cache_metrics", dict)():
+            base_data["cache"] = cache_metrics
         core_api.save_task_result(
             task_id,
             task_name,
@@ -49,8 +55,9 @@ def bot_task(bot_id: str, filter: dict | None = None, trigger_dependents: bool =
             result=build_success_task_result(
                 default_message=f"Bot {bot_id} executed successfully",
                 output=bot_result,
-                base_data={"bot_id": bot_id, "filter": filter, "trigger_dependents": trigger_dependents},
+                base_data=base_data,
                 merge_dict_data=False,
+                affected=TaskAffectedEntities(bot_ids=[bot_id]),
             ),
         )
         return (
@@ -91,7 +98,7 @@ def _execute_by_config(bot_config: dict, filter: dict | None = None, bot_id: str
         filter: Optional filter for bot execution
 
     Returns:
-        Result from the bot execution
+        The executed bot and its result
     """
     bots = {
         "analyst_bot": worker.bots.AnalystBot(),
@@ -121,4 +128,4 @@ def _execute_by_config(bot_config: dict, filter: dict | None = None, bot_id: str
     if filter:
         bot_params["filter"] = filter
 
-    return bot.execute(bot_params)
+    return bot, bot.execute(bot_params)
@@ -1,5 +1,5 @@
-from worker.bot_api import BotApi
 from worker.config import Config
+from worker.core_api import AttributeUpdateBuffer
 from worker.log import logger
 
 from .base_bot import BaseBot
@@ -18,44 +18,41 @@ class CyberSecClassifierBot(BaseBot):
         if not (data := self.get_stories(parameters)):
             return {"message": "No new stories found"}
 
-        self.bot_api = BotApi(
-            bot_endpoint=parameters.get("BOT_ENDPOINT", Config.CYBERSEC_CLASSIFIER_API_ENDPOINT),
-            bot_api_key=parameters.get("BOT_API_KEY", Config.BOT_API_KEY),
-            requests_timeout=parameters.get("REQUESTS_TIMEOUT"),
-        )
+        self.bot_api = self.build_inference_client(parameters, Config.CYBERSEC_CLASSIFIER_API_ENDPOINT, cache=True)
+        news_items = [news_item for story in data for news_item in story.get("news_items", [])]
+        class_results = iter(self.bot_api.infer_many("/", [{"text": news_item.get("content", "")} for news_item in news_items]))
 
         num_news_items = 0
-        for story in data:
-            story_class_list = []
-            story_cybersecurity_status = "incomplete"
-            for news_item in story.get("news_items", []):
-                result = self._process_news_item(news_item)
-                story_class_list.append(result)
-                if result != "none":
-                    num_news_items += 1
-
-                status_set = frozenset(story_class_list)
-
-                if "none" in status_set and len(status_set) > 1:
-                    story_cybersecurity_status = "incomplete"
-                else:
-                    status_map = {
-                        frozenset(["yes"]): "yes",
-                        frozenset(["no"]): "no",
-                        frozenset(["yes", "no"]): "mixed",
-                        frozenset(["none"]): "none",
-                    }
-                    story_cybersecurity_status = status_map.get(status_set, "none")
-
-            attributes = [{"key": "cybersecurity", "value": story_cybersecurity_status}, {"key": self.type, "value": 1}]
-            self.core_api.update_story_attributes(story.get("id", ""), attributes)
+        with self.core_api.attribute_update_buffer() as updates:
+            for story in data:
+                story_class_list = []
+                story_cybersecurity_status = "incomplete"
+                for news_item in story.get("news_items", []):
+                    result = self._process_news_item(news_item, next(class_results), updates)
+                    story_class_list.append(result)
+                    if result != "none":
+                        num_news_items += 1
+
+                    status_set = frozenset(story_class_list)
+
+                    if "none" in status_set and len(status_set) > 1:
+                        story_cybersecurity_status = "incomplete"
+                    else:
+                        status_map = {
+                            frozenset(["yes"]): "yes",
+                            frozenset(["no"]): "no",
+                            frozenset(["yes", "no"]): "mixed",
+                            frozenset(["none"]): "none",
+                        }
+                        story_cybersecurity_status = status_map.get(status_set, "none")
+
+                attributes = [{"key": "cybersecurity", "value": story_cybersecurity_status}, {"key": self.type, "value": 1}]
+                updates.add_story_attributes(story.get("id", ""), attributes)
 
         return {"message": f"Classified {num_news_items} news items"}
 
-    def _classify_news_item(self, content: str) -> dict | None:
-        class_result = self.bot_api.api_post("/", {"text": content})
-
-        if not class_result:
+    def _check_class_result(self, class_result: dict | None) -> dict | None:
+        if not class_result or not isinstance(class_result, dict):
             return None
         if "error" in class_result:
             logger.error(class_result["error"])
@@ -64,26 +61,20 @@ class CyberSecClassifierBot(BaseBot):
         logger.debug(f"Predicted class: {max(class_result, key=class_result.get)}")
         return class_result
 
-    def _process_news_item(self, news_item: dict) -> str:
-        news_item_content = news_item.get("content", "")
+    def _process_news_item(self, news_item: dict, class_result: dict | None, updates: AttributeUpdateBuffer) -> str:
         news_item_id = news_item.get("id", "")
 
         logger.debug(f"Classifying news item with id: {news_item_id}.")
-        class_result = self._classify_news_item(news_item_content)
-        if not class_result:
+        if not (class_result := self._check_class_result(class_result)):
             return "none"
 
         status = "yes" if class_result.get("cybersecurity", 0.0) > Config.CYBERSEC_CLASSIFIER_THRESHOLD else "no"
 
-        if self.core_api.update_news_item_attributes(
+        updates.add_news_item_attributes(
             news_item_id,
             [
                 {"key": "cybersecurity_bot", "value": status},
                 {"key": "cybersecurity_bot_score", "value": str(class_result.get("cybersecurity", "N/A"))},
             ],
-        ):
-            logger.debug(f"Successfully updated news item {news_item_id} with cybersecurity attributes.")
-        else:
-            logger.error(f"Failed to update news item {news_item_id} with cybersecurity attributes.")
-
+        )
         return status
@@ -21,11 +21,9 @@ class GroupingBot(BaseBot):
         if not regexp:
             raise ValueError("GroupingBot requires REGULAR_EXPRESSION parameter")
 
-        if not (data := self.get_stories(parameters)):
-            return {"message": "No new stories found"}
-
         findings = defaultdict(list)
-        for story in data:
+        story_count = 0
+        for story_count, story in enumerate(self.iter_stories(parameters, ("news_items.title", "news_items.content")), start=1):
             for news_item in story["news_items"]:
                 content = news_item["content"]
                 title = news_item["title"]
@@ -36,6 +34,8 @@ class GroupingBot(BaseBot):
                         findings[finding[1]].append(story["id"])
                         break
 
+        if not story_count:
+            return {"message": "No new stories found"}
         if not findings:
             return {"message": "No Groups found"}
 
@@ -1,5 +1,6 @@
 # pyright: reportMissingTypeStubs=false
 
+from importlib.metadata import version
 from typing import Any
 
 import ioc_fanger
@@ -8,8 +9,8 @@ from models.cti import IOC_FINDER_TYPES
 
 from worker.log import logger
 
-from .base_bot import BaseBot
-from .tagging_content import _news_item_content_for_tagging
+from .base_bot import STORY_PAGE_SIZE, BaseBot
+from .tagging_content import TAGGING_NEWS_ITEM_FIELDS, _news_item_content_for_tagging
 
 
 class IOCBot(BaseBot):
@@ -32,18 +33,25 @@ class IOCBot(BaseBot):
     def execute(self, parameters: dict[str, Any] | None = None) -> dict[str, Any]:
         if not parameters:
             parameters = {}
-        if not (data := self.get_stories(parameters)):
-            return {"message": "No new stories found"}
-
         extracted_keywords: dict[str, dict[str, str]] = {}
+        cache = self.build_inference_cache(
+            f"ioc-finder {version('ioc-finder')} ioc-fanger {version('ioc-fanger')} {','.join(self.included_ioc_types)}", "ioc"
+        )
 
-        for i, story in enumerate(data):
-            if i % max(len(data) // 10, 1) == 0:
-                logger.debug(f"Extracting IOCs from {story['id']}: {i}/{len(data)}")
-            for news_item in story["news_items"]:
-                news_item_content = _news_item_content_for_tagging(news_item)
-                iocs = self.extract_ioc(news_item_content)
+        for i, story in enumerate(self.iter_stories(parameters, TAGGING_NEWS_ITEM_FIELDS)):
+            if i % STORY_PAGE_SIZE == 0:
+                logger.debug(f"Extracting IOCs from {story['id']}: {i} stories done")
+            contents = [_news_item_content_for_tagging(news_item) for news_item in story["news_items"]]
+            story_iocs = cache.get_many(contents) if cache else [None] * len(contents)
+            missing = [index for index, iocs in enumerate(story_iocs) if iocs is None]
+            for index in missing:
+                story_iocs[index] = self.extract_ioc(contents[index])
+            if cache and missing:
+                cache.set_many([contents[index] for index in missing], [story_iocs[index] for index in missing])
+            for news_item, iocs in zip(story["news_items"], story_iocs):
                 extracted_keywords[news_item["id"]] = iocs
+        if not extracted_keywords:
+            return {"message": "No new stories found"}
         logger.info({"message": f"Extracted {len(extracted_keywords)} IOCs"})
         return extracted_keywords
 
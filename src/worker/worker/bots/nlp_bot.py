@@ -1,15 +1,9 @@
-from worker.bot_api import BotApi
 from worker.config import Config
 
 from .base_bot import BaseBot
 from .tagging_content import _news_item_content_for_tagging
 
 
-def batched(stories: list, batch_size=10):
-    for i in range(0, len(stories), batch_size):
-        yield stories[i : i + batch_size]
-
-
 class NLPBot(BaseBot):
     def __init__(self, language="en"):
         super().__init__()
@@ -17,41 +11,27 @@ class NLPBot(BaseBot):
         self.name = "NLP Bot"
 
     def execute(self, parameters: dict | None = None) -> dict[str, dict[str, str] | str]:
-        update_result = {}
-
         if not parameters:
             parameters = {}
         if stories := self.get_stories(parameters):
-            self.bot_api = BotApi(
-                bot_endpoint=parameters.get("BOT_ENDPOINT", Config.NLP_API_ENDPOINT),
-                bot_api_key=parameters.get("BOT_API_KEY", Config.BOT_API_KEY),
-                requests_timeout=parameters.get("REQUESTS_TIMEOUT"),
-            )
-
-            for story_batch in batched(stories):
-                update_result |= self._process_stories(story_batch)
-            return update_result
+            self.bot_api = self.build_inference_client(parameters, Config.NLP_API_ENDPOINT, cache=True)
+            return self._process_stories(stories)
         return {"message": "No new stories found"}
 
     def _process_stories(self, stories: list) -> dict:
-        update_result = {}
-
+        news_item_ids = []
+        payloads = []
         for story in stories:
             if "attributes" in story and story.get("attributes", {}):
                 is_cybersecurity = story["attributes"].get("cybersecurity", {}).get("value", "no") == "yes"
             else:
                 is_cybersecurity = False
             for news_item in story["news_items"]:
-                news_item_content = _news_item_content_for_tagging(news_item, separator="\n")
-                current_keywords = self._extract_ner(news_item_content, is_cybersecurity)
-                update_result[news_item["id"]] = current_keywords
-
-        return update_result
+                news_item_ids.append(news_item["id"])
+                payloads.append({"text": _news_item_content_for_tagging(news_item, separator="\n"), "cybersecurity": is_cybersecurity})
 
-    def _extract_ner(self, text: str, is_cybersecurity: bool = False) -> dict:
-        if keywords := self.bot_api.api_post("/", {"text": text, "cybersecurity": is_cybersecurity}):
-            return keywords
-        return {}
+        keywords = self.bot_api.infer_many("/", payloads)
+        return {news_item_id: current_keywords or {} for news_item_id, current_keywords in zip(news_item_ids, keywords)}
 
     # def not_in_stopwords(self, keyword: str) -> bool:
     #    return keyword not in stopwords.words(self.language)
@@ -1,8 +1,10 @@
-from worker.bot_api import BotApi
+import itertools
+
 from worker.config import Config
+from worker.inference_client import InferenceClient
 from worker.log import logger
 
-from .base_bot import BaseBot
+from .base_bot import STORY_PAGE_SIZE, BaseBot
 
 
 class SummaryBot(BaseBot):
@@ -15,44 +17,30 @@ class SummaryBot(BaseBot):
         if not parameters:
             parameters = {}
 
-        if not (data := self.get_stories(parameters)):
+        summary_api = self._build_bot_api(parameters, "SUMMARY_ENDPOINT", Config.SUMMARY_API_ENDPOINT, "summary")
+        title_api = self._build_bot_api(parameters, "TITLE_ENDPOINT", Config.TITLE_API_ENDPOINT, "title")
+
+        story_count = 0
+        stories = self.iter_stories(parameters, ("news_items.title", "news_items.content"))
+        with self.core_api.attribute_update_buffer() as updates:
+            for story_batch in itertools.batched(stories, STORY_PAGE_SIZE):
+                story_payloads = [self._build_story_payload(story.get("news_items", [])) for story in story_batch]
+                summaries = self.predict_summaries(summary_api, story_payloads)
+                title_indexes = [index for index, story_payload in enumerate(story_payloads) if len(story_payload["news_items"]) > 1]
+                titles = dict(zip(title_indexes, self.predict_titles(title_api, [story_payloads[index] for index in title_indexes])))
+
+                for index, story in enumerate(story_batch):
+                    story_count += 1
+                    logger.debug(f"Summarizing {story['id']} with {len(story_payloads[index]['news_items'])} news items")
+                    summary = summaries[index]
+                    title = titles.get(index, "")
+                    if summary or title:
+                        updates.update_story(story["id"], summary=summary or None, title=title or None)
+                        updates.add_story_attributes(story["id"], [{"key": self.type, "value": 1}])
+                        logger.debug(f"Created summary for : {story['id']}")
+        if not story_count:
             return {"message": "No new stories found"}
-
-        summary_api = self._build_bot_api(parameters, "SUMMARY_ENDPOINT", Config.SUMMARY_API_ENDPOINT)
-        title_api = self._build_bot_api(parameters, "TITLE_ENDPOINT", Config.TITLE_API_ENDPOINT)
-
-        for story in data:
-            news_items = story.get("news_items", [])
-            story_payload = self._build_story_payload(news_items)
-
-            logger.debug(f"Summarizing {story['id']} with {len(news_items)} news items")
-            try:
-                summary = self.predict_summary(summary_api, story_payload)
-                if len(news_items) > 1:
-                    title = self.predict_title(title_api, story_payload)
-                else:
-                    title = ""
-
-                story_update_data = {}
-                if summary:
-                    story_update_data["summary"] = summary
-                if title:
-                    story_update_data["title"] = title
-
-                if story_update_data:
-                    if self.core_api.update_story(story["id"], story_update_data):
-                        self.core_api.update_story_attributes(
-                            story["id"],
-                            [{"key": self.type, "value": 1}],
-                        )
-                    else:
-                        logger.warning(f"Failed to update story {story['id']}, skipping attribute update")
-            except Exception:
-                logger.exception(f"Could not generate summary for {story['id']}")
-                continue
-
-            logger.debug(f"Created summary for : {story['id']}")
-        return {"message": f"Summarized {len(data)} stories"}
+        return {"message": f"Summarized {story_count} stories"}
 
     @staticmethod
     def _build_story_payload(news_items: list[dict]) -> dict[str, list[dict[str, str]]]:
@@ -66,30 +54,21 @@ class SummaryBot(BaseBot):
             ]
         }
 
-    @staticmethod
-    def _build_bot_api(parameters: dict, endpoint_parameter: str, default_endpoint: str | None) -> BotApi | None:
-        endpoint = parameters.get(endpoint_parameter) or default_endpoint
-        if not endpoint:
+    def _build_bot_api(self, parameters: dict, endpoint_parameter: str, default_endpoint: str | None, name: str) -> InferenceClient | None:
+        if not (parameters.get(endpoint_parameter) or default_endpoint):
             return None
 
-        return BotApi(
-            bot_endpoint=endpoint,
-            bot_api_key=parameters.get("BOT_API_KEY", Config.BOT_API_KEY),
-            requests_timeout=parameters.get("REQUESTS_TIMEOUT"),
-        )
+        return self.build_inference_client(parameters, default_endpoint or "", endpoint_parameter, name)
 
-    def predict_summary(self, bot_api: BotApi | None, story_payload: dict[str, list[dict[str, str]]]) -> str:
-        if not bot_api:
-            return ""
+    def predict_summaries(self, bot_api: InferenceClient | None, story_payloads: list[dict[str, list[dict[str, str]]]]) -> list[str]:
+        return self._predict(bot_api, story_payloads, "summary")
 
-        if response := bot_api.api_post("", story_payload):
-            return response.get("summary", "")
-        return ""
+    def predict_titles(self, bot_api: InferenceClient | None, story_payloads: list[dict[str, list[dict[str, str]]]]) -> list[str]:
+        return self._predict(bot_api, story_payloads, "title")
 
-    def predict_title(self, bot_api: BotApi | None, story_payload: dict[str, list[dict[str, str]]]) -> str:
-        if not bot_api:
-            return ""
+    @staticmethod
+    def _predict(bot_api: InferenceClient | None, story_payloads: list[dict[str, list[dict[str, str]]]], key: str) -> list[str]:
+        if not bot_api or not story_payloads:
+            return [""] * len(story_payloads)
 
-        if response := bot_api.api_post("", story_payload):
-            return response.get("title", "")
-        return ""
+        return [response.get(key, "") if isinstance(response, dict) else "" for response in bot_api.infer_many("", story_payloads)]
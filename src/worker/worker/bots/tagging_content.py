@@ -1,2 +1,5 @@
+TAGGING_NEWS_ITEM_FIELDS = ("news_items.title", "news_items.review", "news_items.content")
+
+
 def _news_item_content_for_tagging(news_item: dict, separator: str = " ") -> str:
     return separator.join(str(news_item.get(field) or "") for field in ("title", "review", "content"))
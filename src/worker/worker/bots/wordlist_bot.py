@@ -1,10 +1,12 @@
 import re
+from collections.abc import Iterable
 from typing import Any
 
 from worker.log import logger
+from worker.word_list_matcher import WordListMatcher, get_word_list_matcher
 
-from .base_bot import BaseBot
-from .tagging_content import _news_item_content_for_tagging
+from .base_bot import STORY_PAGE_SIZE, BaseBot
+from .tagging_content import TAGGING_NEWS_ITEM_FIELDS, _news_item_content_for_tagging
 
 
 class WordlistBot(BaseBot):
@@ -25,10 +27,10 @@ class WordlistBot(BaseBot):
         if not word_list_entries:
             return {"message": "No word list entries found"}
 
-        if not (data := self.get_stories(parameters)):
+        stories = self.iter_stories(parameters, (*TAGGING_NEWS_ITEM_FIELDS, "news_items.tags"))
+        if not (found_tags := self._find_tags_for_stories(stories, word_list_entries, override_existing_tags, ignore_case)):
             return {"message": "No new stories found"}
 
-        found_tags = self._find_tags_for_stories(data, word_list_entries, override_existing_tags, ignore_case)
         logger.info({"message": f"{len(found_tags)} tags found, saving bot type to story attributes..."})
         return found_tags
 
@@ -41,30 +43,30 @@ class WordlistBot(BaseBot):
             return [entry for word_list in word_lists["items"] for entry in word_list["entries"]]
         return
 
-    def _find_tags_for_stories(self, data, word_list_entries, override_existing_tags, ignore_case) -> dict[str, dict[str, str]]:
+    def _find_tags_for_stories(
+        self, stories: Iterable[dict], word_list_entries, override_existing_tags, ignore_case
+    ) -> dict[str, dict[str, str]]:
         found_tags = {}
-        logger.info(f"Extracting tags from news items: {len(data)}")
-        for i, story in enumerate(data):
-            if i % max(len(data) // 10, 1) == 0:
-                logger.debug(f"Extracting words from {story['id']}: {i}/{len(data)}")
+        entry_set = {item["value"]: item["category"] for item in word_list_entries}
+        matcher = get_word_list_matcher(entry_set, ignore_case=bool(ignore_case & re.IGNORECASE))
+        for i, story in enumerate(stories):
+            if i % STORY_PAGE_SIZE == 0:
+                logger.debug(f"Extracting words from {story['id']}: {i} stories done")
             for news_item in story["news_items"]:
-                found_tags[news_item["id"]] = self._find_tags(news_item, word_list_entries, override_existing_tags, ignore_case)
+                found_tags[news_item["id"]] = self._match_tags(news_item, entry_set, matcher, override_existing_tags)
         return found_tags
 
     def _find_tags(self, news_item, word_list_entries, override_existing_tags, ignore_case) -> dict[str, str]:
-        findings = {}
         entry_set = {item["value"]: item["category"] for item in word_list_entries}
+        matcher = get_word_list_matcher(entry_set, ignore_case=bool(ignore_case & re.IGNORECASE))
+        return self._match_tags(news_item, entry_set, matcher, override_existing_tags)
+
+    def _match_tags(self, news_item, entry_set: dict[str, str], matcher: WordListMatcher, override_existing_tags) -> dict[str, str]:
         existing_tags = self._tag_names(news_item.get("tags") or {})
 
         all_content = _news_item_content_for_tagging(news_item)
 
-        for entry, category in entry_set.items():
-            if re.search(r"\b" + re.escape(entry) + r"\b", all_content, ignore_case):
-                if entry in existing_tags and not override_existing_tags:
-                    continue
-                findings[entry] = category
-
-        return findings
+        return {entry: entry_set[entry] for entry in matcher.find_all(all_content) if override_existing_tags or entry not in existing_tags}
 
     @staticmethod
     def _tag_names(tags) -> set[str]:
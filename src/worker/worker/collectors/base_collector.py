@@ -1,10 +1,10 @@
-import re
 from typing import Any
 
 from models.assess import NewsItem
 
 from worker.core_api import CoreApi
 from worker.log import logger
+from worker.word_list_matcher import get_word_list_matcher
 
 
 class NoChangeError(Exception):
@@ -25,30 +25,26 @@ class BaseCollector:
         self.description = "Base abstract type for all collectors"
 
         self.core_api = CoreApi()
+        self.published_story_ids: list[str] = []
 
     def filter_by_word_list(self, news_items: list[NewsItem], word_lists: list) -> list[NewsItem]:
         if not word_lists:
             return news_items
 
-        include_patterns: set[re.Pattern] = {
-            re.compile(r"\b" + re.escape(entry["value"]) + r"\b", re.IGNORECASE)
-            for word_list in word_lists
-            if "COLLECTOR_INCLUDELIST" in word_list["usage"]
-            for entry in word_list["entries"]
+        include_entries = {
+            entry["value"] for word_list in word_lists if "COLLECTOR_INCLUDELIST" in word_list["usage"] for entry in word_list["entries"]
         }
-
-        exclude_patterns: set[re.Pattern] = {
-            re.compile(r"\b" + re.escape(entry["value"]) + r"\b", re.IGNORECASE)
-            for word_list in word_lists
-            if "COLLECTOR_EXCLUDELIST" in word_list["usage"]
-            for entry in word_list["entries"]
+        exclude_entries = {
+            entry["value"] for word_list in word_lists if "COLLECTOR_EXCLUDELIST" in word_list["usage"] for entry in word_list["entries"]
         }
-        if include_patterns or exclude_patterns:
+        if include_entries or exclude_entries:
+            include_matcher = get_word_list_matcher(include_entries) if include_entries else None
+            exclude_matcher = get_word_list_matcher(exclude_entries) if exclude_entries else None
 
             def matches_filters(item: NewsItem) -> bool:
                 searchable_text = f"{item.title or ''} {item.content or ''}"
-                return (not include_patterns or any(pattern.search(searchable_text) for pattern in include_patterns)) and (
-                    not exclude_patterns or all(not pattern.search(searchable_text) for pattern in exclude_patterns)
+                return (include_matcher is None or include_matcher.search(searchable_text)) and (
+                    exclude_matcher is None or not exclude_matcher.search(searchable_text)
                 )
 
             return [item for item in news_items if matches_filters(item)]
@@ -98,7 +94,10 @@ class BaseCollector:
         news_items_dicts = [item.model_dump(mode="json") for item in news_items]
         if not news_items_dicts:
             return None
-        if (core_response := self.core_api.add_news_items(news_items_dicts)) and (core_message := core_response.get("message")):
+        core_response = self.core_api.add_news_items(news_items_dicts)
+        if isinstance(core_response, dict):
+            self.published_story_ids.extend(str(story_id) for story_id in core_response.get("story_ids") or [])
+        if core_response and (core_message := core_response.get("message")):
             logger.info(core_message)
             if core_message == "All news items were skipped":
                 raise NoChangeError("All news items were skipped")
@@ -11,8 +11,8 @@ from models.assess import NewsItem
 from trafilatura import extract, extract_metadata
 
 from worker.collectors.base_collector import BaseCollector, NoChangeError
+from worker.collectors.fetch_engine import DEFAULT_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_REQUESTS_PER_HOST, FetchEngine
 from worker.collectors.playwright_manager import PlaywrightManager
-from worker.config import Config
 from worker.core_api import IconFile
 from worker.log import logger
 
@@ -49,6 +49,7 @@ class BaseWebCollector(BaseCollector):
         self.web_url: str = ""
         self.http_validators: dict[str, str | None] | None = None
         self.use_conditional_requests = False
+        self.fetch_engine = FetchEngine()
 
     def configure_primary_http_resource(self, source: dict, url: str, *, manual: bool) -> None:
         self.http_validators = {"url": url, "etag": None, "last_modified": None}
@@ -82,8 +83,7 @@ class BaseWebCollector(BaseCollector):
         primary_request = http_validators is not None and http_validators["url"] == url
 
         logger.debug(f"Sending GET request to {url}")
-        with requests.Session(disable_http3=Config.DISABLE_HTTP3) as session:
-            response = session.get(url, headers=self._request_headers(url, modified_since), proxies=self.proxies, timeout=self.timeout)
+        response = self.fetch_engine.get(url, headers=self._request_headers(url, modified_since), proxies=self.proxies, timeout=self.timeout)
         if http_validators is not None and primary_request and response.status_code == 200:
             http_validators["etag"] = response.headers.get("ETag")
             http_validators["last_modified"] = response.headers.get("Last-Modified")
@@ -107,9 +107,18 @@ class BaseWebCollector(BaseCollector):
         if user_agent := source["parameters"].get("USER_AGENT", None):
             self.headers.update({"User-Agent": user_agent})
         self.browser_mode = source["parameters"].get("BROWSER_MODE", "false")
+        self.configure_fetch_engine(source["parameters"])
 
         self.osint_source_id = str(source["id"])
 
+    def configure_fetch_engine(self, parameters: dict):
+        """Apply the per-source fetch limits, in browser mode they also bound the pages loading in parallel."""
+        self.fetch_engine.configure(
+            max_concurrent_requests=int(parameters.get("MAX_CONCURRENT_REQUESTS") or DEFAULT_MAX_CONCURRENT_REQUESTS),
+            max_requests_per_host=int(parameters.get("MAX_REQUESTS_PER_HOST") or DEFAULT_MAX_REQUESTS_PER_HOST),
+            host_request_interval=float(parameters.get("HOST_REQUEST_INTERVAL") or 0),
+        )
+
     def set_proxies(self, proxy_server: str | None):
         self.proxies = {"http": proxy_server, "https": proxy_server, "ftp": proxy_server}
 
@@ -133,8 +142,7 @@ class BaseWebCollector(BaseCollector):
         return None
 
     def _fetch_icon(self, icon_url: str) -> requests.Response:
-        with requests.Session(disable_http3=Config.DISABLE_HTTP3) as session:
-            return session.get(icon_url, headers=self._request_headers(icon_url), proxies=self.proxies, timeout=5)
+        return self.fetch_engine.get(icon_url, headers=self._request_headers(icon_url), proxies=self.proxies, timeout=5)
 
     def update_favicon(self, web_url: str, osint_source_id: str):
         # TODO: Try getting apple-touch-icon first
@@ -152,7 +160,8 @@ class BaseWebCollector(BaseCollector):
 
     def fetch_article_content(self, web_url: str, xpath: str = "") -> tuple[str, datetime.datetime | None] | tuple[Literal[""], None]:
         if self.browser_mode == "true" and self.playwright_manager:
-            web_content, last_modified = self.playwright_manager.fetch_content_with_js(web_url, xpath)
+            with self.fetch_engine.host_limiter(web_url).slot():
+                web_content, last_modified = self.playwright_manager.fetch_content_with_js(web_url, xpath)
             published_date = parse_datetime(last_modified) if last_modified else None
             return web_content, published_date
 
@@ -223,17 +232,18 @@ class BaseWebCollector(BaseCollector):
         urls = [a["href"] for a in soup.find_all("a", href=True) if isinstance(a, Tag) and a.has_attr("href")]
         return [urljoin(collector_url, url) for url in urls if isinstance(url, str)]
 
+    def digest_news_item(self, split_digest_url: str) -> NewsItem | None:
+        try:
+            return self.news_item_from_article(split_digest_url)
+        except ValueError as e:
+            logger.warning(f"Failed to parse the digest with error: {e!s}")
+            return None
+
     def parse_digests(self) -> list[NewsItem]:
-        news_items = []
         max_elements = min(len(self.split_digest_urls), self.digest_splitting_limit)
-        for split_digest_url in self.split_digest_urls[:max_elements]:
-            try:
-                news_items.append(self.news_item_from_article(split_digest_url))
-            except ValueError as e:
-                logger.warning(f"Failed to parse the digest with error: {e!s}")
-                continue
-            except Exception as e:
-                logger.error(f"Failed digest splitting with error: {e!s}")
-                raise
-
-        return news_items
+        try:
+            news_items = self.fetch_engine.map(self.digest_news_item, self.split_digest_urls[:max_elements])
+            return [news_item for news_item in news_items if news_item is not None]
+        except Exception as e:
+            logger.error(f"Failed digest splitting with error: {e!s}")
+            raise
@@ -0,0 +1,204 @@
+"""Long-lived headless Chromium shared by the browser mode collectors of one worker process.
+
+RQ runs every job in a short-lived work horse, so the browser is started as a detached process
+and its DevTools endpoint is recorded in a state file owned by the worker process. Each
+collection run connects over CDP, opens a context for its source and disconnects again. The
+browser is replaced when it fails its health check, has served BROWSER_POOL_MAX_PAGES pages or
+uses more than BROWSER_POOL_MAX_MEMORY_MB.
+"""
+
+import contextlib
+import fcntl
+import json
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from worker.config import Config
+from worker.log import logger
+
+
+OWNER_ENV = "TARANIS_BROWSER_POOL_OWNER"
+STARTUP_TIMEOUT = 15.0
+HEALTH_CHECK_TIMEOUT = 2.0
+HEADLESS_SHELL_NAMES = ("chrome-headless-shell", "headless_shell")
+BROWSER_ARGS = [
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--remote-debugging-address=127.0.0.1",
+    "--remote-debugging-port=0",
+]
+
+
+def _state_path() -> Path:
+    owner = os.environ.get(OWNER_ENV) or str(os.getpid())
+    return Path(Config.BROWSER_POOL_DIR or tempfile.gettempdir()) / f"taranis-browser-{owner}.json"
+
+
+@contextlib.contextmanager
+def _locked_state() -> Iterator[dict[str, Any]]:
+    """Yield the pool state under an exclusive lock and write back changes made to it."""
+    path = _state_path()
+    with open(path.with_suffix(".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            state = json.loads(path.read_text()) if path.exists() else {}
+        except (OSError, ValueError):
+            state = {}
+        before = dict(state)
+        try:
+            yield state
+        finally:
+            if state != before:
+                path.write_text(json.dumps(state))
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except (ProcessLookupError, PermissionError):
+        return False
+    return True
+
+
+def _is_healthy(endpoint: str) -> bool:
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=HEALTH_CHECK_TIMEOUT) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def memory_usage_mb(pid: int) -> float | None:
+    """Resident memory of a process and its descendants, None where /proc is not available."""
+    children: dict[int, list[int]] = {}
+    rss: dict[int, int] = {}
+    try:
+        proc_entries = [entry for entry in os.listdir("/proc") if entry.isdigit()]
+    except OSError:
+        return None
+    for entry in proc_entries:
+        try:
+            status = Path(f"/proc/{entry}/status").read_text()
+        except OSError:
+            continue
+        fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+        child_pid = int(entry)
+        children.setdefault(int(fields.get("PPid", "0").strip()), []).append(child_pid)
+        rss[child_pid] = int(fields.get("VmRSS", "0 kB").split()[0])
+    pending, total_kb = [pid], 0
+    while pending:
+        current = pending.pop()
+        total_kb += rss.get(current, 0)
+        pending.extend(children.get(current, []))
+    return total_kb / 1024
+
+
+def _needs_recycling(state: dict[str, Any]) -> str | None:
+    if not state:
+        return "no browser running"
+    if not _is_running(state["pid"]) or not _is_healthy(state["endpoint"]):
+        return "health check failed"
+    if state["pages_served"] >= Config.BROWSER_POOL_MAX_PAGES:
+        return f"served {state['pages_served']} pages"
+    if (memory := memory_usage_mb(state["pid"])) is not None and memory > Config.BROWSER_POOL_MAX_MEMORY_MB:
+        return f"uses {memory:.0f} MB"
+    return None
+
+
+def resolve_executable(executable_path: str) -> str:
+    """Binary to start for Playwright's Chromium executable path.
+
+    Playwright reports the full Chromium browser, but images installed with
+    `playwright install --only-shell` only contain the headless shell of the same revision.
+    The headless shell is preferred when it is installed.
+    """
+    path = Path(executable_path)
+    if browser_dir := next((parent for parent in path.parents if parent.name.startswith("chromium-")), None):
+        shell_dir = browser_dir.parent / f"chromium_headless_shell-{browser_dir.name.removeprefix('chromium-')}"
+        for name in HEADLESS_SHELL_NAMES:
+            if shells := sorted(shell_dir.glob(f"*/{name}")):
+                return str(shells[0])
+    if path.is_file():
+        return executable_path
+    raise FileNotFoundError(f"Neither {executable_path} nor its headless shell is installed")
+
+
+def _launch(executable_path: str) -> dict[str, Any]:
+    user_data_dir = tempfile.mkdtemp(prefix="taranis-browser-")
+    process = subprocess.Popen(
+        [executable_path, *BROWSER_ARGS, f"--user-data-dir={user_data_dir}", "about:blank"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    port_file = Path(user_data_dir) / "DevToolsActivePort"
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            break
+        if port_file.exists() and (port := port_file.read_text().split("\n", 1)[0].strip()):
+            endpoint = f"http://127.0.0.1:{port}"
+            logger.info(f"Started pooled browser {process.pid} at {endpoint}")
+            return {"pid": process.pid, "endpoint": endpoint, "user_data_dir": user_data_dir, "pages_served": 0}
+        time.sleep(0.05)
+    _terminate({"pid": process.pid, "user_data_dir": user_data_dir})
+    raise RuntimeError(f"Browser {executable_path} did not expose a DevTools endpoint within {STARTUP_TIMEOUT:.0f}s")
+
+
+def _terminate(state: dict[str, Any]) -> None:
+    pid = state["pid"]
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(pid, signal.SIGTERM)
+        deadline = time.monotonic() + 5
+        while _is_running(pid) and time.monotonic() < deadline:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, os.WNOHANG)
+            time.sleep(0.05)
+        if _is_running(pid):
+            os.killpg(pid, signal.SIGKILL)
+    shutil.rmtree(state["user_data_dir"], ignore_errors=True)
+
+
+def acquire(executable_path: str) -> str:
+    """CDP endpoint of a healthy pooled browser, (re)starting it when needed."""
+    with _locked_state() as state:
+        if reason := _needs_recycling(state):
+            if state:
+                logger.info(f"Recycling pooled browser {state['pid']}: {reason}")
+                _terminate(state)
+            state.clear()
+            state.update(_launch(resolve_executable(executable_path)))
+        return state["endpoint"]
+
+
+def release(pages_served: int, healthy: bool = True) -> None:
+    """Record the pages a collection run served; an unhealthy browser is recycled on the next acquire."""
+    with _locked_state() as state:
+        if not state:
+            return
+        state["pages_served"] += pages_served
+        if not healthy:
+            state["pages_served"] = Config.BROWSER_POOL_MAX_PAGES
+
+
+def shutdown() -> None:
+    with _locked_state() as state:
+        if state:
+            logger.info(f"Stopping pooled browser {state['pid']}")
+            _terminate(state)
+            state.clear()
+    with contextlib.suppress(OSError):
+        _state_path().unlink()
+        _state_path().with_suffix(".lock").unlink()
@@ -6,6 +6,7 @@ Functions for collecting news from OSINT sources.
 from contextlib import contextmanager
 from typing import Any
 
+from models.task import TaskAffectedEntities
 from rq import get_current_job
 
 import worker.collectors
@@ -231,6 +232,9 @@ def collector_task(osint_source_id: str, manual: bool = False):
             result=build_success_task_result(
                 default_message=result_message,
                 data=_collector_result_data(osint_source_id, manual, collector_impl),
+                affected=TaskAffectedEntities(
+                    osint_source_ids=[osint_source_id], story_ids=getattr(collector_impl, "published_story_ids", [])
+                ),
             ),
         )
 
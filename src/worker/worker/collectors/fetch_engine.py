@@ -0,0 +1,144 @@
+"""HTTP fetching for web collectors: one pooled session, bounded concurrency and per-host politeness.
+
+Articles are fetched and extracted on a small thread pool, so extracting one article overlaps
+with waiting for the next ones. Requests to the same host are capped and optionally spaced out,
+and 429 responses carrying a short Retry-After are retried after pausing that host.
+"""
+
+import datetime
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+from urllib.parse import urlparse
+
+import niquests as requests
+
+from worker.config import Config
+from worker.log import logger
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_MAX_REQUESTS_PER_HOST = 2
+MAX_RETRIES = 2
+# Longer Retry-After values are not waited for, the 429 response is returned to the caller instead.
+MAX_RETRY_AFTER = 30
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a Retry-After header, given as delay in seconds or as HTTP date."""
+    if not value or not (value := value.strip()):
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    return max((retry_at - datetime.datetime.now(datetime.UTC)).total_seconds(), 0.0)
+
+
+class HostLimiter:
+    """Caps parallel requests to one host and spaces out their start times."""
+
+    def __init__(self, max_requests: int, interval: float):
+        self.slots = threading.BoundedSemaphore(max_requests)
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+    def pause(self, seconds: float) -> None:
+        with self.lock:
+            self.next_start = max(self.next_start, time.monotonic() + seconds)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self.slots:
+            with self.lock:
+                now = time.monotonic()
+                start = max(now, self.next_start)
+                self.next_start = start + self.interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+class FetchEngine:
+    def __init__(
+        self,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_requests_per_host: int = DEFAULT_MAX_REQUESTS_PER_HOST,
+        host_request_interval: float = 0.0,
+    ):
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostLimiter] = {}
+        self.configure(max_concurrent_requests, max_requests_per_host, host_request_interval)
+
+    def configure(self, max_concurrent_requests: int, max_requests_per_host: int, host_request_interval: float) -> None:
+        self.max_concurrent_requests = max(max_concurrent_requests, 1)
+        self.max_requests_per_host = max(max_requests_per_host, 1)
+        self.host_request_interval = max(host_request_interval, 0.0)
+        with self._lock:
+            self._hosts = {}
+
+    @property
+    def session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session(disable_http3=Config.DISABLE_HTTP3)
+            return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def host_limiter(self, url: str) -> HostLimiter:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostLimiter(self.max_requests_per_host, self.host_request_interval)
+            return self._hosts[host]
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        limiter = self.host_limiter(url)
+        for attempt in range(MAX_RETRIES + 1):
+            with limiter.slot():
+                response = self.session.get(url, **kwargs)
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                break
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None or retry_after > MAX_RETRY_AFTER:
+                break
+            logger.info(f"{url} returned 429 Too Many Requests, pausing requests to this host for {retry_after:.1f}s")
+            limiter.pause(retry_after)
+        return response
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Apply func to items on up to max_concurrent_requests threads and yield the results in order.
+
+        An exception raised by func is re-raised when its result is reached, work not yet started is cancelled.
+        """
+        items = list(items)
+        if self.max_concurrent_requests == 1 or len(items) <= 1:
+            yield from map(func, items)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(items)), thread_name_prefix="fetch") as executor:
+            futures = [executor.submit(func, item) for item in items]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
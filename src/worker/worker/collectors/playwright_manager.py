@@ -1,34 +1,97 @@
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 from urllib.parse import urlparse
 
-from playwright.sync_api import Browser, BrowserContext, Error, Page, Playwright, TimeoutError, sync_playwright
+from playwright.async_api import Browser, BrowserContext, Error, Page, Playwright, TimeoutError, async_playwright
 
+from worker.collectors import browser_pool
+from worker.config import Config
 from worker.log import logger
 
 
+T = TypeVar("T")
+CONNECT_TIMEOUT_MS = 10_000
+
+
 class PlaywrightManager:
-    def __init__(self, proxies: dict | None = None, headers: dict | None = None) -> None:
+    """Browser context for one collection run, with up to max_pages pages loading in parallel.
+
+    Playwright runs on its own event loop thread, so fetch_content_with_js can be called from
+    several threads at once. The browser itself comes from the worker's browser pool unless
+    BROWSER_POOL is disabled or the pool cannot start a browser, then it is launched for this
+    run only.
+    """
+
+    def __init__(self, proxies: dict | None = None, headers: dict | None = None, max_pages: int = 1) -> None:
         self.proxies = proxies
         self.headers = headers
+        self.max_pages = max(max_pages, 1)
         self.playwright: Playwright | None = None
         self.browser: Browser | None = None
         self.context: BrowserContext | None = None
-        self.page: Page | None = None
+        self.pages_served = 0
+        self.healthy = True
+        self.pooled = False
+        self._idle_pages: list[Page] = []
+        self._page_slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        if self._loop is None:
+            raise RuntimeError("Playwright event loop is not running")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
 
     def _ensure_started(self) -> None:
-        if self.playwright and self.browser and self.context and self.page:
-            return
+        with self._start_lock:
+            if self.context:
+                return
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever, name="playwright", daemon=True)
+                self._loop_thread.start()
+            self._run(self._start())
 
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(proxy=self.parse_proxies(self.proxies))  # type: ignore
-        self.context = self.setup_context(self.headers)
-        self.page = self.context.new_page()
+    async def _start(self) -> None:
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        self.browser = await self._connect(self.playwright)
+        self.context = await self.setup_context(self.headers)
+        self._page_slots = asyncio.Semaphore(self.max_pages)
 
-    def setup_context(self, headers: dict | None = None) -> BrowserContext:
+    async def _connect(self, playwright: Playwright) -> Browser:
+        if Config.BROWSER_POOL:
+            try:
+                browser = await self._connect_to_pool(playwright)
+                self.pooled = True
+                return browser
+            except (OSError, RuntimeError, Error) as e:
+                logger.error(f"Browser pool is not available, launching a browser for this run: {e!s}")
+        return await playwright.chromium.launch()
+
+    async def _connect_to_pool(self, playwright: Playwright) -> Browser:
+        executable_path = playwright.chromium.executable_path
+        endpoint = await asyncio.to_thread(browser_pool.acquire, executable_path)
+        try:
+            return await playwright.chromium.connect_over_cdp(endpoint, timeout=CONNECT_TIMEOUT_MS)
+        except Error as e:
+            logger.warning(f"Could not connect to pooled browser at {endpoint}, restarting it: {e!s}")
+            await asyncio.to_thread(browser_pool.release, 0, False)
+            endpoint = await asyncio.to_thread(browser_pool.acquire, executable_path)
+            return await playwright.chromium.connect_over_cdp(endpoint, timeout=CONNECT_TIMEOUT_MS)
+
+    async def setup_context(self, headers: dict | None = None) -> BrowserContext:
         if self.browser is None:
             raise RuntimeError("Playwright browser is not started")
+        options: dict[str, Any] = {}
+        if proxy := self.parse_proxies(self.proxies):
+            options["proxy"] = proxy
         if headers and None not in headers.values():
-            return self.browser.new_context(extra_http_headers=headers)
-        return self.browser.new_context()
+            options["extra_http_headers"] = headers
+        return await self.browser.new_context(**options)
 
     def parse_proxies(self, proxies: dict | None = None) -> dict | None:
         http_proxy = proxies.get("http") if proxies else None
@@ -41,46 +104,83 @@ class PlaywrightManager:
         return {"server": parsed_url.geturl(), "username": username, "password": password}
 
     def stop_playwright_if_needed(self) -> None:
+        if self._loop is None:
+            logger.debug("No Playwright to stop")
+            return
+
+        try:
+            self._run(self._stop())
+        except Error as e:
+            logger.warning(f"Error while stopping Playwright: {e!s}")
+            self.healthy = False
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread:
+                self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+
+        if self.pooled and (self.pages_served or not self.healthy):
+            browser_pool.release(self.pages_served, self.healthy)
+        self.pooled = False
+        self.pages_served = 0
+
+    async def _stop(self) -> None:
         if self.context:
-            self.context.close()
+            await self.context.close()
             logger.debug("Playwright context closed")
-        else:
-            logger.debug("No Playwright context to close")
+        self.context = None
+        self._idle_pages = []
 
+        # Disconnects from a pooled browser, closes a browser launched for this run.
         if self.browser:
-            self.browser.close()
+            await self.browser.close()
             logger.debug("Playwright browser closed")
-        else:
-            logger.debug("No Playwright browser to close")
+        self.browser = None
 
         if self.playwright:
-            self.playwright.stop()
-            logger.debug("Playwright context stopped")
-        else:
-            logger.debug("No Playwright to stop")
+            await self.playwright.stop()
+            logger.debug("Playwright stopped")
+        self.playwright = None
 
     def fetch_content_with_js(self, url: str, xpath: str = "") -> tuple[str, str | None]:
         logger.debug(f"Getting web content with JS for {url} - {xpath=}")
         self._ensure_started()
-        page = self.page
-        if page is None:
-            raise RuntimeError("Playwright page is not started")
+        return self._run(self._fetch_content(url, xpath))
+
+    async def _fetch_content(self, url: str, xpath: str) -> tuple[str, str | None]:
+        if self.context is None or self._page_slots is None:
+            raise RuntimeError("Playwright context is not started")
+
+        async with self._page_slots:
+            page = self._idle_pages.pop() if self._idle_pages else await self.context.new_page()
+            try:
+                return await self._load_page(page, url, xpath)
+            finally:
+                self.pages_served += 1
+                if page.is_closed():
+                    self.healthy = False
+                else:
+                    self._idle_pages.append(page)
+
+    async def _load_page(self, page: Page, url: str, xpath: str) -> tuple[str, str | None]:
         last_modified = None
         try:
-            response = page.goto(url)
+            response = await page.goto(url)
             if response:
-                last_modified = response.header_value("Last-Modified")
+                last_modified = await response.header_value("Last-Modified")
 
             if xpath:
                 locator = page.locator(f"xpath={xpath}")
-                locator.wait_for(state="visible")
-                return page.content() or "", last_modified
+                await locator.wait_for(state="visible")
+                return await page.content() or "", last_modified
 
-            page.wait_for_load_state("networkidle")
+            await page.wait_for_load_state("networkidle")
         except TimeoutError as e:
             logger.error(
                 f"Fetching content with JS for {url} with {xpath=} has timed out, invalid XPath could be the reason, check for details. \nDetails: \n{e!s}"
             )
         except Error as e:
             logger.error(f"Error fetching content with JS: {e!s}")
-        return page.content() or "", last_modified
+        return await page.content() or "", last_modified
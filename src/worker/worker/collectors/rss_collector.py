@@ -6,12 +6,15 @@ import feedparser
 import niquests as requests
 from models.assess import NewsItem
 
-from worker.collectors.base_web_collector import BaseWebCollector, parse_datetime
+from worker.collectors.base_web_collector import BaseWebCollector, NoChangeError, parse_datetime
 from worker.collectors.playwright_manager import PlaywrightManager
 from worker.core_api import IconFile
 from worker.log import logger
 
 
+MAX_FEED_ENTRIES = 42
+
+
 class RSSCollectorError(Exception):
     """Custom exception for RSSCollector errors."""
 
@@ -145,14 +148,38 @@ class RSSCollector(BaseWebCollector):
         transformed_segments = [operation.replace("{}", segment) for segment, operation in zip(segments, transform_str.split("/"))]
         return f"{parsed_url.scheme}://{'/'.join(transformed_segments)}"
 
+    def get_entry_link(self, feed_entry: feedparser.FeedParserDict, source: dict) -> str:
+        link: str = str(feed_entry.get("link", ""))
+        if link_transformer := source["parameters"].get("LINK_TRANSFORMER", None):
+            link = self.link_transformer(link, link_transformer)
+        return link
+
+    def drop_known_entries(self, feed_entries: list[feedparser.FeedParserDict], source: dict) -> list[feedparser.FeedParserDict]:
+        """Drop entries core already stores, so their articles are not fetched and extracted again.
+
+        Core identifies news items by a hash over title and link. Both are known from the feed
+        metadata unless the title has to be taken from the article, those entries are kept.
+        """
+        entry_hashes: list[str | None] = []
+        for feed_entry in feed_entries:
+            title = str(feed_entry.get("title", ""))
+            link = self.get_entry_link(feed_entry, source)
+            entry_hashes.append(NewsItem(osint_source_id=str(source["id"]), title=title, link=link).hash if title and link else None)
+
+        if not (hashes := [entry_hash for entry_hash in entry_hashes if entry_hash]):
+            return feed_entries
+        if (known_hashes := self.core_api.get_known_news_item_hashes(hashes)) is None:
+            return feed_entries
+
+        new_entries = [feed_entry for feed_entry, entry_hash in zip(feed_entries, entry_hashes) if entry_hash not in known_hashes]
+        logger.info(f"RSS-Feed {self.feed_url}: skipping {len(feed_entries) - len(new_entries)} already collected entries")
+        return new_entries
+
     def parse_feed_entry(self, feed_entry: feedparser.FeedParserDict, source) -> NewsItem:
         author: str = str(feed_entry.get("author", ""))
         title: str = str(feed_entry.get("title", ""))
         description: str = str(feed_entry.get("description", ""))
-        link: str = str(feed_entry.get("link", ""))
-
-        if link_transformer := source["parameters"].get("LINK_TRANSFORMER", None):
-            link = self.link_transformer(link, link_transformer)
+        link = self.get_entry_link(feed_entry, source)
 
         published = self.get_published_date(feed_entry)
         content = ""
@@ -224,25 +251,28 @@ class RSSCollector(BaseWebCollector):
         return
 
     def parse_feed(self, feed_entries: list[feedparser.FeedParserDict], source: dict) -> list[NewsItem]:
-        for feed_entry in feed_entries:
-            self.news_items.append(self.parse_feed_entry(feed_entry, source))
+        if self.use_feed_content:
+            self.news_items.extend(self.parse_feed_entry(feed_entry, source) for feed_entry in feed_entries)
+        else:
+            self.news_items.extend(self.fetch_engine.map(lambda feed_entry: self.parse_feed_entry(feed_entry, source), feed_entries))
         return self.news_items
 
     def gather_news_items(self, feed: feedparser.FeedParserDict, source: dict) -> list[NewsItem]:
         if self.browser_mode == "true":
-            self.playwright_manager = PlaywrightManager(self.proxies, self._request_headers(""))
+            self.playwright_manager = PlaywrightManager(self.proxies, self._request_headers(""), self.fetch_engine.max_concurrent_requests)
         try:
             self.news_items = self.collect_news(feed, source)
         finally:
             if self.playwright_manager:
                 self.playwright_manager.stop_playwright_if_needed()
+            self.fetch_engine.close()
         return self.news_items
 
     def collect_news(self, feed: feedparser.FeedParserDict, source: dict) -> list[NewsItem]:
         if self.digest_splitting == "true":
-            return self.handle_digests(feed["entries"][:42])
+            return self.handle_digests(feed["entries"][:MAX_FEED_ENTRIES])
 
-        return self.parse_feed(feed["entries"][:42], source)
+        return self.parse_feed(feed["entries"][:MAX_FEED_ENTRIES], source)
 
     def handle_digests(self, feed_entries: list[feedparser.FeedParserDict]) -> list[NewsItem]:
         self.split_digest_urls = self.get_digest_url_list(feed_entries)
@@ -289,6 +319,10 @@ class RSSCollector(BaseWebCollector):
 
         if not feed["entries"]:
             raise EmptyRSSFeedError(self.feed_url)
+        if self.digest_splitting != "true":
+            feed["entries"] = self.drop_known_entries(feed["entries"][:MAX_FEED_ENTRIES], source)
+            if not feed["entries"]:
+                raise NoChangeError("All news items were skipped")
         self.news_items = self.gather_news_items(feed, source)
 
         return self.publish(self.news_items, source)
@@ -55,12 +55,13 @@ class SimpleWebCollector(BaseWebCollector):
 
     def gather_news_items(self) -> list[NewsItem]:
         if self.browser_mode == "true":
-            self.playwright_manager = PlaywrightManager(self.proxies, self._request_headers(""))
+            self.playwright_manager = PlaywrightManager(self.proxies, self._request_headers(""), self.fetch_engine.max_concurrent_requests)
         try:
             self.news_items = self.collect_news()
         finally:
             if self.playwright_manager:
                 self.playwright_manager.stop_playwright_if_needed()
+            self.fetch_engine.close()
 
         return self.news_items
 
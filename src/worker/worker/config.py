@@ -24,6 +24,11 @@ class Settings(BaseSettings):
     SSL_VERIFICATION: bool = False
     DISABLE_HTTP3: bool = False
     REQUESTS_TIMEOUT: int = 60
+    # BROWSER_MODE collectors share one headless browser per worker process, recycled after the limits below.
+    BROWSER_POOL: bool = True
+    BROWSER_POOL_DIR: str = ""
+    BROWSER_POOL_MAX_PAGES: int = 500
+    BROWSER_POOL_MAX_MEMORY_MB: int = 1024
     # This selects which task types the worker handles. The worker defines their dequeue-priority order.
     WORKER_TYPES: list[str] = list(WORKER_TYPE_PRIORITIES)
     REDIS_URL: str = "redis://localhost:6379"
@@ -36,7 +41,17 @@ class Settings(BaseSettings):
     SENTIMENT_ANALYSIS_API_ENDPOINT: str = "http://llm-bot:8000/sentiment"
     CYBERSEC_CLASSIFIER_API_ENDPOINT: str = "http://llm-bot:8000/cybersec-classification"
     CYBERSEC_CLASSIFIER_THRESHOLD: float = 0.65
+    # Defaults for the BATCH_SIZE and MAX_PARALLEL_REQUESTS parameters of the model-backed bots.
+    INFERENCE_BATCH_SIZE: int = 1
+    INFERENCE_MAX_PARALLEL_REQUESTS: int = 4
+    INFERENCE_MAX_RETRIES: int = 2
+    # Result cache of the NLP, sentiment, cybersecurity classifier and IOC bots: "redis", "disk" or "" to disable.
+    INFERENCE_CACHE: Literal["redis", "disk", ""] = "redis"
+    INFERENCE_CACHE_DIR: str = ""
+    INFERENCE_CACHE_MAX_ENTRIES: int = 50000
+    INFERENCE_CACHE_TTL: int = 30 * 24 * 3600
     CRON_POLL_INTERVAL_SECONDS: float = 15.0
+    CRON_FULL_SYNC_INTERVAL_SECONDS: float = 300.0
 
     @field_validator("TARANIS_BASE_PATH", mode="before")
     def ensure_start_and_end_slash(cls, v: str, info: ValidationInfo) -> str:
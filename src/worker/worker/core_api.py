@@ -1,10 +1,11 @@
 # pyright: reportMissingParameterType=false, reportMissingTypeArgument=false
-from typing import Any
+import hashlib
+from typing import Any, Self
 from urllib.parse import urlencode
 
 import niquests as requests
 from models.product import WorkerProduct as Product
-from models.task import TaskResultEnvelope, TaskSubmission
+from models.task import TaskAffectedEntities, TaskResultEnvelope, TaskSubmission
 from niquests.typing import MultiPartFilesAltType
 from pydantic import ValidationError
 from rq import get_current_job
@@ -15,6 +16,7 @@ from worker.log import logger
 
 _MISSING_RESULT = object()
 IconFile = dict[str, tuple[str, bytes | None]]
+ATTRIBUTE_UPDATE_BATCH_SIZE = 200
 
 
 def build_task_result(
@@ -23,12 +25,14 @@ def build_task_result(
     reason: str | None = None,
     retryable: bool = False,
     data: Any = None,
+    affected: TaskAffectedEntities | None = None,
 ) -> dict[str, Any]:
     return TaskResultEnvelope(
         message=message,
         reason=reason,
         retryable=retryable,
         data=data,
+        affected=affected,
     ).model_dump(mode="json", exclude_none=False)
 
 
@@ -42,6 +46,7 @@ def build_success_task_result(
     merge_dict_data: bool = True,
     retryable: bool = False,
     none_message: str | None = None,
+    affected: TaskAffectedEntities | None = None,
 ) -> dict[str, Any]:
     if output is not _MISSING_RESULT and data is not _MISSING_RESULT:
         raise ValueError("build_success_task_result accepts either output=... or data=..., not both")
@@ -51,6 +56,7 @@ def build_success_task_result(
             default_message,
             retryable=retryable,
             data=data,
+            affected=affected,
         )
 
     normalized_data = dict(base_data or {})
@@ -78,6 +84,7 @@ def build_success_task_result(
         message,
         retryable=retryable,
         data=result_data,
+        affected=affected,
     )
 
 
@@ -306,20 +313,42 @@ class CoreApi:
     def get_product(self, product_id: str) -> dict | None:
         return self.api_get(f"/worker/products/{product_id}")
 
-    def get_product_render(self, product_id: str) -> Product | None:
+    def upload_artifact(self, data: bytes) -> str | None:
+        """Store raw bytes in the artifact store of core and return their digest.
+
+        The upload is skipped if core already has an artifact with the same content.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        url = f"{self.api_url}/worker/artifacts"
+        try:
+            if requests.head(url=f"{url}/{digest}", headers=self.headers, verify=self.verify, timeout=self.timeout).ok:
+                return digest
+            headers = {**self.headers, "Content-type": "application/octet-stream"}
+            response = requests.post(url=url, headers=headers, data=data, verify=self.verify, timeout=self.timeout)
+        except requests.exceptions.RequestException:
+            logger.exception("Can't upload artifact")
+            return None
+        if (result := self.check_response(response, url)) is None:
+            return None
+        if result.get("digest") != digest:
+            logger.error(f"Core stored artifact {result.get('digest')} instead of {digest}")
+            return None
+        return digest
+
+    def get_artifact(self, digest: str, mime_type: str | None = None) -> Product | None:
+        url = f"{self.api_url}/worker/artifacts/{digest}"
         try:
-            url = f"{self.api_url}/worker/products/{product_id}/render"
             response = requests.get(url=url, headers=self.headers, verify=self.verify, timeout=self.timeout)
-            if not response.ok:
-                logger.error(f"Call to {url} failed {response.status_code}")
-                return None
-            mime_type = response.headers.get("Content-Type", "")
-            if isinstance(mime_type, bytes):
-                mime_type = mime_type.decode()
-            return Product(data=response.content, mime_type=mime_type)
-        except (requests.exceptions.RequestException, UnicodeDecodeError, ValidationError):
-            logger.exception("Can't get Product Render")
+        except requests.exceptions.RequestException:
+            logger.exception("Can't get artifact")
+            return None
+        if not response.ok:
+            logger.error(f"Call to {url} failed {response.status_code}")
             return None
+        if hashlib.sha256(data := response.content or b"").hexdigest() != digest:
+            logger.error(f"Artifact {digest} failed the integrity check")
+            return None
+        return Product(data=data, mime_type=mime_type)
 
     def publish_product_to_taranis(self, product_id: str) -> dict | None:
         return self.api_post(f"/worker/products/{product_id}/publish")
@@ -374,6 +403,9 @@ class CoreApi:
     def get_stories(self, filter_dict: dict) -> list | None:
         return self.api_get("/worker/stories", params=filter_dict) or []
 
+    def get_stories_page(self, filter_dict: dict) -> dict | None:
+        return self.api_get("/worker/stories", params={"cursor": "", **filter_dict})
+
     def get_tags(self) -> dict | None:
         return self.api_get("/worker/tags")
 
@@ -422,6 +454,25 @@ class CoreApi:
         except requests.exceptions.RequestException:
             return None
 
+    def update_attributes_bulk(self, news_items: dict[str, list[dict]] | None = None, stories: dict[str, dict] | None = None) -> dict | None:
+        """Patch attributes of many news items and stories in one request and core transaction.
+
+        Example:
+
+        update_attributes_bulk(
+            {"news_item_id": [{"key": "sentiment_category", "value": "neutral"}]},
+            {"story_id": {"attributes": [{"key": "SUMMARY_BOT", "value": "1"}], "summary": "..."}},
+        )
+
+        """
+        try:
+            return self.api_patch(url="/bots/attributes", json_data={"news_items": news_items or {}, "stories": stories or {}})
+        except requests.exceptions.RequestException:
+            return None
+
+    def attribute_update_buffer(self, max_size: int = ATTRIBUTE_UPDATE_BATCH_SIZE) -> "AttributeUpdateBuffer":
+        return AttributeUpdateBuffer(self, max_size)
+
     def run_post_collection_bots(self, source_id) -> dict | None:
         try:
             return self.api_put(
@@ -474,6 +525,14 @@ class CoreApi:
         except requests.exceptions.RequestException:
             return None
 
+    def get_known_news_item_hashes(self, hashes: list[str]) -> set[str] | None:
+        try:
+            response = self.api_post(url="/worker/news-items/known", json_data={"hashes": hashes})
+        except requests.exceptions.RequestException:
+            logger.exception("Can't get known news item hashes")
+            return None
+        return set(response["hashes"]) if response else None
+
     def add_news_items(self, news_items) -> dict | None:
         response = self.api_post(url="/worker/news-items", json_data=news_items)
         if response is None:
@@ -506,3 +565,65 @@ class CoreApi:
         except requests.exceptions.RequestException:
             logger.exception("Cannot add or update story.")
             return None
+
+
+class AttributeUpdateBuffer:
+    """Collects news item and story updates of a bot run and sends them with update_attributes_bulk.
+
+    Updates for the same id are merged. The buffer flushes once max_size news items and stories
+    are pending and when a with block using it ends. Ids core could not update end up in failed.
+    """
+
+    def __init__(self, core_api: CoreApi, max_size: int = ATTRIBUTE_UPDATE_BATCH_SIZE):
+        self.core_api = core_api
+        self.max_size = max(max_size, 1)
+        self.news_items: dict[str, list[dict]] = {}
+        self.stories: dict[str, dict[str, Any]] = {}
+        self.failed: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.news_items) + len(self.stories)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def add_news_item_attributes(self, news_item_id: str, attributes: list[dict]) -> None:
+        self.news_items.setdefault(news_item_id, []).extend(attributes)
+        self._flush_if_full()
+
+    def add_story_attributes(self, story_id: str, attributes: list[dict]) -> None:
+        self.stories.setdefault(story_id, {}).setdefault("attributes", []).extend(attributes)
+        self._flush_if_full()
+
+    def update_story(self, story_id: str, *, summary: str | None = None, title: str | None = None) -> None:
+        story_update = self.stories.setdefault(story_id, {})
+        if summary is not None:
+            story_update["summary"] = summary
+        if title is not None:
+            story_update["title"] = title
+        self._flush_if_full()
+
+    def _flush_if_full(self) -> None:
+        if len(self) >= self.max_size:
+            self.flush()
+
+    def flush(self) -> bool:
+        """Send pending updates, False if some of them were not applied."""
+        if not len(self):
+            return True
+        news_items, stories = self.news_items, self.stories
+        self.news_items, self.stories = {}, {}
+        result = self.core_api.update_attributes_bulk(news_items, stories)
+        if result is None:
+            logger.error(f"Failed to update attributes of {len(news_items)} news items and {len(stories)} stories")
+            self.failed |= dict.fromkeys([*news_items, *stories], "Bulk update failed")
+            return False
+        if errors := result.get("errors"):
+            logger.error(f"Failed to update attributes: {errors}")
+            self.failed |= errors
+            return False
+        logger.debug(f"Updated attributes of {len(news_items)} news items and {len(stories)} stories")
+        return True
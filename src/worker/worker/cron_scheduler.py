@@ -9,6 +9,8 @@ from croniter import croniter
 from models.task import CronTaskSpec
 from pydantic import ValidationError
 from redis import Redis
+from redis.client import Pipeline
+from redis.exceptions import RedisError
 from rq import Queue
 
 from worker.config import Config
@@ -17,9 +19,12 @@ from worker.log import logger
 
 DEFS_KEY = "rq:cron:def"  # HASH: job_id -> JSON spec (written by core QueueManager)
 NEXT_KEY = "rq:cron:next"  # ZSET: job_id -> next_run_unix_ts
+EVENTS_KEY = "rq:cron:events"  # STREAM: {op, job_id} for every definition change (written by core QueueManager)
 LOCK_KEY = "rq:cron:leader"  # STRING: leader node id
 ENQUEUE_KEY_PREFIX = "rq:cron:enqueue:"
 ENQUEUE_KEY_TTL_SECONDS = 300
+DUE_BATCH_SIZE = 100
+EVENT_READ_COUNT = 1000
 
 TASK_FUNCTION_MAP = {
     "collector_task": "worker.collectors.collector_tasks.collector_task",
@@ -86,6 +91,66 @@ def _sync_next_index(redis: Redis, base_ts: float) -> dict[str, dict[str, Any]]:
     return specs
 
 
+class CronSpecCache:
+    """In-memory copy of the cron definitions, kept current through the core event stream.
+
+    A full reload happens on start, after becoming leader and every full_sync_interval_seconds,
+    which also covers events trimmed from the stream before they were read.
+    """
+
+    def __init__(self, redis: Redis, full_sync_interval_seconds: float):
+        self.redis = redis
+        self.full_sync_interval_seconds = full_sync_interval_seconds
+        self.specs: dict[str, dict[str, Any]] = {}
+        self.last_event_id = "0-0"
+        self.synced_at: float | None = None
+
+    @property
+    def needs_full_sync(self) -> bool:
+        return self.synced_at is None or time.monotonic() - self.synced_at >= self.full_sync_interval_seconds
+
+    def full_sync(self, base_ts: float) -> None:
+        # Read the stream position first, so changes made during the reload are replayed afterwards.
+        latest = _sync_response(self.redis.xrevrange(EVENTS_KEY, count=1), "redis.xrevrange")
+        self.last_event_id = _decode(latest[0][0], "redis.xrevrange id") if latest else "0-0"
+        self.specs = _sync_next_index(self.redis, base_ts)
+        self.synced_at = time.monotonic()
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        if spec := self.specs.get(job_id):
+            return spec
+        if spec := _load_spec(self.redis, job_id):
+            self.specs[job_id] = spec
+        return spec
+
+    def wait_for_changes(self, timeout_seconds: float) -> set[str]:
+        """Block until core publishes definition changes or the timeout passes, and apply the changes."""
+        response = _sync_response(
+            self.redis.xread({EVENTS_KEY: self.last_event_id}, count=EVENT_READ_COUNT, block=max(int(timeout_seconds * 1000), 1)),
+            "redis.xread",
+        )
+        job_ids: set[str] = set()
+        for _stream, entries in response or []:
+            for event_id, fields in entries:
+                self.last_event_id = _decode(event_id, "redis.xread id")
+                if raw_job_id := fields.get(b"job_id", fields.get("job_id")):
+                    job_ids.add(_decode(raw_job_id, "redis.xread job_id"))
+        self.refresh(job_ids)
+        return job_ids
+
+    def refresh(self, job_ids: set[str]) -> None:
+        if not job_ids:
+            return
+        ordered_ids = sorted(job_ids)
+        raw_specs = _sync_response(self.redis.hmget(DEFS_KEY, ordered_ids), "redis.hmget")
+        for job_id, raw_spec in zip(ordered_ids, raw_specs, strict=True):
+            spec = _normalize_spec(json.loads(_decode(raw_spec, "redis.hmget value"))) if raw_spec else None
+            if spec:
+                self.specs[job_id] = spec
+            else:
+                self.specs.pop(job_id, None)
+
+
 def compute_next(spec: dict[str, Any], base_ts: float) -> float:
     if spec.get("cron"):
         dt = datetime.fromtimestamp(base_ts, tz=UTC)
@@ -109,44 +174,110 @@ def _enqueue_due_job(
     job_id: str,
     spec: dict[str, Any],
     due_ts: float,
+    pipeline: Pipeline | None = None,
+    now_ts: float | None = None,
 ) -> str | None:
+    """Enqueue a due cron job and register its next run.
+
+    With a pipeline, all writes are queued on it and the caller executes it. Runs missed while
+    no scheduler was active are skipped, so a job is enqueued at most once per drain.
+    """
+    own_pipeline = pipeline is None
+    if pipeline is None:
+        pipeline = redis.pipeline()
     queue_name = spec["queue_name"]
     queue = queues.setdefault(queue_name, Queue(queue_name, connection=redis))
     func_path = str(spec.get("func_path") or "")
     task = TASK_FUNCTION_MAP.get(func_path, func_path)
-    if not task:
+    next_ts = compute_next(spec, due_ts)
+    if now_ts is not None and next_ts <= now_ts:
+        next_ts = compute_next(spec, now_ts)
+
+    rq_job_id: str | None = None
+    if task:
+        job_options = dict(spec.get("job_options") or {})
+        kwargs = dict(spec.get("kwargs") or {})
+
+        # Preserve scheduler dashboard labels where available.
+        if spec.get("meta") and "meta" not in job_options:
+            job_options["meta"] = spec["meta"]
+
+        # Deterministic enough for queue dedupe while still carrying the logical cron job id.
+        due_slot = int(due_ts)
+        rq_job_id = f"cron_{job_id}_{due_slot}"
+
+        queue.enqueue(
+            task,
+            *spec.get("args", []),
+            job_id=rq_job_id,
+            pipeline=pipeline,
+            **kwargs,
+            **job_options,
+        )
+    else:
         logger.warning(f"Skipping cron job {job_id} because func_path is missing")
-        next_ts = compute_next(spec, due_ts)
-        redis.zadd(NEXT_KEY, {job_id: next_ts})
-        return None
-    job_options = dict(spec.get("job_options") or {})
-    kwargs = dict(spec.get("kwargs") or {})
-
-    # Preserve scheduler dashboard labels where available.
-    if spec.get("meta") and "meta" not in job_options:
-        job_options["meta"] = spec["meta"]
-
-    # Deterministic enough for queue dedupe while still carrying the logical cron job id.
-    due_slot = int(due_ts)
-    rq_job_id = f"cron_{job_id}_{due_slot}"
-
-    queue.enqueue(
-        task,
-        *spec.get("args", []),
-        job_id=rq_job_id,
-        **kwargs,
-        **job_options,
-    )
 
-    next_ts = compute_next(spec, due_ts)
-    with redis.pipeline() as pipeline:
-        pipeline.zadd(NEXT_KEY, {job_id: next_ts})
+    pipeline.zadd(NEXT_KEY, {job_id: next_ts})
+    if rq_job_id:
         pipeline.rpush(_enqueue_key(job_id), rq_job_id)
         pipeline.expire(_enqueue_key(job_id), ENQUEUE_KEY_TTL_SECONDS)
-        pipeline.execute()
+    if own_pipeline:
+        with pipeline:
+            pipeline.execute()
     return rq_job_id
 
 
+def drain_due_jobs(
+    redis: Redis,
+    queues: dict[str, Queue],
+    spec_cache: CronSpecCache,
+    now_ts: float,
+    retry_delay_seconds: float,
+) -> list[str]:
+    """Enqueue every job due at now_ts, DUE_BATCH_SIZE jobs per Redis round trip."""
+    enqueued: list[str] = []
+    while True:
+        due = _sync_response(
+            redis.zrangebyscore(NEXT_KEY, min=0, max=now_ts, start=0, num=DUE_BATCH_SIZE, withscores=True), "redis.zrangebyscore"
+        )
+        if not due:
+            return enqueued
+
+        batch: list[str] = []
+        with redis.pipeline() as pipeline:
+            for raw_job_id, due_ts in due:
+                job_id = _decode(raw_job_id, "redis.zrangebyscore item")
+                spec = spec_cache.get(job_id)
+                if not spec:
+                    # Spec was removed; drop stale timing entry.
+                    pipeline.zrem(NEXT_KEY, job_id)
+                    continue
+                try:
+                    if rq_job_id := _enqueue_due_job(redis, queues, job_id, spec, float(due_ts), pipeline=pipeline, now_ts=now_ts):
+                        batch.append(rq_job_id)
+                except Exception:
+                    # Keep the job alive and retry on the next wake-up.
+                    pipeline.zadd(NEXT_KEY, {job_id: now_ts + retry_delay_seconds})
+                    logger.exception(f"Failed processing scheduled job {job_id}")
+            try:
+                pipeline.execute()
+            except RedisError:
+                # The batch is applied atomically or not at all; its jobs stay due for the next wake-up.
+                logger.exception("Failed to enqueue due scheduled jobs")
+                return enqueued
+        enqueued.extend(batch)
+
+        if len(due) < DUE_BATCH_SIZE:
+            return enqueued
+
+
+def seconds_until_next_due(redis: Redis, max_wait_seconds: float) -> float:
+    head = _sync_response(redis.zrange(NEXT_KEY, 0, 0, withscores=True), "redis.zrange")
+    if not head:
+        return max_wait_seconds
+    return min(max(float(head[0][1]) - time.time(), 0.0), max_wait_seconds)
+
+
 def acquire_leader(redis: Redis, node_id: str, ttl_seconds: int = 10) -> bool:
     return bool(redis.set(LOCK_KEY, node_id, nx=True, ex=ttl_seconds))
 
@@ -164,40 +295,35 @@ def run_scheduler(
     node_id: str = "cron-b-1",
     poll_interval_seconds: float = 15.0,
     redis_password: str | None = None,
+    full_sync_interval_seconds: float = 300.0,
 ) -> None:
+    """Run the cron scheduler loop.
+
+    The leader sleeps until the earliest next run or until core publishes a definition change,
+    but at most poll_interval_seconds, so the leader lock is renewed in time and next-run
+    entries written without an event are still picked up.
+    """
     redis = Redis.from_url(redis_url, password=redis_password or None, decode_responses=False)
     queues: dict[str, Queue] = {}
     ttl_seconds = int(max(2 * poll_interval_seconds, 30, Config.CRON_POLL_INTERVAL_SECONDS))
+    spec_cache = CronSpecCache(redis, full_sync_interval_seconds)
+    is_leader = False
 
     while True:
         # Keep a single active cron scheduler even if multiple cron instances overlap.
 
         if not acquire_leader(redis, node_id, ttl_seconds=ttl_seconds) and not renew_leader(redis, node_id, ttl_seconds=ttl_seconds):
+            is_leader = False
             time.sleep(poll_interval_seconds)
             continue
 
         now_ts = time.time()
-        specs = _sync_next_index(redis, now_ts)
-        due_ids = _sync_response(redis.zrangebyscore(NEXT_KEY, min=0, max=now_ts, start=0, num=100), "redis.zrangebyscore")
-
-        for raw_job_id in due_ids:
-            job_id = _decode(raw_job_id, "redis.zrangebyscore item")
-
-            spec = specs.get(job_id) or _load_spec(redis, job_id)
-            if not spec:
-                # Spec was removed; drop stale timing entry.
-                redis.zrem(NEXT_KEY, job_id)
-                continue
-
-            try:
-                due_ts = float(redis.zscore(NEXT_KEY, job_id) or now_ts)
-                _enqueue_due_job(redis, queues, job_id, spec, due_ts)
-            except Exception:
-                # Keep the job alive and retry on next poll cycle.
-                redis.zadd(NEXT_KEY, {job_id: now_ts + poll_interval_seconds})
-                logger.exception(f"Failed processing scheduled job {job_id}")
+        if not is_leader or spec_cache.needs_full_sync:
+            spec_cache.full_sync(now_ts)
+            is_leader = True
 
-        time.sleep(poll_interval_seconds)
+        drain_due_jobs(redis, queues, spec_cache, now_ts, retry_delay_seconds=poll_interval_seconds)
+        spec_cache.wait_for_changes(seconds_until_next_due(redis, poll_interval_seconds))
 
 
 def main() -> None:
@@ -206,6 +332,7 @@ def main() -> None:
         node_id=os.getenv("CRON_NODE_ID", "cron-b-1"),
         poll_interval_seconds=Config.CRON_POLL_INTERVAL_SECONDS,
         redis_password=Config.REDIS_PASSWORD,
+        full_sync_interval_seconds=Config.CRON_FULL_SYNC_INTERVAL_SECONDS,
     )
 
 
@@ -0,0 +1,179 @@
+"""Persistent cache for the results of model-backed and extracting bots.
+
+Entries are keyed by bot type, model version and a hash of the normalized input, so text that
+is syndicated across sources or processed again after stories were regrouped reaches the model
+only once. INFERENCE_CACHE selects the store: "redis" is shared by all workers, "disk" keeps a
+SQLite file in INFERENCE_CACHE_DIR and "" disables caching. Both stores hold at most
+INFERENCE_CACHE_MAX_ENTRIES entries, evicting the least recently used first, and drop entries
+after INFERENCE_CACHE_TTL seconds. Cache failures are logged and treated as misses.
+"""
+
+import contextlib
+import hashlib
+import json
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Protocol
+
+import redis
+
+from worker.config import Config
+from worker.log import logger
+
+
+KEY_PREFIX = "taranis:inference-cache"
+LRU_KEY = f"{KEY_PREFIX}:lru"
+DISK_CACHE_FILE = "taranis-inference-cache.sqlite3"
+SQLITE_MAX_VARIABLES = 500
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(value: Any) -> Any:
+    """Input with strings in NFC form and runs of whitespace collapsed, used for the content hash."""
+    if isinstance(value, str):
+        return WHITESPACE.sub(" ", unicodedata.normalize("NFC", value)).strip()
+    if isinstance(value, dict):
+        return {str(key): normalize(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [normalize(item) for item in value]
+    return value
+
+
+def content_hash(value: Any) -> str:
+    canonical = json.dumps(normalize(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    def get_many(self, keys: Sequence[str]) -> dict[str, str]: ...
+
+    def set_many(self, entries: dict[str, str]) -> None: ...
+
+
+class RedisCacheBackend:
+    def __init__(self, connection: Any = None, max_entries: int | None = None, ttl: int | None = None):
+        self.redis = connection or redis.from_url(Config.REDIS_URL, password=Config.REDIS_PASSWORD, decode_responses=False)
+        self.max_entries = max_entries or Config.INFERENCE_CACHE_MAX_ENTRIES
+        self.ttl = Config.INFERENCE_CACHE_TTL if ttl is None else ttl
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, str]:
+        values = self.redis.mget([f"{KEY_PREFIX}:{key}" for key in keys])
+        hits = {key: value.decode() if isinstance(value, bytes) else value for key, value in zip(keys, values) if value is not None}
+        if hits:
+            self.redis.zadd(LRU_KEY, dict.fromkeys(hits, time.time()))
+        return hits
+
+    def set_many(self, entries: dict[str, str]) -> None:
+        pipeline = self.redis.pipeline()
+        for key, value in entries.items():
+            pipeline.set(f"{KEY_PREFIX}:{key}", value, ex=self.ttl or None)
+        pipeline.zadd(LRU_KEY, dict.fromkeys(entries, time.time()))
+        pipeline.zcard(LRU_KEY)
+        if (overflow := pipeline.execute()[-1] - self.max_entries) <= 0:
+            return
+        evicted = [key.decode() if isinstance(key, bytes) else key for key, _ in self.redis.zpopmin(LRU_KEY, overflow)]
+        self.redis.delete(*[f"{KEY_PREFIX}:{key}" for key in evicted])
+
+
+class DiskCacheBackend:
+    """SQLite store, opened per call so that it can be shared by forked work horses."""
+
+    def __init__(self, path: Path | str | None = None, max_entries: int | None = None, ttl: int | None = None):
+        self.path = Path(path) if path else Path(Config.INFERENCE_CACHE_DIR or tempfile.gettempdir()) / DISK_CACHE_FILE
+        self.max_entries = max_entries or Config.INFERENCE_CACHE_MAX_ENTRIES
+        self.ttl = Config.INFERENCE_CACHE_TTL if ttl is None else ttl
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with contextlib.closing(sqlite3.connect(self.path, timeout=30)) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            yield connection
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, str]:
+        now = time.time()
+        oldest = now - self.ttl if self.ttl else 0
+        hits: dict[str, str] = {}
+        with self._connect() as connection:
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                chunk = list(keys[start : start + SQLITE_MAX_VARIABLES])
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(f"SELECT key, value FROM entries WHERE key IN ({placeholders}) AND created >= ?", [*chunk, oldest])
+                hits.update(rows.fetchall())
+            connection.executemany("UPDATE entries SET accessed = ? WHERE key = ?", [(now, key) for key in hits])
+        return hits
+
+    def set_many(self, entries: dict[str, str]) -> None:
+        now = time.time()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                [(key, value, now, now) for key, value in entries.items()],
+            )
+            if self.ttl:
+                connection.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl,))
+            (count,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if (overflow := count - self.max_entries) > 0:
+                connection.execute("DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?)", (overflow,))
+
+
+def build_backend() -> CacheBackend | None:
+    if Config.INFERENCE_CACHE == "redis":
+        return RedisCacheBackend()
+    if Config.INFERENCE_CACHE == "disk":
+        return DiskCacheBackend()
+    return None
+
+
+class InferenceCache:
+    """Results of one bot and model version, looked up by the input they were computed from."""
+
+    def __init__(self, backend: CacheBackend, bot_type: str, model_version: str):
+        self.backend = backend
+        self.namespace = f"{bot_type}:{hashlib.sha256(model_version.encode()).hexdigest()[:16]}"
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, value: Any) -> str:
+        return f"{self.namespace}:{content_hash(value)}"
+
+    def get_many(self, values: Sequence[Any]) -> list[Any | None]:
+        """Cached results for values in order, None for a miss."""
+        if not values:
+            return []
+        keys = [self.key(value) for value in values]
+        try:
+            cached = self.backend.get_many(list(dict.fromkeys(keys)))
+        except (redis.RedisError, sqlite3.Error, OSError) as e:
+            logger.warning(f"Inference cache lookup failed: {e!s}")
+            cached = {}
+        results = [json.loads(cached[key]) if key in cached else None for key in keys]
+        with self.lock:
+            self.hits += sum(result is not None for result in results)
+            self.misses += sum(result is None for result in results)
+        return results
+
+    def set_many(self, values: Sequence[Any], results: Sequence[Any]) -> None:
+        """Store results for their values, skipping None."""
+        entries = {self.key(value): json.dumps(result) for value, result in zip(values, results) if result is not None}
+        if not entries:
+            return
+        try:
+            self.backend.set_many(entries)
+        except (redis.RedisError, sqlite3.Error, OSError) as e:
+            logger.warning(f"Inference cache update failed: {e!s}")
+
+    def as_dict(self) -> dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0}
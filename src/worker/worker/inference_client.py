@@ -0,0 +1,179 @@
+"""Client for the model endpoints behind the LLM-backed bots.
+
+Requests go through the process-wide session of the bot service, up to max_parallel_requests of
+them at once. With batch_size > 1 several inputs are sent in one request as {"batch": [...]} and
+a list with one result per input is expected back; endpoints that answer otherwise get the
+inputs one by one for the rest of the run. Connection errors, 429 and 5xx gateway responses are
+retried with exponential backoff. With a cache, only inputs without a cached result are sent.
+"""
+
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Self
+
+import niquests as requests
+
+from worker.bot_api import BotApi, get_session
+from worker.config import Config
+from worker.inference_cache import InferenceCache
+from worker.log import logger
+
+
+BATCH_KEY = "batch"
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 30.0
+
+
+def _positive_int(value: Any, default: int) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    return number if number > 0 else default
+
+
+class InferenceMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.items = 0
+        self.failed_items = 0
+        self.retries = 0
+        self.latencies: list[float] = []
+
+    def record(self, latency: float, items: int, failed: bool, retries: int) -> None:
+        with self.lock:
+            self.requests += 1
+            self.items += items
+            self.failed_items += items if failed else 0
+            self.retries += retries
+            self.latencies.append(latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self.lock:
+            latencies = sorted(self.latencies)
+            elapsed = time.perf_counter() - self.started
+            return {
+                "requests": self.requests,
+                "items": self.items,
+                "failed_items": self.failed_items,
+                "retries": self.retries,
+                "items_per_second": round(self.items / elapsed, 2) if elapsed > 0 else 0.0,
+                "latency_ms": {
+                    "avg": round(1000 * sum(latencies) / len(latencies), 1) if latencies else 0.0,
+                    "p95": round(1000 * latencies[int(0.95 * (len(latencies) - 1))], 1) if latencies else 0.0,
+                    "max": round(1000 * latencies[-1], 1) if latencies else 0.0,
+                },
+            }
+
+
+class InferenceClient(BotApi):
+    def __init__(
+        self,
+        bot_endpoint: str,
+        bot_api_key: str | None = Config.BOT_API_KEY,
+        requests_timeout: int | str | None = None,
+        batch_size: int = 1,
+        max_parallel_requests: int = 1,
+        max_retries: int = 2,
+    ):
+        super().__init__(bot_endpoint, bot_api_key, requests_timeout)
+        self.batch_size = max(batch_size, 1)
+        self.max_parallel_requests = max(max_parallel_requests, 1)
+        self.max_retries = max(max_retries, 0)
+        self.batching = self.batch_size > 1
+        self.metrics = InferenceMetrics()
+        self.cache: InferenceCache | None = None
+
+    @classmethod
+    def from_parameters(cls, parameters: dict, default_endpoint: str, endpoint_parameter: str = "BOT_ENDPOINT") -> Self:
+        return cls(
+            bot_endpoint=parameters.get(endpoint_parameter) or default_endpoint,
+            bot_api_key=parameters.get("BOT_API_KEY", Config.BOT_API_KEY),
+            requests_timeout=parameters.get("REQUESTS_TIMEOUT"),
+            batch_size=_positive_int(parameters.get("BATCH_SIZE"), Config.INFERENCE_BATCH_SIZE),
+            max_parallel_requests=_positive_int(parameters.get("MAX_PARALLEL_REQUESTS"), Config.INFERENCE_MAX_PARALLEL_REQUESTS),
+            max_retries=Config.INFERENCE_MAX_RETRIES,
+        )
+
+    def api_post(self, url: str, json_data: dict | None = None):
+        return self.infer_many(url, [json_data or {}])[0]
+
+    def infer_many(self, url: str, payloads: Sequence[dict]) -> list[Any]:
+        """Results for payloads in order, None where the endpoint failed."""
+        if self.cache is None or not payloads:
+            return self._infer_many(url, payloads)
+
+        cache_keys = [[url, payload] for payload in payloads]
+        results = self.cache.get_many(cache_keys)
+        if missing := [index for index, result in enumerate(results) if result is None]:
+            inferred = self._infer_many(url, [payloads[index] for index in missing])
+            for index, result in zip(missing, inferred):
+                results[index] = result
+            self.cache.set_many(
+                [cache_keys[index] for index in missing], [result if self._cacheable(result) else None for result in inferred]
+            )
+        return results
+
+    def _infer_many(self, url: str, payloads: Sequence[dict]) -> list[Any]:
+        chunk_size = self.batch_size if self.batching else 1
+        chunks = [list(payloads[start : start + chunk_size]) for start in range(0, len(payloads), chunk_size)]
+        if self.max_parallel_requests == 1 or len(chunks) <= 1:
+            chunk_results = [self._infer_chunk(url, chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel_requests, len(chunks)), thread_name_prefix="inference") as executor:
+                chunk_results = list(executor.map(lambda chunk: self._infer_chunk(url, chunk), chunks))
+        return [result for results in chunk_results for result in results]
+
+    @staticmethod
+    def _cacheable(result: Any) -> bool:
+        return result is not None and not (isinstance(result, dict) and "error" in result)
+
+    def _infer_chunk(self, url: str, chunk: list[dict]) -> list[Any]:
+        if len(chunk) > 1 and self.batching:
+            response = self._send(url, {BATCH_KEY: chunk}, len(chunk))
+            try:
+                results = response.json() if response is not None and response.ok else None
+            except requests.exceptions.JSONDecodeError:
+                results = None
+            if isinstance(results, list) and len(results) == len(chunk):
+                return results
+            if response is not None and (response.ok or 400 <= response.status_code < 500):
+                logger.warning(f"{self.api_url}{url} does not accept batched requests, sending items one by one")
+                self.batching = False
+        return [self._post(url, payload) for payload in chunk]
+
+    def _post(self, url: str, payload: dict) -> Any:
+        if (response := self._send(url, payload, 1)) is None:
+            return None
+        return self.check_response(response, f"{self.api_url}{url}")
+
+    def _send(self, url: str, payload: dict, items: int) -> requests.Response | None:
+        url = f"{self.api_url}{url}"
+        start = time.perf_counter()
+        response = None
+        attempt = 0
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = get_session(url).post(url=url, headers=self.headers, verify=self.verify, json=payload, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                logger.warning(f"Call to {url} failed: {e!s}")
+                response = None
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    break
+            if attempt < self.max_retries:
+                time.sleep(self._retry_delay(response, attempt))
+        self.metrics.record(time.perf_counter() - start, items, response is None or not response.ok, attempt)
+        return response
+
+    @staticmethod
+    def _retry_delay(response: requests.Response | None, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if isinstance(retry_after, str) and retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        return min(RETRY_BACKOFF * 2**attempt, MAX_RETRY_DELAY)
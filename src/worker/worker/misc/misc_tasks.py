@@ -6,6 +6,7 @@ Miscellaneous worker tasks including cleanup and wordlist updates.
 from datetime import UTC, datetime
 
 from croniter import croniter
+from models.task import TaskAffectedEntities
 from rq import get_current_job
 
 from worker.core_api import CoreApi, build_failure_task_result, build_success_task_result
@@ -125,6 +126,7 @@ def gather_word_list(word_list_id: str):
                 if isinstance(result, dict) and result.get("message")
                 else f"Word list {word_list_id} updated",
                 data=result_data,
+                affected=TaskAffectedEntities(word_list_ids=[word_list_id]),
             ),
         )
     return result
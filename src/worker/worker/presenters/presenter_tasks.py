@@ -3,9 +3,9 @@
 Functions for generating products/reports in various formats.
 """
 
-from base64 import b64encode
 from typing import Any
 
+from models.task import TaskAffectedEntities
 from niquests.exceptions import ConnectionError
 from rq import get_current_job
 
@@ -22,11 +22,11 @@ def presenter_task(product_id: str):
         product_id: ID of the product to render
 
     Returns:
-        dict: Result containing product_id, message, and base64-encoded rendered content
+        dict: Result containing product_id, message, and the digest of the rendered content in the artifact store
 
     Raises:
         ValueError: If product not found, misconfigured, or rendering fails
-        ConnectionError: If unable to connect to core API
+        ConnectionError: If unable to connect to core API or to upload the rendered content
     """
     job = get_current_job()
     core_api = CoreApi()
@@ -54,11 +54,12 @@ def presenter_task(product_id: str):
     result_data = None
     if rendered_product := presenter.generate(product, template, parameters=product.get("parameters", {})):
         if isinstance(rendered_product, str):
-            rendered_product = b64encode(rendered_product.encode("utf-8")).decode("ascii")
-        else:
-            rendered_product = b64encode(rendered_product).decode("ascii")
+            rendered_product = rendered_product.encode("utf-8")
+
+        if not (render_digest := core_api.upload_artifact(rendered_product)):
+            raise ConnectionError(f"Unable to upload rendered product {product_id} to core API")
 
-        result_data = {"product_id": product_id, "message": f"Product: {product_id} rendered successfully", "render_result": rendered_product}
+        result_data = {"product_id": product_id, "message": f"Product: {product_id} rendered successfully", "render_digest": render_digest}
 
         # Save task result to database
         if job:
@@ -70,7 +71,8 @@ def presenter_task(product_id: str):
                 worker_type=worker_type,
                 result=build_success_task_result(
                     default_message=result_data["message"],
-                    data={"product_id": product_id, "render_result": rendered_product},
+                    data={"product_id": product_id, "render_digest": render_digest, "render_size": len(rendered_product)},
+                    affected=TaskAffectedEntities(product_ids=[product_id]),
                 ),
             )
 
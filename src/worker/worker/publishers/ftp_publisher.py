@@ -1,5 +1,4 @@
 import ftplib
-from base64 import b64decode
 from io import BytesIO
 from urllib.parse import ParseResult, urlparse
 
@@ -28,10 +27,7 @@ class FTPPublisher(BasePublisher):
         rendered_data = self._require_rendered_data(rendered_product)
 
         logger.debug(ftp_data)
-        if rendered_product.mime_type in ["text/plain", "text/html"]:
-            data_to_upload = BytesIO(rendered_data)
-        else:
-            data_to_upload = BytesIO(b64decode(rendered_data))
+        data_to_upload = BytesIO(rendered_data)
 
         self.input_validation(ftp_data)
         self.upload_to_ftp(ftp_data, data_to_upload)
@@ -1,4 +1,5 @@
 import json
+from base64 import b64encode
 from typing import Any
 
 from confluent_kafka import Producer
@@ -110,5 +111,5 @@ class KafkaPublisher(BasePublisher):
         return {
             "object_name": object_name,
             "mime_type": rendered_product.mime_type,
-            "data": BasePublisher._require_rendered_data(rendered_product).decode("ascii"),
+            "data": b64encode(BasePublisher._require_rendered_data(rendered_product)).decode("ascii"),
         }
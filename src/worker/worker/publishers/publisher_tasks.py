@@ -38,7 +38,7 @@ def publisher_task(product_id: str, publisher_id: str):
         # Get product, publisher, and rendered content
         product = _get_product(core_api, product_id)
         publisher = _get_publisher(core_api, publisher_id)
-        rendered_product = _get_rendered_product(core_api, product_id)
+        rendered_product = _get_rendered_product(core_api, product)
 
         if rendered_product is None:
             raise ValueError("Rendered product is None")
@@ -128,18 +128,21 @@ def _get_publisher(core_api: CoreApi, publisher_id: str) -> dict:
     return publisher
 
 
-def _get_rendered_product(core_api: CoreApi, product_id: str) -> Product | None:
-    """Fetch rendered product from core API.
+def _get_rendered_product(core_api: CoreApi, product: dict[str, str]) -> Product | None:
+    """Fetch rendered product from the artifact store of core.
 
     Args:
         core_api: CoreApi instance
-        product_id: ID of the product
+        product: Product configuration dictionary referencing the render by its digest
 
     Returns:
         Rendered product or None if not found
     """
-    logger.debug(f"Getting rendered product for product {product_id}")
-    return core_api.get_product_render(product_id)
+    if not (render_digest := product.get("render_digest")):
+        logger.error(f"Product {product.get('id')} has not been rendered")
+        return None
+    logger.debug(f"Getting rendered product {render_digest} for product {product.get('id')}")
+    return core_api.get_artifact(render_digest, product.get("mime_type"))
 
 
 def _get_publisher_impl(pub_type: str) -> BasePublisher:
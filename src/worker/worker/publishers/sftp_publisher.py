@@ -1,5 +1,4 @@
 import contextlib
-from base64 import b64decode
 from io import BytesIO, StringIO
 from typing import Any
 from urllib.parse import ParseResult, urlparse
@@ -32,10 +31,7 @@ class SFTPPublisher(BasePublisher):
         server_config: ParseResult = urlparse(ftp_url)  # type: ignore
         rendered_data = self._require_rendered_data(rendered_product)
 
-        if rendered_product.mime_type in ["text/plain", "text/html"]:
-            data_to_upload = BytesIO(rendered_data)
-        else:
-            data_to_upload = BytesIO(b64decode(rendered_data))
+        data_to_upload = BytesIO(rendered_data)
 
         if not server_config:
             raise ValueError("Invalid SFTP URL")
@@ -0,0 +1,105 @@
+import re
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from threading import Lock
+
+
+WORD_PATTERN = re.compile(r"\w+")
+MATCHER_CACHE_SIZE = 8
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class WordListMatcher:
+    """Find word list entries in text with the semantics of ``re.search(r"\\b" + re.escape(entry) + r"\\b", text)``.
+
+    Entries that consist of a single word are matched by intersecting them with the set of words in the text.
+    Phrases are only verified with ``str.find`` when their first word occurs in the text, so the cost of a scan
+    depends on the text length rather than on the number of entries.
+    """
+
+    def __init__(self, entries: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self._words: dict[str, list[str]] = defaultdict(list)
+        self._phrases: dict[str, list[tuple[str, str]]] = defaultdict(list)
+        self._unanchored: list[tuple[str, str]] = []
+        self._patterns: list[tuple[re.Pattern, str]] = []
+
+        for entry in dict.fromkeys(entries):
+            needle = self._fold(entry)
+            first_word = WORD_PATTERN.match(needle)
+            if not needle or len(needle) != len(entry):
+                self._patterns.append((re.compile(r"\b" + re.escape(entry) + r"\b", re.IGNORECASE if ignore_case else re.NOFLAG), entry))
+            elif first_word is None:
+                self._unanchored.append((needle, entry))
+            elif first_word.end() == len(needle):
+                self._words[needle].append(entry)
+            else:
+                self._phrases[first_word.group()].append((needle, entry))
+
+    def _fold(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    @staticmethod
+    def _occurs(haystack: str, needle: str) -> bool:
+        starts_with_word = _is_word_char(needle[0])
+        ends_with_word = _is_word_char(needle[-1])
+        position = haystack.find(needle)
+        while position != -1:
+            end = position + len(needle)
+            before = position > 0 and _is_word_char(haystack[position - 1])
+            after = end < len(haystack) and _is_word_char(haystack[end])
+            if before != starts_with_word and after != ends_with_word:
+                return True
+            position = haystack.find(needle, position + 1)
+        return False
+
+    def _iter_matches(self, text: str):
+        haystack = self._fold(text)
+        words = set(WORD_PATTERN.findall(haystack))
+
+        for word in words & self._words.keys():
+            yield from self._words[word]
+        for word in words & self._phrases.keys():
+            for needle, entry in self._phrases[word]:
+                if self._occurs(haystack, needle):
+                    yield entry
+        for needle, entry in self._unanchored:
+            if self._occurs(haystack, needle):
+                yield entry
+        for pattern, entry in self._patterns:
+            if pattern.search(text):
+                yield entry
+
+    def find_all(self, text: str) -> set[str]:
+        return set(self._iter_matches(text))
+
+    def search(self, text: str) -> bool:
+        return next(self._iter_matches(text), None) is not None
+
+
+_matcher_cache: OrderedDict[tuple[frozenset[str], bool], WordListMatcher] = OrderedDict()
+_matcher_cache_lock = Lock()
+
+
+def get_word_list_matcher(entries: Iterable[str], ignore_case: bool = True) -> WordListMatcher:
+    """Return a matcher for the given entries, reusing the one built for an identical word list revision."""
+    key = (frozenset(entries), ignore_case)
+    with _matcher_cache_lock:
+        if matcher := _matcher_cache.get(key):
+            _matcher_cache.move_to_end(key)
+            return matcher
+
+    matcher = WordListMatcher(key[0], ignore_case)
+    with _matcher_cache_lock:
+        _matcher_cache[key] = matcher
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    return matcher
+
+
+def clear_word_list_matcher_cache() -> None:
+    with _matcher_cache_lock:
+        _matcher_cache.clear()